@@ -8,6 +8,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 from utils.logger import logger
+from utils.metrics import timed
 
 load_dotenv()  # .env 파일 자동 로드
 
@@ -71,7 +72,8 @@ def save_report_to_db(report_data: Dict[str, Any]) -> None:
     """MongoDB에 신고 데이터 저장"""
     try:
         chat_report_collection = mongodb.get_collection("chat_reports")
-        chat_report_collection.insert_one(report_data)
+        with timed("mongo_operations", ("chat_reports", "insert_one")):
+            chat_report_collection.insert_one(report_data)
         logger.info(
             f"Chat report saved: {report_data['messageId']}, "
             f"Result: {report_data['result']}, "
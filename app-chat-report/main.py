@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import RedirectResponse
 from utils.error_handler import register_exception_handlers
+from utils.metrics import register_metrics
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
@@ -39,6 +40,8 @@ app = FastAPI(
 )
 
 register_exception_handlers(app)
+# Prometheus 지표 (/metrics, 경로별 요청 처리 시간)
+register_metrics(app, namespace="chat_report")
 
 # 라우터 등록
 app.include_router(chat_report_router)
@@ -9,8 +9,22 @@ from models.hyper_clover_loader import ModelSingleton
 from models.kcelectra_base_loader import get_model
 from schemas.chat_report_schema import ChatReportRequest, ChatReportResponse
 from utils.logger import log_performance, logger
+from utils.metrics import metrics_registry, timed
 
 message_filter_collection = mongodb.get_collection("message_filters")
+
+metrics_registry.describe(
+    "mongo_operations",
+    "mongo_operation_duration_seconds",
+    "MongoDB 호출 시간",
+    ("collection", "operation"),
+)
+metrics_registry.describe(
+    "model_calls",
+    "model_call_duration_seconds",
+    "유해성 판단 모델(분류기/LLM) 호출 시간",
+    ("model",),
+)
 # =================================================================
 # 설정 및 상수
 # =================================================================
@@ -69,10 +83,12 @@ async def get_active_profanity_words() -> frozenset[str]:
     """MongoDB에서 활성화된 욕설 목록을 로드"""
     try:
         # Fetch only active words
-        cursor = message_filter_collection.find(
-            {"is_active": True}, {"word": 1, "_id": 0}
-        )
-        words = {doc["word"] for doc in await cursor.to_list(length=None)}
+        with timed("mongo_operations", ("message_filters", "find")):
+            cursor = message_filter_collection.find(
+                {"is_active": True}, {"word": 1, "_id": 0}
+            )
+            docs = await cursor.to_list(length=None)
+        words = {doc["word"] for doc in docs}
         logger.info(f"Loaded {len(words)} active profanity words from DB.")
         return frozenset(words)
     except Exception as e:
@@ -103,7 +119,8 @@ def check_ai_model_toxicity(message: str) -> ToxicityResult:
     """AI 모델을 통한 유해성 검사"""
     try:
         model = get_model()
-        result = model(message)[0]
+        with timed("model_calls", "kcelectra"):
+            result = model(message)[0]
 
         label = result.get("label", ToxicityLabel.SAFE.value)
         confidence_raw = result.get("score", 0.0)
@@ -173,7 +190,8 @@ async def handle_chat_report_(message: str) -> ChatReportResponse:
     try:
         # Clova 모델 사용 (기존 로직 유지)
         clova_model = ModelSingleton.get_instance()
-        result = clova_model.classify(text=message)
+        with timed("model_calls", "hyperclova"):
+            result = clova_model.classify(text=message)
         is_toxic = any(
             keyword in result
             for keyword in ["유해합니다", "제재 대상", "부적절", "비속어"]
@@ -10,6 +10,8 @@ from inspect import signature
 from typing import Any, Callable, Dict, Optional
 
 import psutil
+from utils.log_queue import attach_queue_handler
+from utils.metrics import metrics_registry
 
 # 1. 포맷터 먼저 정의
 formatter = logging.Formatter(
@@ -25,7 +27,6 @@ if not logger.hasHandlers():
     # 콘솔 핸들러
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # 파일 핸들러
     os.makedirs("logs", exist_ok=True)
@@ -33,7 +34,9 @@ if not logger.hasHandlers():
         f"logs/performance_{datetime.now().strftime('%Y%m%d')}.log"
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # 요청 경로에서는 큐에만 넣고, 콘솔/파일 쓰기는 리스너 스레드에서 처리
+    attach_queue_handler(logger, [console_handler, file_handler])
 
 
 # 성능 지표 컬렉션 (간단한 인메모리 저장소)
@@ -43,6 +46,13 @@ performance_metrics = {
     "memory_usage_samples": [],
     "memory_usage_by_function": {},
 }
+# Prometheus 노출용 고정 크기 지표 (/metrics)
+metrics_registry.describe(
+    "api_response_times",
+    "operation_duration_seconds",
+    "log_performance 작업 소요 시간",
+    ("operation",),
+)
 
 
 def log_performance(operation_name: Optional[str] = None, include_memory: bool = False):
@@ -145,6 +155,7 @@ def log_performance(operation_name: Optional[str] = None, include_memory: bool =
                     performance_metrics["error_counts"][op_name][error_type] = 0
 
                 performance_metrics["error_counts"][op_name][error_type] += 1
+                metrics_registry.count_error(op_name, error_type)
 
                 raise
 
@@ -233,6 +244,7 @@ def log_performance(operation_name: Optional[str] = None, include_memory: bool =
                 if error_type not in performance_metrics["error_counts"]:
                     performance_metrics["error_counts"][error_type] = 0
                 performance_metrics["error_counts"][error_type] += 1
+                metrics_registry.count_error(op_name, error_type)
 
                 raise
 
@@ -485,6 +497,7 @@ def _store_metric(op_name: str, elapsed: float, result: Any = None) -> None:
     성능 지표 저장
     """
     # API 응답 시간 저장
+    metrics_registry.observe_latency("api_response_times", op_name, elapsed)
     if op_name not in performance_metrics["api_response_times"]:
         performance_metrics["api_response_times"][op_name] = []
     performance_metrics["api_response_times"][op_name].append(elapsed)
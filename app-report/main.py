@@ -13,6 +13,7 @@ from fastapi.responses import RedirectResponse
 
 from .api.endpoints.tuning_report_router import TuningReportRouter
 from .utils.error_handler import register_exception_handlers
+from .utils.metrics import register_metrics
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
@@ -25,6 +26,8 @@ app = FastAPI(
 )
 
 register_exception_handlers(app)  # 반드시 포함
+# Prometheus 지표 (/metrics, 경로별 요청 처리 시간)
+register_metrics(app, namespace="report")
 
 # 라우터 등록 - API를 기능별로 모듈화
 app.include_router(TuningReportRouter().router)
@@ -13,9 +13,17 @@ from ..core.enum_process import convert_to_korean
 from ..models.midm_loader_gcp_vllm import get_model
 from ..schemas.tuning_schema import TuningReport, TuningReportResponse
 from ..utils.logger import log_performance, logger
+from ..utils.metrics import metrics_registry, timed
 
 load_dotenv()
 
+metrics_registry.describe(
+    "llm_calls",
+    "llm_call_duration_seconds",
+    "리포트 생성 단계별 LLM 에이전트 호출 시간",
+    ("agent",),
+)
+
 
 def _format_profile_for_prompt(profile: dict, user_label: str) -> str:
     """
@@ -263,10 +271,13 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
         def connection_finder_node(state: AgentState):
             """1단계: 관계 분석 노드"""
             logger.info("1단계: 관계 분석 시작")
-            result = connection_finder_agent.invoke(state)
+            with timed("llm_calls", "connection_finder"):
+                result = connection_finder_agent.invoke(state)
             # State에 결과 저장
             state["connection_analysis"] = result["messages"][-1].content
-            logger.info(
+            logger.info(f"관계 분석 완료 ({len(state['connection_analysis'])}자)")
+            # 단계별 전체 출력(수 KB)은 DEBUG에서만 기록
+            logger.debug(
                 f"--- 관계 분석 완료 ---\n{state['connection_analysis']}\n--------------------"
             )
             return state
@@ -278,9 +289,11 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
             input_state = {
                 "messages": [{"role": "user", "content": state["connection_analysis"]}]
             }
-            result = topic_planner_agent.invoke(input_state)
+            with timed("llm_calls", "topic_planner"):
+                result = topic_planner_agent.invoke(input_state)
             state["topic_list"] = result["messages"][-1].content
-            logger.info(
+            logger.info(f"주제 기획 완료 ({len(state['topic_list'])}자)")
+            logger.debug(
                 f"--- 주제 기획 완료 ---\n{state['topic_list']}\n--------------------"
             )
             return state
@@ -292,9 +305,11 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
             input_state = {
                 "messages": [{"role": "user", "content": state["topic_list"]}]
             }
-            result = researcher_agent.invoke(input_state)
+            with timed("llm_calls", "researcher"):
+                result = researcher_agent.invoke(input_state)
             state["research_results"] = result["messages"][-1].content
-            logger.info(
+            logger.info(f"정보 검색 완료 ({len(state['research_results'])}자)")
+            logger.debug(
                 f"--- 정보 검색 완료---\n{state['research_results']}\n--------------------"
             )
             return state
@@ -311,7 +326,8 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
             관련 검색 결과: {state["research_results"]}
             """
             input_state = {"messages": [{"role": "user", "content": combined_input}]}
-            result = creative_concept_agent.invoke(input_state)
+            with timed("llm_calls", "creative_concept"):
+                result = creative_concept_agent.invoke(input_state)
             concept_text = result["messages"][-1].content
 
             try:
@@ -334,7 +350,8 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
                     concept_text  # 실패 시 원본 텍스트를 그대로 전달
                 )
 
-            logger.info(
+            logger.info(f"컨셉 설계 완료 ({len(state['creative_concept'])}자)")
+            logger.debug(
                 f"--- 컨셉 설계 완료---\n{state['creative_concept']}\n--------------------"
             )
             return state
@@ -346,9 +363,11 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
             input_state = {
                 "messages": [{"role": "user", "content": state["creative_concept"]}]
             }
-            result = content_generator_agent.invoke(input_state)
+            with timed("llm_calls", "content_generator"):
+                result = content_generator_agent.invoke(input_state)
             state["final_content"] = result["messages"][-1].content
-            logger.info(
+            logger.info(f"본문 생성 완료 ({len(state['final_content'])}자)")
+            logger.debug(
                 f"--- 본문 생성 완료---\n{state['final_content']}\n--------------------"
             )
             return state
@@ -367,7 +386,7 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
             state["json_output"] = json.dumps(
                 final_json_data, ensure_ascii=False, indent=2
             )
-            logger.info(
+            logger.debug(
                 f"--- [6단계 결과: 최종 포맷팅] ---\n{state['json_output']}\n--------------------"
             )
 
@@ -446,7 +465,7 @@ def generate_tuning_report_with_agent(request: TuningReport) -> TuningReportResp
 
         logger.info("\n\n=============== 최종 결과물 ===============")
         final_response_content = final_state["json_output"]
-        logger.info(f"--- 최종 생성된 콘텐츠---\n{final_response_content}")
+        logger.debug(f"--- 최종 생성된 콘텐츠---\n{final_response_content}")
 
         # JSON 형식 검증
         try:
@@ -0,0 +1,113 @@
+# 비동기(큐) 로그 핸들러 유틸리티
+# 요청 처리 경로에서는 로그 레코드를 제한된 크기의 큐에 넣기만 하고,
+# 콘솔/파일 쓰기는 별도 리스너 스레드가 처리하여 느린 디스크/표준 출력이 응답 지연에 영향을 주지 않도록 함
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
+
+from .metrics import metrics_registry
+
+# 로그 큐 최대 적재 레코드 수 (가득 차면 삭제 정책 적용)
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+metrics_registry.describe(
+    "log_records_dropped",
+    "log_records_dropped",
+    "로그 큐 포화로 버린 로그 레코드 수",
+    ("logger", "level"),
+)
+
+_listeners: List[QueueListener] = []
+_queues: List[tuple] = []
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    제한된 크기의 큐에 로그 레코드를 넣는 핸들러 (큐가 가득 차도 호출 스레드를 막지 않음)
+
+    삭제 정책:
+    - WARNING 미만: 새 레코드를 버림
+    - WARNING 이상: 가장 오래된 레코드를 버리고 새 레코드를 넣음 (오류 로그 우선 보존)
+    버린 레코드는 log_records_dropped 카운터에 (로거 이름, 레벨)별로 기록
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if record.levelno >= logging.WARNING:
+            try:
+                dropped = self.queue.get_nowait()
+                self._count_dropped(dropped)
+                self.queue.put_nowait(record)
+                return
+            except (queue.Empty, queue.Full):
+                pass
+        self._count_dropped(record)
+
+    @staticmethod
+    def _count_dropped(record: logging.LogRecord) -> None:
+        metrics_registry.increment(
+            "log_records_dropped", (record.name, record.levelname)
+        )
+
+
+def attach_queue_handler(
+    target_logger: logging.Logger,
+    handlers: List[logging.Handler],
+    maxsize: int = None,
+) -> QueueListener:
+    """
+    로거에 큐 핸들러를 연결하고 실제 출력 핸들러는 리스너 스레드에서 실행
+
+    Args:
+        target_logger: 큐 핸들러를 붙일 로거
+        handlers: 리스너 스레드에서 실행할 출력 핸들러 (콘솔, 파일 등)
+        maxsize: 큐 최대 적재 레코드 수 (기본값: LOG_QUEUE_SIZE)
+
+    Returns:
+        시작된 QueueListener (프로세스 종료 시 남은 레코드를 기록하고 자동 중지)
+    """
+    log_queue = queue.Queue(maxsize=maxsize or LOG_QUEUE_SIZE)
+    target_logger.addHandler(BoundedQueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    _queues.append((target_logger.name, log_queue))
+    return listener
+
+
+def dropped_records() -> dict:
+    """
+    (로거 이름, 레벨)별 버린 로그 레코드 수
+    """
+    return metrics_registry.counters("log_records_dropped")
+
+
+def collect_log_queue_gauges() -> list:
+    """
+    로거별 로그 큐 적재량 게이지 (/metrics 수집기)
+    """
+    return [
+        ("log_queue_depth", "로그 큐 적재 레코드 수", {"logger": name}, q.qsize())
+        for name, q in _queues
+    ]
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    # 종료 시 큐에 남은 레코드를 모두 기록한 뒤 리스너 스레드 중지 (이미 중지된 리스너 제외)
+    for listener in _listeners:
+        if listener._thread is not None:
+            listener.stop()
+    _listeners.clear()
+
+
+metrics_registry.add_collector(collect_log_queue_gauges)
@@ -9,20 +9,24 @@ from typing import Any, Callable, Dict, Optional
 
 import psutil
 
+from .log_queue import attach_queue_handler
+from .metrics import metrics_registry
+
 # --------- 로거 설정 ---------
 logger = logging.getLogger("tuning_performance")
 formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
 
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
 
 os.makedirs("logs", exist_ok=True)
 file_handler = logging.FileHandler(
     f"logs/performance_{datetime.now().strftime('%Y%m%d')}.log"
 )
 file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+
+# 요청 경로에서는 큐에만 넣고, 콘솔/파일 쓰기는 리스너 스레드에서 처리
+log_listener = attach_queue_handler(logger, [console_handler, file_handler])
 
 logger.setLevel(logging.INFO)
 
@@ -32,6 +36,13 @@ performance_metrics = {
     "memory_usage_samples": [],
     "memory_usage_by_function": {},
 }
+# Prometheus 노출용 고정 크기 지표 (/metrics)
+metrics_registry.describe(
+    "api_response_times",
+    "operation_duration_seconds",
+    "log_performance 작업 소요 시간",
+    ("operation",),
+)
 
 
 # --------- 성능 데코레이터 ---------
@@ -229,12 +240,14 @@ def _safe_args_for_logging(arguments: Dict[str, Any]) -> str:
 
 
 def _store_metric(op_name: str, elapsed: float) -> None:
+    metrics_registry.observe_latency("api_response_times", op_name, elapsed)
     if op_name not in performance_metrics["api_response_times"]:
         performance_metrics["api_response_times"][op_name] = []
     performance_metrics["api_response_times"][op_name].append(elapsed)
 
 
 def _record_error_metric(op_name: str, error_type: str) -> None:
+    metrics_registry.count_error(op_name, error_type)
     if op_name not in performance_metrics["error_counts"]:
         performance_metrics["error_counts"][op_name] = {}
     if error_type not in performance_metrics["error_counts"][op_name]:
@@ -3,36 +3,86 @@
 라우터에서 받은 요청을 처리하고 서비스 레이어와 연결
 """
 
+import json
 import logging
+from typing import Iterator
 
 from core.vector_database import (
-    get_similarities,
+    get_similarity_collection,
+    iter_similarities,
+    iter_users,
     list_similarities,
-    list_users,
     reset_collections,
 )
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from schemas.exclusion_schema import ExclusionUpdate
+from schemas.scoring_schema import WeightProfileUpdate
 from schemas.user_schema import BaseResponse, EmbeddingRegister
+from services.bulk_import_service import (
+    BULK_IMPORT_MAX_BYTES,
+    bulk_import_too_large,
+    import_users_bulk,
+)
+from services.exclusion_service import get_exclusion_lists, update_exclusions
+from services.registration_job_service import (
+    RegistrationQueueFullError,
+    registration_job_queue,
+)
+from services.score_profile_service import apply_weight_profile, get_active_weights
 from services.user_service import (
     delete_user_metatdata,
     delete_user_metatdata_v3,
+    ensure_encoder_ready,
     register_user,
+    register_user_profile_v3,
     register_user_v3,
 )
+from utils.executor import cpu_executor
 
 logger = logging.getLogger(__name__)
 
 
-async def db_user_list():
-    result = await list_users()
-    return {
-        "code": "REGISTERD_ID_CHECKED",
-        "data": {
-            "ids": result.get("ids", []),
-            "count": len(result.get("ids", [])),
-            # "metadatas": result.get("metadatas", []),
-        },
-    }
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _to_ndjson(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _stream_user_ids(page_size: int) -> Iterator[str]:
+    """
+    사용자 ID를 한 줄에 하나씩 NDJSON으로 출력하고, 마지막 줄에 요약 정보를 출력
+    """
+    count = 0
+    for page in iter_users(page_size=page_size):
+        for user_id in page["ids"]:
+            count += 1
+            yield _to_ndjson({"id": user_id})
+    yield _to_ndjson({"code": "REGISTERD_ID_CHECKED", "count": count})
+
+
+def _stream_similarities(category: str, page_size: int) -> Iterator[str]:
+    """
+    유사도 문서를 한 줄에 하나씩 NDJSON으로 출력하고, 마지막 줄에 요약 정보를 출력
+    """
+    count = 0
+    for page in iter_similarities(category, page_size=page_size):
+        for doc_id, metadata in zip(page["ids"], page["metadatas"]):
+            count += 1
+            yield _to_ndjson({"id": doc_id, "metadata": metadata})
+    yield _to_ndjson(
+        {
+            "code": "REGISTERD_SIMILARITY_CHECKED",
+            "collection_name": category,
+            "count": count,
+        }
+    )
+
+
+async def db_user_list(page_size: int = 500) -> StreamingResponse:
+    # 동기 제너레이터는 StreamingResponse가 스레드풀에서 순회하므로 이벤트 루프를 막지 않음
+    return StreamingResponse(_stream_user_ids(page_size), media_type=NDJSON_MEDIA_TYPE)
 
 
 async def db_similarity_list():
@@ -47,17 +97,20 @@ async def db_similarity_list():
     }
 
 
-async def db_similarity_list_v3(category: str):
-    result = await get_similarities(category)
-    return {
-        "code": "REGISTERD_SIMILARITY_CHECKED",
-        "data": {
-            "collection_name": category,
-            "ids": result.get("ids", []),
-            "count": len(result.get("ids", [])),
-            "metadatas": (result.get("metadatas", [])),
-        },
-    }
+async def db_similarity_list_v3(
+    category: str, page_size: int = 500
+) -> StreamingResponse:
+    try:
+        # 잘못된 카테고리는 스트리밍 시작 전에 검증 (응답 헤더 전송 이후에는 상태 코드 변경 불가)
+        get_similarity_collection(category)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "SIMILARITY_INVALID_CATEGORY", "data": None},
+        )
+    return StreamingResponse(
+        _stream_similarities(category, page_size), media_type=NDJSON_MEDIA_TYPE
+    )
 
 
 async def db_reset_data():
@@ -84,9 +137,126 @@ async def create_user_v3(user_data: EmbeddingRegister) -> BaseResponse:
         )
 
 
+# 큐가 가득 찼을 때 클라이언트에 안내할 재시도 대기 시간(초)
+REGISTER_RETRY_AFTER_SECONDS = "5"
+
+
+def _registration_queue_full_error() -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=BaseResponse(
+            code="EMBEDDING_REGISTER_QUEUE_FULL", data=None
+        ).model_dump(),
+        headers={"Retry-After": REGISTER_RETRY_AFTER_SECONDS},
+    )
+
+
+async def create_user_v3_async(user_data: EmbeddingRegister) -> BaseResponse:
+    """
+    프로필 저장까지만 요청 내에서 처리하고, 유사도 계산은 백그라운드 작업으로 등록
+
+    Returns:
+        BaseResponse: 작업 ID를 포함한 접수 응답 (202)
+
+    Raises:
+        HTTPException: 큐가 가득 찬 경우 429, 그 외 오류는 등록 API와 동일
+    """
+    # 프로필을 저장하기 전에 큐 여유를 먼저 확인 (저장 후 거절 → 롤백 최소화)
+    if registration_job_queue.is_full():
+        raise _registration_queue_full_error()
+
+    try:
+        await ensure_encoder_ready()
+        user_id = await cpu_executor.run(register_user_profile_v3, user_data)
+    except HTTPException as http_ex:
+        logger.warning(f"[REGISTER_USER_HTTP_ERROR] {http_ex.detail}")
+        raise
+    except Exception as e:
+        logger.exception(f"[REGISTER_USER_FATAL_ERROR]: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=BaseResponse(
+                code="EMBEDDING_REGISTER_SERVER_ERROR", data=None
+            ).model_dump(),
+        )
+
+    try:
+        job = registration_job_queue.submit(user_id)
+    except RegistrationQueueFullError as e:
+        logger.warning(f"[REGISTER_QUEUE_FULL] rollback for {user_id}: {e}")
+        await cpu_executor.run(
+            delete_user_metatdata_v3, user_id, reject_when_full=False
+        )
+        raise _registration_queue_full_error()
+
+    return BaseResponse(
+        code="EMBEDDING_REGISTER_ACCEPTED",
+        data={"jobId": job["jobId"], "userId": job["userId"], "status": job["status"]},
+    )
+
+
+async def read_bulk_body(request: Request) -> bytes:
+    """
+    일괄 등록 본문을 크기 제한과 함께 읽음
+    Content-Length가 제한을 넘으면 읽기 전에, 스트리밍 중 누적 크기가 넘으면 즉시 413으로 거절
+
+    Raises:
+        HTTPException: 본문 크기 초과 413
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > BULK_IMPORT_MAX_BYTES:
+        raise bulk_import_too_large({"maxBytes": BULK_IMPORT_MAX_BYTES})
+
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > BULK_IMPORT_MAX_BYTES:
+            raise bulk_import_too_large({"maxBytes": BULK_IMPORT_MAX_BYTES})
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def create_users_bulk_v3(request: Request) -> BaseResponse:
+    """
+    JSONL 사용자 레코드 일괄 등록 (전체 검증 → 일괄 임베딩 → 도메인별 유사도 저장)
+
+    Returns:
+        BaseResponse: 등록 수와 도메인별 유사도 저장 사용자 수 / 계산 방식
+
+    Raises:
+        HTTPException: 검증 실패 422, 중복 ID 409, 본문 크기/레코드 수 초과 413, 실행기 포화 429
+    """
+    body = await read_bulk_body(request)
+    try:
+        await ensure_encoder_ready()
+        result = await cpu_executor.run(import_users_bulk, body.splitlines())
+        return BaseResponse(code="EMBEDDING_BULK_REGISTER_SUCCESS", data=result)
+    except HTTPException as http_ex:
+        logger.warning(f"[BULK_REGISTER_HTTP_ERROR] {http_ex.detail}")
+        raise
+    except Exception as e:
+        logger.exception(f"[BULK_REGISTER_FATAL_ERROR]: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=BaseResponse(
+                code="EMBEDDING_REGISTER_SERVER_ERROR", data=None
+            ).model_dump(),
+        )
+
+
+async def get_registration_job(job_id: str) -> BaseResponse:
+    job = registration_job_queue.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=BaseResponse(code="REGISTER_JOB_NOT_FOUND", data=None).model_dump(),
+        )
+    return BaseResponse(code="REGISTER_JOB_RETRIEVED", data=job)
+
+
 async def delete_user_data_v3(user_id: int) -> BaseResponse:
     try:
-        delete_user_metatdata_v3(user_id)
+        await cpu_executor.run(delete_user_metatdata_v3, user_id)
         return BaseResponse(code="EMBEDDING_DELETE_SUCCESS", data=None)
     except HTTPException as http_ex:
         logger.warning(f"[EMBEDDING_DELETE_HTTP_ERROR] {http_ex.detail}")
@@ -101,6 +271,86 @@ async def delete_user_data_v3(user_id: int) -> BaseResponse:
         )
 
 
+async def get_user_exclusions(user_id: int) -> BaseResponse:
+    try:
+        exclusions = await cpu_executor.run(get_exclusion_lists, str(user_id))
+        return BaseResponse(code="EXCLUSION_RETRIEVED", data=exclusions)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"[EXCLUSION_FETCH_FATAL_ERROR]: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=BaseResponse(
+                code="EXCLUSION_FETCH_SERVER_ERROR", data=None
+            ).model_dump(),
+        )
+
+
+async def update_user_exclusions(
+    user_id: int, kind: str, update: ExclusionUpdate
+) -> BaseResponse:
+    try:
+        exclusions = await cpu_executor.run(
+            update_exclusions, str(user_id), kind, update.add, update.remove
+        )
+        return BaseResponse(code="EXCLUSION_UPDATE_SUCCESS", data=exclusions)
+    except HTTPException as http_ex:
+        logger.warning(f"[EXCLUSION_UPDATE_HTTP_ERROR] {http_ex.detail}")
+        raise
+    except Exception as e:
+        logger.exception(f"[EXCLUSION_UPDATE_FATAL_ERROR]: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=BaseResponse(
+                code="EXCLUSION_UPDATE_SERVER_ERROR", data=None
+            ).model_dump(),
+        )
+
+
+async def get_weight_profile_v3() -> BaseResponse:
+    try:
+        weights = await cpu_executor.run(get_active_weights)
+        return BaseResponse(code="WEIGHT_PROFILE_RETRIEVED", data=weights)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"[WEIGHT_PROFILE_FETCH_FATAL_ERROR]: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=BaseResponse(
+                code="WEIGHT_PROFILE_FETCH_SERVER_ERROR", data=None
+            ).model_dump(),
+        )
+
+
+async def update_weight_profile_v3(update: WeightProfileUpdate) -> BaseResponse:
+    """
+    카테고리별 가중치 변경 후 저장된 점수 구성 요소로 유사도 맵 재조합 (모델 호출 없음)
+
+    Returns:
+        BaseResponse: 적용된 가중치와 카테고리별 재조합 통계
+    """
+    updates = {
+        category: weights.model_dump() if weights is not None else None
+        for category, weights in (("friend", update.friend), ("couple", update.couple))
+    }
+    try:
+        result = await cpu_executor.run(apply_weight_profile, updates)
+        return BaseResponse(code="WEIGHT_PROFILE_UPDATE_SUCCESS", data=result)
+    except HTTPException as http_ex:
+        logger.warning(f"[WEIGHT_PROFILE_UPDATE_HTTP_ERROR] {http_ex.detail}")
+        raise
+    except Exception as e:
+        logger.exception(f"[WEIGHT_PROFILE_UPDATE_FATAL_ERROR]: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=BaseResponse(
+                code="WEIGHT_PROFILE_UPDATE_SERVER_ERROR", data=None
+            ).model_dump(),
+        )
+
+
 # -------------------- 아래는 기존 버전----------------------
 
 
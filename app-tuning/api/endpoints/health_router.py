@@ -7,6 +7,8 @@ import os
 
 import chromadb
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from models.sbert_loader import get_model_status
 
 
 class HealthRouter:
@@ -38,11 +40,30 @@ class HealthRouter:
         """라우터 경로 설정"""
         self.router.add_api_route("", self.check_health, methods=["GET"])
         self.router.add_api_route("/chromadb", self.check_chromadb, methods=["GET"])
+        self.router.add_api_route("/ready", self.check_ready, methods=["GET"])
 
     async def check_health(self):
         """기본 헬스 체크 엔드포인트"""
         return {"status": "UP", "message": "서비스가 정상적으로 실행 중입니다"}
 
+    async def check_ready(self):
+        """임베딩 모델 준비 상태 확인 엔드포인트 (준비 전에는 503)"""
+        encoder = get_model_status()
+        if encoder["status"] == "READY":
+            return {
+                "status": "UP",
+                "message": "임베딩 모델 준비 완료",
+                "encoder": encoder,
+            }
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "DOWN",
+                "message": "임베딩 모델이 아직 준비되지 않았습니다",
+                "encoder": encoder,
+            },
+        )
+
     async def check_chromadb(self):
         """ChromaDB 연결 확인 엔드포인트"""
         if self.chroma_client is None:
@@ -1,11 +1,113 @@
 """
 성능 모니터링 및 지표 요약 API 엔드포인트 정의 및 관리
 수집된 성능 로그를 기반으로 성능 요약 통계를 제공
+(Prometheus 수집용 /metrics는 utils.metrics.register_metrics로 등록, 런타임 게이지는 collect_runtime_gauges)
 """
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+import asyncio
+import os
+import secrets
+from typing import Iterator, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+from models.batch_encoder import batch_encoder
+from models.inference_pool import get_inference_pool_stats
+from services.registration_job_service import registration_job_queue
 from utils import logger
+from utils.domain_lock import domain_locks
+from utils.executor import cpu_executor
+from utils.memory_snapshots import (
+    SnapshotNotFoundError,
+    TracemallocNotStartedError,
+    memory_snapshots,
+)
+from utils.metrics import GaugeSample, metrics_registry
+from utils.profiler import (
+    PROFILE_INTERVAL_MS,
+    PROFILE_MAX_SECONDS,
+    ProfilerBusyError,
+    sample_stacks,
+)
+from utils.tracing import trace_store
+
+
+def require_monitoring_token(
+    x_monitoring_token: Optional[str] = Header(None),
+) -> None:
+    """
+    운영 진단 엔드포인트(프로파일링 등) 접근 토큰 확인 (X-Monitoring-Token 헤더)
+    MONITORING_TOKEN이 설정되지 않은 환경에서는 엔드포인트를 비활성화
+    """
+    expected = os.getenv("MONITORING_TOKEN")
+    if not expected:
+        raise HTTPException(
+            status_code=403,
+            detail={"code": "MONITORING_TOKEN_NOT_CONFIGURED", "data": None},
+        )
+    if not x_monitoring_token or not secrets.compare_digest(
+        x_monitoring_token, expected
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail={"code": "INVALID_MONITORING_TOKEN", "data": None},
+        )
+
+
+def collect_runtime_gauges() -> Iterator[GaugeSample]:
+    """
+    /metrics 조회 시점의 큐 적재량, 실행기/락/인코더 상태, 캐시 적중률 게이지
+    """
+    queue = registration_job_queue.stats()
+    yield (
+        "queue_depth",
+        "작업 큐 적재량",
+        {"queue": "registration"},
+        queue["queueDepth"],
+    )
+    encoder = batch_encoder.stats()
+    yield (
+        "queue_depth",
+        "작업 큐 적재량",
+        {"queue": "batch_encoder"},
+        encoder["queueDepth"],
+    )
+
+    executor = cpu_executor.stats()
+    labels = {"executor": executor["name"]}
+    yield (
+        "executor_inflight",
+        "실행기 처리 중 + 대기 작업 수",
+        labels,
+        executor["inflight"],
+    )
+    yield ("executor_queued", "실행기 대기 작업 수", labels, executor["queued"])
+
+    # 누적 거절/경합 횟수는 발생 지점에서 카운터(executor_rejected_total,
+    # domain_locks_contended_total)로 기록하므로 여기서는 현재 상태만 게이지로 노출
+    locks = domain_locks.stats()
+    yield ("domain_locks_locked", "잠긴 도메인 수", {}, locks["lockedDomains"])
+
+    pool = get_inference_pool_stats()
+    if pool:
+        yield (
+            "inference_pool_idle_workers",
+            "유휴 추론 워커 수",
+            {},
+            pool["idleWorkers"],
+        )
+
+    requests_by_cache = {}
+    for (cache, result), count in metrics_registry.counters("cache_requests").items():
+        requests_by_cache.setdefault(cache, {})[result] = count
+    for cache, counts in requests_by_cache.items():
+        total = sum(counts.values())
+        yield (
+            "cache_hit_ratio",
+            "캐시 적중률",
+            {"cache": cache},
+            counts.get("hit", 0) / total,
+        )
 
 
 class PerformanceRouter:
@@ -26,6 +128,103 @@ class PerformanceRouter:
             summary="성능 지표 요약 조회",
             description="API 응답 시간, 메모리 사용량, 오류 횟수 등 애플리케이션 성능 관련 메트릭 요약 정보를 조회합니다.",
         )
+        self.router.add_api_route(
+            "/registration-queue",
+            self.get_registration_queue,
+            methods=["GET"],
+            summary="비동기 등록 작업 큐 상태 조회",
+            description="비동기 등록 작업 큐의 적재량, 워커 수, 상태별 작업 수를 조회합니다.",
+        )
+        self.router.add_api_route(
+            "/executor",
+            self.get_executor_stats,
+            methods=["GET"],
+            summary="CPU 작업 실행기 상태 조회",
+            description="임베딩/유사도 계산 전용 실행기의 사용률, 대기 작업 수, 거절 횟수를 조회합니다.",
+        )
+        self.router.add_api_route(
+            "/domain-locks",
+            self.get_domain_lock_stats,
+            methods=["GET"],
+            summary="도메인 쓰기 락 경합 조회",
+            description="이메일 도메인별 유사도 쓰기 락의 획득/경합 횟수와 평균 대기 시간을 조회합니다.",
+        )
+        self.router.add_api_route(
+            "/encoder",
+            self.get_encoder_stats,
+            methods=["GET"],
+            summary="마이크로 배치 인코더 상태 조회",
+            description="SBERT 마이크로 배치 인코더의 배치 채움 비율, 큐 대기 시간, 배치당 인코딩 시간을 조회합니다.",
+        )
+        self.router.add_api_route(
+            "/inference-pool",
+            self.get_inference_pool_stats,
+            methods=["GET"],
+            summary="SBERT 추론 워커 풀 상태 조회",
+            description="프로세스 외부 추론 워커 수, 유휴 워커 수, 배치 처리량과 대기 시간을 조회합니다. (SBERT_INFERENCE_WORKERS 미설정 시 data는 null)",
+        )
+        self.router.add_api_route(
+            "/traces/slowest",
+            self.get_slowest_traces,
+            methods=["GET"],
+            summary="느린 요청 추적 조회",
+            description="최근 요청/등록 작업 중 소요 시간이 긴 추적을 단계(구간)별 소요 시간, Chroma 송수신 바이트와 함께 조회합니다.",
+        )
+        self.router.add_api_route(
+            "/profile",
+            self.get_profile,
+            methods=["GET"],
+            dependencies=[Depends(require_monitoring_token)],
+            summary="샘플링 프로파일 수집",
+            description="지정한 시간 동안 모든 스레드의 호출 스택을 일정 간격으로 수집하여 collapsed stack 또는 speedscope 형식으로 반환합니다. (X-Monitoring-Token 헤더 필요)",
+        )
+        # tracemalloc 메모리 스냅샷 (/monitoring/memory/...)
+        memory_routes = [
+            (
+                "/memory/tracemalloc",
+                self.get_tracemalloc_status,
+                "GET",
+                "tracemalloc 상태 조회",
+                "추적 여부, 현재/최대 추적 메모리, 보관 중인 스냅샷 목록을 조회합니다.",
+            ),
+            (
+                "/memory/tracemalloc/start",
+                self.start_tracemalloc,
+                "POST",
+                "tracemalloc 추적 시작",
+                "메모리 할당 위치 추적을 시작합니다. 추적 중에는 모든 할당에 비용이 추가되므로 진단 후 중지하세요.",
+            ),
+            (
+                "/memory/tracemalloc/stop",
+                self.stop_tracemalloc,
+                "POST",
+                "tracemalloc 추적 중지",
+                "메모리 할당 위치 추적을 중지하고 보관 중인 스냅샷을 삭제합니다.",
+            ),
+            (
+                "/memory/snapshots/{name}",
+                self.take_memory_snapshot,
+                "POST",
+                "메모리 스냅샷 저장",
+                "현재 할당 상태를 이름을 붙여 저장합니다. 직전 스냅샷 이후 최대 추적 메모리도 함께 기록합니다.",
+            ),
+            (
+                "/memory/diff",
+                self.get_memory_diff,
+                "GET",
+                "메모리 스냅샷 비교",
+                "두 스냅샷의 할당 위치별 크기 차이 상위 목록과 패키지별 합계를 조회합니다.",
+            ),
+        ]
+        for path, endpoint, method, summary, description in memory_routes:
+            self.router.add_api_route(
+                path,
+                endpoint,
+                methods=[method],
+                dependencies=[Depends(require_monitoring_token)],
+                summary=summary,
+                description=f"{description} (X-Monitoring-Token 헤더 필요)",
+            )
 
     def get_summary(self) -> JSONResponse:
         """
@@ -47,3 +246,271 @@ class PerformanceRouter:
         return JSONResponse(
             content={"code": "PERFORMANCE_SUMMARY_RETRIEVED", "data": summary}
         )
+
+    def get_registration_queue(self) -> JSONResponse:
+        """
+        비동기 등록 작업 큐 상태를 반환
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "REGISTRATION_QUEUE_RETRIEVED",
+          "data": {"queueDepth": 3, "maxQueueSize": 100, "workers": 1, ...}
+        }
+        ```
+        """
+        return JSONResponse(
+            content={
+                "code": "REGISTRATION_QUEUE_RETRIEVED",
+                "data": registration_job_queue.stats(),
+            }
+        )
+
+    def get_executor_stats(self) -> JSONResponse:
+        """
+        CPU 작업 실행기 사용률 통계를 반환
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "EXECUTOR_STATS_RETRIEVED",
+          "data": {"maxWorkers": 2, "inflight": 3, "queued": 1, "rejectedTotal": 0, ...}
+        }
+        ```
+        """
+        return JSONResponse(
+            content={
+                "code": "EXECUTOR_STATS_RETRIEVED",
+                "data": cpu_executor.stats(),
+            }
+        )
+
+    def get_domain_lock_stats(self) -> JSONResponse:
+        """
+        도메인 쓰기 락 경합 통계를 반환
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "DOMAIN_LOCK_STATS_RETRIEVED",
+          "data": {"domains": 3, "lockedDomains": 1, "contendedTotal": 4, ...}
+        }
+        ```
+        """
+        return JSONResponse(
+            content={
+                "code": "DOMAIN_LOCK_STATS_RETRIEVED",
+                "data": domain_locks.stats(),
+            }
+        )
+
+    def get_encoder_stats(self) -> JSONResponse:
+        """
+        마이크로 배치 인코더 통계를 반환
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "ENCODER_STATS_RETRIEVED",
+          "data": {"maxBatchSize": 64, "avgFillRatio": 0.41, "avgQueueWaitMs": 3.2, ...}
+        }
+        ```
+        """
+        return JSONResponse(
+            content={
+                "code": "ENCODER_STATS_RETRIEVED",
+                "data": batch_encoder.stats(),
+            }
+        )
+
+    def get_inference_pool_stats(self) -> JSONResponse:
+        """
+        SBERT 추론 워커 풀 통계를 반환 (풀을 사용하지 않으면 data는 null)
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "INFERENCE_POOL_STATS_RETRIEVED",
+          "data": {"workers": 2, "threadsPerWorker": 1, "idleWorkers": 1, ...}
+        }
+        ```
+        """
+        return JSONResponse(
+            content={
+                "code": "INFERENCE_POOL_STATS_RETRIEVED",
+                "data": get_inference_pool_stats(),
+            }
+        )
+
+    def get_slowest_traces(
+        self,
+        limit: int = Query(10, ge=1, le=100, description="조회할 추적 수"),
+        name: Optional[str] = Query(
+            None, description="루트 구간 이름 필터 (예: POST /api/v3/users)"
+        ),
+    ) -> JSONResponse:
+        """
+        최근 추적 중 소요 시간이 긴 순서로 반환
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "SLOWEST_TRACES_RETRIEVED",
+          "data": [
+            {
+              "traceId": "4bf92f35...",
+              "name": "POST /api/v3/users",
+              "durationMs": 812.4,
+              "chromaBytesIn": 10485760,
+              "chromaBytesOut": 20480,
+              "stages": {"encode_candidates": {"count": 1, "totalMs": 402.1}, ...},
+              "root": {"name": "POST /api/v3/users", "children": [...], ...}
+            }
+          ]
+        }
+        ```
+        """
+        return JSONResponse(
+            content={
+                "code": "SLOWEST_TRACES_RETRIEVED",
+                "data": trace_store.slowest(limit=limit, name=name),
+            }
+        )
+
+    async def get_profile(
+        self,
+        seconds: float = Query(
+            10, gt=0, le=PROFILE_MAX_SECONDS, description="수집 시간(초)"
+        ),
+        interval_ms: int = Query(
+            PROFILE_INTERVAL_MS, ge=1, le=1000, description="샘플링 간격(밀리초)"
+        ),
+        output: Literal["collapsed", "speedscope"] = Query(
+            "collapsed", alias="format", description="결과 형식"
+        ),
+    ):
+        """
+        샘플링 프로파일을 수집하여 반환 (수집은 별도 스레드에서 실행, 동시에 하나만 허용)
+
+        **응답 예시 (format=collapsed)**:
+        ```text
+        cpu_0;_bootstrap (threading.py:995);...;compute_matching_scores_with_components (matching_score_by_category.py:461) 37
+        ```
+        format=speedscope이면 https://www.speedscope.app 에서 바로 열 수 있는 JSON 반환
+        """
+        try:
+            profile = await asyncio.to_thread(
+                sample_stacks, seconds, interval_ms / 1000
+            )
+        except ProfilerBusyError:
+            raise HTTPException(
+                status_code=409, detail={"code": "PROFILER_BUSY", "data": None}
+            )
+
+        headers = {
+            "X-Profile-Samples": str(profile.sample_count),
+            "X-Profile-Overhead-Ratio": f"{profile.overhead_ratio:.4f}",
+        }
+        if output == "speedscope":
+            return JSONResponse(
+                content=profile.to_speedscope(f"tuning-api {seconds}s profile"),
+                headers=headers,
+            )
+        return PlainTextResponse(profile.to_collapsed(), headers=headers)
+
+    def get_tracemalloc_status(self) -> JSONResponse:
+        """
+        tracemalloc 추적 상태와 보관 중인 스냅샷 목록을 반환
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "TRACEMALLOC_STATUS_RETRIEVED",
+          "data": {"tracing": true, "frames": 1, "tracedMb": 812.4, "peakMb": 1530.2, "snapshots": [...]}
+        }
+        ```
+        """
+        return JSONResponse(
+            content={
+                "code": "TRACEMALLOC_STATUS_RETRIEVED",
+                "data": memory_snapshots.status(),
+            }
+        )
+
+    def start_tracemalloc(
+        self,
+        frames: int = Query(
+            1, ge=1, le=64, description="할당 위치별 저장할 호출 스택 깊이"
+        ),
+    ) -> JSONResponse:
+        """
+        tracemalloc 추적을 시작 (이미 추적 중이면 상태만 반환)
+        """
+        return JSONResponse(
+            content={
+                "code": "TRACEMALLOC_STARTED",
+                "data": memory_snapshots.start(frames),
+            }
+        )
+
+    def stop_tracemalloc(self) -> JSONResponse:
+        """
+        tracemalloc 추적을 중지하고 스냅샷을 삭제
+        """
+        return JSONResponse(
+            content={"code": "TRACEMALLOC_STOPPED", "data": memory_snapshots.stop()}
+        )
+
+    def take_memory_snapshot(self, name: str) -> JSONResponse:
+        """
+        현재 할당 상태를 이름을 붙여 저장
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "MEMORY_SNAPSHOT_TAKEN",
+          "data": {"name": "after_recompute", "tracedMb": 920.1, "peakSincePreviousMb": 1530.2, ...}
+        }
+        ```
+        """
+        try:
+            snapshot = memory_snapshots.take(name)
+        except TracemallocNotStartedError:
+            raise HTTPException(
+                status_code=409,
+                detail={"code": "TRACEMALLOC_NOT_STARTED", "data": None},
+            )
+        return JSONResponse(content={"code": "MEMORY_SNAPSHOT_TAKEN", "data": snapshot})
+
+    def get_memory_diff(
+        self,
+        base: str = Query(..., description="기준 스냅샷 이름"),
+        target: str = Query(..., description="비교 스냅샷 이름"),
+        group_by: Literal["lineno", "filename", "traceback"] = Query(
+            "lineno", description="할당 위치 묶음 기준"
+        ),
+        limit: int = Query(20, ge=1, le=200, description="반환할 할당 위치 수"),
+    ) -> JSONResponse:
+        """
+        두 스냅샷의 할당 위치별 크기 차이를 반환
+
+        **응답 예시**:
+        ```json
+        {
+          "code": "MEMORY_DIFF_RETRIEVED",
+          "data": {
+            "totalDiffMb": 412.7,
+            "byPackage": [{"package": "pandas", "sizeDiffMb": 230.1}, {"package": "stdlib:json", "sizeDiffMb": 120.4}, ...],
+            "top": [{"traceback": [".../pandas/core/frame.py:722"], "sizeDiffMb": 180.2, "countDiff": 12, ...}, ...]
+          }
+        }
+        ```
+        """
+        try:
+            diff = memory_snapshots.diff(base, target, group_by=group_by, limit=limit)
+        except SnapshotNotFoundError as e:
+            raise HTTPException(
+                status_code=404,
+                detail={"code": "MEMORY_SNAPSHOT_NOT_FOUND", "data": {"name": e.name}},
+            )
+        return JSONResponse(content={"code": "MEMORY_DIFF_RETRIEVED", "data": diff})
@@ -5,7 +5,10 @@
 """
 
 from api.controllers import user_controller
-from fastapi import APIRouter, Body, Path
+from fastapi import APIRouter, Body, Path, Query, Request
+from fastapi.responses import StreamingResponse
+from schemas.exclusion_schema import ExclusionUpdate
+from schemas.scoring_schema import WeightProfileUpdate
 from schemas.user_schema import BaseResponse, EmbeddingRegister
 
 
@@ -27,9 +30,9 @@ class UserRouter:
             "/v1/users",
             self.db_user_list,
             methods=["GET"],
-            response_model=BaseResponse,
+            response_class=StreamingResponse,
             summary="사용자 조회(내부 확인용)",
-            description="벡터DB user_collection에 등록된 사용자 리스트를 조회합니다.",
+            description="벡터DB user_collection에 등록된 사용자 리스트를 NDJSON 스트림으로 조회합니다.",
         )
 
         self.router.add_api_route(
@@ -44,9 +47,9 @@ class UserRouter:
             "/v3/similarities",
             self.db_similarity_list_v3,
             methods=["GET"],
-            response_model=BaseResponse,
+            response_class=StreamingResponse,
             summary="매칭 스코어 조회(내부 확인용)",
-            description="벡터DB 유사도 collection에 등록된 모든 매칭 스코어를 조회합니다.",
+            description="벡터DB 유사도 collection에 등록된 모든 매칭 스코어를 NDJSON 스트림으로 조회합니다.",
         )
 
         self.router.add_api_route(
@@ -86,6 +89,31 @@ class UserRouter:
             summary="사용자 등록(v3)",
             description="사용자 등록 후 임베딩 벡터를 생성합니다.",
         )
+        self.router_v3.add_api_route(
+            "/users/async",
+            self.create_user_v3_async,
+            methods=["POST"],
+            status_code=202,
+            response_model=BaseResponse,
+            summary="사용자 등록(v3, 비동기 유사도 계산)",
+            description="사용자 프로필을 저장한 뒤 즉시 202를 반환하고, 유사도 계산은 백그라운드 작업으로 처리합니다. 작업 큐가 가득 찬 경우 429를 반환합니다.",
+        )
+        self.router_v3.add_api_route(
+            "/users/bulk",
+            self.create_users_bulk_v3,
+            methods=["POST"],
+            response_model=BaseResponse,
+            summary="사용자 일괄 등록(v3)",
+            description="EmbeddingRegister 레코드를 한 줄에 하나씩 담은 JSONL(NDJSON) 본문을 받아 전체 검증 후 일괄 임베딩하고, 도메인별 유사도를 저장합니다(신규 사용자가 도메인의 큰 비중이면 전체 쌍 1회 계산, 그 외에는 신규 사용자만 계산). 레코드 중 하나라도 유효하지 않으면 전체를 거절하고(422), 본문 크기나 레코드 수가 제한을 넘으면 파싱 전에 거절합니다(413).",
+        )
+        self.router_v3.add_api_route(
+            "/users/jobs/{job_id}",
+            self.get_registration_job,
+            methods=["GET"],
+            response_model=BaseResponse,
+            summary="비동기 등록 작업 상태 조회",
+            description="비동기 등록 작업의 상태(QUEUED, RUNNING, SUCCEEDED, FAILED)와 카테고리별 진행률을 조회합니다.",
+        )
         self.router_v3.add_api_route(
             "/users/{user_id}",
             self.delete_user_data_v3,
@@ -94,9 +122,46 @@ class UserRouter:
             summary="사용자 삭제(v3)",
             description="벡터 데이터베이스에서 사용자 데이터를 삭제합니다.",
         )
+        self.router_v3.add_api_route(
+            "/users/{user_id}/exclusions",
+            self.get_user_exclusions,
+            methods=["GET"],
+            response_model=BaseResponse,
+            summary="추천 제외 집합 조회",
+            description="차단(blocked)/매칭 완료(matched)/노출(seen) 제외 사용자 목록을 조회합니다.",
+        )
+        self.router_v3.add_api_route(
+            "/users/{user_id}/exclusions/{kind}",
+            self.update_user_exclusions,
+            methods=["PATCH"],
+            response_model=BaseResponse,
+            summary="추천 제외 집합 변경",
+            description="제외 집합(blocked, matched, seen)에 사용자를 추가/삭제합니다. 튜닝 결과 상위 K 선정 시 적용됩니다.",
+        )
+        self.router_v3.add_api_route(
+            "/similarities/weights",
+            self.get_weight_profile_v3,
+            methods=["GET"],
+            response_model=BaseResponse,
+            summary="매칭 점수 가중치 조회",
+            description="카테고리별 활성 가중치(embedding, rule, mbti, age)를 조회합니다.",
+        )
+        self.router_v3.add_api_route(
+            "/similarities/weights",
+            self.update_weight_profile_v3,
+            methods=["PUT"],
+            response_model=BaseResponse,
+            summary="매칭 점수 가중치 변경",
+            description="지정한 카테고리의 가중치를 변경하고, 저장된 점수 구성 요소(코사인/MBTI/연령대)를 재조합하여 유사도를 갱신합니다. 모델 호출이나 전체 재계산은 하지 않습니다.",
+        )
 
-    async def db_user_list(self) -> BaseResponse:
-        return await user_controller.db_user_list()
+    async def db_user_list(
+        self,
+        page_size: int = Query(
+            500, alias="pageSize", description="페이지당 조회 건수", ge=1, le=5000
+        ),
+    ) -> StreamingResponse:
+        return await user_controller.db_user_list(page_size)
 
     async def db_similarity_list(self) -> BaseResponse:
         return await user_controller.db_similarity_list()
@@ -104,8 +169,14 @@ class UserRouter:
     async def db_reset_data(self) -> BaseResponse:
         return await user_controller.db_reset_data()
 
-    async def db_similarity_list_v3(self, category) -> BaseResponse:
-        return await user_controller.db_similarity_list_v3(category)
+    async def db_similarity_list_v3(
+        self,
+        category: str = Query(..., description="카테고리 (friend, couple)"),
+        page_size: int = Query(
+            500, alias="pageSize", description="페이지당 조회 건수", ge=1, le=5000
+        ),
+    ) -> StreamingResponse:
+        return await user_controller.db_similarity_list_v3(category, page_size)
 
     async def create_user_v3(
         self, user_data: EmbeddingRegister = Body(..., description="사용자 등록 데이터")
@@ -117,6 +188,41 @@ class UserRouter:
     ) -> BaseResponse:
         return await user_controller.delete_user_data_v3(user_id)
 
+    async def create_user_v3_async(
+        self, user_data: EmbeddingRegister = Body(..., description="사용자 등록 데이터")
+    ) -> BaseResponse:
+        return await user_controller.create_user_v3_async(user_data)
+
+    async def create_users_bulk_v3(self, request: Request) -> BaseResponse:
+        return await user_controller.create_users_bulk_v3(request)
+
+    async def get_registration_job(
+        self, job_id: str = Path(..., description="등록 작업 ID")
+    ) -> BaseResponse:
+        return await user_controller.get_registration_job(job_id)
+
+    async def get_user_exclusions(
+        self, user_id: int = Path(..., description="제외 집합을 조회할 사용자의 ID")
+    ) -> BaseResponse:
+        return await user_controller.get_user_exclusions(user_id)
+
+    async def update_user_exclusions(
+        self,
+        user_id: int = Path(..., description="제외 집합을 변경할 사용자의 ID"),
+        kind: str = Path(..., description="제외 집합 종류 (blocked, matched, seen)"),
+        update: ExclusionUpdate = Body(..., description="추가/삭제할 사용자 ID 목록"),
+    ) -> BaseResponse:
+        return await user_controller.update_user_exclusions(user_id, kind, update)
+
+    async def get_weight_profile_v3(self) -> BaseResponse:
+        return await user_controller.get_weight_profile_v3()
+
+    async def update_weight_profile_v3(
+        self,
+        update: WeightProfileUpdate = Body(..., description="카테고리별 새 가중치"),
+    ) -> BaseResponse:
+        return await user_controller.update_weight_profile_v3(update)
+
     # -------------------- 아래는 기존 버전----------------------
     async def create_user(
         self, user_data: EmbeddingRegister = Body(..., description="사용자 등록 데이터")
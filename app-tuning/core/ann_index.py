@@ -0,0 +1,216 @@
+"""
+도메인별 근사 최근접 이웃(ANN) 후보 인덱스
+프로필 통합 문장 임베딩(user_profiles 컬렉션 임베딩)에 대해 코사인 HNSW 인덱스를 유지하고
+기준 사용자와 가까운 상위 K명을 후보로 반환 (정확한 점수 계산은 후보에 대해서만 수행)
+
+사용자마다 해시 가능한 속성 키(예: (성별, MBTI, 연령대))를 함께 저장하여,
+속성 키 집합으로 조회 대상을 제한할 수 있음. 조건을 만족하는 사용자가 적으면
+HNSW 필터 조회(파이썬 콜백으로 그래프 대부분을 방문)보다 정규화 벡터 행렬곱이 빠르므로 정확 계산
+
+주요 기능:
+1. 사용자 추가/삭제 (라벨 재사용, 용량 자동 확장)
+2. 자기 자신 제외 / 속성 키 조건을 만족하는 상위 K명 조회 (ID, 코사인 유사도, 속성 키)
+"""
+
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import hnswlib
+import numpy as np
+
+# HNSW 그래프 파라미터 (M: 노드당 연결 수, ef_construction: 구축 시 탐색 폭)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+# 최초 용량 (부족하면 두 배씩 확장)
+INITIAL_CAPACITY = 1024
+# 조건을 만족하는 사용자 수가 이 이하이면 HNSW 대신 정확 계산
+BRUTE_FORCE_MAX_ELEMENTS = 2048
+
+
+class DomainAnnIndex:
+    """
+    한 도메인 사용자들의 코사인 HNSW 인덱스
+    hnswlib는 resize/mark_deleted와 조회의 동시 실행을 보장하지 않으므로 모든 연산을 락으로 직렬화
+    """
+
+    def __init__(self, dim: int, ef_search: int = 200):
+        self._index = hnswlib.Index(space="cosine", dim=dim)
+        self._index.init_index(
+            max_elements=INITIAL_CAPACITY,
+            ef_construction=HNSW_EF_CONSTRUCTION,
+            M=HNSW_M,
+            allow_replace_deleted=True,
+        )
+        self._ef_search = ef_search
+        self._labels: Dict[str, int] = {}
+        self._ids: Dict[int, str] = {}
+        self._attributes: Dict[int, Hashable] = {}
+        self._attribute_counts: Counter = Counter()
+        self._labels_by_attribute: Dict[Hashable, Set[int]] = defaultdict(set)
+        # 정확 계산용 정규화 벡터 (라벨 순서)
+        self._vectors = np.zeros((INITIAL_CAPACITY, dim), np.float32)
+        self._free_labels: List[int] = []
+        self._next_label = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def ids(self) -> set:
+        with self._lock:
+            return set(self._labels)
+
+    def attribute_counts(self) -> Dict[Hashable, int]:
+        """
+        속성 키별 사용자 수
+        """
+        with self._lock:
+            return dict(self._attribute_counts)
+
+    def add(
+        self,
+        ids: List[str],
+        embeddings: Iterable[list],
+        attributes: List[Hashable],
+    ) -> None:
+        """
+        사용자 추가 (이미 있는 ID는 무시, 삭제된 라벨 재사용)
+        """
+        with self._lock:
+            rows = [
+                (user_id, embedding, attribute)
+                for user_id, embedding, attribute in zip(ids, embeddings, attributes)
+                if user_id not in self._labels
+            ]
+            if not rows:
+                return
+
+            labels = []
+            for user_id, _, attribute in rows:
+                if self._free_labels:
+                    label = self._free_labels.pop()
+                else:
+                    label = self._next_label
+                    self._next_label += 1
+                self._labels[user_id] = label
+                self._ids[label] = user_id
+                self._attributes[label] = attribute
+                self._attribute_counts[attribute] += 1
+                self._labels_by_attribute[attribute].add(label)
+                labels.append(label)
+
+            capacity = self._index.get_max_elements()
+            if self._next_label > capacity:
+                capacity = max(capacity * 2, self._next_label)
+                self._index.resize_index(capacity)
+                self._vectors.resize((capacity, self._vectors.shape[1]), refcheck=False)
+
+            vectors = np.asarray([embedding for _, embedding, _ in rows], np.float32)
+            self._index.add_items(vectors, labels, replace_deleted=True)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            self._vectors[labels] = vectors / np.clip(norms, 1e-12, None)
+
+    def remove(self, ids: Iterable[str]) -> None:
+        with self._lock:
+            for user_id in ids:
+                label = self._labels.pop(user_id, None)
+                if label is None:
+                    continue
+                self._index.mark_deleted(label)
+                attribute = self._attributes.pop(label)
+                self._attribute_counts[attribute] -= 1
+                self._labels_by_attribute[attribute].discard(label)
+                if not self._attribute_counts[attribute]:
+                    del self._attribute_counts[attribute]
+                    del self._labels_by_attribute[attribute]
+                del self._ids[label]
+                self._free_labels.append(label)
+
+    def query(
+        self,
+        embedding: list,
+        k: int,
+        exclude_id: Optional[str] = None,
+        attributes: Optional[Set[Hashable]] = None,
+    ) -> List[Tuple[str, float, Hashable]]:
+        """
+        기준 임베딩과 코사인 유사도가 높은 순서의 상위 k명
+
+        Args:
+            embedding: 기준 사용자 임베딩
+            k: 조회 수 (조건을 만족하는 사용자가 더 적으면 그 수만큼)
+            exclude_id: 제외할 사용자 ID (기준 사용자 본인)
+            attributes: 허용할 속성 키 집합 (없으면 전체)
+
+        Returns:
+            [(사용자 ID, 코사인 유사도, 속성 키)]
+        """
+        with self._lock:
+            excluded_label = self._labels.get(exclude_id)
+            if attributes is None:
+                eligible = len(self._labels)
+            else:
+                eligible = sum(self._attribute_counts.get(a, 0) for a in attributes)
+                if eligible <= BRUTE_FORCE_MAX_ELEMENTS:
+                    return self._exact_query(embedding, k, excluded_label, attributes)
+
+            excluded = excluded_label is not None and (
+                attributes is None or self._attributes[excluded_label] in attributes
+            )
+            # 본인은 필터 조건 대신 한 명 더 조회한 뒤 제거
+            fetch = min(k, eligible - excluded) + excluded
+            if fetch - excluded <= 0:
+                return []
+
+            if attributes is None:
+                label_filter = None
+            else:
+                stored = self._attributes
+                label_filter = lambda label: stored[label] in attributes  # noqa: E731
+            self._index.set_ef(max(self._ef_search, fetch))
+            labels, distances = self._index.knn_query(
+                np.asarray([embedding], np.float32), k=fetch, filter=label_filter
+            )
+            results = []
+            for label, distance in zip(labels[0].tolist(), distances[0].tolist()):
+                if label != excluded_label:
+                    results.append(
+                        (self._ids[label], 1.0 - distance, self._attributes[label])
+                    )
+            return results[:k]
+
+    def _exact_query(
+        self,
+        embedding: list,
+        k: int,
+        excluded_label: Optional[int],
+        attributes: Set[Hashable],
+    ) -> List[Tuple[str, float, Hashable]]:
+        labels = np.fromiter(
+            (
+                label
+                for attribute in attributes
+                for label in self._labels_by_attribute.get(attribute, ())
+                if label != excluded_label
+            ),
+            dtype=np.int64,
+        )
+        if not len(labels):
+            return []
+
+        query = np.asarray(embedding, np.float32)
+        similarities = self._vectors[labels] @ (
+            query / max(float(np.linalg.norm(query)), 1e-12)
+        )
+        k = min(k, len(labels))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [
+            (
+                self._ids[int(labels[i])],
+                float(similarities[i]),
+                self._attributes[int(labels[i])],
+            )
+            for i in top
+        ]
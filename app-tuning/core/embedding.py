@@ -1,8 +1,9 @@
 # 임베딩 모델을 통해 유저 관심사를 임베딩 벡터화
-from typing import List
+from typing import List, Tuple
 
+from models.batch_encoder import batch_encoder
 from models.sbert_loader import get_model
-from utils.logger import log_performance, logger
+from utils.logger import PERF_HOT_SAMPLE_EVERY, log_performance, logger
 
 
 def user_data_to_sentence(meta: dict) -> str:
@@ -61,7 +62,11 @@ def convert_user_to_text(data: dict, fields: List[str]) -> str:
 
 
 # 필드별 임베딩
-@log_performance(operation_name="embed_fields", include_memory=True)
+@log_performance(
+    operation_name="embed_fields",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
+)
 def embed_fields(user: dict, fields: list, model=None) -> dict:
     """
     개별 필드를 임베딩 벡터로 변환
@@ -105,11 +110,15 @@ def embed_fields(user: dict, fields: list, model=None) -> dict:
     return field_embeddings
 
 
-@log_performance(operation_name="embed_fields_optimized", include_memory=True)
+@log_performance(
+    operation_name="embed_fields_optimized",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
+)
 def embed_fields_optimized(user: dict, fields: list) -> dict:
     """
     최적화된 필드별 임베딩 벡터 생성
-    - 배치 처리로 한 번에 모든 필드 임베딩
+    - 배치 처리로 한 번에 모든 필드 임베딩 (동시 요청과 병합)
     - 캐시 활용으로 중복 계산 방지
 
     Args:
@@ -122,14 +131,26 @@ def embed_fields_optimized(user: dict, fields: list) -> dict:
     # 모델 인스턴스 획득
     model = get_model()
 
-    # 처리할 텍스트와 필드 매핑
-    field_texts = []
-    field_mapping = []
-
     # 임베딩 차원 (모델에서 가져오기)
     dim = model.get_sentence_embedding_dimension()
 
     # 각 필드별 텍스트 준비
+    field_texts, field_mapping = build_field_texts(user, fields)
+
+    # 배치 처리로 한 번에 임베딩 생성 (동시 요청과 병합되는 마이크로 배치 인코더 사용)
+    embeddings = batch_encoder.encode(field_texts) if field_texts else []
+    return map_field_embeddings(embeddings, field_mapping, fields, dim)
+
+
+def build_field_texts(user: dict, fields: list) -> Tuple[List[str], List[str]]:
+    """
+    필드별 임베딩 입력 텍스트 생성 (값이 비어 있는 필드는 제외)
+
+    Returns:
+        (텍스트 목록, 텍스트와 같은 순서의 필드명 목록)
+    """
+    field_texts = []
+    field_mapping = []
     for field in fields:
         value = user.get(field)
         if not value:
@@ -138,22 +159,19 @@ def embed_fields_optimized(user: dict, fields: list) -> dict:
         text = ", ".join(value) if isinstance(value, list) else str(value)
         field_texts.append(text)
         field_mapping.append(field)
+    return field_texts, field_mapping
 
-    # 배치 처리로 한 번에 임베딩 생성
-    if field_texts:
-        embeddings = model.encode(field_texts, show_progress_bar=False)
-
-        # 결과 매핑
-        field_embeddings = {}
-        for i, field in enumerate(field_mapping):
-            field_embeddings[field] = embeddings[i].tolist()
 
-        # 누락된 필드에 대해 빈 벡터 추가
-        for field in fields:
-            if field not in field_embeddings:
-                field_embeddings[field] = [0.0] * dim
-
-        return field_embeddings
-    else:
-        # 모든 필드가 비어 있는 경우
-        return {field: [0.0] * dim for field in fields}
+def map_field_embeddings(
+    embeddings, field_mapping: List[str], fields: list, dim: int
+) -> dict:
+    """
+    인코딩 결과를 {필드명: 임베딩 벡터}로 매핑 (누락된 필드는 0 벡터)
+    """
+    field_embeddings = {
+        field: embeddings[i].tolist() for i, field in enumerate(field_mapping)
+    }
+    for field in fields:
+        if field not in field_embeddings:
+            field_embeddings[field] = [0.0] * dim
+    return field_embeddings
@@ -0,0 +1,113 @@
+"""
+사용자 제외 집합(차단 / 매칭 완료 / 이미 노출) 비트맵 모듈
+정수형 userId를 비트 위치로 사용하는 압축 비트맵을 제공
+
+주요 기능:
+1. userId 추가/삭제/포함 여부 확인
+2. 여러 비트맵 합집합 (제외 집합 통합)
+3. 메타데이터 저장용 문자열 직렬화 (zlib 압축 + base64)
+
+userId는 순차 증가하는 정수이므로 비트맵 크기는 최대 userId / 8 바이트이며,
+연속 구간이 많을수록 zlib 압축 효율이 높아짐
+파이썬 정수 비트 연산은 비트 길이에 비례하므로 추가/삭제/포함 여부 확인도
+O(최대 userId) 비용이 들며, 비트맵 크기를 제한하기 위해 userId는 MAX_USER_ID 이하만 허용
+"""
+
+import base64
+import os
+import zlib
+from typing import Iterable, Iterator, Union
+
+# 비트맵에 저장할 수 있는 최대 userId (비트맵 최대 크기 = MAX_USER_ID / 8 바이트)
+MAX_USER_ID = int(os.getenv("EXCLUSION_MAX_USER_ID", "10000000"))
+
+
+class ExclusionBitmap:
+    """
+    userId 집합을 파이썬 정수 비트셋으로 표현하는 비트맵
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, user_ids: Iterable[Union[int, str]] = ()):
+        self._bits = 0
+        self.update(user_ids)
+
+    # ---------------------- 변경 연산 ----------------------
+    def add(self, user_id: Union[int, str]) -> None:
+        self._bits |= 1 << _to_bit(user_id)
+
+    def discard(self, user_id: Union[int, str]) -> None:
+        self._bits &= ~(1 << _to_bit(user_id))
+
+    def update(self, user_ids: Iterable[Union[int, str]]) -> None:
+        for user_id in user_ids:
+            self.add(user_id)
+
+    def difference_update(self, user_ids: Iterable[Union[int, str]]) -> None:
+        for user_id in user_ids:
+            self.discard(user_id)
+
+    # ---------------------- 조회 연산 ----------------------
+    def __contains__(self, user_id: Union[int, str]) -> bool:
+        try:
+            return bool(self._bits >> _to_bit(user_id) & 1)
+        except ValueError:
+            return False
+
+    def __or__(self, other: "ExclusionBitmap") -> "ExclusionBitmap":
+        merged = ExclusionBitmap()
+        merged._bits = self._bits | other._bits
+        return merged
+
+    def __iter__(self) -> Iterator[int]:
+        bits, offset = self._bits, 0
+        while bits:
+            # 최하위 1비트 위치를 찾아가며 순회 (설정된 비트 수만큼만 반복)
+            low = bits & -bits
+            position = low.bit_length() - 1
+            yield offset + position
+            bits >>= position + 1
+            offset += position + 1
+
+    def __len__(self) -> int:
+        return bin(self._bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ExclusionBitmap) and self._bits == other._bits
+
+    def __repr__(self) -> str:
+        return f"ExclusionBitmap(size={len(self)})"
+
+    # ---------------------- 직렬화 ----------------------
+    def to_string(self) -> str:
+        """
+        비트맵을 메타데이터 저장용 문자열로 직렬화 (빈 비트맵은 빈 문자열)
+        """
+        if not self._bits:
+            return ""
+        raw = self._bits.to_bytes((self._bits.bit_length() + 7) // 8, "little")
+        return base64.b64encode(zlib.compress(raw)).decode("ascii")
+
+    @classmethod
+    def from_string(cls, value: str) -> "ExclusionBitmap":
+        """
+        to_string()으로 직렬화된 문자열에서 비트맵 복원
+        """
+        bitmap = cls()
+        if value:
+            raw = zlib.decompress(base64.b64decode(value))
+            bitmap._bits = int.from_bytes(raw, "little")
+        return bitmap
+
+
+def _to_bit(user_id: Union[int, str]) -> int:
+    position = int(user_id)
+    if position < 0:
+        raise ValueError(f"userId는 음수가 될 수 없습니다: {user_id}")
+    if position > MAX_USER_ID:
+        raise ValueError(f"userId는 {MAX_USER_ID} 이하여야 합니다: {user_id}")
+    return position
@@ -12,14 +12,22 @@
 """
 
 import json
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from core.embedding import user_data_to_sentence
+from core.score_components import (
+    COMPONENT_DTYPE,
+    RULE_WEIGHTS,
+    component_weight_vector,
+    pack_components,
+)
+from models.bucketed_encoder import encode_length_bucketed
 from models.sbert_loader import get_model
 from sklearn.metrics.pairwise import cosine_similarity
-from utils.logger import log_performance
+from utils.logger import PERF_HOT_SAMPLE_EVERY, log_performance
+from utils.tracing import span
 
 # ---------------------- 상수 정의 ----------------------
 # 모델 임베딩 차원 및 가중치 상수
@@ -59,6 +67,13 @@ MBTI_COMPATIBILITY = {
     "ESFP": ["ISFJ", "ISTJ"],
 }
 
+# 매칭 카테고리 및 카테고리별 가중치 (임베딩 유사도 / 규칙 기반 유사도)
+CATEGORIES = ["friend", "couple"]
+WEIGHTS_BY_CATEGORY = {
+    "friend": {"embedding": 0.7, "rule": 0.3},
+    "couple": {"embedding": 0.6, "rule": 0.4},
+}
+
 # 연령대 그룹 정의 및 순서 설정
 AGE_GROUPS = {
     "AGE_10S": 1,
@@ -267,7 +282,7 @@ def rule_based_similarity_v3(user1: dict, user2: dict) -> float:
     # - MBTI 호환성: 50%
     # - 연령대 일치도: 50%
 
-    final_score = mbti_score * 0.5 + age_score * 0.5
+    final_score = mbti_score * RULE_WEIGHTS["mbti"] + age_score * RULE_WEIGHTS["age"]
 
     # 소수점 6자리로 반올림하여 반환
     return round(final_score, 6)
@@ -320,7 +335,11 @@ def combine_embeddings(
     return 0.6 * norm_profile + 0.4 * norm_fields
 
 
-@log_performance(operation_name="compute_matching_score", include_memory=True)
+@log_performance(
+    operation_name="compute_matching_score",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
+)
 def compute_matching_score(
     user_id: str,
     user_embedding: List[float],
@@ -414,62 +433,222 @@ def compute_matching_score_sentence_based(
     """
     문장 임베딩 기반 매칭 점수 계산 (유저 메타데이터를 한국어 문장으로 변환 후 임베딩)
     """
+    return compute_matching_scores_by_categories(
+        user_id=user_id,
+        user_meta=user_meta,
+        all_users=all_users,
+        categories=[category],
+    )[category]
 
-    # 1. 가중치 정의
-    weights_by_category = {
-        "friend": {"embedding": 0.7, "rule": 0.3},
-        "couple": {"embedding": 0.6, "rule": 0.4},
-    }
-    weights = weights_by_category.get(category, weights_by_category["friend"])
-    embedding_weight = weights["embedding"]
-    rule_weight = weights["rule"]
 
-    # 2. 데이터를 Pandas DataFrame으로 변환 (한 번만 수행)
-    df = pd.DataFrame(all_users["metadatas"])
-    df["id"] = all_users["ids"]
+def compute_matching_scores_by_categories(
+    user_id: str,
+    user_meta: dict,
+    all_users: dict,
+    categories: List[str] = CATEGORIES,
+    weights_by_category: Optional[Dict[str, dict]] = None,
+) -> Dict[str, dict]:
+    """
+    문장 임베딩 기반 매칭 점수를 여러 카테고리에 대해 한 번에 계산
+    (점수 구성 요소 없이 점수만 필요한 경우, compute_matching_scores_with_components 참고)
 
-    # 3. Pandas를 이용한 초고속 필터링
-    domain = user_meta.get("emailDomain")  # noqa: F841
-    my_gender = user_meta.get("gender")  # noqa: F841
+    Returns:
+        {카테고리: {사용자 ID: 매칭 점수}}
+    """
+    return compute_matching_scores_with_components(
+        user_id, user_meta, all_users, categories, weights_by_category
+    )[0]
 
-    # 기본 필터링 조건
-    query = "(id != @user_id) & (emailDomain == @domain)"
-    if category == "couple" and my_gender:
-        query += " & (gender != @my_gender)"
 
-    filtered_df = df.query(query).reset_index()  # 쿼리를 통해 조건에 맞는 사용자만 선택
+def compute_matching_scores_with_components(
+    user_id: str,
+    user_meta: dict,
+    all_users: dict,
+    categories: List[str] = CATEGORIES,
+    weights_by_category: Optional[Dict[str, dict]] = None,
+) -> Tuple[Dict[str, dict], Dict[str, Optional[dict]]]:
+    """
+    문장 임베딩 기반 매칭 점수와 점수 구성 요소를 여러 카테고리에 대해 한 번에 계산
+    카테고리 간 차이는 성별 필터와 가중치뿐이므로, 도메인 후보 필터링/문장 임베딩/
+    코사인 유사도/규칙 기반 점수는 한 번만 계산하고 카테고리별로 마스킹 및 가중치만 다르게 적용
 
-    if filtered_df.empty:
-        return {}
+    Args:
+        user_id: 기준 사용자 ID
+        user_meta: 기준 사용자의 메타데이터
+        all_users: 전체 사용자 데이터 (IDs, 임베딩, 메타데이터)
+        categories: 계산할 카테고리 목록 ("friend", "couple")
+        weights_by_category: 카테고리별 가중치 (없으면 WEIGHTS_BY_CATEGORY)
 
-    # 4. 임베딩 계산 (필터링된 사용자에 대해서만 수행)
-    model = get_model()
+    Returns:
+        ({카테고리: {사용자 ID: 매칭 점수}}, {카테고리: 직렬화된 점수 구성 요소 또는 None})
+    """
+    results = {category: {} for category in categories}
+    packed = {category: None for category in categories}
 
-    my_text = user_data_to_sentence(user_meta)
-    my_embedding = model.encode(my_text, show_progress_bar=False)
+    # 1. 데이터를 Pandas DataFrame으로 변환 (한 번만 수행)
+    with span("dataframe_filter", users=len(all_users["ids"])) as current:
+        df = pd.DataFrame(all_users["metadatas"])
+        df["id"] = all_users["ids"]
 
-    other_texts = filtered_df.apply(user_data_to_sentence, axis=1).tolist()
-    other_embeddings_matrix = model.encode(other_texts, show_progress_bar=False)
+        # 2. 도메인 기준 후보 필터링 (모든 카테고리 공통)
+        domain = user_meta.get("emailDomain")  # noqa: F841
+        my_gender = user_meta.get("gender")
 
-    # 5. 유사도 및 점수 계산 (벡터화 연산)
-    cosine_sims = cosine_similarity([my_embedding], other_embeddings_matrix)[0]
+        filtered_df = df.query(
+            "(id != @user_id) & (emailDomain == @domain)"
+        ).reset_index()
+        if current is not None:
+            current.attributes["candidates"] = len(filtered_df)
 
-    # 규칙 기반 유사도 계산
-    # rule_sims = calculate_rule_scores_in_batch(user_meta, filtered_df)
+    if filtered_df.empty:
+        return results, packed
+
+    # 3. 임베딩 계산 (필터링된 사용자에 대해서만, 한 번만 수행)
+    with span("encode_candidates", candidates=len(filtered_df)):
+        model = get_model()
+
+        my_text = user_data_to_sentence(user_meta)
+        my_embedding = model.encode(my_text, show_progress_bar=False)
+
+        # 사용자별 계산은 후보 수가 도메인 크기로 작으므로 한 번의 encode로 처리
+        # (길이 버킷은 버킷 구성을 위한 토큰화가 추가되고 작은 호출로 쪼개지므로 일괄 경로에서만 사용)
+        other_texts = filtered_df.apply(user_data_to_sentence, axis=1).tolist()
+        other_embeddings_matrix = model.encode(other_texts, show_progress_bar=False)
+
+    # 4. 점수 구성 요소 계산 (코사인 / MBTI / 연령대, 벡터화 연산, 한 번만 수행)
+    with span("rule_scoring"):
+        cosine_sims = cosine_similarity([my_embedding], other_embeddings_matrix)[0]
+        others = filtered_df.to_dict("records")
+        components = np.column_stack(
+            [
+                cosine_sims,
+                [
+                    mbti_weighted_score(user_meta.get("MBTI"), o.get("MBTI"))
+                    for o in others
+                ],
+                [
+                    age_group_match_score(user_meta.get("ageGroup"), o.get("ageGroup"))
+                    for o in others
+                ],
+            ]
+        )
+        genders = filtered_df["gender"].to_numpy() if "gender" in filtered_df else None
+
+    # 5. 카테고리별 후보 마스킹 및 가중치 적용
+    with span("blend", categories=len(categories)):
+        return _blend_by_categories(
+            filtered_df["id"].to_numpy(),
+            components,
+            genders,
+            my_gender,
+            categories,
+            weights_by_category or WEIGHTS_BY_CATEGORY,
+        )
 
-    rule_sims = np.array(
-        [
-            rule_based_similarity_v3(user_meta, row.to_dict())
-            for _, row in filtered_df.iterrows()
-        ]
-    )
 
-    final_scores = embedding_weight * cosine_sims + rule_weight * rule_sims
+def _blend_by_categories(
+    other_ids: np.ndarray,
+    components: np.ndarray,
+    genders: Optional[np.ndarray],
+    my_gender: Optional[str],
+    categories: List[str],
+    weights_by_category: Dict[str, dict],
+) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """
+    카테고리별 성별 마스킹 후 구성 요소에 가중치를 적용하여 점수 계산
+    (카테고리별 후보의 구성 요소도 함께 직렬화)
+    """
+    # 저장 정밀도로 맞춘 값으로 점수를 계산해야 저장된 구성 요소의 재조합 결과와 일치
+    components = components.astype(COMPONENT_DTYPE)
+    results, packed = {}, {}
+    for category in categories:
+        weights = weights_by_category.get(category, weights_by_category["friend"])
+
+        if category == "couple" and my_gender and genders is not None:
+            # 커플 카테고리: 성별이 다른 사용자만
+            mask = genders != my_gender
+        else:
+            mask = np.ones(len(other_ids), dtype=bool)
+
+        final_scores = components[mask] @ component_weight_vector(weights)
+
+        results[category] = {
+            other_id: round(float(score), 6)
+            for other_id, score in zip(other_ids[mask], final_scores)
+        }
+        packed[category] = pack_components(other_ids[mask], components[mask])
+    return results, packed
+
+
+def iter_domain_matching_scores(
+    ids: List[str],
+    metadatas: List[dict],
+    categories: List[str] = CATEGORIES,
+    weights_by_category: Optional[Dict[str, dict]] = None,
+) -> Iterator[Tuple[str, Dict[str, dict], Dict[str, dict]]]:
+    """
+    같은 도메인 사용자 전체의 카테고리별 매칭 점수를 한 번의 임베딩으로 계산 (일괄 등록용)
+    사용자별 계산(compute_matching_scores_with_components)과 같은 문장/가중치/성별 필터를
+    적용하되, 문장 임베딩은 도메인 전체를 한 번만 인코딩하고 점수는 사용자 한 명씩
+    행 단위로 산출 (메모리 사용량은 사용자 수에 비례)
 
-    # 6. 최종 결과 생성
-    similarities = {
-        other_id: round(score, 6)
-        for other_id, score in zip(filtered_df["id"], final_scores)
-    }
+    Args:
+        ids: 도메인 사용자 ID 목록
+        metadatas: ids와 같은 순서의 사용자 메타데이터
+        categories: 계산할 카테고리 목록 ("friend", "couple")
+        weights_by_category: 카테고리별 가중치 (없으면 WEIGHTS_BY_CATEGORY)
+
+    Yields:
+        (사용자 ID, {카테고리: {상대 사용자 ID: 매칭 점수}},
+         {카테고리: 직렬화된 점수 구성 요소})
+    """
+    if not ids:
+        return
+
+    df = pd.DataFrame(metadatas)
+    other_ids = np.asarray(ids)
+    weights_by_category = weights_by_category or WEIGHTS_BY_CATEGORY
+
+    # 1. 도메인 전체 문장 임베딩 (한 번만 수행, 길이 버킷 단위)
+    texts = df.apply(user_data_to_sentence, axis=1).tolist()
+    embeddings = encode_length_bucketed(get_model(), texts)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+    # 2. 규칙 기반 구성 요소는 MBTI / 연령대 값에만 의존하므로 값 조합 간 표로 계산
+    records = df.to_dict("records")
+    mbti_values = [record.get("MBTI") for record in records]
+    age_values = [record.get("ageGroup") for record in records]
+    mbti_index, mbti_table = _pairwise_table(mbti_values, mbti_weighted_score)
+    age_index, age_table = _pairwise_table(age_values, age_group_match_score)
+    genders = df["gender"].to_numpy() if "gender" in df else None
+
+    # 3. 사용자별 구성 요소 행 계산 및 카테고리별 마스킹/가중치 적용
+    for i, user_id in enumerate(ids):
+        others = np.arange(len(ids)) != i
+        components = np.column_stack(
+            [
+                embeddings[others] @ embeddings[i],
+                mbti_table[mbti_index[i], mbti_index[others]],
+                age_table[age_index[i], age_index[others]],
+            ]
+        )
+        scores, packed = _blend_by_categories(
+            other_ids[others],
+            components,
+            genders[others] if genders is not None else None,
+            genders[i] if genders is not None else None,
+            categories,
+            weights_by_category,
+        )
+        yield user_id, scores, packed
 
-    return similarities
+
+def _pairwise_table(values: list, score_fn) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    값 목록의 고유값 간 점수 표와 값별 표 인덱스 생성
+    """
+    unique_values = list(dict.fromkeys(values))
+    index = {value: i for i, value in enumerate(unique_values)}
+    table = np.array([[score_fn(a, b) for b in unique_values] for a in unique_values])
+    return np.array([index[value] for value in values]), table
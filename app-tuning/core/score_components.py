@@ -0,0 +1,78 @@
+"""
+매칭 점수 구성 요소 저장/재조합 모듈
+최종 매칭 점수 = embedding x 코사인 + rule x (mbti x MBTI 점수 + age x 연령대 점수) 이므로,
+쌍별 구성 요소(코사인, MBTI, 연령대)를 저장해 두면 가중치 변경 시 모델 호출 없이
+벡터 연산만으로 점수를 다시 계산할 수 있음
+
+주요 기능:
+1. 구성 요소 행렬의 압축 직렬화 (float32 + base64, 상대 ID 목록은 쉼표 구분 문자열)
+2. 카테고리별 가중치 → 구성 요소 가중치 벡터 변환 및 검증
+"""
+
+import base64
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 구성 요소 순서 (저장 행렬의 열 순서)
+COMPONENT_NAMES = ("cosine", "mbti", "age")
+
+# 유사도 문서 메타데이터 필드명
+COMPONENT_IDS_FIELD = "componentIds"
+COMPONENTS_FIELD = "components"
+
+# 구성 요소 저장 정밀도 (점수는 소수점 6자리로 저장되므로 유효숫자 약 3자리인 float16은 재조합 오차가 큼)
+COMPONENT_DTYPE = np.float32
+
+# 규칙 기반 유사도 내부 가중치 (MBTI 호환성 / 연령대 일치도)
+RULE_WEIGHTS = {"mbti": 0.5, "age": 0.5}
+
+
+def pack_components(other_ids, components: np.ndarray) -> Dict[str, str]:
+    """
+    구성 요소 행렬을 유사도 문서 메타데이터 필드로 직렬화
+
+    Args:
+        other_ids: 상대 사용자 ID 목록 (행 순서)
+        components: (상대 수 x 3) 구성 요소 행렬 (COMPONENT_NAMES 순서)
+
+    Returns:
+        {"componentIds": "id1,id2,...", "components": base64(float32 행렬)}
+    """
+    matrix = np.ascontiguousarray(components, dtype=COMPONENT_DTYPE)
+    return {
+        COMPONENT_IDS_FIELD: ",".join(str(other_id) for other_id in other_ids),
+        COMPONENTS_FIELD: base64.b64encode(matrix.tobytes()).decode("ascii"),
+    }
+
+
+def unpack_components(metadata: dict) -> Optional[Tuple[List[str], np.ndarray]]:
+    """
+    유사도 문서 메타데이터에서 구성 요소 복원 (저장되지 않은 문서는 None)
+
+    Returns:
+        (상대 사용자 ID 목록, (상대 수 x 3) float32 구성 요소 행렬)
+    """
+    encoded = metadata.get(COMPONENTS_FIELD)
+    if not encoded:
+        return None
+    other_ids = metadata.get(COMPONENT_IDS_FIELD, "").split(",")
+    matrix = np.frombuffer(base64.b64decode(encoded), dtype=COMPONENT_DTYPE)
+    return other_ids, matrix.reshape(len(other_ids), len(COMPONENT_NAMES))
+
+
+def component_weight_vector(weights: dict) -> np.ndarray:
+    """
+    카테고리 가중치를 구성 요소 가중치 벡터로 변환
+
+    Args:
+        weights: {"embedding": float, "rule": float} (+ 선택: "mbti", "age" 규칙 내부 가중치)
+
+    Returns:
+        COMPONENT_NAMES 순서의 가중치 벡터 [embedding, rule x mbti, rule x age]
+    """
+    mbti = weights.get("mbti", RULE_WEIGHTS["mbti"])
+    age = weights.get("age", RULE_WEIGHTS["age"])
+    return np.array(
+        [weights["embedding"], weights["rule"] * mbti, weights["rule"] * age]
+    )
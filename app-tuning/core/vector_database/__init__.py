@@ -1,30 +1,52 @@
 from .client import get_chroma_client
 from .collections import (
+    get_exclusion_collection,
+    get_scoring_profile_collection,
     get_similarity_collection,
     get_user_collection,
     reset_collections,
 )
+from .exclusion_repository import delete_exclusions, get_exclusions, upsert_exclusions
+from .scoring_profile_repository import get_weight_profile, upsert_weight_profile
 from .similarity_repository import (
     clean_up_similarity,
     clean_up_similarity_v3,
     get_similarities,
     get_user_similarities,
+    iter_similarities,
     list_similarities,
 )
-from .user_repository import delete_user, delete_user_v3, get_users_data, list_users
+from .user_repository import (
+    delete_user,
+    delete_user_v3,
+    get_users_data,
+    iter_users,
+    list_users,
+    query_similar_users,
+)
 
 __all__ = [
     "get_chroma_client",
+    "get_exclusion_collection",
+    "get_scoring_profile_collection",
     "get_similarity_collection",
     "get_user_collection",
     "reset_collections",
+    "delete_exclusions",
+    "get_exclusions",
+    "upsert_exclusions",
+    "get_weight_profile",
+    "upsert_weight_profile",
     "clean_up_similarity",
     "clean_up_similarity_v3",
     "get_user_similarities",
     "get_similarities",
+    "iter_similarities",
     "list_similarities",
     "delete_user",
     "delete_user_v3",
     "get_users_data",
+    "iter_users",
     "list_users",
+    "query_similar_users",
 ]
@@ -5,6 +5,7 @@ import requests
 from utils.logger import logger
 
 import chromadb
+from chromadb.config import Settings
 
 chroma_client = None
 
@@ -70,6 +71,11 @@ def get_chroma_client():
             )
             chroma_path = os.path.join(base_dir, "chroma_db")
             chroma_client = chromadb.PersistentClient(path=chroma_path)
+        elif mode == "ephemeral":
+            # 프로세스 메모리 내 클라이언트 (부하 테스트 / 벤치마크용, 종료 시 데이터 삭제)
+            chroma_client = chromadb.EphemeralClient(
+                Settings(anonymized_telemetry=False, allow_reset=True)
+            )
         else:
             # 서버 모드 (기본)
             host = os.getenv("CHROMA_HOST", "localhost")
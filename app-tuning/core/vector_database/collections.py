@@ -1,6 +1,9 @@
+import threading
 from typing import Optional
 
 from utils.logger import logger
+from utils.metrics import metrics_registry, timed
+from utils.tracing import add_chroma_bytes, span
 
 from .client import get_chroma_client
 
@@ -8,6 +11,11 @@ USER_COLLECTION_NAME = "user_profiles"
 SIMILARITY_COLLECTION_NAME = "user_similarities"
 FRIEND_SIMILARITY_COLLECTION_NAME = "friend_similarities"
 COUPLE_SIMILARITY_COLLECTION_NAME = "couple_similarities"
+EXCLUSION_COLLECTION_NAME = "user_exclusions"
+SCORING_PROFILE_COLLECTION_NAME = "scoring_profiles"
+# 컬렉션 생성 시 메타데이터 (사용자 프로필은 벡터 조회 순서가 매칭 점수의 코사인과 같도록 cosine 공간)
+# 이미 생성된 컬렉션의 거리 공간은 바뀌지 않으므로, 기존 컬렉션은 재생성해야 적용됨
+COLLECTION_METADATA = {USER_COLLECTION_NAME: {"hnsw:space": "cosine"}}
 COLLECTION_MAP = {
     None: ("user_similarity", SIMILARITY_COLLECTION_NAME),
     "friend": ("friend_similarity", FRIEND_SIMILARITY_COLLECTION_NAME),
@@ -15,6 +23,73 @@ COLLECTION_MAP = {
 }
 
 
+# 호출 시간을 기록할 Chroma 컬렉션 메서드
+INSTRUMENTED_METHODS = frozenset(
+    ["add", "count", "delete", "get", "peek", "query", "update", "upsert"]
+)
+metrics_registry.describe(
+    "chroma_operations",
+    "chroma_operation_duration_seconds",
+    "Chroma 컬렉션 호출 시간",
+    ("collection", "operation"),
+)
+metrics_registry.describe(
+    "cache_requests",
+    "cache_requests",
+    "프로세스 내 캐시 조회 결과별 횟수",
+    ("cache", "result"),
+)
+
+
+class InstrumentedCollection:
+    """
+    Chroma 컬렉션 호출 시간을 (컬렉션, 메서드)별 히스토그램에 기록하는 래퍼
+    진행 중인 추적이 있으면 호출마다 chroma.<메서드> 구간과 송수신 바이트(근사값)도 기록
+    기록 대상이 아닌 속성/메서드는 원래 컬렉션으로 그대로 위임
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, attribute):
+        value = getattr(self._collection, attribute)
+        if attribute not in INSTRUMENTED_METHODS:
+            return value
+
+        def call(*args, **kwargs):
+            name = self._collection.name
+            with timed("chroma_operations", (name, attribute)):
+                with span(f"chroma.{attribute}", collection=name) as current:
+                    result = value(*args, **kwargs)
+                    if current is not None:
+                        add_chroma_bytes(
+                            payload_bytes(args) + payload_bytes(kwargs),
+                            payload_bytes(result),
+                        )
+                    return result
+
+        return call
+
+
+def payload_bytes(value) -> int:
+    """
+    Chroma 요청/응답 크기 근사값 (문자열은 길이, 임베딩은 float32 기준, 그 외 값은 8바이트)
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(len(str(key)) + payload_bytes(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], float):
+            return 4 * len(value)
+        return sum(payload_bytes(item) for item in value)
+    return 8
+
+
 def _is_alive(collection) -> bool:
     try:
         collection.count()  # 헬스 체크
@@ -25,6 +100,7 @@ def _is_alive(collection) -> bool:
 
 
 _collection_cache = {}
+_collection_lock = threading.Lock()
 
 
 def _get_or_create_collection(cache_key, collection_name):
@@ -32,6 +108,7 @@ def _get_or_create_collection(cache_key, collection_name):
 
     if collection:
         if _is_alive(collection):
+            metrics_registry.increment("cache_requests", ("chroma_collection", "hit"))
             return collection
         else:
             logger.warning(
@@ -39,22 +116,42 @@ def _get_or_create_collection(cache_key, collection_name):
             )
             _collection_cache[cache_key] = None  # 무효화
 
-    client = get_chroma_client()
-    if client is None:
-        raise RuntimeError("ChromaDB 클라이언트를 사용할 수 없습니다.")
+    metrics_registry.increment("cache_requests", ("chroma_collection", "miss"))
+    # 동시 요청이 같은 컬렉션을 함께 생성하면 로컬 Chroma(PersistentClient / EphemeralClient)는
+    # 중복 생성 오류가 발생하므로 클라이언트 연결과 컬렉션 생성은 한 번에 하나씩 수행
+    with _collection_lock:
+        cached = _collection_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-    try:
-        collection = client.get_or_create_collection(collection_name)
-        _collection_cache[cache_key] = collection
-        return collection
-    except Exception as e:
-        raise RuntimeError(f"{collection_name} 컬렉션 초기화 실패: {e}") from e
+        client = get_chroma_client()
+        if client is None:
+            raise RuntimeError("ChromaDB 클라이언트를 사용할 수 없습니다.")
+
+        try:
+            collection = InstrumentedCollection(
+                client.get_or_create_collection(
+                    collection_name, metadata=COLLECTION_METADATA.get(collection_name)
+                )
+            )
+            _collection_cache[cache_key] = collection
+            return collection
+        except Exception as e:
+            raise RuntimeError(f"{collection_name} 컬렉션 초기화 실패: {e}") from e
 
 
 def get_user_collection():
     return _get_or_create_collection("user", USER_COLLECTION_NAME)
 
 
+def get_exclusion_collection():
+    return _get_or_create_collection("exclusion", EXCLUSION_COLLECTION_NAME)
+
+
+def get_scoring_profile_collection():
+    return _get_or_create_collection("scoring_profile", SCORING_PROFILE_COLLECTION_NAME)
+
+
 def get_similarity_collection(category: Optional[str] = None):
     """
     카테고리에 따라 적절한 similarity 컬렉션을 반환합니다.
@@ -95,6 +192,8 @@ def reset_collections():
             FRIEND_SIMILARITY_COLLECTION_NAME: "_friend_similarity_collection",
             COUPLE_SIMILARITY_COLLECTION_NAME: "_couple_similarity_collection",
             SIMILARITY_COLLECTION_NAME: "_similarity_collection",
+            EXCLUSION_COLLECTION_NAME: "_exclusion_collection",
+            SCORING_PROFILE_COLLECTION_NAME: "_scoring_profile_collection",
         }
 
         # 삭제 + 재생성 + 전역 초기화
@@ -104,7 +203,9 @@ def reset_collections():
             except Exception as e:
                 logger.error(f"⚠️ 컬렉션 삭제 실패 [{collection_name}]: {e}")
 
-            collection = client.get_or_create_collection(collection_name)
+            collection = client.get_or_create_collection(
+                collection_name, metadata=COLLECTION_METADATA.get(collection_name)
+            )
             globals()[global_var] = collection  # 전역 변수 초기화 (제거 여부 확인 필요)
 
         logger.info("✅ 모든 컬렉션 초기화 및 전역 변수 설정 완료")
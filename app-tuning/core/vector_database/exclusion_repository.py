@@ -0,0 +1,48 @@
+from typing import Dict
+
+from .collections import get_exclusion_collection
+
+# 제외 집합 컬렉션은 메타데이터 조회 전용이지만 Chroma는 임베딩을 필수로 요구하므로
+# 1차원 고정 벡터를 저장 (유사도 검색에는 사용하지 않음)
+PLACEHOLDER_EMBEDDING = [0.0]
+
+
+def get_exclusions(user_id: str) -> Dict[str, str]:
+    """
+    특정 사용자의 제외 집합 메타데이터 조회
+
+    Args:
+        user_id (str): 사용자 ID
+
+    Returns:
+        dict: {종류: 직렬화된 비트맵 문자열}, 저장된 데이터가 없으면 빈 딕셔너리
+    """
+    result = get_exclusion_collection().get(ids=[str(user_id)], include=["metadatas"])
+    if not result.get("metadatas") or result["metadatas"][0] is None:
+        return {}
+    metadata = dict(result["metadatas"][0])
+    metadata.pop("userId", None)
+    return metadata
+
+
+def upsert_exclusions(user_id: str, exclusions: Dict[str, str]) -> None:
+    """
+    특정 사용자의 제외 집합 메타데이터 저장
+
+    Args:
+        user_id (str): 사용자 ID
+        exclusions (dict): {종류: 직렬화된 비트맵 문자열}
+    """
+    user_id = str(user_id)
+    get_exclusion_collection().upsert(
+        ids=[user_id],
+        embeddings=[PLACEHOLDER_EMBEDDING],
+        metadatas=[{"userId": user_id, **exclusions}],
+    )
+
+
+def delete_exclusions(user_id: str) -> None:
+    """
+    특정 사용자의 제외 집합 삭제 (사용자 삭제 시 정리용)
+    """
+    get_exclusion_collection().delete(ids=[str(user_id)])
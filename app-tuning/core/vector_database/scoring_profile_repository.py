@@ -0,0 +1,39 @@
+import json
+from typing import Dict, Optional
+
+from .collections import get_scoring_profile_collection
+
+# 활성 가중치 프로필 문서 ID
+ACTIVE_PROFILE_ID = "active"
+# 프로필 컬렉션은 메타데이터 조회 전용이지만 Chroma는 임베딩을 필수로 요구하므로
+# 1차원 고정 벡터를 저장 (유사도 검색에는 사용하지 않음)
+PLACEHOLDER_EMBEDDING = [0.0]
+
+
+def get_weight_profile() -> Optional[Dict[str, dict]]:
+    """
+    활성 카테고리별 가중치 프로필 조회
+
+    Returns:
+        dict: {카테고리: 가중치}, 저장된 프로필이 없으면 None
+    """
+    result = get_scoring_profile_collection().get(
+        ids=[ACTIVE_PROFILE_ID], include=["metadatas"]
+    )
+    if not result.get("metadatas") or result["metadatas"][0] is None:
+        return None
+    return json.loads(result["metadatas"][0]["weights"])
+
+
+def upsert_weight_profile(weights_by_category: Dict[str, dict]) -> None:
+    """
+    활성 카테고리별 가중치 프로필 저장
+
+    Args:
+        weights_by_category (dict): {카테고리: {"embedding", "rule", "mbti", "age"}}
+    """
+    get_scoring_profile_collection().upsert(
+        ids=[ACTIVE_PROFILE_ID],
+        embeddings=[PLACEHOLDER_EMBEDDING],
+        metadatas=[{"weights": json.dumps(weights_by_category)}],
+    )
@@ -1,5 +1,6 @@
+import asyncio
 import json
-from typing import Optional
+from typing import Iterator, Optional
 
 from fastapi import HTTPException
 from utils.logger import logger
@@ -155,10 +156,39 @@ async def get_similarities(
     """
     collection = get_similarity_collection(category=category)
 
+    # 동기 Chroma 호출은 스레드에서 실행하여 이벤트 루프를 막지 않음
     if user_id:
-        return collection.get(ids=user_id, include=["metadatas"])
+        return await asyncio.to_thread(
+            collection.get, ids=user_id, include=["metadatas"]
+        )
     else:
-        return collection.get()
+        return await asyncio.to_thread(collection.get)
+
+
+def iter_similarities(
+    category: Optional[str] = None, page_size: int = 500
+) -> Iterator[dict]:
+    """
+    유사도 메타데이터를 페이지 단위로 조회 (limit/offset)
+    대용량 컬렉션에서도 메모리 사용량이 페이지 크기로 제한됨
+
+    Args:
+        category (str, optional): 'friend' 또는 'couple'
+        page_size (int): 한 번에 조회할 문서 수
+
+    Yields:
+        dict: 페이지별 컬렉션 조회 결과 (메타데이터 포함)
+    """
+    collection = get_similarity_collection(category=category)
+    offset = 0
+    while True:
+        page = collection.get(limit=page_size, offset=offset, include=["metadatas"])
+        if not page.get("ids"):
+            return
+        yield page
+        if len(page["ids"]) < page_size:
+            return
+        offset += page_size
 
 
 # ---------------------아래 함수를 위의 get_similarities()하나로 사용할 예정
@@ -167,7 +197,7 @@ async def get_user_similarities(user_id: str):
     특정 사용자 ID에 대한 유사도 메타데이터 조회
     """
     collection = get_similarity_collection()
-    return collection.get(ids=user_id, include=["metadatas"])
+    return await asyncio.to_thread(collection.get, ids=user_id, include=["metadatas"])
 
 
 async def list_similarities():
@@ -175,4 +205,4 @@ async def list_similarities():
     전체 유사도 목록 조회
     """
     collection = get_similarity_collection()
-    return collection.get()
+    return await asyncio.to_thread(collection.get)
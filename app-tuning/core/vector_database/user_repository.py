@@ -1,7 +1,11 @@
+import asyncio
+from typing import Iterator, Optional
+
 from fastapi import HTTPException
 from utils.logger import logger
 
 from .collections import get_similarity_collection, get_user_collection
+from .exclusion_repository import delete_exclusions
 
 
 def get_user_data(user_id: str):
@@ -25,7 +29,8 @@ async def get_users_data(user_ids: list[str]):
     여러 사용자 ID에 대한 메타데이터 조회
     """
     collection = get_user_collection()
-    return collection.get(ids=user_ids, include=["metadatas"])
+    # 동기 Chroma 호출은 스레드에서 실행하여 이벤트 루프를 막지 않음
+    return await asyncio.to_thread(collection.get, ids=user_ids, include=["metadatas"])
 
 
 async def list_users():
@@ -33,7 +38,70 @@ async def list_users():
     전체 사용자 목록 조회
     """
     collection = get_user_collection()
-    return collection.get()
+    return await asyncio.to_thread(collection.get)
+
+
+def iter_users(page_size: int = 500, include: list = None) -> Iterator[dict]:
+    """
+    전체 사용자 목록을 페이지 단위로 조회 (limit/offset)
+    한 번에 전체 컬렉션을 메모리에 올리지 않도록 페이지마다 결과를 반환
+
+    Args:
+        page_size (int): 한 번에 조회할 문서 수
+        include (list, optional): 조회할 필드 목록 (기본값: ids만 조회)
+
+    Yields:
+        dict: 페이지별 컬렉션 조회 결과
+    """
+    collection = get_user_collection()
+    offset = 0
+    while True:
+        page = collection.get(limit=page_size, offset=offset, include=include or [])
+        if not page.get("ids"):
+            return
+        yield page
+        if len(page["ids"]) < page_size:
+            return
+        offset += page_size
+
+
+def query_similar_users(
+    embedding: list,
+    n_results: int,
+    email_domain: str,
+    exclude_gender: Optional[str] = None,
+    exclude_id: Optional[str] = None,
+) -> dict:
+    """
+    같은 도메인(선택: 다른 성별) 사용자 중 임베딩이 가까운 상위 n_results명 조회
+    메타데이터 필터와 최근접 탐색을 Chroma가 처리하므로 컬렉션 전체를 내려받지 않음
+
+    Args:
+        embedding: 기준 사용자 임베딩
+        n_results: 조회 수 (조건을 만족하는 사용자가 더 적으면 그 수만큼)
+        email_domain: 도메인 조건
+        exclude_gender: 제외할 성별 (couple 후보 조회 시 기준 사용자의 성별)
+        exclude_id: 결과에서 제외할 사용자 ID (기준 사용자 본인)
+
+    Returns:
+        {"ids", "embeddings", "metadatas", "distances"} (가까운 순서)
+    """
+    where = {"emailDomain": email_domain}
+    if exclude_gender:
+        where = {"$and": [where, {"gender": {"$ne": exclude_gender}}]}
+
+    # 본인이 결과에 포함될 수 있으므로 한 명 더 조회한 뒤 제거
+    result = get_user_collection().query(
+        query_embeddings=[embedding],
+        n_results=n_results + (exclude_id is not None),
+        where=where,
+        include=["embeddings", "metadatas", "distances"],
+    )
+    keep = [i for i, user_id in enumerate(result["ids"][0]) if user_id != exclude_id]
+    return {
+        key: [result[key][0][i] for i in keep[:n_results]]
+        for key in ("ids", "embeddings", "metadatas", "distances")
+    }
 
 
 def delete_user(user_id: int):
@@ -92,6 +160,9 @@ def delete_user_v3(user_id: int):
             similarity_collection = get_similarity_collection(category)
             similarity_collection.delete(ids=[user_id])
 
+        # 해당 사용자의 제외 집합(차단/매칭/노출) 삭제
+        delete_exclusions(user_id)
+
         logger.info(
             f"user_id '{user_id}' 삭제 완료 (user_profiles 및 모든 similarity 컬렉션)"
         )
@@ -12,26 +12,37 @@ import time
 from contextlib import asynccontextmanager
 
 from api.endpoints.health_router import HealthRouter
-from api.endpoints.monitoring_router import PerformanceRouter
+from api.endpoints.monitoring_router import PerformanceRouter, collect_runtime_gauges
 from api.endpoints.tuning_router import TuningRouter
 from api.endpoints.user_router import UserRouter
 from core.vector_database.client import get_chroma_client
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import RedirectResponse
+from models.batch_encoder import batch_encoder
+from models.inference_pool import shutdown_inference_pool
+from models.sbert_loader import start_background_loading
 from scripts.recompute_all_similarities_optimized import (
     recompute_all_similarities_optimized_v2,
 )
+from services.registration_job_service import registration_job_queue
 from utils.error_handler import register_exception_handlers
+from utils.log_queue import attach_queue_handler
 from utils.logger import logger, logging
+from utils.metrics import metrics_registry, register_metrics
+from utils.tracing import TracingMiddleware
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
-# 로거 설정
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# 로거 설정 (basicConfig와 같은 형식, 콘솔 쓰기는 로그 큐 리스너 스레드에서 처리)
+if not logging.root.handlers:
+    root_handler = logging.StreamHandler()
+    root_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    logging.root.setLevel(logging.INFO)
+    attach_queue_handler(logging.root, [root_handler])
 
 # 디버깅용 전역 플래그
 LIFESPAN_CALLED = False
@@ -105,6 +116,25 @@ async def run_similarity_script():
         return False
 
 
+async def recompute_similarities_on_startup(model_loading: asyncio.Task):
+    """모델 준비 완료 후 전체 유사도 재계산 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    try:
+        await model_loading
+        logger.info("[LIFESPAN] ChromaDB 연결 확인 시작...")
+        if await asyncio.to_thread(get_chroma_client):
+            logger.info("[LIFESPAN] ChromaDB 연결 성공, 스크립트 실행...")
+            await asyncio.to_thread(recompute_all_similarities_optimized_v2)
+        else:
+            logger.warning(
+                "[LIFESPAN] ⚠️ ChromaDB 연결 실패로 인해 유사도 재계산 스크립트를 실행하지 않습니다."
+            )
+    except Exception as e:
+        logger.error(f"[LIFESPAN] startup 중 오류: {e}")
+        import traceback
+
+        logger.error(f"[LIFESPAN] 상세 오류: {traceback.format_exc()}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
@@ -119,22 +149,14 @@ async def lifespan(app: FastAPI):
     env = os.getenv("ENVIRONMENT", "dev")
     logger.info(f"[LIFESPAN] Environment: {env}")
 
-    try:
-        logger.info("[LIFESPAN] ChromaDB 연결 확인 시작...")
-        if get_chroma_client():
-            logger.info("[LIFESPAN] ChromaDB 연결 성공, 스크립트 실행...")
-            recompute_all_similarities_optimized_v2()
-        else:
-            logger.warning(
-                "[LIFESPAN] ⚠️ ChromaDB 연결 실패로 인해 유사도 재계산 스크립트를 실행하지 않습니다."
-            )
-    except Exception as e:
-        logger.error(f"[LIFESPAN] startup 중 오류: {e}")
-        import traceback
-
-        # 경과 시간 계산
+    # 임베딩 모델은 요청 처리를 막지 않도록 백그라운드에서 로드 (준비 상태: /api/v1/health/ready)
+    model_loading = start_background_loading()
+    # 동시 임베딩 요청을 병합하는 마이크로 배치 인코더를 앱 이벤트 루프에 연결
+    batch_encoder.start()
 
-        logger.error(f"[LIFESPAN] 상세 오류: {traceback.format_exc()}")
+    # 시작 시 유사도 재계산은 RECOMPUTE_ON_STARTUP=true일 때만 모델 준비 후 백그라운드로 실행
+    if os.getenv("RECOMPUTE_ON_STARTUP", "false").lower() == "true":
+        asyncio.create_task(recompute_similarities_on_startup(model_loading))
 
     logger.info("✅ [LIFESPAN] 애플리케이션 시작 완료")
 
@@ -142,6 +164,9 @@ async def lifespan(app: FastAPI):
 
     # 종료 시 실행
     logger.info("🔄 [LIFESPAN] 애플리케이션 종료 중...")
+    await registration_job_queue.stop()
+    await batch_encoder.stop()
+    shutdown_inference_pool()
 
 
 # 먼저 lifespan 함수가 제대로 정의되었는지 확인
@@ -152,10 +177,16 @@ logger.info(f"Lifespan function defined: {lifespan}")
 app = FastAPI(
     title="TUNING API",
     description="조직 내부 사용자 간의 자연스럽고 부담 없는 소통을 돕는 소셜 매칭 서비스 API",
-    version="1.0.0"
-    #lifespan=lifespan,
+    version="1.0.0",
+    lifespan=lifespan,
 )
 register_exception_handlers(app)  # 반드시 포함
+# Prometheus 지표 (/metrics, 경로별 요청 처리 시간)
+register_metrics(app, namespace="tuning")
+metrics_registry.add_collector(collect_runtime_gauges)
+# 요청별 구간 추적 (/monitoring/traces/slowest)
+app.add_middleware(TracingMiddleware)
+
 
 # 라우터 등록 - API를 기능별로 모듈화
 app.include_router(HealthRouter().router)
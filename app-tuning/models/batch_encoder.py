@@ -0,0 +1,253 @@
+"""
+SBERT 마이크로 배치 인코더
+동시에 들어온 임베딩 요청의 텍스트를 짧은 시간(또는 최대 개수)만큼 모아
+한 번의 model.encode 호출로 처리하고, 각 호출자에게 자신의 구간만 돌려줌
+
+주요 기능:
+1. asyncio 큐 기반 요청 병합 (ENCODER_MAX_BATCH_SIZE, ENCODER_MAX_WAIT_MS)
+2. 실행기 워커 스레드에서 호출 가능한 동기 인터페이스 (이벤트 루프로 위임, ENCODER_TIMEOUT_SECONDS)
+3. 배치 채움 비율 및 큐 대기 시간 통계 제공
+4. 중지 시 처리 중 / 대기 중인 요청을 모두 실패 처리하여 호출자가 멈추지 않도록 함
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from models.sbert_loader import get_model
+from utils.logger import logger
+from utils.metrics import metrics_registry
+
+# 인코딩 배치 지표 (마이크로 배치 / 길이 버킷 인코딩 공용)
+metrics_registry.describe(
+    "encode_batch_size", "encode_batch_size", "인코딩 배치당 문장 수", ("source",)
+)
+metrics_registry.describe(
+    "encode_batches",
+    "encode_batch_duration_seconds",
+    "인코딩 배치당 모델 호출 시간",
+    ("source",),
+)
+
+
+class EncoderStoppedError(RuntimeError):
+    """
+    배치 처리기가 중지되어 대기 중이던 인코딩 요청을 처리할 수 없는 경우 발생
+    """
+
+
+class MicroBatchEncoder:
+    """
+    동시 인코딩 요청을 모아 한 번에 처리하는 인코더 프런트엔드
+    이벤트 루프에 연결(start)되기 전이거나 루프 스레드에서 동기 호출된 경우에는
+    모델을 직접 호출하여 기존 동작과 동일하게 처리
+    """
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float, timeout: float = 120.0):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        # 큐에서 꺼내 수집/인코딩 중인 요청 (중지 시 실패 처리 대상)
+        self._batch: list = []
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._batched_texts = 0
+        self._requests = 0
+        self._direct_calls = 0
+        self._queue_wait_total = 0.0
+        self._encode_time_total = 0.0
+
+    # ---------------------- 수명 주기 ----------------------
+    def start(self) -> None:
+        """
+        현재 이벤트 루프에 배치 처리 태스크를 시작 (앱 시작 시 호출)
+        """
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._batcher = self._loop.create_task(self._run_batcher())
+        logger.info(
+            f"[ENCODER] 마이크로 배치 시작 (max_batch={self.max_batch_size}, "
+            f"max_wait={self.max_wait * 1000:.1f}ms)"
+        )
+
+    async def stop(self) -> None:
+        """
+        배치 처리 태스크를 중지하고, 처리 중이거나 큐에 남은 요청을 모두 실패 처리
+        (워커 스레드에서 결과를 기다리는 호출자가 멈추지 않도록 함)
+        """
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+        pending = self._batch
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future, _ in pending:
+            if not future.done():
+                future.set_exception(EncoderStoppedError("인코더가 중지되었습니다."))
+        self._batch = []
+        self._loop = self._queue = self._batcher = None
+
+    @property
+    def running(self) -> bool:
+        return self._batcher is not None and not self._batcher.done()
+
+    # ---------------------- 인코딩 ----------------------
+    def encode(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """
+        동기 인코딩 (실행기 워커 스레드용)
+
+        Args:
+            texts: 단일 문장 또는 문장 리스트
+
+        Returns:
+            np.ndarray: 단일 문장이면 1차원, 리스트면 2차원 배열 (model.encode와 동일)
+        """
+        loop = self._loop
+        on_loop_thread = False
+        if loop is not None:
+            try:
+                on_loop_thread = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop_thread = False
+
+        if not self.running or on_loop_thread:
+            # 배치 처리기가 없거나 루프 스레드에서 블로킹 대기하면 교착되므로 직접 인코딩
+            with self._stats_lock:
+                self._direct_calls += 1
+            return get_model().encode(texts, show_progress_bar=False)
+
+        future = asyncio.run_coroutine_threadsafe(self.encode_async(texts), loop)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"인코딩 결과 대기 시간 초과 ({self.timeout:.0f}초)")
+
+    async def encode_async(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """
+        비동기 인코딩 (이벤트 루프용)
+        """
+        single = isinstance(texts, str)
+        items = [texts] if single else list(texts)
+        if not items:
+            return np.empty((0, 0), dtype=np.float32)
+        if not self.running:
+            result = await asyncio.to_thread(
+                get_model().encode, items, show_progress_bar=False
+            )
+            return result[0] if single else result
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((items, future, time.perf_counter()))
+        result = await future
+        return result[0] if single else result
+
+    # ---------------------- 배치 처리 ----------------------
+    async def _collect_batch(self) -> list:
+        first = await self._queue.get()
+        self._batch = batch = [first]
+        size = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+
+        while size < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    async def _run_batcher(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            started_at = time.perf_counter()
+            texts = [text for items, _, _ in batch for text in items]
+            try:
+                embeddings = await asyncio.to_thread(
+                    get_model().encode, texts, show_progress_bar=False
+                )
+            except Exception as e:
+                logger.error(f"[ENCODER] 배치 인코딩 실패 ({len(texts)}건): {e}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                self._batch = []
+                continue
+
+            encode_time = time.perf_counter() - started_at
+            metrics_registry.observe("encode_batch_size", "micro_batch", len(texts))
+            metrics_registry.observe_latency(
+                "encode_batches", "micro_batch", encode_time
+            )
+            offset = 0
+            for items, future, _ in batch:
+                if not future.done():
+                    future.set_result(embeddings[offset : offset + len(items)])
+                offset += len(items)
+            self._batch = []
+
+            with self._stats_lock:
+                self._batches += 1
+                self._requests += len(batch)
+                self._batched_texts += len(texts)
+                self._encode_time_total += encode_time
+                self._queue_wait_total += sum(
+                    started_at - enqueued_at for _, _, enqueued_at in batch
+                )
+
+    def stats(self) -> Dict:
+        """
+        배치 채움 비율 및 큐 대기 시간 통계
+        """
+        with self._stats_lock:
+            batches = self._batches
+            return {
+                "running": self.running,
+                "maxBatchSize": self.max_batch_size,
+                "maxWaitMs": round(self.max_wait * 1000, 3),
+                "queueDepth": self._queue.qsize() if self._queue else 0,
+                "batchesTotal": batches,
+                "requestsTotal": self._requests,
+                "textsTotal": self._batched_texts,
+                "directCallsTotal": self._direct_calls,
+                "avgBatchSize": (
+                    round(self._batched_texts / batches, 2) if batches else 0.0
+                ),
+                "avgFillRatio": (
+                    round(self._batched_texts / (batches * self.max_batch_size), 3)
+                    if batches
+                    else 0.0
+                ),
+                "avgQueueWaitMs": (
+                    round(self._queue_wait_total / self._requests * 1000, 3)
+                    if self._requests
+                    else 0.0
+                ),
+                "avgEncodeMs": (
+                    round(self._encode_time_total / batches * 1000, 3)
+                    if batches
+                    else 0.0
+                ),
+            }
+
+
+batch_encoder = MicroBatchEncoder(
+    max_batch_size=int(os.getenv("ENCODER_MAX_BATCH_SIZE", "64")),
+    max_wait_ms=float(os.getenv("ENCODER_MAX_WAIT_MS", "5")),
+    timeout=float(os.getenv("ENCODER_TIMEOUT_SECONDS", "120")),
+)
@@ -0,0 +1,122 @@
+"""
+SBERT 길이 버킷 배치 인코더
+길이가 크게 다른 문장을 한 배치로 인코딩하면 대부분의 토큰이 패딩이 되므로,
+토큰 길이순으로 정렬한 뒤 패딩 비율 한도 내에서 버킷으로 묶어 버킷별 길이로 인코딩하고
+결과는 원래 입력 순서로 복원
+
+주요 기능:
+1. 토크나이저 기준 토큰 길이 계산 (토크나이저가 없는 인코더는 문자 길이로 대체)
+2. 패딩 비율 / 버킷당 토큰 수 / 버킷 크기 한도 기반 버킷 구성
+3. 버킷별 인코딩 후 원래 순서로 결과 복원
+
+재계산, 일괄 등록 등 대량 인코딩 경로에서 사용
+"""
+
+import os
+from typing import List, Sequence
+
+import numpy as np
+from utils.metrics import metrics_registry, timed
+
+# 버킷 내 허용 패딩 비율 (패딩 토큰 / 전체 토큰)
+BUCKET_PADDING_RATIO = float(os.getenv("ENCODER_BUCKET_PADDING_RATIO", "0.05"))
+# 버킷당 최대 토큰 수 (버킷 크기 x 버킷 최대 길이)
+BUCKET_MAX_TOKENS = int(os.getenv("ENCODER_BUCKET_MAX_TOKENS", "8192"))
+# 버킷당 최대 문장 수
+BUCKET_MAX_SIZE = int(os.getenv("ENCODER_BUCKET_MAX_SIZE", "128"))
+
+
+def token_lengths(model, texts: Sequence[str]) -> List[int]:
+    """
+    문장별 토큰 길이 (특수 토큰 포함, 모델 최대 길이로 절단)
+    토크나이저가 없는 인코더(추론 워커 풀 등)는 문자 길이를 대신 사용
+    """
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None:
+        return [len(text) for text in texts]
+    encoded = tokenizer(
+        list(texts),
+        truncation=True,
+        max_length=getattr(model, "max_seq_length", None),
+        return_length=True,
+    )
+    return [int(length) for length in encoded["length"]]
+
+
+def plan_buckets(
+    lengths: Sequence[int],
+    padding_ratio: float = BUCKET_PADDING_RATIO,
+    max_tokens: int = BUCKET_MAX_TOKENS,
+    max_size: int = BUCKET_MAX_SIZE,
+) -> List[List[int]]:
+    """
+    길이순 정렬 후 한도를 넘지 않도록 인덱스를 버킷으로 묶음
+
+    Args:
+        lengths: 문장별 토큰 길이
+        padding_ratio: 버킷 내 허용 패딩 비율
+        max_tokens: 버킷당 최대 토큰 수 (버킷 크기 x 버킷 최대 길이)
+        max_size: 버킷당 최대 문장 수
+
+    Returns:
+        원래 입력 인덱스의 버킷 목록 (각 버킷은 길이 오름차순)
+    """
+    buckets: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        length = max(int(lengths[index]), 1)
+        if current:
+            # 오름차순이므로 새 문장 길이가 곧 버킷의 최대 길이
+            padded = length * (len(current) + 1)
+            padding = padded - (current_tokens + length)
+            if (
+                len(current) >= max_size
+                or padded > max_tokens
+                or padding > padding_ratio * padded
+            ):
+                buckets.append(current)
+                current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += length
+
+    if current:
+        buckets.append(current)
+    return buckets
+
+
+def encode_length_bucketed(model, texts: Sequence[str], **plan_kwargs) -> np.ndarray:
+    """
+    길이 버킷 단위로 인코딩하고 원래 입력 순서의 임베딩 행렬 반환
+
+    Args:
+        model: SentenceTransformer 호환 인코더
+        texts: 인코딩할 문장 목록
+        plan_kwargs: plan_buckets 한도 재지정 (padding_ratio, max_tokens, max_size)
+
+    Returns:
+        np.ndarray: (문장 수 x 임베딩 차원) 임베딩 행렬
+    """
+    texts = list(texts)
+    if not texts:
+        return np.empty((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    buckets = plan_buckets(token_lengths(model, texts), **plan_kwargs)
+    embeddings = None
+    for bucket in buckets:
+        metrics_registry.observe("encode_batch_size", "length_bucket", len(bucket))
+        with timed("encode_batches", "length_bucket"):
+            bucket_embeddings = np.asarray(
+                model.encode(
+                    [texts[i] for i in bucket],
+                    batch_size=len(bucket),
+                    show_progress_bar=False,
+                )
+            )
+        if embeddings is None:
+            embeddings = np.empty(
+                (len(texts), bucket_embeddings.shape[1]), dtype=bucket_embeddings.dtype
+            )
+        embeddings[bucket] = bucket_embeddings
+    return embeddings
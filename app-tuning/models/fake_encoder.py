@@ -0,0 +1,70 @@
+"""
+해시 기반 가짜 SBERT 인코더 (SBERT_BACKEND=fake)
+모델 파일 다운로드/로드 없이 문장을 결정적인 단위 벡터로 변환하여,
+테스트/벤치마크에서 인코딩을 제외한 나머지 파이프라인 비용만 측정하기 위한 용도
+
+- 문장을 단어(\\w+) 단위로 나누고 단어마다 해시 시드로 생성한 고정 벡터를 더한 뒤 L2 정규화
+  (같은 단어를 공유하는 문장끼리 코사인 유사도가 높아지므로 순위 계산 경로도 의미 있게 동작)
+- 해시는 blake2b를 사용하여 프로세스/실행 간 결과가 동일 (PYTHONHASHSEED 영향 없음)
+- SentenceTransformer와 동일한 encode / get_sentence_embedding_dimension 인터페이스
+- 토크나이저가 없으므로 길이 버킷 인코딩은 문자 길이 기준으로 동작
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import List, Optional, Union
+
+import numpy as np
+
+# 가짜 임베딩 차원 (기본값: ko-sbert-sts와 동일한 768)
+FAKE_ENCODER_DIM = int(os.getenv("FAKE_ENCODER_DIM", "768"))
+# 단어별 벡터 캐시 크기 (Enum 어휘 + 문장 템플릿 단어 수보다 충분히 크게)
+TOKEN_CACHE_SIZE = 65536
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _token_vector(token: str, dim: int) -> np.ndarray:
+    seed = int.from_bytes(
+        hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+    return np.random.default_rng(seed).standard_normal(dim, dtype=np.float32)
+
+
+class HashingEncoder:
+    """
+    단어 해시 벡터 합의 정규화 결과를 임베딩으로 반환하는 결정적 인코더
+    """
+
+    def __init__(self, dim: int = FAKE_ENCODER_DIM):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def _embed(self, text: str) -> np.ndarray:
+        # 단어가 없는 문장(빈 문자열, 기호만 있는 문장)은 문장 전체를 하나의 단어로 취급
+        tokens = _WORD_PATTERN.findall(text) or [text]
+        vector = np.sum([_token_vector(token, self.dim) for token in tokens], axis=0)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: Optional[bool] = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        문장(또는 문장 목록)의 임베딩 (단일 문장이면 1차원, 리스트면 2차원 float32 배열)
+        batch_size 등 SentenceTransformer 인자는 호환을 위해 받기만 함
+        """
+        if isinstance(sentences, str):
+            return self._embed(sentences)
+        if not len(sentences):
+            return np.empty((0, self.dim), dtype=np.float32)
+        return np.stack([self._embed(text) for text in sentences])
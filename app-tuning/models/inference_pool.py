@@ -0,0 +1,328 @@
+"""
+SBERT 프로세스 외부 추론 워커 풀
+API 프로세스와 분리된 워커 프로세스에서 모델을 한 번만 로드하여 추론하고,
+텍스트 배치는 파이프로 전달, 임베딩 결과는 공유 메모리로 반환
+
+주요 기능:
+1. 워커 프로세스별 모델 1회 로드 (spawn 방식, 워커별 torch 스레드 수 제한)
+2. 워커별 재사용 공유 메모리 버퍼로 임베딩 반환 (pickle 직렬화 비용 제거)
+3. SentenceTransformer와 동일한 encode / get_sentence_embedding_dimension 인터페이스
+4. 워커 비정상 종료 / 응답 시간 초과 시 자동 재시작 (재시작 실패 시 풀에서 제외)
+
+SBERT_INFERENCE_WORKERS > 0 이면 models.sbert_loader.get_model()이 이 풀을 반환
+"""
+
+import importlib
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from utils.cpu_quota import inference_threads
+from utils.logger import logger
+
+DEFAULT_MODEL_LOADER = "models.sbert_loader:get_model"
+# 워커 공유 메모리 버퍼 최소 크기 (768차원 float32 기준 약 340문장)
+MIN_BUFFER_BYTES = 1 << 20
+# 유휴 워커 대기 중 풀 상태(남은 워커 수)를 다시 확인하는 간격
+IDLE_POLL_SECONDS = 1.0
+
+
+class InferencePoolError(RuntimeError):
+    """추론 워커 처리 실패 시 발생"""
+
+
+def _load_model(loader_path: str):
+    module_name, _, attr = loader_path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+def _worker_main(conn, loader_path: str, num_threads: int) -> None:
+    """
+    워커 프로세스 진입점: 모델을 로드한 뒤 파이프로 받은 배치를 순서대로 인코딩
+    """
+    # 워커에서는 모델을 직접 로드하도록 표시하고 스레드 수를 제한
+    os.environ["SBERT_INFERENCE_WORKER"] = "1"
+    os.environ["SBERT_NUM_THREADS"] = str(num_threads)
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    model = _load_model(loader_path)
+    buffer: Optional[shared_memory.SharedMemory] = None
+    conn.send(("ready", model.get_sentence_embedding_dimension()))
+
+    try:
+        while True:
+            texts = conn.recv()
+            if texts is None:
+                break
+            try:
+                embeddings = np.ascontiguousarray(
+                    model.encode(texts, show_progress_bar=False), dtype=np.float32
+                )
+                if buffer is None or buffer.size < embeddings.nbytes:
+                    if buffer is not None:
+                        buffer.close()
+                        buffer.unlink()
+                    buffer = shared_memory.SharedMemory(
+                        create=True, size=max(MIN_BUFFER_BYTES, embeddings.nbytes * 2)
+                    )
+                np.ndarray(embeddings.shape, dtype=np.float32, buffer=buffer.buf)[:] = (
+                    embeddings
+                )
+                conn.send(("ok", buffer.name, embeddings.shape))
+            except Exception as e:
+                conn.send(("error", repr(e), None))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if buffer is not None:
+            buffer.close()
+            buffer.unlink()
+
+
+class _Worker:
+    def __init__(self, ctx, loader_path: str, num_threads: int, worker_no: int):
+        self.worker_no = worker_no
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, loader_path, num_threads),
+            name=f"sbert-inference-{worker_no}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.buffer: Optional[shared_memory.SharedMemory] = None
+
+    def wait_ready(self, timeout: float) -> int:
+        if not self.conn.poll(timeout):
+            raise InferencePoolError(
+                f"추론 워커 {self.worker_no} 초기화 시간 초과 ({timeout}s)"
+            )
+        status, dim = self.conn.recv()
+        if status != "ready":
+            raise InferencePoolError(f"추론 워커 {self.worker_no} 초기화 실패")
+        return dim
+
+    def encode(self, texts: List[str], timeout: float) -> np.ndarray:
+        self.conn.send(texts)
+        if not self.conn.poll(timeout):
+            raise TimeoutError(
+                f"추론 워커 {self.worker_no} 응답 시간 초과 ({timeout}s)"
+            )
+        status, payload, shape = self.conn.recv()
+        if status != "ok":
+            raise InferencePoolError(f"추론 워커 인코딩 실패: {payload}")
+
+        if self.buffer is None or self.buffer.name != payload:
+            self._close_buffer()
+            self.buffer = shared_memory.SharedMemory(name=payload)
+            # 버퍼 소유/정리는 워커 프로세스가 담당하므로 부모의 추적 대상에서 제외
+            resource_tracker.unregister(self.buffer._name, "shared_memory")
+        # 워커가 다음 배치에서 버퍼를 재사용하므로 반환 전에 복사
+        return np.ndarray(shape, dtype=np.float32, buffer=self.buffer.buf).copy()
+
+    def _close_buffer(self) -> None:
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+
+    def stop(self, timeout: float = 5) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self._close_buffer()
+        self.conn.close()
+
+
+class InferenceWorkerPool:
+    """
+    SBERT 추론 워커 프로세스 풀 (SentenceTransformer 호환 인터페이스)
+    요청 스레드는 유휴 워커 하나를 빌려 배치를 처리하고 반납
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        num_threads: Optional[int] = None,
+        loader_path: str = DEFAULT_MODEL_LOADER,
+        startup_timeout: float = 600,
+        encode_timeout: float = 120,
+    ):
+        self.num_workers = num_workers
+        self.num_threads = num_threads or inference_threads(workers=num_workers)
+        self.loader_path = loader_path
+        self.startup_timeout = startup_timeout
+        self.encode_timeout = encode_timeout
+        self._ctx = mp.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._dim: Optional[int] = None
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._texts = 0
+        self._restarts = 0
+        self._wait_total = 0.0
+        self._encode_total = 0.0
+
+    def start(self) -> "InferenceWorkerPool":
+        logger.info(
+            f"[INFERENCE_POOL] 워커 {self.num_workers}개 시작 "
+            f"(워커당 torch 스레드 {self.num_threads})"
+        )
+        workers = [self._spawn(no) for no in range(1, self.num_workers + 1)]
+        for worker in workers:
+            self._dim = worker.wait_ready(self.startup_timeout)
+            self._workers.append(worker)
+            self._idle.put(worker)
+        return self
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+        self._workers.clear()
+
+    def _spawn(self, worker_no: int) -> _Worker:
+        return _Worker(self._ctx, self.loader_path, self.num_threads, worker_no)
+
+    def _acquire(self) -> _Worker:
+        """
+        유휴 워커 하나를 빌림 (재시작 실패로 남은 워커가 없으면 대기하지 않고 실패)
+        """
+        while True:
+            if not self._workers:
+                raise InferencePoolError("사용 가능한 추론 워커 없음")
+            try:
+                return self._idle.get(timeout=IDLE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def _restart(self, worker: _Worker) -> None:
+        """
+        응답하지 않는 워커를 종료하고 새 워커로 교체하여 유휴 목록에 반납
+        새 워커가 준비되지 않으면 해당 슬롯을 풀에서 제외
+        """
+        logger.error(f"[INFERENCE_POOL] 워커 {worker.worker_no} 재시작")
+        worker.stop(timeout=1)
+        replacement = None
+        try:
+            replacement = self._spawn(worker.worker_no)
+            replacement.wait_ready(self.startup_timeout)
+        except Exception as e:
+            if replacement is not None:
+                replacement.stop(timeout=1)
+            self._workers.remove(worker)
+            logger.error(
+                f"[INFERENCE_POOL] 워커 {worker.worker_no} 재시작 실패, 풀에서 제외: {e!r}"
+            )
+            return
+        self._workers[self._workers.index(worker)] = replacement
+        with self._stats_lock:
+            self._restarts += 1
+        self._idle.put(replacement)
+
+    # ---------------------- SentenceTransformer 호환 ----------------------
+    def get_sentence_embedding_dimension(self) -> int:
+        return self._dim
+
+    def encode(
+        self, sentences: Union[str, List[str]], show_progress_bar: bool = False, **_
+    ) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.empty((0, self._dim), dtype=np.float32)
+
+        requested_at = time.perf_counter()
+        worker = self._acquire()
+        started_at = time.perf_counter()
+        try:
+            embeddings = worker.encode(texts, self.encode_timeout)
+        except InferencePoolError:
+            # 워커가 오류 응답을 보낸 경우이므로 워커는 정상 (그대로 반납)
+            self._idle.put(worker)
+            raise
+        except Exception as e:
+            # 연결 끊김 / 응답 시간 초과 등 파이프 상태를 알 수 없으면 반납하지 않고 교체
+            self._restart(worker)
+            raise InferencePoolError(f"추론 워커 응답 실패: {e!r}") from e
+        except BaseException:
+            self._restart(worker)
+            raise
+        self._idle.put(worker)
+
+        with self._stats_lock:
+            self._batches += 1
+            self._texts += len(texts)
+            self._wait_total += started_at - requested_at
+            self._encode_total += time.perf_counter() - started_at
+        return embeddings[0] if single else embeddings
+
+    def stats(self) -> Dict:
+        """
+        워커 풀 처리 통계
+        """
+        with self._stats_lock:
+            return {
+                "workers": self.num_workers,
+                "threadsPerWorker": self.num_threads,
+                "aliveWorkers": sum(w.process.is_alive() for w in self._workers),
+                "idleWorkers": self._idle.qsize(),
+                "batchesTotal": self._batches,
+                "textsTotal": self._texts,
+                "restartsTotal": self._restarts,
+                "avgWaitMs": (
+                    round(self._wait_total / self._batches * 1000, 3)
+                    if self._batches
+                    else 0.0
+                ),
+                "avgEncodeMs": (
+                    round(self._encode_total / self._batches * 1000, 3)
+                    if self._batches
+                    else 0.0
+                ),
+            }
+
+
+_pool: Optional[InferenceWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_inference_pool() -> InferenceWorkerPool:
+    """
+    전역 추론 워커 풀 반환 (최초 호출 시 워커 시작)
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = InferenceWorkerPool(
+                    num_workers=int(os.getenv("SBERT_INFERENCE_WORKERS", "1")),
+                    encode_timeout=float(
+                        os.getenv("SBERT_INFERENCE_TIMEOUT_SECONDS", "120")
+                    ),
+                ).start()
+    return _pool
+
+
+def get_inference_pool_stats() -> Optional[Dict]:
+    """
+    추론 워커 풀 통계 (풀이 시작되지 않았으면 None)
+    """
+    return _pool.stats() if _pool is not None else None
+
+
+def shutdown_inference_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,124 @@
+"""
+SBERT 추론 백엔드 선택 모듈
+같은 ko-sbert-sts 모델을 PyTorch fp32 / ONNX Runtime fp32 / ONNX Runtime 동적 int8 양자화
+중 하나로 로드 (테스트/벤치마크용 해시 기반 가짜 인코더 선택 가능)
+
+- ONNX 백엔드는 Transformer 모듈만 ONNX 그래프로 실행하고, 풀링(mean pooling) 등
+  나머지 모듈은 modules.json 설정 그대로 sentence-transformers가 처리하므로
+  풀링/정규화 방식은 PyTorch 백엔드와 동일
+- ONNX 변환/양자화 결과는 모델 캐시 옆 디렉토리(<모델>-onnx)에 저장되어 최초 1회만 수행
+- ONNX 백엔드 사용 시 `pip install -r requirements-onnx.txt` 필요 (optimum[onnxruntime])
+- sentence-transformers는 로드 시점에 임포트 (모듈 임포트 비용 최소화)
+- fake 백엔드는 모델 파일 없이 models.fake_encoder.HashingEncoder를 사용 (오프라인 테스트/벤치마크용)
+"""
+
+import os
+from pathlib import Path
+
+from utils.logger import logger
+
+MODEL_NAME = "jhgan/ko-sbert-sts"
+MODEL_DIR_NAME = MODEL_NAME.replace("/", "-")
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx-int8"
+BACKEND_FAKE = "fake"
+BACKENDS = (BACKEND_TORCH, BACKEND_ONNX, BACKEND_ONNX_INT8, BACKEND_FAKE)
+
+ONNX_MODEL_FILE = "onnx/model.onnx"
+# 동적 양자화 대상 CPU 명령어 세트 (arm64, avx2, avx512, avx512_vnni)
+ONNX_QUANTIZATION_CONFIG = os.getenv("SBERT_ONNX_QUANTIZATION", "avx2")
+
+
+def get_backend() -> str:
+    """
+    SBERT_BACKEND 환경 변수에서 추론 백엔드 조회 (기본값: torch)
+    """
+    backend = os.getenv("SBERT_BACKEND", BACKEND_TORCH).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 SBERT_BACKEND입니다: {backend} ({BACKENDS})")
+    return backend
+
+
+def resolve_model_path() -> Path:
+    """
+    로컬 모델 경로 (SENTENCE_TRANSFORMERS_HOME 또는 app-tuning/model-cache 기준)
+    """
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    model_cache = os.environ.get(
+        "SENTENCE_TRANSFORMERS_HOME", os.path.join(base_dir, "model-cache")
+    )
+    return Path(model_cache) / MODEL_DIR_NAME
+
+
+def _onnx_model_dir(model_path: Path) -> Path:
+    return model_path.parent / f"{model_path.name}-onnx"
+
+
+def _quantized_file_name() -> str:
+    return f"onnx/model_qint8_{ONNX_QUANTIZATION_CONFIG}.onnx"
+
+
+def _load_onnx_model(model_path: Path):
+    from sentence_transformers import SentenceTransformer
+
+    onnx_dir = _onnx_model_dir(model_path)
+    if (onnx_dir / ONNX_MODEL_FILE).exists():
+        return SentenceTransformer(str(onnx_dir), backend="onnx")
+
+    # 최초 1회: PyTorch 가중치를 ONNX로 변환하여 저장
+    logger.info(f"ONNX 모델이 없어 변환합니다: {model_path} → {onnx_dir}")
+    model = SentenceTransformer(str(model_path), backend="onnx")
+    model.save(str(onnx_dir))
+    return model
+
+
+def _load_onnx_int8_model(model_path: Path):
+    from sentence_transformers import SentenceTransformer
+
+    onnx_dir = _onnx_model_dir(model_path)
+    file_name = _quantized_file_name()
+    if not (onnx_dir / file_name).exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        # 최초 1회: fp32 ONNX 모델을 동적 int8 양자화하여 저장
+        logger.info(
+            f"int8 ONNX 모델이 없어 양자화합니다 ({ONNX_QUANTIZATION_CONFIG}): {onnx_dir}"
+        )
+        export_dynamic_quantized_onnx_model(
+            _load_onnx_model(model_path),
+            quantization_config=ONNX_QUANTIZATION_CONFIG,
+            model_name_or_path=str(onnx_dir),
+        )
+    return SentenceTransformer(
+        str(onnx_dir), backend="onnx", model_kwargs={"file_name": file_name}
+    )
+
+
+def load_sentence_transformer(model_path: Path, backend: str = BACKEND_TORCH):
+    """
+    지정한 백엔드로 로컬 SBERT 모델 로드
+
+    Args:
+        model_path: 로컬 모델 경로 (PyTorch 가중치)
+        backend: torch / onnx / onnx-int8 / fake
+
+    Returns:
+        SentenceTransformer: 백엔드와 무관하게 동일한 encode 인터페이스
+    """
+    if backend == BACKEND_FAKE:
+        from models.fake_encoder import HashingEncoder
+
+        logger.warning("해시 기반 가짜 인코더를 사용합니다 (SBERT_BACKEND=fake)")
+        return HashingEncoder()
+
+    logger.info(f"SBERT 모델을 로드합니다 (backend={backend}): {model_path}")
+    if backend == BACKEND_ONNX:
+        return _load_onnx_model(model_path)
+    if backend == BACKEND_ONNX_INT8:
+        return _load_onnx_int8_model(model_path)
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(str(model_path))
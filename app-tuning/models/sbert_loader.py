@@ -2,37 +2,49 @@
 SBERT 모델 로더 모듈
 한국어 문장 임베딩을 위한 SBERT 모델을 효율적으로 로드하고 관리
 싱글톤 패턴을 적용하여 메모리 사용량 최적화 및 일관된 추론 환경 제공
+
+모델은 임포트 시점이 아니라 최초 사용 시점(또는 앱 시작 시 백그라운드)에 로드되며,
+torch / sentence-transformers 임포트도 로드 시점으로 지연
 """
 
+import asyncio
 import os
 import subprocess
-from pathlib import Path
-
-import torch
-from sentence_transformers import SentenceTransformer
+import threading
+import time
+from typing import Dict, Optional
+
+from models.sbert_backends import (
+    BACKEND_FAKE,
+    BACKEND_TORCH,
+    get_backend,
+    resolve_model_path,
+)
+from utils.cpu_quota import inference_threads
 from utils.logger import logger
 
+# 추론 워커 풀 사용 시 API 프로세스는 모델을 로드하지 않고 워커 프로세스에 위임
+INFERENCE_WORKERS = int(os.getenv("SBERT_INFERENCE_WORKERS", "0"))
+IS_INFERENCE_WORKER = os.getenv("SBERT_INFERENCE_WORKER") == "1"
+USE_INFERENCE_POOL = INFERENCE_WORKERS > 0 and not IS_INFERENCE_WORKER
 
-# 모듈 임포트 시점에 바로 모델 초기화
-def _load_model():
-    loaded_model = None  # 이 줄 추가
-    # CPU 스레드 수 최적화 - 시스템의 모든 코어 활용
-    torch.set_num_threads(max(1, os.cpu_count() // 2))  # 최소 1개는 사용하도록 보장
 
-    # 환경변수에서 모델 경로 가져오기
+# 모델 로드 (최초 get_model() 호출 시 1회 실행)
+def _load_model():
+    from models.sbert_backends import load_sentence_transformer
 
-    MODEL_NAME = "jhgan/ko-sbert-sts"
-    MODEL_DIR_NAME = MODEL_NAME.replace("/", "-")
+    # 가짜 인코더는 torch 임포트 / 모델 다운로드 없이 바로 생성
+    if get_backend() == BACKEND_FAKE:
+        return load_sentence_transformer(resolve_model_path(), BACKEND_FAKE)
 
-    # app-tuning 디렉토리 기준으로 고정
-    BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    import torch
 
-    # SENTENCE_TRANSFORMERS_HOME 환경변수 있으면 사용, 없으면 model-cache 기본 경로
-    MODEL_CACHE = os.environ.get(
-        "SENTENCE_TRANSFORMERS_HOME", os.path.join(BASE_DIR, "model-cache")
-    )
+    loaded_model = None  # 이 줄 추가
+    # CPU 스레드 수 최적화 - cgroup CPU 할당량 기준 절반 (SBERT_NUM_THREADS로 지정 가능)
+    torch.set_num_threads(inference_threads())
 
-    MODEL_PATH = Path(MODEL_CACHE) / MODEL_DIR_NAME
+    # 모델 경로 (SENTENCE_TRANSFORMERS_HOME 환경변수 있으면 사용, 없으면 model-cache 기본 경로)
+    MODEL_PATH = resolve_model_path()
     # 모델 경로가 존재하지 않으면 다운로드 시도
     if not MODEL_PATH.exists():
         logger.warning(f"모델이 존재하지 않습니다: {MODEL_PATH}")
@@ -64,10 +76,11 @@ def _load_model():
         logger.info(f"모델이 이미 존재합니다: {MODEL_PATH} (다운로드 건너뜀)")
         logger.info("SBERT 모델을 로드합니다...")
 
-    # 로컬 경로에서 모델 로드
-    loaded_model = SentenceTransformer(str(MODEL_PATH))
-    # GPU가 있는 경우에만 GPU로 이동
-    if torch.cuda.is_available():
+    # 로컬 경로에서 선택한 백엔드(SBERT_BACKEND: torch / onnx / onnx-int8)로 모델 로드
+    backend = get_backend()
+    loaded_model = load_sentence_transformer(MODEL_PATH, backend)
+    # GPU가 있는 경우에만 GPU로 이동 (PyTorch 백엔드)
+    if backend == BACKEND_TORCH and torch.cuda.is_available():
         loaded_model = loaded_model.half().to("cuda")
 
     # 모델 예열 (첫 추론 시간 단축)
@@ -76,16 +89,100 @@ def _load_model():
     return loaded_model
 
 
-# 모듈 레벨에서 모델 초기화
-model = _load_model()
+# 로드된 모델(또는 추론 워커 풀)과 준비 상태
+_model = None
+_model_lock = threading.Lock()
+_ready = threading.Event()
+_load_error: Optional[str] = None
+_load_seconds: Optional[float] = None
+_loading_task: Optional[asyncio.Task] = None
+
+
+def _load_encoder():
+    # 추론 워커 풀 사용 시 API 프로세스는 모델을 로드하지 않고 워커 프로세스에 위임
+    if USE_INFERENCE_POOL:
+        from models.inference_pool import get_inference_pool
+
+        return get_inference_pool()
+    return _load_model()
 
 
 # 모델 인스턴스에 접근하기 위한 간단한 함수
 def get_model():
     """
-    초기화된 SBERT 모델 인스턴스 반환
+    SBERT 모델 인스턴스 반환 (로드 전이면 로드가 끝날 때까지 대기)
 
     Returns:
         SentenceTransformer: 초기화된 한국어 SBERT 모델 인스턴스
+            (추론 워커 풀 사용 시 동일한 encode 인터페이스의 InferenceWorkerPool)
+    """
+    global _model, _load_error, _load_seconds
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                started_at = time.perf_counter()
+                try:
+                    _model = _load_encoder()
+                except Exception as e:
+                    _load_error = str(e)
+                    logger.error(f"[MODEL_LOAD_FAILED] {e}")
+                    raise
+                _load_error = None
+                _load_seconds = round(time.perf_counter() - started_at, 3)
+                _ready.set()
+                logger.info(f"SBERT 모델 준비 완료 ({_load_seconds}초)")
+    return _model
+
+
+def is_model_ready() -> bool:
+    return _ready.is_set()
+
+
+def start_background_loading() -> asyncio.Task:
     """
-    return model
+    현재 이벤트 루프에서 모델 로드를 백그라운드로 시작 (앱 시작 시 호출)
+    """
+    global _loading_task
+    if _loading_task is None or (_loading_task.done() and not is_model_ready()):
+        _loading_task = asyncio.get_running_loop().create_task(
+            asyncio.to_thread(get_model)
+        )
+        # 실패는 get_model()에서 기록하므로 미처리 예외 경고만 방지
+        _loading_task.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
+    return _loading_task
+
+
+async def wait_until_model_ready(timeout: float) -> None:
+    """
+    모델 준비 완료까지 대기 (백그라운드 로드가 시작되지 않았다면 시작)
+
+    Raises:
+        asyncio.TimeoutError: timeout 내에 준비되지 않은 경우
+        Exception: 모델 로드 실패 시 해당 예외
+    """
+    if is_model_ready():
+        return
+    await asyncio.wait_for(asyncio.shield(start_background_loading()), timeout)
+
+
+def get_model_status() -> Dict:
+    """
+    모델 준비 상태 (READY / LOADING / FAILED / NOT_STARTED)
+    """
+    if is_model_ready():
+        status = "READY"
+    elif _load_error is not None and not _model_lock.locked():
+        status = "FAILED"
+    elif _model_lock.locked() or (_loading_task and not _loading_task.done()):
+        status = "LOADING"
+    else:
+        status = "NOT_STARTED"
+    return {
+        "status": status,
+        "backend": get_backend(),
+        "inferencePool": USE_INFERENCE_POOL,
+        "loadSeconds": _load_seconds,
+        "error": _load_error,
+    }
@@ -0,0 +1,28 @@
+"""
+추천 제외 집합(차단 / 매칭 완료 / 이미 노출) 관련 데이터 모델 정의
+"""
+
+from typing import List
+
+from core.exclusion_bitmap import MAX_USER_ID
+from pydantic import BaseModel, ConfigDict, Field, conint
+
+# 제외 대상 userId (비트맵 크기 제한을 위해 MAX_USER_ID 이하만 허용)
+ExcludedUserId = conint(ge=1, le=MAX_USER_ID)
+
+
+class ExclusionUpdate(BaseModel):
+    """
+    제외 집합 변경 요청 모델
+    """
+
+    add: List[ExcludedUserId] = Field(
+        default_factory=list, description="추가할 사용자 ID 목록"
+    )
+    remove: List[ExcludedUserId] = Field(
+        default_factory=list, description="삭제할 사용자 ID 목록"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"add": [12, 30], "remove": [7]}}
+    )
@@ -0,0 +1,54 @@
+"""
+매칭 점수 가중치 프로필 관련 데이터 모델 정의
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# 가중치 합 검증 허용 오차 (0.7 + 0.3 같은 부동소수점 합 오차 허용)
+WEIGHT_SUM_TOLERANCE = 1e-6
+
+
+class CategoryWeights(BaseModel):
+    """
+    카테고리별 점수 가중치
+    최종 점수 = embedding x 코사인 + rule x (mbti x MBTI 점수 + age x 연령대 점수)
+    """
+
+    embedding: float = Field(..., ge=0, le=1, description="문장 임베딩 코사인 가중치")
+    rule: float = Field(..., ge=0, le=1, description="규칙 기반 유사도 가중치")
+    mbti: float = Field(0.5, ge=0, le=1, description="규칙 내 MBTI 호환성 가중치")
+    age: float = Field(0.5, ge=0, le=1, description="규칙 내 연령대 일치도 가중치")
+
+    @model_validator(mode="after")
+    def check_weight_sums(self) -> "CategoryWeights":
+        # 재조합 점수가 0~1 범위를 유지하도록 가중치 쌍의 합은 1이어야 함
+        if abs(self.embedding + self.rule - 1) > WEIGHT_SUM_TOLERANCE:
+            raise ValueError("embedding과 rule 가중치의 합은 1이어야 합니다.")
+        if abs(self.mbti + self.age - 1) > WEIGHT_SUM_TOLERANCE:
+            raise ValueError("mbti와 age 가중치의 합은 1이어야 합니다.")
+        return self
+
+
+class WeightProfileUpdate(BaseModel):
+    """
+    가중치 프로필 변경 요청 모델 (지정한 카테고리만 변경 및 재조합)
+    """
+
+    friend: Optional[CategoryWeights] = Field(None, description="friend 가중치")
+    couple: Optional[CategoryWeights] = Field(None, description="couple 가중치")
+
+    @model_validator(mode="after")
+    def check_any_category(self) -> "WeightProfileUpdate":
+        if self.friend is None and self.couple is None:
+            raise ValueError("friend 또는 couple 중 하나 이상의 가중치가 필요합니다.")
+        return self
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "friend": {"embedding": 0.6, "rule": 0.4, "mbti": 0.5, "age": 0.5}
+            }
+        }
+    )
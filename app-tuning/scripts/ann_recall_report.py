@@ -0,0 +1,159 @@
+"""
+ANN 후보 선정 recall@K 리포트 스크립트
+무작위(시드 고정) 프로필로 한 도메인을 구성하고, 도메인 전체를 정확히 점수화한 상위 K명과
+후보 선정(규칙 점수 수준별 HNSW 조회)으로 뽑은 M명만 정확히 점수화(재순위화)한 상위 K명을
+비교하여 카테고리별 recall@K 출력
+
+사용법:
+    python scripts/ann_recall_report.py [--users 5000] [--queries 20]
+        [--candidates 100,200,500] [--top-k 100] [--ef 200]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+from core.ann_index import DomainAnnIndex  # noqa: E402
+from core.embedding import user_data_to_sentence  # noqa: E402
+from core.enum_process import ENUM_MAPPINGS  # noqa: E402
+from core.matching_score_by_category import (  # noqa: E402
+    AGE_GROUPS,
+    CATEGORIES,
+    MBTI_COMPATIBILITY,
+    compute_matching_scores_by_categories,
+    iter_domain_matching_scores,
+)
+from models.bucketed_encoder import encode_length_bucketed  # noqa: E402
+from models.sbert_loader import get_model  # noqa: E402
+from scripts.encoder_reference_corpus import build_reference_profiles  # noqa: E402
+from services.candidate_service import attribute_key, rank_candidates  # noqa: E402
+from services.score_profile_service import default_weights  # noqa: E402
+from services.user_service import safe_join  # noqa: E402
+
+DOMAIN = "recall.example.com"
+
+
+def build_domain(num_users: int, seed: int) -> tuple:
+    """
+    저장소 메타데이터와 같은 형식(문자열 결합)의 도메인 사용자 생성
+    """
+    rng = random.Random(seed)
+    ids, metadatas = [], []
+    for i, profile in enumerate(build_reference_profiles(num_users, seed)):
+        profile.update(
+            emailDomain=DOMAIN,
+            gender=rng.choice(list(ENUM_MAPPINGS["gender"])),
+            ageGroup=rng.choice(list(AGE_GROUPS)),
+            MBTI=rng.choice(list(MBTI_COMPATIBILITY)),
+        )
+        ids.append(str(i + 1))
+        metadatas.append({key: safe_join(value) for key, value in profile.items()})
+    return ids, metadatas
+
+
+def top_k(scores: dict, k: int) -> set:
+    return set(sorted(scores, key=scores.get, reverse=True)[:k])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ANN 후보 선정 recall@K 리포트")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--candidates", default="100,200,500")
+    parser.add_argument("--top-k", type=int, default=100)
+    parser.add_argument("--ef", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    candidate_sizes = [int(size) for size in args.candidates.split(",")]
+    weights = default_weights()
+
+    model = get_model()
+    ids, metadatas = build_domain(args.users, args.seed)
+    all_users = {"ids": ids, "metadatas": metadatas}
+    positions = {user_id: i for i, user_id in enumerate(ids)}
+    query_ids = ids[: args.queries]
+
+    # 저장소 임베딩과 같은 프로필 통합 문장 임베딩으로 인덱스 구성
+    started_at = time.perf_counter()
+    embeddings = encode_length_bucketed(
+        model, [user_data_to_sentence(meta) for meta in metadatas]
+    )
+    index = DomainAnnIndex(embeddings.shape[1], ef_search=args.ef)
+    index.add(ids, embeddings, [attribute_key(meta) for meta in metadatas])
+    print(
+        f"도메인 {args.users}명 인덱스 구성 {time.perf_counter() - started_at:.1f}s, "
+        f"질의 {len(query_ids)}명, top-{args.top_k}\n"
+    )
+
+    # 정답: 도메인 전체 정확 점수 (질의 사용자만 필요하므로 앞에서부터 중단)
+    exact = {}
+    for user_id, scores, _ in iter_domain_matching_scores(ids, metadatas):
+        exact[user_id] = scores
+        if len(exact) == len(query_ids):
+            break
+
+    # 사용자별 전체 계산 소요 시간 (등록 경로의 기존 동작)
+    started_at = time.perf_counter()
+    for user_id in query_ids[:3]:
+        compute_matching_scores_by_categories(
+            user_id, metadatas[positions[user_id]], all_users
+        )
+    full_sec = (time.perf_counter() - started_at) / len(query_ids[:3])
+
+    header = "".join(f"{f'{c} recall':>16}{f'{c} min':>12}" for c in CATEGORIES)
+    print(f"{'M':>6}{header}{'ms/user':>10}")
+    for size in candidate_sizes:
+        recalls = {category: [] for category in CATEGORIES}
+        elapsed = []
+        for user_id in query_ids:
+            position = positions[user_id]
+            meta = metadatas[position]
+            started_at = time.perf_counter()
+            candidate_ids = set()
+            for category in CATEGORIES:
+                candidate_ids.update(
+                    rank_candidates(
+                        index,
+                        embeddings[position],
+                        user_id,
+                        meta,
+                        category,
+                        weights[category],
+                        top_k=args.top_k,
+                        num_candidates=size,
+                    )
+                )
+            candidates = [user_id] + sorted(candidate_ids)
+            reranked = compute_matching_scores_by_categories(
+                user_id,
+                meta,
+                {
+                    "ids": candidates,
+                    "metadatas": [metadatas[positions[c]] for c in candidates],
+                },
+            )
+            elapsed.append(time.perf_counter() - started_at)
+
+            for category in CATEGORIES:
+                expected = top_k(exact[user_id][category], args.top_k)
+                if expected:
+                    found = top_k(reranked[category], args.top_k)
+                    recalls[category].append(len(expected & found) / len(expected))
+
+        row = "".join(
+            f"{statistics.mean(recalls[c]):>16.3f}{min(recalls[c]):>12.3f}"
+            for c in CATEGORIES
+        )
+        print(f"{size:>6}{row}{statistics.mean(elapsed) * 1000:>10.1f}")
+    print(f"{'full':>6}{'':>{28 * len(CATEGORIES)}}{full_sec * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+길이 버킷 인코딩 벤치마크 스크립트
+기준 코퍼스(프로필 통합 문장 + 필드별 짧은 문자열)를 기존 model.encode 호출과
+길이 버킷 인코딩으로 각각 처리하여 초당 실제 토큰 수와 패딩 비율 비교
+
+사용법:
+    python scripts/benchmark_bucketed_encoding.py [--profiles 200] [--repeats 3]
+        [--padding-ratio 0.05] [--max-tokens 8192]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+from models.bucketed_encoder import (  # noqa: E402
+    BUCKET_MAX_SIZE,
+    BUCKET_MAX_TOKENS,
+    BUCKET_PADDING_RATIO,
+    encode_length_bucketed,
+    plan_buckets,
+    token_lengths,
+)
+from models.sbert_loader import get_model  # noqa: E402
+from scripts.encoder_reference_corpus import build_reference_corpus  # noqa: E402
+
+# model.encode 기본 배치 크기
+DEFAULT_BATCH_SIZE = 32
+
+
+def padded_tokens_default(texts: list, lengths: list) -> int:
+    """
+    model.encode 기본 동작(문자 길이 내림차순 정렬 후 32개씩 배치)의 패딩 포함 토큰 수
+    """
+    order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+    total = 0
+    for start in range(0, len(order), DEFAULT_BATCH_SIZE):
+        batch = [lengths[i] for i in order[start : start + DEFAULT_BATCH_SIZE]]
+        total += max(batch) * len(batch)
+    return total
+
+
+def measure(func, repeats: int) -> float:
+    """
+    예열 1회 후 repeats회 측정의 중앙값 (초)
+    """
+    func()
+    elapsed = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - started_at)
+    return statistics.median(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="길이 버킷 인코딩 벤치마크")
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--padding-ratio", type=float, default=BUCKET_PADDING_RATIO)
+    parser.add_argument("--max-tokens", type=int, default=BUCKET_MAX_TOKENS)
+    parser.add_argument("--max-size", type=int, default=BUCKET_MAX_SIZE)
+    args = parser.parse_args()
+
+    model = get_model()
+    corpus = build_reference_corpus(args.profiles)
+    lengths = token_lengths(model, corpus)
+    real_tokens = sum(lengths)
+    plan = {
+        "padding_ratio": args.padding_ratio,
+        "max_tokens": args.max_tokens,
+        "max_size": args.max_size,
+    }
+    buckets = plan_buckets(lengths, **plan)
+    bucketed_padded = sum(max(lengths[i] for i in b) * len(b) for b in buckets)
+    default_padded = padded_tokens_default(corpus, lengths)
+
+    default_sec = measure(
+        lambda: model.encode(corpus, show_progress_bar=False), args.repeats
+    )
+    bucketed_sec = measure(
+        lambda: encode_length_bucketed(model, corpus, **plan), args.repeats
+    )
+
+    print(
+        f"문장 {len(corpus)}개, 실제 토큰 {real_tokens}개, 버킷 {len(buckets)}개, "
+        f"반복 {args.repeats}회 (중앙값)\n"
+    )
+    print(f"{'mode':<10}{'sec':>10}{'tokens/s':>12}{'padding':>10}")
+    for name, seconds, padded in (
+        ("default", default_sec, default_padded),
+        ("bucketed", bucketed_sec, bucketed_padded),
+    ):
+        print(
+            f"{name:<10}{seconds:>10.3f}{real_tokens / seconds:>12.1f}"
+            f"{1 - real_tokens / padded:>10.1%}"
+        )
+    print(f"\n속도 향상: {default_sec / bucketed_sec:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+매칭 후보 조회 방식 벤치마크 스크립트
+메모리(Ephemeral) Chroma에 무작위(시드 고정) 사용자를 여러 도메인으로 저장하고, 사용자별 후보 조회를
+1. 전체 조회(full): 컬렉션 전체 get 후 클라이언트에서 도메인/성별 필터링 (기존 경로)
+2. Chroma 조회(chroma): collection.query + 메타데이터 필터 (ANN_CANDIDATE_SOURCE=chroma)
+3. 로컬 인덱스(local): 규칙 점수 수준별 HNSW 조회 (ANN_CANDIDATE_SOURCE=local, 인덱스 구성 시간 별도)
+방식으로 각각 수행하여 사용자당 소요 시간과 카테고리별 recall@K 비교
+
+정답은 저장된 임베딩의 코사인 + 규칙 점수(MBTI, 연령대)를 도메인 전체에 대해 numpy로 계산한 상위 K명
+(모델 인코딩과 필드별 임베딩 점수 계산은 세 방식에 공통이므로 측정에서 제외)
+
+사용법:
+    python scripts/benchmark_candidate_sources.py [--users 20000] [--domains 4]
+        [--queries 20] [--dim 384] [--field-dim 64] [--top-k 100] [--candidates 200]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+import chromadb  # noqa: E402
+import core.vector_database.client as chroma_client_module  # noqa: E402
+import services.candidate_service as candidate_service  # noqa: E402
+from chromadb.config import Settings  # noqa: E402
+from core.enum_process import ENUM_MAPPINGS  # noqa: E402
+from core.matching_score_by_category import (  # noqa: E402
+    AGE_GROUPS,
+    CATEGORIES,
+    EMBEDDING_FIELDS,
+    MBTI_COMPATIBILITY,
+    age_group_match_score,
+    mbti_weighted_score,
+)
+from core.score_components import component_weight_vector  # noqa: E402
+from core.vector_database import get_user_collection  # noqa: E402
+from services.score_profile_service import default_weights  # noqa: E402
+
+WRITE_BATCH_SIZE = 1000
+# 도메인 내 임베딩 군집 수 (비슷한 관심사 사용자 분포 모사)
+NUM_CLUSTERS = 32
+
+
+def populate(args) -> tuple:
+    """
+    도메인/성별/MBTI/연령대 메타데이터와 군집형 임베딩을 가진 사용자 저장
+    (필드별 임베딩 JSON은 실제 저장 크기를 흉내 내는 용도, --field-dim으로 크기 조절)
+    """
+    rng = np.random.default_rng(args.seed)
+    picker = random.Random(args.seed)
+    centers = rng.normal(size=(NUM_CLUSTERS, args.dim))
+    embeddings = (
+        centers[rng.integers(NUM_CLUSTERS, size=args.users)]
+        + rng.normal(scale=0.8, size=(args.users, args.dim))
+    ).astype(np.float32)
+
+    ids = [str(i + 1) for i in range(args.users)]
+    metadatas = []
+    for _ in ids:
+        field_embeddings = {
+            field: np.round(rng.normal(size=args.field_dim), 4).tolist()
+            for field in EMBEDDING_FIELDS
+        }
+        metadatas.append(
+            {
+                "emailDomain": f"domain{picker.randrange(args.domains)}.example.com",
+                "gender": picker.choice(list(ENUM_MAPPINGS["gender"])),
+                "MBTI": picker.choice(list(MBTI_COMPATIBILITY)),
+                "ageGroup": picker.choice(list(AGE_GROUPS)),
+                "field_embeddings": json.dumps(field_embeddings),
+            }
+        )
+
+    collection = get_user_collection()
+    for start in range(0, len(ids), WRITE_BATCH_SIZE):
+        end = start + WRITE_BATCH_SIZE
+        collection.add(
+            ids=ids[start:end],
+            embeddings=embeddings[start:end].tolist(),
+            metadatas=metadatas[start:end],
+        )
+    return ids, embeddings, metadatas
+
+
+def exact_top_k(position, normalized, metadatas, category, weights, k) -> set:
+    """
+    도메인 전체(couple: 다른 성별)에 대한 코사인 + 규칙 점수 상위 k명
+    """
+    me = metadatas[position]
+    embedding_weight, mbti_weight, age_weight = component_weight_vector(weights)
+    others = [
+        i
+        for i, meta in enumerate(metadatas)
+        if i != position
+        and meta["emailDomain"] == me["emailDomain"]
+        and (category != "couple" or meta["gender"] != me["gender"])
+    ]
+    cosines = normalized[others] @ normalized[position]
+    rules = np.array(
+        [
+            mbti_weight * mbti_weighted_score(me["MBTI"], metadatas[i]["MBTI"])
+            + age_weight
+            * age_group_match_score(me["ageGroup"], metadatas[i]["ageGroup"])
+            for i in others
+        ]
+    )
+    scores = embedding_weight * cosines + rules
+    return {str(others[i] + 1) for i in np.argsort(-scores)[:k]}
+
+
+def measure(query_ids, fn) -> tuple:
+    elapsed, results = [], []
+    for user_id in query_ids:
+        started_at = time.perf_counter()
+        results.append(fn(user_id))
+        elapsed.append(time.perf_counter() - started_at)
+    return statistics.mean(elapsed) * 1000, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="매칭 후보 조회 방식 벤치마크")
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--domains", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--field-dim", type=int, default=64)
+    parser.add_argument("--top-k", type=int, default=100)
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # 운영 DB에 접근하지 않도록 메모리 클라이언트 사용
+    chroma_client_module.chroma_client = chromadb.EphemeralClient(
+        Settings(anonymized_telemetry=False, allow_reset=True)
+    )
+    candidate_service.ANN_MIN_DOMAIN_SIZE = 1
+    candidate_service.ANN_TOP_K = args.top_k
+    candidate_service.ANN_CANDIDATES = args.candidates
+
+    started_at = time.perf_counter()
+    ids, embeddings, metadatas = populate(args)
+    print(
+        f"사용자 {args.users}명 / 도메인 {args.domains}개 저장 "
+        f"{time.perf_counter() - started_at:.1f}s, 질의 {args.queries}명, "
+        f"top-{args.top_k}, 후보 {args.candidates}명\n"
+    )
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    weights = default_weights()
+    query_ids = ids[: args.queries]
+
+    def full_scan(user_id: str) -> list:
+        users = get_user_collection().get(include=["embeddings", "metadatas"])
+        domain = metadatas[int(user_id) - 1]["emailDomain"]
+        return [
+            other_id
+            for other_id, meta in zip(users["ids"], users["metadatas"])
+            if meta["emailDomain"] == domain and other_id != user_id
+        ]
+
+    def select(source: str):
+        def run(user_id: str) -> list:
+            candidate_service.ANN_CANDIDATE_SOURCE = source
+            return candidate_service.select_candidate_users(user_id, CATEGORIES)["ids"]
+
+        return run
+
+    # 로컬 인덱스 구성 (도메인별 첫 조회 시 동기화)
+    started_at = time.perf_counter()
+    for domain in range(args.domains):
+        first = next(
+            i
+            for i, meta in enumerate(metadatas)
+            if meta["emailDomain"] == f"domain{domain}.example.com"
+        )
+        select("local")(ids[first])
+    print(f"로컬 인덱스 구성 {time.perf_counter() - started_at:.1f}s\n")
+
+    header = "".join(f"{f'{c} recall':>16}" for c in CATEGORIES)
+    print(f"{'source':>8}{'ms/user':>10}{header}")
+    for name, fn in (
+        ("full", full_scan),
+        ("chroma", select("chroma")),
+        ("local", select("local")),
+    ):
+        elapsed_ms, results = measure(query_ids, fn)
+        recalls = {category: [] for category in CATEGORIES}
+        for user_id, candidate_ids in zip(query_ids, results):
+            position = int(user_id) - 1
+            candidates = set(candidate_ids) - {user_id}
+            for category in CATEGORIES:
+                expected = exact_top_k(
+                    position,
+                    normalized,
+                    metadatas,
+                    category,
+                    weights[category],
+                    args.top_k,
+                )
+                if expected:
+                    recalls[category].append(len(expected & candidates) / len(expected))
+        row = "".join(f"{statistics.mean(recalls[c]):>16.3f}" for c in CATEGORIES)
+        print(f"{name:>8}{elapsed_ms:>10.1f}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+SBERT 백엔드별 처리량 벤치마크 스크립트
+기준 코퍼스를 백엔드(torch / onnx / onnx-int8)와 배치 크기별로 인코딩하여 초당 문장 수 측정
+
+사용법:
+    python scripts/benchmark_encoder_backends.py [--backends torch onnx onnx-int8]
+        [--batch-sizes 1 8 32] [--repeats 3]
+torch 스레드 수는 앱과 동일하게 SBERT_NUM_THREADS / cgroup CPU 할당량 기준으로 설정
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+import torch  # noqa: E402
+from models.sbert_backends import BACKEND_FAKE, BACKENDS  # noqa: E402
+from scripts.check_encoder_parity import load_backend_model  # noqa: E402
+from scripts.encoder_reference_corpus import build_reference_corpus  # noqa: E402
+from utils.cpu_quota import inference_threads  # noqa: E402
+
+
+def benchmark(model, corpus: list, batch_size: int, repeats: int) -> dict:
+    """
+    배치 크기별 인코딩 처리량 측정 (예열 1회 후 repeats회 측정의 중앙값)
+    """
+    model.encode(
+        corpus[: max(batch_size, 8)], batch_size=batch_size, show_progress_bar=False
+    )
+    elapsed = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        model.encode(corpus, batch_size=batch_size, show_progress_bar=False)
+        elapsed.append(time.perf_counter() - started_at)
+    median = statistics.median(elapsed)
+    return {"seconds": median, "sentences_per_sec": len(corpus) / median}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SBERT 백엔드 처리량 벤치마크")
+    # 테스트용 해시 인코더(fake)는 실제 모델이 아니므로 측정 대상에서 제외
+    model_backends = [b for b in BACKENDS if b != BACKEND_FAKE]
+    parser.add_argument(
+        "--backends", nargs="+", default=model_backends, choices=model_backends
+    )
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--profiles", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    torch.set_num_threads(inference_threads())
+    corpus = build_reference_corpus(args.profiles)
+    print(
+        f"문장 {len(corpus)}개, torch 스레드 {torch.get_num_threads()}개, "
+        f"반복 {args.repeats}회 (중앙값)\n"
+    )
+    print(f"{'backend':<12}{'batch':>7}{'sec':>10}{'sent/s':>12}")
+
+    for backend in args.backends:
+        model = load_backend_model(backend)
+        for batch_size in args.batch_sizes:
+            result = benchmark(model, corpus, batch_size, args.repeats)
+            print(
+                f"{backend:<12}{batch_size:>7}{result['seconds']:>10.3f}"
+                f"{result['sentences_per_sec']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+log_performance 데코레이터 호출당 비용 벤치마크 스크립트
+같은 빈 함수(사용자 ID/카테고리 인자)를 데코레이터 없이 / 샘플링 간격·메모리 측정 조합별로 감싸
+호출당 추가 시간(마이크로초) 비교
+로그는 실제와 같이 로그 큐를 거쳐 리스너 스레드에서 포맷하고 os.devnull로 출력 (콘솔/파일 쓰기 비용 제외)
+
+사용법:
+    python scripts/benchmark_log_performance.py [--calls 20000] [--repeats 5]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+from utils.log_queue import attach_queue_handler, dropped_records  # noqa: E402
+from utils.logger import log_performance, logger  # noqa: E402
+
+
+def target(user_id: str, similarities: dict, category: str) -> dict:
+    return similarities
+
+
+def per_call_us(func, calls: int, repeats: int) -> float:
+    """
+    repeats회 측정 중 중앙값 (호출당 마이크로초)
+    """
+    similarities = {"2": 0.5}
+    samples = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            func("1", similarities, "friend")
+        samples.append((time.perf_counter() - started_at) / calls * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="log_performance 호출당 비용 벤치마크")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    original_handlers = logger.handlers[:]
+    logger.handlers = []
+    listener = attach_queue_handler(logger, [handler])
+
+    variants = [("no decorator", target)]
+    for sample_every in (1, 10, 100):
+        for include_memory in (False, True):
+            name = f"every={sample_every}, memory={'on' if include_memory else 'off'}"
+            variants.append(
+                (
+                    name,
+                    log_performance(
+                        operation_name="benchmark",
+                        include_memory=include_memory,
+                        sample_every=sample_every,
+                    )(target),
+                )
+            )
+
+    try:
+        baseline = None
+        print(f"{'variant':<28}{'us/call':>10}{'overhead':>10}")
+        for name, func in variants:
+            cost = per_call_us(func, args.calls, args.repeats)
+            baseline = cost if baseline is None else baseline
+            print(f"{name:<28}{cost:>10.2f}{cost - baseline:>10.2f}")
+        print(f"\n로그 큐 포화로 버린 레코드: {sum(dropped_records().values())}")
+    finally:
+        listener.stop()
+        logger.handlers = original_handlers
+        devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+사용자 일괄 등록 스크립트
+신규 조직 온보딩 시 EmbeddingRegister 레코드(JSONL)를 API를 거치지 않고 직접 등록
+(POST /api/v3/users/bulk와 같은 검증/일괄 임베딩/도메인별 유사도 1회 계산 로직 사용)
+
+사용법:
+    python scripts/bulk_import_users.py users.jsonl
+검증 실패 또는 등록 실패 시 오류 내용을 출력하고 종료 코드 1 반환
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+from fastapi import HTTPException  # noqa: E402
+from services.bulk_import_service import import_users_bulk  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="사용자 일괄 등록 (JSONL)")
+    parser.add_argument("path", help="EmbeddingRegister 레코드 JSONL 파일 경로")
+    args = parser.parse_args()
+
+    started_at = time.time()
+    with open(args.path, encoding="utf-8") as f:
+        try:
+            result = import_users_bulk(f)
+        except HTTPException as e:
+            print(json.dumps(e.detail, ensure_ascii=False, indent=2))
+            return 1
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"✅ {result['imported']}명 등록 완료 ({time.time() - started_at:.2f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+SBERT 백엔드 정합성 검사 스크립트
+PyTorch fp32 출력 대비 ONNX / ONNX int8 출력의 코사인 편차를 기준 코퍼스에서 측정
+
+측정 항목:
+1. 문장별 코사인 유사도 (fp32 임베딩 vs 후보 백엔드 임베딩): 평균 / 최소 / 하위 1%
+2. 프로필 간 유사도 행렬 차이: 최대 / 평균 절대 오차 (매칭 점수에 직접 영향)
+3. 프로필별 상위 10명 이웃 일치율
+
+사용법:
+    python scripts/check_encoder_parity.py [--backends onnx onnx-int8] [--min-cosine 0.99]
+최소 코사인이 기준보다 낮은 백엔드가 있으면 종료 코드 1 반환
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+from models.sbert_backends import (  # noqa: E402
+    BACKEND_FAKE,
+    BACKEND_ONNX,
+    BACKEND_ONNX_INT8,
+    BACKEND_TORCH,
+    BACKENDS,
+    get_backend,
+    load_sentence_transformer,
+    resolve_model_path,
+)
+from scripts.encoder_reference_corpus import (  # noqa: E402
+    LIST_FIELDS,
+    build_reference_corpus,
+)
+
+TOP_K = 10
+
+
+def load_backend_model(backend: str):
+    """
+    백엔드별 모델 로드 (앱 설정과 같은 백엔드는 이미 로드된 모델 재사용)
+    """
+    if backend == get_backend():
+        from models.sbert_loader import get_model
+
+        return get_model()
+    return load_sentence_transformer(resolve_model_path(), backend)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.clip(norms, 1e-12, None)
+
+
+def compare_embeddings(reference: np.ndarray, candidate: np.ndarray) -> dict:
+    """
+    기준(fp32) 임베딩과 후보 임베딩의 편차 계산
+
+    Args:
+        reference: 기준 임베딩 (문장 수 x 차원)
+        candidate: 후보 임베딩 (문장 수 x 차원)
+    """
+    ref, cand = _normalize(reference), _normalize(candidate)
+    cosine = np.sum(ref * cand, axis=1)
+
+    # 프로필 통합 문장만 골라 프로필 간 유사도 행렬 비교
+    stride = 1 + len(LIST_FIELDS)
+    ref_profiles, cand_profiles = ref[::stride], cand[::stride]
+    ref_sims = ref_profiles @ ref_profiles.T
+    cand_sims = cand_profiles @ cand_profiles.T
+    off_diagonal = ~np.eye(len(ref_profiles), dtype=bool)
+    sim_diff = np.abs(ref_sims - cand_sims)[off_diagonal]
+
+    # 자기 자신은 이웃에서 제외
+    np.fill_diagonal(ref_sims, -np.inf)
+    np.fill_diagonal(cand_sims, -np.inf)
+
+    k = min(TOP_K, len(ref_profiles) - 1)
+    ref_top = np.argsort(-ref_sims, axis=1)[:, :k]
+    cand_top = np.argsort(-cand_sims, axis=1)[:, :k]
+    overlap = np.mean([len(set(r) & set(c)) / k for r, c in zip(ref_top, cand_top)])
+
+    return {
+        "cosine_mean": float(cosine.mean()),
+        "cosine_min": float(cosine.min()),
+        "cosine_p01": float(np.percentile(cosine, 1)),
+        "pairwise_abs_diff_max": float(sim_diff.max()),
+        "pairwise_abs_diff_mean": float(sim_diff.mean()),
+        f"top{k}_overlap": float(overlap),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SBERT 백엔드 정합성 검사")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=[BACKEND_ONNX, BACKEND_ONNX_INT8],
+        choices=[b for b in BACKENDS if b not in (BACKEND_TORCH, BACKEND_FAKE)],
+    )
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    args = parser.parse_args()
+
+    corpus = build_reference_corpus(args.profiles)
+    print(f"기준 코퍼스: 프로필 {args.profiles}개, 문장 {len(corpus)}개")
+
+    reference = load_backend_model(BACKEND_TORCH).encode(
+        corpus, show_progress_bar=False
+    )
+
+    failed = []
+    for backend in args.backends:
+        candidate = load_backend_model(backend).encode(corpus, show_progress_bar=False)
+        report = compare_embeddings(np.asarray(reference), np.asarray(candidate))
+        print(f"\n[{backend}] vs torch fp32")
+        for name, value in report.items():
+            print(f"  {name:<24} {value:.6f}")
+        if report["cosine_min"] < args.min_cosine:
+            failed.append(backend)
+
+    if failed:
+        print(f"\n❌ 최소 코사인 {args.min_cosine} 미만: {', '.join(failed)}")
+        return 1
+    print(f"\n✅ 모든 백엔드가 최소 코사인 {args.min_cosine} 이상")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+인코더 비교용 기준 코퍼스 생성
+ENUM 값으로 무작위(시드 고정) 프로필을 만들어 실제 등록 경로와 같은 형태의 입력을 생성
+- 프로필 통합 문장 (user_data_to_sentence)
+- 필드별 문자열 (embed_fields_optimized 입력과 동일한 ", " 결합)
+"""
+
+import os
+import random
+import sys
+from typing import List
+
+script_dir = os.path.dirname(__file__)
+project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
+sys.path.insert(0, project_root)
+
+from core.enum_process import ENUM_MAPPINGS, convert_to_korean  # noqa: E402
+
+SINGLE_VALUE_FIELDS = ["religion", "smoking", "drinking"]
+LIST_FIELDS = [
+    "personality",
+    "preferredPeople",
+    "currentInterests",
+    "favoriteFoods",
+    "likedSports",
+    "pets",
+    "selfDevelopment",
+    "hobbies",
+]
+
+
+def build_reference_profiles(num_profiles: int = 200, seed: int = 42) -> List[dict]:
+    """
+    한국어로 변환된 무작위 프로필 목록 생성 (시드 고정으로 항상 동일)
+    """
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(num_profiles):
+        profile = {
+            field: rng.choice(list(ENUM_MAPPINGS[field]))
+            for field in SINGLE_VALUE_FIELDS
+        }
+        for field in LIST_FIELDS:
+            values = list(ENUM_MAPPINGS[field])
+            profile[field] = rng.sample(values, rng.randint(1, min(3, len(values))))
+        profiles.append(convert_to_korean(profile))
+    return profiles
+
+
+def build_reference_corpus(num_profiles: int = 200, seed: int = 42) -> List[str]:
+    """
+    프로필 통합 문장과 필드별 문자열로 구성된 기준 코퍼스 생성
+    """
+    from core.embedding import user_data_to_sentence
+
+    corpus = []
+    for profile in build_reference_profiles(num_profiles, seed):
+        corpus.append(user_data_to_sentence(profile))
+        corpus.extend(", ".join(profile[field]) for field in LIST_FIELDS)
+    return corpus
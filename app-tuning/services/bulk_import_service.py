@@ -0,0 +1,387 @@
+"""
+사용자 일괄 등록 서비스
+신규 조직 온보딩 시 EmbeddingRegister 레코드(JSONL)를 한 번에 등록
+
+처리 순서:
+1. 본문 크기 / 레코드 수 확인 (파싱 전에 413 거절)
+2. 전체 레코드 검증 (스키마, 필수 필드, 파일 내 중복 ID, 기존 등록 ID) - 하나라도 실패하면 전체 거절
+3. 통합 문장 / 필드별 문자열을 한 번에 길이 버킷 인코딩
+4. 사용자 컬렉션에 배치 단위 저장 (실패 시 저장한 사용자 롤백)
+5. 도메인별 유사도 저장
+   - 신규 사용자가 도메인의 큰 비중(BULK_IMPORT_FULL_RECOMPUTE_RATIO 이상)이면
+     전체 쌍 유사도를 한 번만 계산하여 배치 upsert (사용자별 재계산을 N번 반복하지 않음)
+   - 그 외에는 기존 사용자 전체를 다시 쓰지 않도록 신규 사용자만 사용자별 경로(대규모 도메인은 ANN 후보)로 계산
+"""
+
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple, Union
+
+from core.embedding import build_field_texts, map_field_embeddings
+from core.enum_process import convert_to_korean
+from core.matching_score_by_category import (
+    CATEGORIES,
+    iter_domain_matching_scores,
+    user_data_to_sentence,
+)
+from core.vector_database import get_similarity_collection, get_user_collection
+from fastapi import HTTPException
+from models.bucketed_encoder import encode_length_bucketed
+from models.sbert_loader import get_model
+from pydantic import ValidationError
+from schemas.user_schema import EmbeddingRegister
+from services.candidate_service import select_candidate_users
+from services.score_profile_service import get_active_weights
+from services.user_service import (
+    EMBEDDING_TARGET_FIELDS,
+    build_user_metadata,
+    convert_numpy_floats,
+    update_similarity_for_users_v3_all_categories,
+    validate_user_fields,
+)
+from utils.domain_lock import domain_locks
+from utils.logger import log_performance, logger
+
+# 요청당 최대 레코드 수 / 본문 크기(바이트)와 Chroma 배치 쓰기 크기
+BULK_IMPORT_MAX_RECORDS = int(os.getenv("BULK_IMPORT_MAX_RECORDS", "5000"))
+BULK_IMPORT_MAX_BYTES = int(os.getenv("BULK_IMPORT_MAX_BYTES", str(16 * 1024 * 1024)))
+BULK_WRITE_BATCH_SIZE = int(os.getenv("BULK_WRITE_BATCH_SIZE", "500"))
+# 신규 사용자 비중이 이 값 이상인 도메인만 전체 쌍 유사도를 재계산
+BULK_IMPORT_FULL_RECOMPUTE_RATIO = float(
+    os.getenv("BULK_IMPORT_FULL_RECOMPUTE_RATIO", "0.5")
+)
+
+SIMILARITY_ALL_PAIRS = "all_pairs"
+SIMILARITY_NEW_USERS = "new_users"
+# 검증 실패 응답에 포함할 최대 오류 수
+MAX_REPORTED_ERRORS = 100
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _record_error(line_no: int, user_id, code: str, errors) -> Dict:
+    return {"line": line_no, "userId": user_id, "code": code, "errors": errors}
+
+
+def bulk_import_too_large(limit: Dict) -> HTTPException:
+    """
+    본문 크기 또는 레코드 수 초과 응답 (413)
+    """
+    return HTTPException(
+        status_code=413,
+        detail={"code": "BULK_IMPORT_TOO_LARGE", "data": limit},
+    )
+
+
+def parse_bulk_records(
+    lines: Iterable[Union[str, bytes]],
+) -> Tuple[List[EmbeddingRegister], List[Dict]]:
+    """
+    JSONL 레코드를 파싱/검증 (빈 줄은 무시)
+
+    Returns:
+        (검증된 사용자 목록, 줄 번호별 오류 목록)
+    """
+    users: List[EmbeddingRegister] = []
+    errors: List[Dict] = []
+    seen_ids = set()
+
+    for line_no, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            errors.append(_record_error(line_no, None, "INVALID_JSON", str(e)))
+            continue
+
+        user_id = record.get("userId") if isinstance(record, dict) else None
+        try:
+            user = EmbeddingRegister.model_validate(record)
+            validate_user_fields(user)
+        except ValidationError as e:
+            details = [
+                {"loc": list(err["loc"]), "msg": err["msg"], "type": err["type"]}
+                for err in e.errors()
+            ]
+            errors.append(_record_error(line_no, user_id, "INVALID_RECORD", details))
+            continue
+        except HTTPException as e:
+            errors.append(_record_error(line_no, user_id, "INVALID_RECORD", e.detail))
+            continue
+
+        if user.userId in seen_ids:
+            errors.append(
+                _record_error(line_no, user.userId, "DUPLICATE_ID_IN_FILE", None)
+            )
+            continue
+        seen_ids.add(user.userId)
+        users.append(user)
+
+    return users, errors
+
+
+def find_registered_ids(user_ids: List[str]) -> List[str]:
+    """
+    이미 등록된 사용자 ID 조회 (배치 단위)
+    """
+    registered = []
+    for chunk in _chunks(user_ids, BULK_WRITE_BATCH_SIZE):
+        registered.extend(get_user_collection().get(ids=chunk, include=[])["ids"])
+    return registered
+
+
+@log_performance(operation_name="prepare_bulk_embedding_data", include_memory=True)
+def prepare_bulk_embedding_data(
+    users: List[EmbeddingRegister],
+) -> Tuple[List[List[float]], List[dict]]:
+    """
+    전체 사용자의 통합 문장과 필드별 문자열을 한 번의 길이 버킷 인코딩으로 임베딩
+    (사용자별 등록의 prepare_embedding_data와 같은 임베딩/메타데이터 생성)
+
+    Returns:
+        (사용자별 통합 임베딩, 사용자별 저장용 메타데이터)
+    """
+    model = get_model()
+    dim = model.get_sentence_embedding_dimension()
+
+    user_dicts = [convert_to_korean(user.model_dump()) for user in users]
+    texts = [user_data_to_sentence(user_dict) for user_dict in user_dicts]
+    field_plans = []
+    for user_dict in user_dicts:
+        field_texts, field_mapping = build_field_texts(
+            user_dict, EMBEDDING_TARGET_FIELDS
+        )
+        field_plans.append((len(texts), field_mapping))
+        texts.extend(field_texts)
+
+    encoded = encode_length_bucketed(model, texts)
+
+    embeddings, metadatas = [], []
+    for i, (user_dict, (offset, field_mapping)) in enumerate(
+        zip(user_dicts, field_plans)
+    ):
+        embeddings.append(encoded[i].tolist())
+        field_embeddings = map_field_embeddings(
+            encoded[offset : offset + len(field_mapping)],
+            field_mapping,
+            EMBEDDING_TARGET_FIELDS,
+            dim,
+        )
+        metadatas.append(build_user_metadata(user_dict, field_embeddings))
+    return embeddings, metadatas
+
+
+def add_users_in_batches(
+    ids: List[str], embeddings: List[list], metadatas: List[dict]
+) -> None:
+    """
+    사용자 컬렉션에 배치 단위로 저장 (실패 시 이미 저장한 배치를 롤백)
+    """
+    collection = get_user_collection()
+    added: List[str] = []
+    try:
+        for start in range(0, len(ids), BULK_WRITE_BATCH_SIZE):
+            end = start + BULK_WRITE_BATCH_SIZE
+            collection.add(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
+            )
+            added.extend(ids[start:end])
+    except Exception:
+        if added:
+            logger.error(f"[BULK_IMPORT] 사용자 저장 실패, {len(added)}명 롤백")
+            collection.delete(ids=added)
+        raise
+
+
+@log_performance(
+    operation_name="recompute_domain_similarities_bulk", include_memory=True
+)
+def recompute_domain_similarities(domain: str) -> int:
+    """
+    도메인 전체 사용자의 카테고리별 유사도를 한 번에 계산하여 배치 upsert
+    도메인 전체 쌍을 새로 계산하므로 역방향 병합 없이 양방향 점수가 그대로 저장됨
+
+    Returns:
+        유사도를 저장한 사용자 수
+    """
+    # 같은 도메인의 개별 등록/삭제와 유사도 쓰기가 섞이지 않도록 도메인 락 안에서 조회~저장
+    with domain_locks.hold(domain):
+        domain_users = get_user_collection().get(
+            where={"emailDomain": domain}, include=["embeddings", "metadatas"]
+        )
+        embeddings_by_id = dict(zip(domain_users["ids"], domain_users["embeddings"]))
+
+        pending = {category: [] for category in CATEGORIES}
+        count = 0
+        for user_id, scores_by_category, components in iter_domain_matching_scores(
+            domain_users["ids"],
+            domain_users["metadatas"],
+            weights_by_category=get_active_weights(),
+        ):
+            count += 1
+            for category, similarities in scores_by_category.items():
+                pending[category].append((user_id, similarities, components[category]))
+                if len(pending[category]) >= BULK_WRITE_BATCH_SIZE:
+                    _upsert_similarities(category, pending[category], embeddings_by_id)
+                    pending[category] = []
+
+        for category, batch in pending.items():
+            if batch:
+                _upsert_similarities(category, batch, embeddings_by_id)
+    return count
+
+
+def score_imported_users(domain: str, user_ids: List[str]) -> int:
+    """
+    신규 사용자만 사용자별 경로로 유사도를 계산하여 저장 (기존 사용자 문서는 역방향 점수만 갱신)
+    대규모 도메인은 ANN 후보만, 그 외에는 한 번 조회한 도메인 전체 사용자를 대상으로 계산
+
+    Returns:
+        유사도를 저장한 사용자 수
+    """
+    domain_users = None
+    for user_id in user_ids:
+        candidates = select_candidate_users(user_id, CATEGORIES)
+        if candidates is None:
+            if domain_users is None:
+                domain_users = get_user_collection().get(
+                    where={"emailDomain": domain}, include=["embeddings", "metadatas"]
+                )
+            candidates = domain_users
+        update_similarity_for_users_v3_all_categories(user_id, candidates)
+    return len(user_ids)
+
+
+def choose_similarity_strategy(imported: int, domain_size: int) -> str:
+    """
+    신규 사용자 비중으로 도메인 유사도 계산 방식 선택
+    (전체 쌍 계산은 O(N²)이고 도메인 전체 문서를 다시 쓰므로 비중이 클 때만 사용)
+    """
+    if domain_size and imported / domain_size >= BULK_IMPORT_FULL_RECOMPUTE_RATIO:
+        return SIMILARITY_ALL_PAIRS
+    return SIMILARITY_NEW_USERS
+
+
+def _upsert_similarities(
+    category: str,
+    batch: List[Tuple[str, dict, dict]],
+    embeddings_by_id: Dict[str, list],
+) -> None:
+    get_similarity_collection(category).upsert(
+        ids=[user_id for user_id, _, _ in batch],
+        embeddings=[embeddings_by_id[user_id] for user_id, _, _ in batch],
+        metadatas=[
+            {
+                "userId": user_id,
+                "similarities": json.dumps(convert_numpy_floats(similarities)),
+                **components,
+            }
+            for user_id, similarities, components in batch
+        ],
+    )
+
+
+@log_performance(operation_name="import_users_bulk", include_memory=True)
+def import_users_bulk(lines: Iterable[Union[str, bytes]]) -> Dict:
+    """
+    JSONL 사용자 레코드 일괄 등록
+
+    Args:
+        lines: EmbeddingRegister 레코드의 JSON 문자열 (한 줄에 하나)
+
+    Returns:
+        등록 결과 요약 (등록 수, 도메인별 유사도 저장 사용자 수)
+
+    Raises:
+        HTTPException: 레코드 검증 실패/중복 ID(422, 409), 레코드 수 초과(413), 저장 실패(500)
+    """
+    # 레코드 수 초과는 파싱/검증 전에 거절
+    lines = list(lines)
+    if sum(1 for line in lines if line.strip()) > BULK_IMPORT_MAX_RECORDS:
+        raise bulk_import_too_large({"maxRecords": BULK_IMPORT_MAX_RECORDS})
+
+    users, errors = parse_bulk_records(lines)
+    if errors:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "code": "BULK_IMPORT_VALIDATION_FAILED",
+                "data": {
+                    "errorCount": len(errors),
+                    "errors": errors[:MAX_REPORTED_ERRORS],
+                },
+            },
+        )
+    if not users:
+        raise HTTPException(
+            status_code=422,
+            detail={"code": "BULK_IMPORT_EMPTY", "data": None},
+        )
+
+    user_ids = [str(user.userId) for user in users]
+    registered = find_registered_ids(user_ids)
+    if registered:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "EMBEDDING_CONFLICT_DUPLICATE_ID",
+                "data": {"userIds": registered[:MAX_REPORTED_ERRORS]},
+            },
+        )
+
+    try:
+        embeddings, metadatas = prepare_bulk_embedding_data(users)
+        add_users_in_batches(user_ids, embeddings, metadatas)
+    except Exception as e:
+        logger.error(f"[BULK_IMPORT] 사용자 등록 실패: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={"code": "EMBEDDING_REGISTER_SERVER_ERROR", "message": str(e)},
+        )
+    logger.info(f"[BULK_IMPORT] 사용자 {len(user_ids)}명 저장 완료")
+
+    # 도메인별 유사도 저장 (등록된 사용자는 유지하고 재계산으로 복구 가능)
+    imported_by_domain: Dict[str, List[str]] = OrderedDict()
+    for user_id, user in zip(user_ids, users):
+        imported_by_domain.setdefault(user.emailDomain, []).append(user_id)
+
+    similarity_users, strategies = {}, {}
+    try:
+        for domain, domain_user_ids in imported_by_domain.items():
+            domain_size = len(
+                get_user_collection().get(where={"emailDomain": domain}, include=[])[
+                    "ids"
+                ]
+            )
+            strategies[domain] = choose_similarity_strategy(
+                len(domain_user_ids), domain_size
+            )
+            if strategies[domain] == SIMILARITY_ALL_PAIRS:
+                similarity_users[domain] = recompute_domain_similarities(domain)
+            else:
+                similarity_users[domain] = score_imported_users(domain, domain_user_ids)
+    except Exception as e:
+        logger.error(f"[BULK_IMPORT] 유사도 계산 실패 (domain={domain}): {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": "BULK_IMPORT_SIMILARITY_FAILED",
+                "message": f"{domain}: {e} (유사도 재계산 스크립트로 복구 필요)",
+            },
+        )
+
+    return {
+        "imported": len(user_ids),
+        "similarityUsersByDomain": similarity_users,
+        "similarityStrategyByDomain": strategies,
+    }
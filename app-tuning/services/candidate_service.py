@@ -0,0 +1,249 @@
+"""
+대규모 도메인의 매칭 후보 선정 서비스
+튜닝 결과에는 상위 100명만 노출되므로, 도메인 사용자 수가 기준 이상이면 도메인 전체를
+정확히 점수화하지 않고 HNSW 인덱스로 후보 M명만 뽑아 기존 코사인 + 규칙 가중 점수를
+후보에 대해서만 계산 (friend: 도메인 전체, couple: 다른 성별)
+
+후보 선정 방식:
+최종 점수 = embedding x 코사인 + (규칙 점수) 이고 규칙 점수는 상대의 (MBTI, 연령대)에만 의존하므로,
+같은 규칙 점수 수준 안에서는 코사인 순서가 곧 최종 점수 순서.
+따라서 수준별 코사인 상위 K명의 합집합은 전체 최종 점수 상위 K명을 포함하며(HNSW 재현율 범위 내),
+임베딩만으로 상위 M명을 뽑을 때처럼 규칙 점수가 높은 사용자를 놓치지 않음
+
+후보 조회 방식 (ANN_CANDIDATE_SOURCE):
+- local (기본): 프로세스별 메모리 HNSW 인덱스 + 규칙 점수 수준별 조회. 조회할 때마다 도메인 사용자
+  ID 목록과 비교하여 다른 프로세스/워커의 등록·삭제분을 반영
+- chroma: user_profiles 컬렉션의 벡터 조회(collection.query)에 도메인/성별 메타데이터 필터를 걸어
+  Chroma가 필터링과 최근접 탐색을 처리. 프로세스 메모리/동기화 비용이 없지만 임베딩 거리만으로
+  상위 M명을 뽑으므로 규칙 점수 비중만큼 재현율이 낮아질 수 있음 (scripts/benchmark_candidate_sources.py)
+"""
+
+import heapq
+import os
+import threading
+from typing import Dict, List, Optional
+
+from core.ann_index import DomainAnnIndex
+from core.matching_score_by_category import age_group_match_score, mbti_weighted_score
+from core.score_components import component_weight_vector
+from core.vector_database import get_user_collection, query_similar_users
+from services.score_profile_service import get_active_weights
+from utils.logger import logger
+from utils.metrics import metrics_registry
+
+# 후보 조회 방식 ("local" 또는 "chroma")
+ANN_CANDIDATE_SOURCE = os.getenv("ANN_CANDIDATE_SOURCE", "local")
+# 후보 선정을 적용할 최소 도메인 사용자 수 (0 이하면 비활성화)
+ANN_MIN_DOMAIN_SIZE = int(os.getenv("ANN_MIN_DOMAIN_SIZE", "5000"))
+# 규칙 점수 수준별 코사인 상위 조회 수 (K, 튜닝 결과 노출 수)
+ANN_TOP_K = int(os.getenv("ANN_TOP_K", "100"))
+# 카테고리별 정확히 재계산할 후보 수 (M)
+ANN_CANDIDATES = int(os.getenv("ANN_CANDIDATES", "200"))
+# HNSW 조회 탐색 폭 (조회 수보다 작으면 조회 수 사용)
+ANN_EF_SEARCH = int(os.getenv("ANN_EF_SEARCH", "200"))
+# 인덱스 동기화 시 임베딩 조회 배치 크기
+ANN_SYNC_BATCH_SIZE = 500
+
+_indexes: Dict[str, DomainAnnIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def attribute_key(meta: dict) -> tuple:
+    """
+    후보 인덱스 속성 키 (성별 필터와 규칙 점수 계산에 필요한 값)
+    """
+    return (meta.get("gender"), meta.get("MBTI"), meta.get("ageGroup"))
+
+
+def _domain_user_ids(domain: str) -> Optional[List[str]]:
+    """
+    후보 선정 대상 도메인의 사용자 ID 목록 (기준 미만 도메인은 None)
+    """
+    domain_ids = get_user_collection().get(where={"emailDomain": domain}, include=[])[
+        "ids"
+    ]
+    if ANN_MIN_DOMAIN_SIZE <= 0 or len(domain_ids) < ANN_MIN_DOMAIN_SIZE:
+        # 기준 미만으로 줄어든 도메인(초기화 포함)의 인덱스는 버려서 오래된 임베딩을 남기지 않음
+        with _indexes_lock:
+            _indexes.pop(domain, None)
+        return None
+    return domain_ids
+
+
+def _sync_domain_index(domain: str, domain_ids: List[str], dim: int) -> DomainAnnIndex:
+    """
+    도메인 인덱스를 저장소의 현재 사용자 목록과 동기화
+    """
+    collection = get_user_collection()
+    with _indexes_lock:
+        index = _indexes.get(domain)
+        result = "hit" if index is not None else "miss"
+        if index is None:
+            index = _indexes[domain] = DomainAnnIndex(dim, ef_search=ANN_EF_SEARCH)
+    metrics_registry.increment("cache_requests", ("ann_index", result))
+
+    indexed = index.ids()
+    current = set(domain_ids)
+    index.remove(indexed - current)
+
+    missing = [user_id for user_id in domain_ids if user_id not in indexed]
+    for start in range(0, len(missing), ANN_SYNC_BATCH_SIZE):
+        batch = collection.get(
+            ids=missing[start : start + ANN_SYNC_BATCH_SIZE],
+            include=["embeddings", "metadatas"],
+        )
+        index.add(
+            batch["ids"],
+            batch["embeddings"],
+            [attribute_key(meta) for meta in batch["metadatas"]],
+        )
+    if missing:
+        logger.info(f"[ANN] {domain} 인덱스 동기화: +{len(missing)}명 ({len(index)}명)")
+    return index
+
+
+def rank_candidates(
+    index: DomainAnnIndex,
+    embedding: list,
+    user_id: str,
+    user_meta: dict,
+    category: str,
+    weights: dict,
+    top_k: int = None,
+    num_candidates: int = None,
+) -> List[str]:
+    """
+    규칙 점수 수준별 코사인 상위 top_k명을 모아 근사 최종 점수 상위 num_candidates명 반환
+    (근사 점수는 저장된 임베딩의 코사인으로 계산, 정확한 점수는 호출 측에서 재계산)
+
+    Args:
+        index: 기준 사용자 도메인의 후보 인덱스
+        embedding: 기준 사용자 임베딩
+        user_id: 기준 사용자 ID (후보에서 제외)
+        user_meta: 기준 사용자 메타데이터
+        category: "friend" 또는 "couple" (couple은 다른 성별만)
+        weights: 카테고리 가중치 ({"embedding", "rule", "mbti", "age"})
+
+    Returns:
+        근사 최종 점수 내림차순 후보 ID 목록
+    """
+    top_k = top_k or ANN_TOP_K
+    num_candidates = max(num_candidates or ANN_CANDIDATES, top_k)
+    embedding_weight, mbti_weight, age_weight = component_weight_vector(weights)
+    my_gender = user_meta.get("gender")
+
+    # 1. 속성 키별 규칙 점수 → 규칙 점수 수준별 속성 키 집합
+    rule_by_attribute = {}
+    for attribute in index.attribute_counts():
+        gender, mbti, age_group = attribute
+        if category == "couple" and my_gender and gender == my_gender:
+            continue
+        rule_by_attribute[attribute] = round(
+            mbti_weight * mbti_weighted_score(user_meta.get("MBTI"), mbti)
+            + age_weight * age_group_match_score(user_meta.get("ageGroup"), age_group),
+            6,
+        )
+    if not rule_by_attribute:
+        return []
+    levels: Dict[float, set] = {}
+    for attribute, rule in rule_by_attribute.items():
+        levels.setdefault(rule, set()).add(attribute)
+
+    scores: Dict[str, float] = {}
+
+    def collect(attributes: set) -> list:
+        hits = index.query(embedding, top_k, exclude_id=user_id, attributes=attributes)
+        for other_id, cosine, attribute in hits:
+            scores[other_id] = embedding_weight * cosine + rule_by_attribute[attribute]
+        return hits
+
+    # 2. 전체 후보의 코사인 상위 조회 (최대 코사인 → 수준별 점수 상한 계산에 사용)
+    hits = collect(set(rule_by_attribute))
+    if not hits:
+        return []
+    max_cosine = hits[0][1]
+
+    # 3. 규칙 점수가 높은 수준부터 조회, 수준의 점수 상한이 현재 top_k번째 점수보다 낮으면 중단
+    for rule in sorted(levels, reverse=True):
+        if len(scores) >= top_k:
+            kth_score = heapq.nlargest(top_k, scores.values())[-1]
+            if embedding_weight * max_cosine + rule < kth_score:
+                break
+        collect(levels[rule])
+
+    return heapq.nlargest(num_candidates, scores, key=scores.get)
+
+
+def _query_chroma_candidates(
+    embedding: list, user_id: str, user_meta: dict, categories: List[str]
+) -> dict:
+    """
+    Chroma 벡터 조회 + 메타데이터 필터로 카테고리별 상위 M명 조회 (중복 제거 후 병합)
+    """
+    merged = {"ids": [], "embeddings": [], "metadatas": []}
+    seen = set()
+    for category in categories:
+        exclude_gender = user_meta.get("gender") if category == "couple" else None
+        result = query_similar_users(
+            embedding,
+            ANN_CANDIDATES,
+            user_meta.get("emailDomain"),
+            exclude_gender=exclude_gender,
+            exclude_id=user_id,
+        )
+        for row in zip(result["ids"], result["embeddings"], result["metadatas"]):
+            if row[0] not in seen:
+                seen.add(row[0])
+                for key, value in zip(merged, row):
+                    merged[key].append(value)
+    return merged
+
+
+def select_candidate_users(user_id: str, categories: List[str]) -> Optional[dict]:
+    """
+    기준 사용자와 ANN 후보 사용자의 데이터 조회 (도메인이 기준 미만이면 None → 전체 계산)
+
+    Args:
+        user_id: 기준 사용자 ID (이미 저장된 사용자)
+        categories: 점수를 계산할 카테고리 목록 ("friend", "couple")
+
+    Returns:
+        기준 사용자 + 후보 사용자의 {"ids", "embeddings", "metadatas"} (컬렉션 get 결과 형식)
+        + 조회 시점 도메인 전체 사용자 ID "domainIds" (후보가 아닌 기존 사용자와
+        조회 이후 등록된 사용자를 구분하는 용도)
+    """
+    collection = get_user_collection()
+    me = collection.get(ids=[user_id], include=["embeddings", "metadatas"])
+    if not me["ids"]:
+        return None
+    embedding, meta = me["embeddings"][0], me["metadatas"][0]
+
+    domain = meta.get("emailDomain")
+    domain_ids = _domain_user_ids(domain)
+    if domain_ids is None:
+        return None
+
+    if ANN_CANDIDATE_SOURCE == "chroma":
+        candidates = _query_chroma_candidates(embedding, user_id, meta, categories)
+    else:
+        index = _sync_domain_index(domain, domain_ids, len(embedding))
+        weights = get_active_weights()
+        candidate_ids = set()
+        for category in categories:
+            candidate_ids.update(
+                rank_candidates(
+                    index, embedding, user_id, meta, category, weights[category]
+                )
+            )
+        if not candidate_ids:
+            return {**me, "domainIds": domain_ids}
+        candidates = collection.get(
+            ids=sorted(candidate_ids), include=["embeddings", "metadatas"]
+        )
+
+    return {
+        "ids": me["ids"] + candidates["ids"],
+        "embeddings": list(me["embeddings"]) + list(candidates["embeddings"]),
+        "metadatas": me["metadatas"] + candidates["metadatas"],
+        "domainIds": domain_ids,
+    }
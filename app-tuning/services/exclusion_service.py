@@ -0,0 +1,96 @@
+"""
+추천 제외 집합(차단 / 매칭 완료 / 이미 노출) 관리 서비스
+사용자별 제외 집합을 비트맵으로 저장하고, 튜닝 결과 상위 K 선정 시 적용
+"""
+
+import threading
+from typing import Dict, List
+
+from core.exclusion_bitmap import ExclusionBitmap
+from core.vector_database import get_exclusions, upsert_exclusions
+from fastapi import HTTPException
+from utils.logger import log_performance
+
+# 제외 집합 종류
+# - blocked: 사용자가 차단한 상대
+# - matched: 이미 매칭이 성사된 상대
+# - seen: 이미 추천 리스트로 노출된 상대
+EXCLUSION_KINDS = ("blocked", "matched", "seen")
+
+# 사용자별 제외 집합 읽기-수정-쓰기 직렬화용 고정 개수 분할 락
+# (userId 해시로 락을 선택하므로 사용자 수와 무관하게 락 개수가 일정)
+EXCLUSION_LOCK_STRIPES = 64
+_exclusion_locks = [threading.Lock() for _ in range(EXCLUSION_LOCK_STRIPES)]
+
+
+def _exclusion_lock(user_id: str) -> threading.Lock:
+    return _exclusion_locks[hash(str(user_id)) % EXCLUSION_LOCK_STRIPES]
+
+
+def validate_exclusion_kind(kind: str) -> None:
+    if kind not in EXCLUSION_KINDS:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "EXCLUSION_INVALID_KIND", "data": None},
+        )
+
+
+def load_exclusion_bitmaps(user_id: str) -> Dict[str, ExclusionBitmap]:
+    """
+    사용자의 종류별 제외 비트맵 조회 (저장된 값이 없으면 빈 비트맵)
+    """
+    stored = get_exclusions(str(user_id))
+    return {
+        kind: ExclusionBitmap.from_string(stored.get(kind, ""))
+        for kind in EXCLUSION_KINDS
+    }
+
+
+def load_combined_exclusion_bitmap(user_id: str) -> ExclusionBitmap:
+    """
+    튜닝 결과에 적용할 전체 제외 비트맵 조회 (모든 종류의 합집합)
+    """
+    combined = ExclusionBitmap()
+    for bitmap in load_exclusion_bitmaps(user_id).values():
+        combined = combined | bitmap
+    return combined
+
+
+@log_performance(operation_name="update_exclusions")
+def update_exclusions(
+    user_id: str, kind: str, add: List[int], remove: List[int]
+) -> Dict[str, List[int]]:
+    """
+    사용자의 특정 종류 제외 집합에 userId를 추가/삭제
+
+    Args:
+        user_id: 제외 집합을 소유한 사용자 ID
+        kind: 제외 집합 종류 (blocked, matched, seen)
+        add: 추가할 userId 목록
+        remove: 삭제할 userId 목록
+
+    Returns:
+        종류별 제외 userId 목록
+    """
+    validate_exclusion_kind(kind)
+
+    # 같은 사용자에 대한 동시 변경이 서로의 결과를 덮어쓰지 않도록 조회~저장을 직렬화
+    with _exclusion_lock(user_id):
+        bitmaps = load_exclusion_bitmaps(user_id)
+        bitmaps[kind].update(add)
+        bitmaps[kind].difference_update(remove)
+
+        upsert_exclusions(
+            str(user_id),
+            {name: bitmap.to_string() for name, bitmap in bitmaps.items()},
+        )
+    return {name: list(bitmap) for name, bitmap in bitmaps.items()}
+
+
+def get_exclusion_lists(user_id: str) -> Dict[str, List[int]]:
+    """
+    사용자의 종류별 제외 userId 목록 조회
+    """
+    return {
+        kind: list(bitmap) for kind, bitmap in load_exclusion_bitmaps(user_id).items()
+    }
@@ -0,0 +1,197 @@
+"""
+비동기 사용자 등록 작업 큐
+프로필 저장은 요청 내에서 즉시 처리하고, 카테고리별 유사도 계산은
+제한된 크기의 작업 큐와 백그라운드 워커에서 처리
+
+주요 기능:
+1. 유사도 계산 작업 등록 (큐가 가득 차면 즉시 거절)
+2. 작업 상태/진행률 조회
+3. 큐 적재량 및 워커 상태 통계 제공 (용량 튜닝용)
+4. 앱 종료 시 워커 중지 및 미완료 작업 실패 처리
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from services.user_service import update_registered_user_similarities_v3
+from utils.executor import cpu_executor
+from utils.logger import logger
+from utils.tracing import start_trace
+
+CATEGORIES = ["friend", "couple"]
+
+# 작업 상태
+JOB_QUEUED = "QUEUED"
+JOB_RUNNING = "RUNNING"
+JOB_SUCCEEDED = "SUCCEEDED"
+JOB_FAILED = "FAILED"
+
+
+class RegistrationQueueFullError(Exception):
+    """등록 작업 큐가 가득 찬 경우 발생"""
+
+
+class RegistrationJobQueue:
+    """
+    유사도 계산 작업을 처리하는 제한 크기 작업 큐
+    워커는 첫 작업 등록 시점에 현재 이벤트 루프에서 시작됨
+    """
+
+    def __init__(self, max_queue_size: int, worker_count: int, max_history: int):
+        self.max_queue_size = max_queue_size
+        self.worker_count = worker_count
+        self.max_history = max_history
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: list = []
+        self._jobs: "OrderedDict[str, Dict]" = OrderedDict()
+        self._processed = 0
+        self._failed = 0
+
+    # ---------------------- 작업 등록/조회 ----------------------
+    def is_full(self) -> bool:
+        return self._queue is not None and self._queue.full()
+
+    def submit(self, user_id: str) -> Dict:
+        """
+        유사도 계산 작업 등록
+
+        Raises:
+            RegistrationQueueFullError: 큐가 가득 찬 경우
+        """
+        self._ensure_workers()
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "jobId": job_id,
+            "userId": user_id,
+            "status": JOB_QUEUED,
+            "completedCategories": [],
+            "totalCategories": len(CATEGORIES),
+            "error": None,
+            "createdAt": time.time(),
+            "startedAt": None,
+            "finishedAt": None,
+        }
+        try:
+            self._queue.put_nowait(job_id)
+        except asyncio.QueueFull:
+            raise RegistrationQueueFullError(
+                f"등록 작업 큐가 가득 찼습니다 (max={self.max_queue_size})"
+            )
+
+        self._jobs[job_id] = job
+        self._evict_finished_jobs()
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict:
+        """
+        큐 적재량 및 처리 현황 통계
+        """
+        status_counts = {
+            status: 0 for status in (JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED)
+        }
+        for job in self._jobs.values():
+            status_counts[job["status"]] += 1
+
+        return {
+            "queueDepth": self._queue.qsize() if self._queue else 0,
+            "maxQueueSize": self.max_queue_size,
+            "workers": self.worker_count,
+            "activeWorkers": status_counts[JOB_RUNNING],
+            "jobsByStatus": status_counts,
+            "processedTotal": self._processed,
+            "failedTotal": self._failed,
+        }
+
+    # ---------------------- 수명 주기 ----------------------
+    async def stop(self) -> None:
+        """
+        워커 태스크를 취소하고 대기/실행 중이던 작업을 실패 처리 (앱 종료 시 호출)
+        실행기 스레드에서 이미 시작된 계산은 끝까지 실행되지만 결과는 반영하지 않음
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+        for job in self._jobs.values():
+            if job["status"] in (JOB_QUEUED, JOB_RUNNING):
+                job["status"] = JOB_FAILED
+                job["error"] = "SERVER_SHUTDOWN"
+                job["finishedAt"] = time.time()
+
+    # ---------------------- 워커 ----------------------
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+
+        # 종료된 워커(이벤트 루프 재시작 등)는 다시 생성
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.worker_count:
+            self._workers.append(
+                asyncio.create_task(self._worker(len(self._workers) + 1))
+            )
+
+    async def _worker(self, worker_no: int) -> None:
+        logger.info(f"[REGISTRATION_WORKER-{worker_no}] 시작")
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(self._jobs[job_id])
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: Dict) -> None:
+        job["status"] = JOB_RUNNING
+        job["startedAt"] = time.time()
+
+        def on_progress(category: str) -> None:
+            job["completedCategories"].append(category)
+
+        try:
+            # 동기 유사도 계산은 CPU 전용 실행기에서 처리
+            # (작업 큐 자체가 크기 제한이 있으므로 포화 시에도 거절하지 않고 대기)
+            # 워커 태스크는 첫 요청의 컨텍스트를 물려받으므로 작업마다 새 추적으로 분리
+            with start_trace("registration_job", jobId=job["jobId"]):
+                await cpu_executor.run(
+                    update_registered_user_similarities_v3,
+                    job["userId"],
+                    on_progress,
+                    reject_when_full=False,
+                )
+            job["status"] = JOB_SUCCEEDED
+        except Exception as e:
+            job["status"] = JOB_FAILED
+            job["error"] = getattr(e, "detail", None) or str(e)
+            self._failed += 1
+            logger.error(
+                f"[REGISTRATION_JOB_FAILED] jobId={job['jobId']} userId={job['userId']}: {e}"
+            )
+        finally:
+            job["finishedAt"] = time.time()
+            self._processed += 1
+
+    def _evict_finished_jobs(self) -> None:
+        # 오래된 완료 작업부터 제거하여 작업 이력 크기를 제한
+        while len(self._jobs) > self.max_history:
+            for job_id, job in self._jobs.items():
+                if job["status"] in (JOB_SUCCEEDED, JOB_FAILED):
+                    del self._jobs[job_id]
+                    break
+            else:
+                return
+
+
+registration_job_queue = RegistrationJobQueue(
+    max_queue_size=int(os.getenv("REGISTRATION_QUEUE_SIZE", "100")),
+    worker_count=int(os.getenv("REGISTRATION_WORKERS", "2")),
+    max_history=int(os.getenv("REGISTRATION_JOB_HISTORY", "1000")),
+)
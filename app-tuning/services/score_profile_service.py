@@ -0,0 +1,176 @@
+"""
+매칭 점수 가중치 프로필 관리 서비스
+저장된 쌍별 점수 구성 요소(코사인 / MBTI / 연령대)로 가중치 변경을 재조합하여
+모델 호출이나 전체 재계산 없이 유사도 맵(순위)을 갱신
+
+주요 기능:
+1. 활성 가중치 프로필 조회 (저장된 프로필이 없으면 기본 가중치)
+2. 가중치 변경 저장 후 도메인별 벡터 연산 재조합 및 유사도 맵 일괄 갱신
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+from core.matching_score_by_category import CATEGORIES, WEIGHTS_BY_CATEGORY
+from core.score_components import (
+    RULE_WEIGHTS,
+    component_weight_vector,
+    unpack_components,
+)
+from core.vector_database import (
+    get_similarity_collection,
+    get_user_collection,
+    get_weight_profile,
+    iter_users,
+    upsert_weight_profile,
+)
+from utils.domain_lock import domain_locks
+from utils.logger import log_performance, logger
+
+# 유사도 맵 갱신 배치 크기
+REBLEND_WRITE_BATCH_SIZE = int(os.getenv("REBLEND_WRITE_BATCH_SIZE", "500"))
+
+
+def default_weights() -> Dict[str, dict]:
+    return {
+        category: {**RULE_WEIGHTS, **WEIGHTS_BY_CATEGORY[category]}
+        for category in CATEGORIES
+    }
+
+
+def get_active_weights() -> Dict[str, dict]:
+    """
+    활성 카테고리별 가중치 (저장된 프로필을 기본 가중치 위에 덮어씀)
+    """
+    weights = default_weights()
+    for category, stored in (get_weight_profile() or {}).items():
+        weights[category] = {**weights.get(category, {}), **stored}
+    return weights
+
+
+def _list_domains() -> List[str]:
+    domains = []
+    for page in iter_users(include=["metadatas"]):
+        domains.extend(meta.get("emailDomain") for meta in page["metadatas"])
+    return list(dict.fromkeys(domain for domain in domains if domain))
+
+
+def reblend_domain(domain: str, category: str, weights: dict) -> Dict[str, int]:
+    """
+    도메인 사용자들의 유사도 맵을 저장된 구성 요소와 새 가중치로 재조합
+
+    구성 요소는 각 쌍을 계산한 쪽(나중에 등록된 사용자)의 문서에만 저장되므로,
+    도메인 전체 문서의 구성 요소를 (기준, 상대) 양방향 키로 모아 한 번에 점수를 계산하고
+    각 사용자 맵의 기존 키만 갱신 (구성 요소가 없는 쌍은 기존 점수 유지)
+
+    Returns:
+        {"users": 갱신한 사용자 수, "pairs": 재조합한 점수 수, "unresolved": 구성 요소가 없는 점수 수}
+    """
+    stats = {"users": 0, "pairs": 0, "unresolved": 0}
+    user_ids = get_user_collection().get(where={"emailDomain": domain}, include=[])[
+        "ids"
+    ]
+    if not user_ids:
+        return stats
+
+    collection = get_similarity_collection(category)
+    # 같은 도메인의 등록/삭제에 의한 유사도 쓰기와 섞이지 않도록 조회~저장을 도메인 락으로 보호
+    with domain_locks.hold(domain):
+        docs = collection.get(ids=user_ids, include=["metadatas"])
+        index = {user_id: i for i, user_id in enumerate(user_ids)}
+        size = len(user_ids)
+
+        # 1. (기준, 상대) 쌍별 구성 요소를 모아 새 가중치로 한 번에 점수 계산
+        pair_keys, pair_components = [], []
+        for meta in docs["metadatas"]:
+            unpacked = unpack_components(meta)
+            if unpacked is None or meta.get("userId") not in index:
+                continue
+            other_ids, components = unpacked
+            others = np.array([index.get(other_id, -1) for other_id in other_ids])
+            known = others >= 0
+            pair_keys.append(index[meta["userId"]] * size + others[known])
+            pair_components.append(components[known])
+
+        if not pair_keys:
+            # 구성 요소 저장 이전에 계산된 도메인은 재계산 스크립트로 구성 요소를 채워야 함
+            logger.warning(f"[WEIGHT_PROFILE] 구성 요소 없음: {domain}/{category}")
+            return stats
+
+        sources = np.concatenate(pair_keys)
+        scores = np.concatenate(pair_components) @ component_weight_vector(weights)
+        # 역방향 키에도 같은 점수 적용 (MBTI 점수는 일부 순서쌍에서 비대칭이지만,
+        # 기본 등록 경로의 역방향 쓰기도 계산한 쪽의 점수를 상대 문서에 그대로 저장하므로 동일하게 맞춤)
+        reverse = (sources % size) * size + sources // size
+        keys = np.concatenate([sources, reverse])
+        values = np.concatenate([scores, scores])
+        order = np.argsort(keys, kind="stable")
+        keys, values = keys[order], values[order]
+
+        # 2. 사용자별 맵의 기존 키만 새 점수로 갱신
+        updates = []
+        for doc_id, meta in zip(docs["ids"], docs["metadatas"]):
+            similarity_map = json.loads(meta.get("similarities", "{}"))
+            other_ids = [other_id for other_id in similarity_map if other_id in index]
+            if not other_ids:
+                continue
+            queries = index[doc_id] * size + np.array(
+                [index[other_id] for other_id in other_ids]
+            )
+            positions = np.minimum(np.searchsorted(keys, queries), len(keys) - 1)
+            found = keys[positions] == queries
+            for other_id, position, is_found in zip(other_ids, positions, found):
+                if is_found:
+                    similarity_map[other_id] = round(float(values[position]), 6)
+            stats["pairs"] += int(found.sum())
+            stats["unresolved"] += int((~found).sum())
+            updates.append((doc_id, similarity_map))
+
+        # 3. 유사도 맵 일괄 갱신 (메타데이터 병합 업데이트이므로 구성 요소 필드는 유지)
+        for start in range(0, len(updates), REBLEND_WRITE_BATCH_SIZE):
+            batch = updates[start : start + REBLEND_WRITE_BATCH_SIZE]
+            collection.update(
+                ids=[doc_id for doc_id, _ in batch],
+                metadatas=[
+                    {"similarities": json.dumps(similarity_map)}
+                    for _, similarity_map in batch
+                ],
+            )
+        stats["users"] = len(updates)
+    return stats
+
+
+@log_performance(operation_name="apply_weight_profile", include_memory=True)
+def apply_weight_profile(updates: Dict[str, Optional[dict]]) -> Dict:
+    """
+    가중치 프로필을 저장하고 변경된 카테고리의 유사도 맵을 도메인별로 재조합
+
+    Args:
+        updates: {카테고리: 새 가중치 또는 None(변경 없음)}
+
+    Returns:
+        적용된 가중치와 카테고리별 재조합 통계
+    """
+    weights = get_active_weights()
+    changed = [category for category, value in updates.items() if value is not None]
+    for category in changed:
+        weights[category] = {**RULE_WEIGHTS, **updates[category]}
+
+    # 이후 등록/재계산도 새 가중치를 사용하도록 먼저 저장
+    upsert_weight_profile(weights)
+    logger.info(f"[WEIGHT_PROFILE] 가중치 변경: {json.dumps(weights)}")
+
+    stats = {
+        category: {"users": 0, "pairs": 0, "unresolved": 0} for category in changed
+    }
+    domains = _list_domains()
+    for domain in domains:
+        for category in changed:
+            for key, value in reblend_domain(
+                domain, category, weights[category]
+            ).items():
+                stats[category][key] += value
+
+    return {"weights": weights, "domains": len(domains), "reblended": stats}
@@ -1,8 +1,13 @@
+import asyncio
+import heapq
 import json
+from typing import Optional
 
+from core.exclusion_bitmap import ExclusionBitmap
 from core.vector_database import get_similarities, get_users_data
 from fastapi import HTTPException
 from schemas.tuning_schema import TuningResponse
+from services.exclusion_service import load_combined_exclusion_bitmap
 from utils import logger
 
 
@@ -57,18 +62,30 @@ async def fetch_users_metadata(user_ids: list[str]) -> dict[str, dict]:
         )
 
 
+# 제외 집합(차단/매칭/노출)에 포함된 유저를 유사도 후보에서 제거하는 함수
+def apply_exclusions(
+    similarities: dict[str, float], excluded: Optional[ExclusionBitmap]
+) -> dict[str, float]:
+    if not excluded:
+        return similarities
+    return {uid: score for uid, score in similarities.items() if uid not in excluded}
+
+
 # 유사도 정보와 메타데이터를 기반으로 추천 ID만 추출하는 함수
 def format_recommendations(
-    similarities: dict[str, float], metadata: dict[str, dict], top_k: int = 100
+    similarities: dict[str, float],
+    metadata: dict[str, dict],
+    top_k: int = 100,
 ) -> list[int]:
 
-    # 유사도 점수를 기준으로 내림차순 정렬 후 상위 N개만 추출
-    sorted_users = sorted(similarities.items(), key=lambda x: x[1], reverse=True)[
-        :top_k
-    ]
+    # metadata가 없는 유저를 먼저 걸러낸 뒤 상위 N개를 선정
+    # (선정 후 필터링하면 페이지가 top_k보다 적게 채워짐)
+    candidates = (
+        (uid, score) for uid, score in similarities.items() if uid in metadata
+    )
+    top_users = heapq.nlargest(top_k, candidates, key=lambda x: x[1])
 
-    # metadata가 존재하는 유저만 ID로 반환
-    return [int(uid) for uid, _ in sorted_users if uid in metadata]
+    return [int(uid) for uid, _ in top_users]
 
 
 # 전체 추천 결과를 반환하는 메인 함수 (친구 매칭 추천 only)
@@ -77,7 +94,9 @@ async def get_matching_users(user_id: str) -> TuningResponse:
     # 유사도 정보 가져오기
     similarities = await fetch_user_similarities(str(user_id))
 
-    # 유사도에 포함된 유저 ID만 추출
+    # 제외 집합(차단/매칭/노출) 적용 후 남은 유저 ID만 추출
+    excluded = await asyncio.to_thread(load_combined_exclusion_bitmap, str(user_id))
+    similarities = apply_exclusions(similarities, excluded)
     user_ids = list(similarities.keys())
 
     # 해당 유저들의 메타데이터 조회
@@ -95,7 +114,9 @@ async def get_matching_users_by_category(user_id: str, category: str) -> TuningR
     # 유사도 정보 가져오기
     similarities = await fetch_user_similarities(str(user_id), category)
 
-    # 유사도에 포함된 유저 ID만 추출
+    # 제외 집합(차단/매칭/노출) 적용 후 남은 유저 ID만 추출
+    excluded = await asyncio.to_thread(load_combined_exclusion_bitmap, str(user_id))
+    similarities = apply_exclusions(similarities, excluded)
     user_ids = list(similarities.keys())
 
     # 해당 유저들의 메타데이터 조회
@@ -1,10 +1,14 @@
+import asyncio
 import json
+import os
+from typing import Callable, Optional
 
 import numpy as np
 from core.embedding import embed_fields_optimized
 from core.enum_process import convert_to_korean
 from core.matching_score_by_category import (
-    compute_matching_score_sentence_based,
+    CATEGORIES,
+    compute_matching_scores_with_components,
     user_data_to_sentence,
 )
 from core.matching_score_optimized import compute_matching_score_optimized
@@ -17,9 +21,30 @@ from core.vector_database import (
     get_user_collection,
 )
 from fastapi import HTTPException
-from models.sbert_loader import get_model
+from models.batch_encoder import batch_encoder
+from models.sbert_loader import wait_until_model_ready
 from schemas.user_schema import EmbeddingRegister
-from utils.logger import log_performance, logger
+from services.candidate_service import select_candidate_users
+from services.score_profile_service import get_active_weights
+from utils.domain_lock import domain_locks
+from utils.executor import cpu_executor
+from utils.logger import PERF_HOT_SAMPLE_EVERY, log_performance, logger
+from utils.tracing import span
+
+# 필드별 임베딩 대상 필드 목록 (v3)
+EMBEDDING_TARGET_FIELDS = [
+    "religion",
+    "smoking",
+    "drinking",
+    "personality",
+    "preferredPeople",
+    "currentInterests",
+    "favoriteFoods",
+    "likedSports",
+    "pets",
+    "selfDevelopment",
+    "hobbies",
+]
 
 
 # 메타데이터 저장 시 문자열로 반환하기 위함
@@ -29,6 +54,13 @@ def safe_join(value):
     return ", ".join(str(v) for v in value) if isinstance(value, list) else str(value)
 
 
+# 한글화된 사용자 딕셔너리와 필드별 임베딩으로 저장용 메타데이터 생성
+def build_user_metadata(user_dict: dict, field_embeddings: dict) -> dict:
+    metadata = {k: safe_join(v) for k, v in user_dict.items()}
+    metadata["field_embeddings"] = json.dumps(field_embeddings)
+    return metadata
+
+
 @log_performance(operation_name="prepare_embedding_data", include_memory=True)
 def prepare_embedding_data(
     user_dict: dict, target_fields: list[str]
@@ -49,18 +81,14 @@ def prepare_embedding_data(
         # user_text = convert_user_to_text(user_dict, target_fields)
         user_text = user_data_to_sentence(user_dict)
 
-        model = get_model()
-        embedding = model.encode(
-            user_text, show_progress_bar=False
-        ).tolist()  # 통합 텍스트 임베딩 생성
+        # 통합 텍스트 임베딩 생성 (동시 요청과 병합되는 마이크로 배치 인코더 사용)
+        with span("encode"):
+            embedding = batch_encoder.encode(user_text).tolist()
         if not embedding:
             raise ValueError("임베딩 벡터가 비어 있습니다.")
         field_embeddings = embed_fields_optimized(user_dict, target_fields)
 
-        metadata = {k: safe_join(v) for k, v in user_dict.items()}
-        metadata["field_embeddings"] = json.dumps(field_embeddings)
-
-        return embedding, metadata
+        return embedding, build_user_metadata(user_dict, field_embeddings)
 
     except Exception as e:
         raise HTTPException(
@@ -79,7 +107,11 @@ def upsert_similarity(user_id: str, embedding: list, similarities: dict):
 
 
 # 매칭 스코어 정보 역방향 DB 저장
-@log_performance(operation_name="update_reverse_similarities", include_memory=True)
+@log_performance(
+    operation_name="update_reverse_similarities",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
+)
 def update_reverse_similarities(user_id: str, similarities: dict):
     for other_id, score in similarities.items():
         try:
@@ -119,7 +151,11 @@ def update_reverse_similarities(user_id: str, similarities: dict):
 
 
 # 현재 유저가 저장하지 않은 상대방의 기존 유사도를 병합
-@log_performance(operation_name="enrich_with_reverse_similarities", include_memory=True)
+@log_performance(
+    operation_name="enrich_with_reverse_similarities",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
+)
 def enrich_with_reverse_similarities(
     user_id: str, similarities: dict, all_users: dict
 ) -> dict:
@@ -256,6 +292,32 @@ def check_duplicate_user(user_id: str) -> None:
         )
 
 
+# 임베딩 모델 준비 대기 시간(초)과 준비되지 않은 경우의 재시도 안내 시간
+MODEL_READY_TIMEOUT = float(os.getenv("MODEL_READY_TIMEOUT", "30"))
+MODEL_RETRY_AFTER_SECONDS = "10"
+
+
+# 임베딩이 필요한 요청은 모델 준비 완료를 기다린 뒤 처리 (시간 초과/로드 실패 시 503)
+async def ensure_encoder_ready() -> None:
+    try:
+        await wait_until_model_ready(MODEL_READY_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "ENCODER_NOT_READY",
+                "message": "임베딩 모델을 로드하는 중입니다",
+            },
+            headers={"Retry-After": MODEL_RETRY_AFTER_SECONDS},
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"code": "ENCODER_LOAD_FAILED", "message": str(e)},
+            headers={"Retry-After": MODEL_RETRY_AFTER_SECONDS},
+        )
+
+
 # 신규 유저 등록과 매칭 스코어 계산 처리 통합 로직
 @log_performance(operation_name="register_user", include_memory=True)
 async def register_user(user: EmbeddingRegister) -> None:
@@ -277,6 +339,7 @@ async def register_user(user: EmbeddingRegister) -> None:
         )
 
     check_duplicate_user(user_id)
+    await ensure_encoder_ready()
 
     try:
         user_dict = user.model_dump()
@@ -343,6 +406,52 @@ def delete_user_metatdata(user_id: int):
 # -----------------v3-----------------
 
 
+# 사용자의 이메일 도메인 조회 (없으면 None)
+def get_user_email_domain(user_id: str) -> Optional[str]:
+    result = get_user_collection().get(ids=[user_id], include=["metadatas"])
+    if not result["ids"] or not result["metadatas"][0]:
+        return None
+    return result["metadatas"][0].get("emailDomain")
+
+
+# 전체 사용자 데이터에서 기준 사용자의 임베딩과 메타데이터를 찾는 헬퍼 함수
+def find_user_entry(user_id: str, all_users_data: dict) -> tuple[list, dict]:
+    ids = all_users_data["ids"]
+    if user_id not in ids:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "SIMILARITY_USER_NOT_FOUND",
+                "message": f"User ID {user_id} not found",
+            },
+        )
+    idx = ids.index(user_id)
+    return all_users_data["embeddings"][idx], all_users_data["metadatas"][idx]
+
+
+# 계산된 유사도를 역방향 저장 → 양방향 통합 → 최종 저장 순으로 반영
+def store_similarities_v3(
+    user_id: str,
+    user_embedding: list,
+    similarities: dict,
+    all_users_data: dict,
+    category: str,
+    components: Optional[dict] = None,
+) -> dict:
+    # 역방향 저장
+    update_reverse_similarities_v3(user_id, similarities, category)
+
+    # 양방향 유사도 통합
+    final_similarities = enrich_with_reverse_similarities_v3(
+        user_id, similarities, all_users_data, category
+    )
+    # 최종 반영 (직접 계산한 쌍의 점수 구성 요소 포함)
+    upsert_similarity_v3(
+        user_id, user_embedding, final_similarities, category, components
+    )
+    return final_similarities
+
+
 # 전체 유저와의 매칭 스코어 계산 및 저장
 @log_performance(operation_name="update_similarity_for_users_v3", include_memory=True)
 def update_similarity_for_users_v3(
@@ -350,48 +459,110 @@ def update_similarity_for_users_v3(
 ) -> dict:
     try:
         # all_users_data가 제공되지 않은 경우에만 DB에서 데이터를 가져옴
+        # (대규모 도메인은 ANN 후보만, 그 외에는 전체 사용자)
         if all_users_data is None:
-            all_users_data = get_user_collection().get(
-                include=["embeddings", "metadatas"]
-            )
+            with span("candidate_select"):
+                all_users_data = select_candidate_users(
+                    user_id, [category]
+                ) or get_user_collection().get(include=["embeddings", "metadatas"])
 
-        ids, embeddings, metadatas = (
-            all_users_data["ids"],
-            all_users_data["embeddings"],
-            all_users_data["metadatas"],
-        )
+        user_embedding, user_meta = find_user_entry(user_id, all_users_data)
 
-        if user_id not in ids:
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "code": "SIMILARITY_USER_NOT_FOUND",
-                    "message": f"User ID {user_id} not found",
-                },
-            )
-        idx = ids.index(user_id)
-        user_meta = metadatas[idx]
-        user_embedding = embeddings[idx]
-
-        # 초기 유사도 계산
-        similarities = compute_matching_score_sentence_based(
+        # 초기 유사도 및 점수 구성 요소 계산 (활성 가중치 프로필 적용)
+        similarities, components = compute_matching_scores_with_components(
             user_id=user_id,
             user_meta=user_meta,
             all_users=all_users_data,
-            category=category,
+            categories=[category],
+            weights_by_category=get_active_weights(),
         )
 
-        # 역방향 저장
-        update_reverse_similarities_v3(user_id, similarities, category)
+        # 역방향 유사도 읽기-수정-쓰기는 같은 도메인 안에서만 직렬화
+        with domain_locks.hold(user_meta.get("emailDomain")):
+            final_similarities = store_similarities_v3(
+                user_id,
+                user_embedding,
+                similarities[category],
+                all_users_data,
+                category,
+                components[category],
+            )
+
+        return {"userId": user_id, "updated_similarities_v3": len(final_similarities)}
+
+    except HTTPException as http_ex:
+        raise http_ex
 
-        # 양방향 유사도 통합
-        final_similarities = enrich_with_reverse_similarities_v3(
-            user_id, similarities, all_users_data, category
+    except Exception as e:
+        logger.error(f"[SIMILARITY_UPDATE_ERROR] {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": "SIMILARITY_UPDATE_FAILED",
+                "message": str(e),
+            },
         )
-        # 최종 반영
-        upsert_similarity_v3(user_id, user_embedding, final_similarities, category)
 
-        return {"userId": user_id, "updated_similarities_v3": len(final_similarities)}
+
+# friend/couple 매칭 스코어를 한 번의 임베딩/점수 계산으로 산출하여 저장
+@log_performance(
+    operation_name="update_similarity_for_users_v3_all_categories",
+    include_memory=True,
+)
+def update_similarity_for_users_v3_all_categories(
+    user_id: str,
+    all_users_data: dict = None,
+    on_progress: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """
+    모든 카테고리(friend, couple)의 유사도를 한 번에 계산하고 카테고리별로 저장
+
+    Args:
+        user_id: 기준 사용자 ID
+        all_users_data: 전체 사용자 데이터 (없으면 DB에서 조회)
+        on_progress: 카테고리별 저장이 끝날 때마다 카테고리 이름으로 호출되는 콜백
+
+    Returns:
+        카테고리별 저장된 유사도 개수
+    """
+    try:
+        # 대규모 도메인은 ANN 후보만 정확히 점수화, 그 외에는 전체 사용자 조회
+        if all_users_data is None:
+            with span("candidate_select"):
+                all_users_data = select_candidate_users(
+                    user_id, CATEGORIES
+                ) or get_user_collection().get(include=["embeddings", "metadatas"])
+
+        user_embedding, user_meta = find_user_entry(user_id, all_users_data)
+
+        # 후보 필터링/문장 임베딩/규칙 점수를 카테고리 간 공유하여 한 번만 계산
+        similarities_by_category, components_by_category = (
+            compute_matching_scores_with_components(
+                user_id=user_id,
+                user_meta=user_meta,
+                all_users=all_users_data,
+                categories=CATEGORIES,
+                weights_by_category=get_active_weights(),
+            )
+        )
+
+        # 점수 계산은 락 밖에서 병렬로, 저장은 같은 도메인 안에서만 직렬화
+        result = {"userId": user_id}
+        with domain_locks.hold(user_meta.get("emailDomain")):
+            for category, similarities in similarities_by_category.items():
+                final_similarities = store_similarities_v3(
+                    user_id,
+                    user_embedding,
+                    similarities,
+                    all_users_data,
+                    category,
+                    components_by_category[category],
+                )
+                result[f"updated_similarities_{category}"] = len(final_similarities)
+                if on_progress:
+                    on_progress(category)
+
+        return result
 
     except HTTPException as http_ex:
         raise http_ex
@@ -423,31 +594,43 @@ def convert_numpy_floats(obj):
 
 
 # 매칭 스코어 정보 DB 저장 (V3 - 변경 사항이 있을 때만 업데이트)
-@log_performance(operation_name="upsert_similarity_v3", include_memory=True)
+@log_performance(
+    operation_name="upsert_similarity_v3",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
+)
 def upsert_similarity_v3(
-    user_id: str, embedding: list, similarities: dict, category: str
+    user_id: str,
+    embedding: list,
+    similarities: dict,
+    category: str,
+    components: Optional[dict] = None,
 ):
     collection = get_similarity_collection(category)
     # float 변환 및 6자리 반올림
     serializable_similarities = convert_numpy_floats(similarities)
+    metadata = {
+        "userId": user_id,
+        "similarities": json.dumps(serializable_similarities),
+        **(components or {}),
+    }
     existing_data = collection.get(ids=[user_id], include=["metadatas"])
-    if (
-        existing_data["ids"]
-        and existing_data["metadatas"][0]
-        and json.loads(existing_data["metadatas"][0].get("similarities", "{}"))
-        == serializable_similarities
-    ):
-        return
-    collection.upsert(
-        ids=[user_id],
-        embeddings=[embedding],
-        metadatas=[
-            {"userId": user_id, "similarities": json.dumps(serializable_similarities)}
-        ],
-    )
+    if existing_data["ids"] and existing_data["metadatas"][0]:
+        existing = existing_data["metadatas"][0]
+        if json.loads(
+            existing.get("similarities", "{}")
+        ) == serializable_similarities and all(
+            existing.get(key) == value for key, value in (components or {}).items()
+        ):
+            return
+    collection.upsert(ids=[user_id], embeddings=[embedding], metadatas=[metadata])
 
 
-@log_performance(operation_name="update_reverse_similarities_v3", include_memory=True)
+@log_performance(
+    operation_name="update_reverse_similarities_v3",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
+)
 def update_reverse_similarities_v3(user_id: str, similarities: dict, category: str):
     """
     유사도 점수를 역방향으로 업데이트합니다. (최적화: 배치 처리)
@@ -508,7 +691,9 @@ def update_reverse_similarities_v3(user_id: str, similarities: dict, category: s
 
 
 @log_performance(
-    operation_name="enrich_with_reverse_similarities_v3", include_memory=True
+    operation_name="enrich_with_reverse_similarities_v3",
+    include_memory=True,
+    sample_every=PERF_HOT_SAMPLE_EVERY,
 )
 def enrich_with_reverse_similarities_v3(
     user_id: str, similarities: dict, all_users: dict, category: str
@@ -522,30 +707,68 @@ def enrich_with_reverse_similarities_v3(
     if not other_ids_to_check:
         return updated_map
 
-    # 일괄 조회
-    all_sims = get_similarity_collection(category).get(ids=other_ids_to_check)
+    # 일괄 조회 (본인 문서 포함: all_users 조회 이후 등록된 사용자가
+    # 역방향으로 기록한 점수를 덮어쓰지 않도록 함께 병합)
+    all_sims = get_similarity_collection(category).get(
+        ids=other_ids_to_check + [user_id]
+    )
     if not all_sims or not all_sims.get("metadatas"):
         return updated_map
 
+    stored_own_map = {}
     for meta in all_sims["metadatas"]:
         other_id = meta["userId"]
         try:
             other_map = json.loads(meta.get("similarities", "{}"))
-            if user_id in other_map and other_id not in updated_map:
+            if other_id == user_id:
+                stored_own_map = other_map
+            elif user_id in other_map and other_id not in updated_map:
                 updated_map[other_id] = other_map[user_id]
         except (json.JSONDecodeError, KeyError):
             continue
 
+    updated_map.update(
+        _scores_from_later_registrations(user_id, stored_own_map, all_users)
+    )
     return updated_map
 
 
-# 신규 유저 등록과 매칭 스코어 계산 처리 통합 로직
-@log_performance(operation_name="register_user_v3", include_memory=True)
-async def register_user_v3(user: EmbeddingRegister) -> None:
+def _scores_from_later_registrations(
+    user_id: str, stored_own_map: dict, all_users: dict
+) -> dict:
+    """
+    저장된 본인 문서의 점수 중 all_users 조회 이후 같은 도메인에 등록된 사용자가
+    역방향으로 기록한 점수만 반환
+    조회 시점에 존재했던 사용자(ANN 후보가 아니었던 도메인 사용자 포함)와
+    이후 삭제되었거나 다른 도메인인 사용자의 점수는 버려서, 전체 재계산 시 문서가 교체되도록 함
+    """
+    snapshot_ids = {str(oid) for oid in all_users["ids"]}
+    snapshot_ids.update(str(oid) for oid in all_users.get("domainIds", ()))
+    later_ids = [
+        other_id
+        for other_id in stored_own_map
+        if other_id and other_id not in snapshot_ids
+    ]
+    if not later_ids:
+        return {}
+
+    domain = all_users["metadatas"][all_users["ids"].index(user_id)].get("emailDomain")
+    registered = get_user_collection().get(ids=later_ids, include=["metadatas"])
+    return {
+        other_id: stored_own_map[other_id]
+        for other_id, meta in zip(registered["ids"], registered["metadatas"])
+        if meta and meta.get("emailDomain") == domain
+    }
+
+
+# 신규 유저 프로필 검증/임베딩/저장 (유사도 계산 제외)
+@log_performance(operation_name="register_user_profile_v3", include_memory=True)
+def register_user_profile_v3(user: EmbeddingRegister) -> str:
     try:
         user_id = str(user.userId)
         validate_user_fields(user)
-    # ... (예외 처리 부분은 동일) ...
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -559,21 +782,7 @@ async def register_user_v3(user: EmbeddingRegister) -> None:
 
     try:
         user_dict = user.model_dump()
-        target_fields = [
-            "religion",
-            "smoking",
-            "drinking",
-            "personality",
-            "preferredPeople",
-            "currentInterests",
-            "favoriteFoods",
-            "likedSports",
-            "pets",
-            "selfDevelopment",
-            "hobbies",
-        ]
-        embedding, metadata = prepare_embedding_data(user_dict, target_fields)
-    # ... (예외 처리 부분은 동일) ...
+        embedding, metadata = prepare_embedding_data(user_dict, EMBEDDING_TARGET_FIELDS)
     except Exception as e:
         logger.error(f"[ REGISTER ERROR] 사용자 등록 실패: {e}")
         raise HTTPException(
@@ -585,22 +794,35 @@ async def register_user_v3(user: EmbeddingRegister) -> None:
         get_user_collection().add(
             ids=[user_id], embeddings=[embedding], metadatas=[metadata]
         )
+    except Exception as e:
+        logger.error(f"[ REGISTER ERROR] 사용자 저장 실패: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={"code": "EMBEDDING_REGISTER_SERVER_ERROR", "message": str(e)},
+        )
 
-        # --- 기존 병렬 처리 코드 ---
-        # with concurrent.futures.ThreadPoolExecutor() as executor:
-        #     futures = [
-        #         executor.submit(update_similarity_for_users_v3, user_id, category)
-        #         for category in ["friend", "couple"]
-        #     ]
-        #     for future in concurrent.futures.as_completed(futures):
-        #         future.result()
-
-        # --- ✨ 변경된 순차 처리 코드 ---
-        logger.info(f"유사도 계산을 순차적으로 시작합니다: user_id={user_id}")
-        for category in ["friend", "couple"]:
-            logger.info(f"[{category}] 카테고리 계산 시작...")
-            update_similarity_for_users_v3(user_id, category)
-            logger.info(f"[{category}] 카테고리 계산 완료.")
+    return user_id
+
+
+# 등록된 유저의 카테고리별 매칭 스코어 계산 (실패 시 사용자 데이터 롤백)
+@log_performance(
+    operation_name="update_registered_user_similarities_v3", include_memory=True
+)
+def update_registered_user_similarities_v3(
+    user_id: str, on_progress: Optional[Callable[[str], None]] = None
+) -> None:
+    """
+    등록된 사용자의 friend/couple 유사도를 계산하고 저장
+
+    Args:
+        user_id: 등록된 사용자 ID
+        on_progress: 카테고리별 계산이 끝날 때마다 카테고리 이름으로 호출되는 콜백
+    """
+    try:
+        # friend/couple을 한 번의 후보 필터링/임베딩/점수 계산으로 처리
+        logger.info(f"카테고리별 유사도 계산을 시작합니다: user_id={user_id}")
+        update_similarity_for_users_v3_all_categories(user_id, on_progress=on_progress)
+        logger.info(f"카테고리별 유사도 계산 완료: user_id={user_id}")
 
     except Exception as e:
         # ❌ 유사도 저장 실패 → 사용자 등록/벡터 모두 삭제
@@ -619,12 +841,27 @@ async def register_user_v3(user: EmbeddingRegister) -> None:
         )
 
 
+def _register_user_v3_sync(user: EmbeddingRegister) -> None:
+    user_id = register_user_profile_v3(user)
+    update_registered_user_similarities_v3(user_id)
+
+
+# 신규 유저 등록과 매칭 스코어 계산 처리 통합 로직
+@log_performance(operation_name="register_user_v3", include_memory=True)
+async def register_user_v3(user: EmbeddingRegister) -> None:
+    await ensure_encoder_ready()
+    # 임베딩/점수 계산/동기 Chroma 호출은 CPU 전용 실행기에서 처리 (포화 시 429)
+    await cpu_executor.run(_register_user_v3_sync, user)
+
+
 # 전체 유저와의 매칭 스코어 계산 및 저장
 @log_performance(operation_name="delete_user_v3", include_memory=True)
 def delete_user_metatdata_v3(user_id: int):
     try:
-        clean_up_similarity_v3(user_id)
-        delete_user_v3(user_id)
+        # 다른 사용자의 유사도 JSON을 수정하므로 등록과 같은 도메인 락을 사용
+        with domain_locks.hold(get_user_email_domain(str(user_id))):
+            clean_up_similarity_v3(user_id)
+            delete_user_v3(user_id)
         return {"code": "EMBEDDING_DELETE_SUCCESS", "data": None}
     except HTTPException as http_ex:
         raise http_ex
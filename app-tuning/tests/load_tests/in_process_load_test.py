@@ -0,0 +1,280 @@
+"""
+프로세스 내 종단 간 부하 테스트 하네스
+실행 중인 서버와 ChromaDB 없이 FastAPI 앱을 같은 프로세스에서 기동하고
+(CHROMA_MODE=ephemeral 메모리 Chroma + SBERT_BACKEND=fake 해시 인코더),
+httpx ASGI 전송으로 사용자 등록 / 튜닝 조회 시나리오를 지정한 동시성으로 실행
+
+시나리오별 측정 항목:
+1. 처리량 (초당 요청 수), 상태 코드별 응답 수
+2. 지연 시간 p50 / p95 / p99 / 최대 (밀리초, 요청 전송부터 응답 본문 수신까지)
+3. Chroma 호출 수 ((컬렉션, 메서드)별, chroma_operations 지표의 시나리오 전후 차이)
+
+네트워크/직렬화 비용이 없으므로 절대값은 운영 환경보다 작고, 인코딩을 제외한 파이프라인
+(도메인 락, 점수 계산, Chroma 읽기/쓰기 횟수)의 동시성 특성과 회귀 비교 용도로 사용
+실제 모델 포함 측정은 SBERT_BACKEND=torch 등을 지정 (로컬 모델 필요)
+
+사용법:
+    python tests/load_tests/in_process_load_test.py [--users 200] [--concurrency 10]
+        [--tuning-requests 400] [--domains 2] [--seed 42] [--output 결과.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# 앱 임포트 전에 메모리 Chroma / 가짜 인코더 설정 (Chroma는 항상 메모리 모드)
+os.environ["CHROMA_MODE"] = "ephemeral"
+os.environ.setdefault("SBERT_BACKEND", "fake")
+os.environ.setdefault("RECOMPUTE_ON_STARTUP", "false")
+
+load_tests_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(load_tests_dir, os.pardir, os.pardir))
+sys.path.insert(0, project_root)
+
+import httpx  # noqa: E402
+from core.enum_process import ENUM_MAPPINGS  # noqa: E402
+from core.matching_score_by_category import CATEGORIES, MBTI_COMPATIBILITY  # noqa: E402
+from main import app  # noqa: E402
+from models.sbert_loader import wait_until_model_ready  # noqa: E402
+from utils.logger import logger  # noqa: E402
+from utils.metrics import metrics_registry  # noqa: E402
+
+BASE_URL = "http://loadtest"
+REGISTER_PATH = "/api/v3/users"
+TUNING_PATH = "/api/v3/tuning"
+# 모델(가짜 인코더 포함) 준비 대기 시간(초)
+MODEL_READY_TIMEOUT = 300
+# 요청별 최대 대기 시간(초, 초과 시 TimeoutError로 집계하여 하네스가 멈추지 않도록 함)
+REQUEST_TIMEOUT = 60
+
+# 요청: (메서드, 경로, httpx 요청 인자)
+Request = Tuple[str, str, dict]
+
+SINGLE_FIELDS = ["gender", "ageGroup", "religion", "smoking", "drinking"]
+LIST_FIELDS = [
+    "personality",
+    "preferredPeople",
+    "currentInterests",
+    "favoriteFoods",
+    "likedSports",
+    "pets",
+    "selfDevelopment",
+    "hobbies",
+]
+
+
+def generate_users(count: int, domains: int, seed: int) -> List[dict]:
+    """
+    Enum 어휘로 시드 고정 등록 요청 본문(EmbeddingRegister) 생성
+    """
+    picker = random.Random(seed)
+    users = []
+    for user_id in range(1, count + 1):
+        user = {
+            "userId": user_id,
+            "emailDomain": f"domain{user_id % domains}.loadtest.com",
+            "MBTI": picker.choice(list(MBTI_COMPATIBILITY)),
+        }
+        for field in SINGLE_FIELDS:
+            user[field] = picker.choice(list(ENUM_MAPPINGS[field]))
+        for field in LIST_FIELDS:
+            user[field] = picker.sample(
+                list(ENUM_MAPPINGS[field]), picker.randint(1, 3)
+            )
+        users.append(user)
+    return users
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """
+    지연 시간(초) 목록의 밀리초 단위 요약 (정확한 백분위수)
+    """
+    if not latencies:
+        return {}
+    values = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50Ms": round(float(p50), 2),
+        "p95Ms": round(float(p95), 2),
+        "p99Ms": round(float(p99), 2),
+        "meanMs": round(float(values.mean()), 2),
+        "maxMs": round(float(values.max()), 2),
+    }
+
+
+def chroma_call_counts() -> Dict[str, int]:
+    """
+    (컬렉션 메서드)별 누적 Chroma 호출 수
+    """
+    return {
+        name: summary["count"]
+        for name, summary in metrics_registry.latency_summary(
+            "chroma_operations"
+        ).items()
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    requests: List[Request],
+    concurrency: int,
+) -> dict:
+    """
+    concurrency개 작업자가 요청 목록을 순서대로 나눠 전송하고 시나리오 결과 집계
+    """
+    pending = iter(requests)
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+
+    async def worker() -> None:
+        for method, path, kwargs in pending:
+            started_at = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    client.request(method, path, **kwargs), REQUEST_TIMEOUT
+                )
+                statuses[str(response.status_code)] += 1
+            except Exception as e:
+                statuses[type(e).__name__] += 1
+                logger.warning(f"[LOAD TEST] {name} 요청 실패: {e}")
+            latencies.append(time.perf_counter() - started_at)
+
+    chroma_before = chroma_call_counts()
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+    chroma_after = chroma_call_counts()
+
+    chroma_calls = {
+        key: count - chroma_before.get(key, 0)
+        for key, count in sorted(chroma_after.items())
+        if count - chroma_before.get(key, 0)
+    }
+    total_chroma_calls = sum(chroma_calls.values())
+    return {
+        "scenario": name,
+        "requests": len(requests),
+        "concurrency": concurrency,
+        "succeeded": sum(
+            count for status, count in statuses.items() if status.startswith("2")
+        ),
+        "statusCodes": dict(statuses),
+        "elapsedSeconds": round(elapsed, 3),
+        "throughputRps": round(len(requests) / elapsed, 2) if elapsed else 0.0,
+        "latency": latency_summary(latencies),
+        "chromaCalls": chroma_calls,
+        "chromaCallsPerRequest": (
+            round(total_chroma_calls / len(requests), 2) if requests else 0.0
+        ),
+    }
+
+
+async def run_load_test(
+    users: int,
+    concurrency: int,
+    tuning_requests: int,
+    domains: int,
+    seed: int,
+) -> dict:
+    """
+    앱 수명 주기(lifespan) 안에서 등록 → 튜닝 조회 시나리오 순서로 실행
+    """
+    payloads = generate_users(users, domains, seed)
+    picker = random.Random(seed)
+    tuning = [
+        (
+            "GET",
+            TUNING_PATH,
+            {
+                "params": {
+                    "userId": picker.randint(1, users),
+                    "category": picker.choice(CATEGORIES),
+                }
+            },
+        )
+        for _ in range(tuning_requests)
+    ]
+
+    results = []
+    async with app.router.lifespan_context(app):
+        await wait_until_model_ready(MODEL_READY_TIMEOUT)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url=BASE_URL, timeout=None
+        ) as client:
+            register = [("POST", REGISTER_PATH, {"json": user}) for user in payloads]
+            results.append(
+                await run_scenario(client, "register", register, concurrency)
+            )
+            if tuning:
+                results.append(
+                    await run_scenario(client, "tuning", tuning, concurrency)
+                )
+    return {
+        "config": {
+            "users": users,
+            "concurrency": concurrency,
+            "tuningRequests": tuning_requests,
+            "domains": domains,
+            "seed": seed,
+            "encoderBackend": os.environ["SBERT_BACKEND"],
+        },
+        "scenarios": results,
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(
+        f"{'scenario':<10}{'req':>6}{'ok':>6}{'rps':>9}"
+        f"{'p50':>9}{'p95':>9}{'p99':>9}{'chroma/req':>12}"
+    )
+    for result in report["scenarios"]:
+        latency = result["latency"]
+        print(
+            f"{result['scenario']:<10}{result['requests']:>6}{result['succeeded']:>6}"
+            f"{result['throughputRps']:>9.1f}{latency.get('p50Ms', 0):>9.1f}"
+            f"{latency.get('p95Ms', 0):>9.1f}{latency.get('p99Ms', 0):>9.1f}"
+            f"{result['chromaCallsPerRequest']:>12.2f}"
+        )
+        for key, count in result["chromaCalls"].items():
+            print(f"    chroma {key}: {count}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="프로세스 내 종단 간 부하 테스트")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--tuning-requests", type=int, default=400)
+    parser.add_argument("--domains", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    # 요청별 INFO 로그는 측정 출력과 섞이지 않도록 제외
+    logging.getLogger().setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    report = asyncio.run(
+        run_load_test(
+            args.users, args.concurrency, args.tuning_requests, args.domains, args.seed
+        )
+    )
+    _print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+"""
+매칭 점수 엔진 벤치마크 모듈
+Enum 어휘(ENUM_MAPPINGS)로 시드 고정 가상 도메인(N명)을 만들고, 저장소의 모든 매칭 점수 엔진을
+같은 조건에서 실행하여 소요 시간 / 최대 메모리(RSS) / 처리량을 JSON으로 기록한 뒤
+저장소에 포함된 기준 결과(baseline.json)와 비교하여 성능 저하를 표시
+
+측정 방식:
+1. 도메인 크기별로 데이터는 한 번만 생성하고, 엔진마다 fork한 자식 프로세스에서 실행
+   (엔진 간 메모리 최대치/캐시가 섞이지 않도록 분리, 최대 RSS는 자식 시작 시점 대비 증가량)
+2. 엔진 준비 시간(인덱스 구성, 모델 로드)은 setupSeconds로 따로 기록하고 질의 시간에서 제외
+3. 기준 사용자 queries명에 대해 각각 점수를 계산 (msPerQuery, 도메인 사용자 처리량 pairsPerSecond)
+4. 기기 성능 차이를 보정하기 위해 고정 작업(calibrationSeconds) 시간으로 나눈 값끼리 비교
+
+임베딩은 numpy 배열 행, 필드별 임베딩은 실제 저장 형식(JSON 문자열)으로 생성하며,
+메모리 사용량을 제한하기 위해 차원은 --dim(기본 64)으로 줄여서 사용
+문장 임베딩 기반 엔진은 기본적으로 해시 기반 가짜 인코더(SBERT_BACKEND=fake)로 실행하여
+모델 없이 인코딩을 제외한 파이프라인 비용을 측정 (실제 모델 포함 측정은 SBERT_BACKEND=torch 등 지정,
+이때 로컬 모델 경로가 없으면 건너뜀)
+
+사용법:
+    python tests/performance/benchmark_engines.py [--sizes 1000,10000,100000]
+        [--queries 3] [--engines legacy,optimized,...] [--dim 64] [--seed 42]
+        [--tolerance 0.25] [--output 결과.json] [--update-baseline]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import psutil
+
+performance_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(performance_dir, os.pardir, os.pardir))
+sys.path.insert(0, project_root)
+
+import core.matching_score as matching_score  # noqa: E402
+import core.matching_score_by_category as matching_score_by_category  # noqa: E402
+import core.matching_score_optimized as matching_score_optimized  # noqa: E402
+from core.ann_index import DomainAnnIndex  # noqa: E402
+from core.enum_process import ENUM_MAPPINGS, convert_to_korean  # noqa: E402
+from models.sbert_backends import (  # noqa: E402
+    BACKEND_FAKE,
+    get_backend,
+    resolve_model_path,
+)
+from services.candidate_service import attribute_key, rank_candidates  # noqa: E402
+from services.score_profile_service import default_weights  # noqa: E402
+from services.user_service import build_user_metadata  # noqa: E402
+from utils.logger import logger  # noqa: E402
+
+BASELINE_PATH = os.path.join(performance_dir, "baseline.json")
+RESULTS_DIR = os.path.join(performance_dir, "results")
+DEFAULT_SIZES = "1000,10000,100000"
+DOMAIN = "benchmark.example.com"
+MB = 1024 * 1024
+# 최대 RSS 비교 시 무시할 증가량 (할당자/페이지 단위 잡음)
+RSS_NOISE_MB = 16
+
+# 다중 선택 필드와 사용자별 선택 개수 범위
+LIST_FIELDS = {
+    "personality": (1, 3),
+    "preferredPeople": (1, 3),
+    "currentInterests": (1, 3),
+    "favoriteFoods": (1, 3),
+    "likedSports": (1, 2),
+    "pets": (0, 1),
+    "selfDevelopment": (1, 2),
+    "hobbies": (1, 3),
+}
+SINGLE_FIELDS = ["gender", "ageGroup", "religion", "smoking", "drinking"]
+
+
+def generate_domain(size: int, dim: int, seed: int) -> dict:
+    """
+    한 도메인에 속한 size명의 사용자 데이터 생성 (Chroma get 결과와 같은 구조)
+    메타데이터는 등록 경로와 같이 한국어 변환 후 문자열로 저장된 형식
+    """
+    rng = np.random.default_rng(seed)
+    picker = random.Random(seed)
+    mbti_types = list(matching_score_by_category.MBTI_COMPATIBILITY)
+
+    ids = [str(i + 1) for i in range(size)]
+    embeddings = rng.normal(size=(size, dim)).astype(np.float32)
+    metadatas = []
+    for _ in ids:
+        user = {
+            field: picker.choice(list(ENUM_MAPPINGS[field])) for field in SINGLE_FIELDS
+        }
+        for field, (low, high) in LIST_FIELDS.items():
+            user[field] = picker.sample(
+                list(ENUM_MAPPINGS[field]), picker.randint(low, high)
+            )
+        user["MBTI"] = picker.choice(mbti_types)
+        user["emailDomain"] = DOMAIN
+        field_embeddings = {
+            field: np.round(rng.normal(size=dim), 4).tolist()
+            for field in matching_score_by_category.EMBEDDING_FIELDS
+        }
+        metadatas.append(build_user_metadata(convert_to_korean(user), field_embeddings))
+    return {"ids": ids, "embeddings": embeddings, "metadatas": metadatas}
+
+
+# ---------------------- 엔진 정의 ----------------------
+# 엔진 준비 함수: 도메인 데이터를 받아 (기준 사용자 위치 → 점수를 계산한 상대 수) 함수 반환
+
+
+def _legacy(data: dict) -> Callable[[int], int]:
+    ids, embeddings, metadatas = data["ids"], data["embeddings"], data["metadatas"]
+    return lambda i: len(
+        matching_score.compute_matching_score(ids[i], embeddings[i], metadatas[i], data)
+    )
+
+
+def _optimized(data: dict) -> Callable[[int], int]:
+    ids, embeddings, metadatas = data["ids"], data["embeddings"], data["metadatas"]
+    return lambda i: len(
+        matching_score_optimized.compute_matching_score_optimized(
+            ids[i], embeddings[i], metadatas[i], data
+        )
+    )
+
+
+def _by_category(data: dict) -> Callable[[int], int]:
+    ids, embeddings, metadatas = data["ids"], data["embeddings"], data["metadatas"]
+    return lambda i: len(
+        matching_score_by_category.compute_matching_score(
+            ids[i], embeddings[i], metadatas[i], data, "friend"
+        )
+    )
+
+
+def _sentence_based(data: dict) -> Callable[[int], int]:
+    matching_score_by_category.get_model()
+    ids, metadatas = data["ids"], data["metadatas"]
+    return lambda i: len(
+        matching_score_by_category.compute_matching_score_sentence_based(
+            ids[i], metadatas[i], data, "friend"
+        )
+    )
+
+
+def _with_components(data: dict) -> Callable[[int], int]:
+    matching_score_by_category.get_model()
+    ids, metadatas = data["ids"], data["metadatas"]
+
+    def run(i: int) -> int:
+        scores, _ = matching_score_by_category.compute_matching_scores_with_components(
+            ids[i], metadatas[i], data
+        )
+        return sum(len(category_scores) for category_scores in scores.values())
+
+    return run
+
+
+def _domain_batch(data: dict) -> Callable[[int], int]:
+    # 도메인 전체 인코딩은 첫 사용자 계산 시 수행되므로 질의 시간에 포함
+    # (기준 사용자는 위치와 무관하게 도메인 순서대로 산출)
+    matching_score_by_category.get_model()
+    scores_iter = matching_score_by_category.iter_domain_matching_scores(
+        data["ids"], data["metadatas"]
+    )
+
+    def run(i: int) -> int:
+        _, scores, _ = next(scores_iter)
+        return sum(len(category_scores) for category_scores in scores.values())
+
+    return run
+
+
+def _ann_rank(data: dict) -> Callable[[int], int]:
+    ids, embeddings, metadatas = data["ids"], data["embeddings"], data["metadatas"]
+    index = DomainAnnIndex(embeddings.shape[1])
+    index.add(ids, embeddings, [attribute_key(meta) for meta in metadatas])
+    weights = default_weights()
+
+    def run(i: int) -> int:
+        return sum(
+            len(
+                rank_candidates(
+                    index,
+                    embeddings[i],
+                    ids[i],
+                    metadatas[i],
+                    category,
+                    weights[category],
+                )
+            )
+            for category in matching_score_by_category.CATEGORIES
+        )
+
+    return run
+
+
+# 엔진 이름 → (준비 함수, 문장 임베딩 모델 필요 여부)
+ENGINES: Dict[str, tuple] = {
+    "legacy": (_legacy, False),
+    "optimized": (_optimized, False),
+    "by_category": (_by_category, False),
+    "sentence_based": (_sentence_based, True),
+    "with_components": (_with_components, True),
+    "domain_batch": (_domain_batch, True),
+    "ann_rank": (_ann_rank, False),
+}
+
+
+def model_unavailable_reason() -> Optional[str]:
+    """
+    문장 임베딩 엔진을 실행할 수 없는 이유 (실행 가능하면 None)
+    벤치마크 중 모델 다운로드를 시도하지 않도록 로컬 모델 경로만 확인
+    """
+    if get_backend() == BACKEND_FAKE:
+        return None
+    model_path = resolve_model_path()
+    if not model_path.exists():
+        return f"모델 없음: {os.path.relpath(model_path, project_root)}"
+    return None
+
+
+# ---------------------- 측정 ----------------------
+
+
+def calibrate(repeats: int = 5) -> float:
+    """
+    기기 성능 보정용 고정 작업 시간 (행렬곱 + 파이썬 반복 + JSON 파싱, 중앙값)
+    """
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(256, 256))
+    payload = json.dumps(np.round(rng.normal(size=(64, 64)), 4).tolist())
+    elapsed = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        for _ in range(10):
+            matrix @ matrix
+            json.loads(payload)
+        sum(i * i for i in range(300000))
+        elapsed.append(time.perf_counter() - started_at)
+    return statistics.median(elapsed)
+
+
+def _measure(engine: str, data: dict, queries: int) -> dict:
+    prepare, _ = ENGINES[engine]
+    rss_start = psutil.Process().memory_info().rss
+
+    started_at = time.perf_counter()
+    run = prepare(data)
+    setup_seconds = time.perf_counter() - started_at
+
+    latencies, scored = [], 0
+    for position in range(queries):
+        started_at = time.perf_counter()
+        scored += run(position)
+        latencies.append(time.perf_counter() - started_at)
+
+    # 리눅스 ru_maxrss 단위는 KB
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    wall_seconds = sum(latencies)
+    pairs = queries * (len(data["ids"]) - 1)
+    return {
+        "setupSeconds": round(setup_seconds, 4),
+        "wallSeconds": round(wall_seconds, 4),
+        "msPerQuery": round(wall_seconds / queries * 1000, 3),
+        "p50Ms": round(statistics.median(latencies) * 1000, 3),
+        "queriesPerSecond": round(queries / wall_seconds, 3),
+        "pairsPerSecond": round(pairs / wall_seconds, 1),
+        "scored": scored,
+        "peakRssMb": round(peak_rss / MB, 1),
+        "peakRssDeltaMb": round(max(peak_rss - rss_start, 0) / MB, 1),
+    }
+
+
+def _child(conn, engine: str, data: dict, queries: int) -> None:
+    try:
+        conn.send(_measure(engine, data, queries))
+    except Exception as e:
+        conn.send({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+def run_cell(engine: str, data: dict, queries: int) -> dict:
+    """
+    fork한 자식 프로세스에서 엔진 하나를 측정 (데이터는 fork로 공유, 결과만 파이프로 전달)
+    """
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(sender, engine, data, queries))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = None
+    process.join()
+    if result is None:
+        result = {"error": f"자식 프로세스 비정상 종료 (exitcode={process.exitcode})"}
+    return result
+
+
+def run_benchmark(
+    sizes: List[int],
+    engines: List[str],
+    queries: int,
+    dim: int,
+    seed: int,
+) -> dict:
+    """
+    도메인 크기 x 엔진별 측정 결과
+    """
+    model_reason = model_unavailable_reason()
+    report = {
+        "createdAt": datetime.now().isoformat(timespec="seconds"),
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {
+            "queries": queries,
+            "dim": dim,
+            "seed": seed,
+            "encoderBackend": get_backend(),
+        },
+        "calibrationSeconds": round(calibrate(), 5),
+        "results": [],
+    }
+    for size in sizes:
+        started_at = time.perf_counter()
+        data = generate_domain(size, dim, seed)
+        print(f"[N={size}] 데이터 생성 {time.perf_counter() - started_at:.1f}s")
+        for engine in engines:
+            _, requires_model = ENGINES[engine]
+            if requires_model and model_reason:
+                result = {"skipped": model_reason}
+            else:
+                result = run_cell(engine, data, min(queries, size))
+            report["results"].append({"engine": engine, "size": size, **result})
+            print(f"  {engine:<16} {_describe(result)}")
+        del data
+    return report
+
+
+def _describe(result: dict) -> str:
+    if "skipped" in result:
+        return f"건너뜀 ({result['skipped']})"
+    if "error" in result:
+        return f"실패 ({result['error']})"
+    return (
+        f"{result['msPerQuery']:>10.1f} ms/query {result['pairsPerSecond']:>12.0f} "
+        f"pairs/s  peak +{result['peakRssDeltaMb']:.0f}MB"
+    )
+
+
+# ---------------------- 기준 결과 비교 ----------------------
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    기준 결과 대비 보정 시간(msPerQuery / calibrationSeconds) 또는 최대 RSS 증가량이
+    tolerance 비율을 넘게 늘어난 (엔진, 크기) 목록을 반환하고 각 결과에 비교 값 기록
+    """
+    baseline_rows = {
+        (row["engine"], row["size"]): row
+        for row in baseline.get("results", [])
+        if "msPerQuery" in row
+    }
+    scale = baseline["calibrationSeconds"] / report["calibrationSeconds"]
+    regressions = []
+    for row in report["results"]:
+        base = baseline_rows.get((row["engine"], row["size"]))
+        if base is None or "msPerQuery" not in row:
+            continue
+
+        time_ratio = row["msPerQuery"] * scale / base["msPerQuery"]
+        rss_growth = row["peakRssDeltaMb"] - base["peakRssDeltaMb"]
+        row["timeRatio"] = round(time_ratio, 3)
+        row["rssGrowthMb"] = round(rss_growth, 1)
+        reasons = []
+        if time_ratio > 1 + tolerance:
+            reasons.append(f"시간 x{time_ratio:.2f}")
+        if rss_growth > RSS_NOISE_MB and row["peakRssDeltaMb"] > base[
+            "peakRssDeltaMb"
+        ] * (1 + tolerance):
+            reasons.append(f"메모리 +{rss_growth:.0f}MB")
+        row["regression"] = bool(reasons)
+        if reasons:
+            regressions.append(f"{row['engine']} N={row['size']}: {', '.join(reasons)}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="매칭 점수 엔진 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--queries", type=int, default=3)
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--output", default=None)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="비교하지 않고 결과를 기준 결과 파일로 저장",
+    )
+    args = parser.parse_args()
+
+    engines = [name.strip() for name in args.engines.split(",") if name.strip()]
+    unknown = sorted(set(engines) - set(ENGINES))
+    if unknown:
+        parser.error(f"알 수 없는 엔진: {unknown} (사용 가능: {list(ENGINES)})")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    # 문장 임베딩은 지정하지 않으면 가짜 인코더 (재현 가능한 오프라인 측정)
+    os.environ.setdefault("SBERT_BACKEND", BACKEND_FAKE)
+    # 엔진 내부 성능 로그(INFO)는 측정 출력과 섞이지 않도록 제외
+    logger.setLevel("WARNING")
+    report = run_benchmark(sizes, engines, args.queries, args.dim, args.seed)
+
+    regressions = []
+    if args.update_baseline:
+        output = args.baseline
+    else:
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        else:
+            print(f"기준 결과 파일이 없어 비교를 건너뜁니다: {args.baseline}")
+        report["regressions"] = regressions
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = args.output or os.path.join(
+            RESULTS_DIR, f"engines_{datetime.now():%Y%m%d_%H%M%S}.json"
+        )
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if regressions:
+        print(f"성능 저하 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
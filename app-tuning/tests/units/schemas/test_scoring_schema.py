@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+from schemas.scoring_schema import CategoryWeights, WeightProfileUpdate
+
+
+class TestCategoryWeights:
+    def test_valid_category_weights(self):
+        """가중치 쌍의 합이 1이면 생성되고 규칙 내부 가중치는 기본값 사용"""
+        weights = CategoryWeights(embedding=0.7, rule=0.3)
+        assert weights.mbti == 0.5
+        assert weights.age == 0.5
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"embedding": 0.7, "rule": 0.4},
+            {"embedding": 0.6, "rule": 0.4, "mbti": 0.6, "age": 0.6},
+        ],
+    )
+    def test_invalid_weight_sums(self, data):
+        """embedding + rule 또는 mbti + age의 합이 1이 아니면 유효성 검증 실패"""
+        with pytest.raises(ValidationError):
+            CategoryWeights(**data)
+
+
+class TestWeightProfileUpdate:
+    def test_requires_any_category(self):
+        """friend/couple 모두 없는 경우 유효성 검증 실패"""
+        with pytest.raises(ValidationError):
+            WeightProfileUpdate()
@@ -0,0 +1,94 @@
+"""
+도메인 ANN 후보 인덱스 테스트 모듈
+이 모듈은 HNSW 후보 인덱스의 조회/갱신 기능을 테스트합니다.
+주요 테스트 대상:
+- 정확한 코사인 상위 K명 대비 후보 재현율
+- 본인 제외 / 속성 키 조건 (HNSW 필터 조회, 소규모 조건의 정확 계산)
+- 삭제 후 라벨 재사용 및 용량 확장
+"""
+
+import numpy as np
+import pytest
+from core.ann_index import BRUTE_FORCE_MAX_ELEMENTS, INITIAL_CAPACITY, DomainAnnIndex
+
+
+@pytest.fixture
+def domain():
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(BRUTE_FORCE_MAX_ELEMENTS * 2, 32)).astype(np.float32)
+    ids = [str(i) for i in range(len(embeddings))]
+    # 속성 키: (성별, 그룹) - 성별 조건은 HNSW 필터, 그룹 조건은 정확 계산 경로
+    attributes = [("MALE" if i % 2 else "FEMALE", i % 10) for i in range(len(ids))]
+    index = DomainAnnIndex(32)
+    index.add(ids, embeddings, attributes)
+    return index, ids, embeddings, attributes
+
+
+def test_query_recall_against_exact_cosine(domain):
+    index, ids, embeddings, _ = domain
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    recalls = []
+    for query in range(20):
+        exact = np.argsort(-(normalized @ normalized[query]))[1:51]
+        found = [
+            user_id for user_id, _, _ in index.query(embeddings[query], 50, ids[query])
+        ]
+        assert ids[query] not in found and len(found) == 50
+        recalls.append(len({ids[i] for i in exact} & set(found)) / 50)
+
+    assert np.mean(recalls) >= 0.95
+
+
+def test_query_filters_attributes(domain):
+    index, ids, embeddings, attributes = domain
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    # 조건 사용자가 많으면 HNSW 필터 조회
+    females = {("FEMALE", group) for group in range(10)}
+    hits = index.query(embeddings[1], 100, exclude_id=ids[1], attributes=females)
+    assert len(hits) == 100
+    assert all(attribute[0] == "FEMALE" for _, _, attribute in hits)
+
+    # 조건 사용자가 적으면 정확 계산 (코사인 내림차순, 본인 제외)
+    group = {attributes[1]}
+    hits = index.query(embeddings[1], 10, exclude_id=ids[1], attributes=group)
+    members = [
+        i for i, attribute in enumerate(attributes) if attribute in group and i != 1
+    ]
+    expected = sorted(members, key=lambda i: -(normalized[i] @ normalized[1]))[:10]
+    assert [user_id for user_id, _, _ in hits] == [ids[i] for i in expected]
+    assert hits[0][1] == pytest.approx(
+        float(normalized[expected[0]] @ normalized[1]), abs=1e-5
+    )
+
+
+def test_remove_and_reuse_labels(domain):
+    index, ids, embeddings, attributes = domain
+
+    index.remove(ids[10:])
+    assert len(index) == 10
+    assert {user_id for user_id, _, _ in index.query(embeddings[0], 100)} == set(
+        ids[:10]
+    )
+    assert sum(index.attribute_counts().values()) == 10
+
+    # 삭제된 라벨을 재사용하여 다시 추가
+    index.add(ids[10:15], embeddings[10:15], attributes[10:15])
+    assert len(index) == 15
+    assert index.query(embeddings[12], 1)[0][0] == ids[12]
+    assert index.query(embeddings[12], 1, attributes={attributes[12]})[0][0] == ids[12]
+
+
+def test_add_grows_capacity():
+    rng = np.random.default_rng(1)
+    embeddings = rng.normal(size=(INITIAL_CAPACITY + 10, 8)).astype(np.float32)
+    ids = [str(i) for i in range(len(embeddings))]
+    index = DomainAnnIndex(8)
+
+    index.add(ids[:INITIAL_CAPACITY], embeddings, [None] * INITIAL_CAPACITY)
+    index.add(ids[INITIAL_CAPACITY:], embeddings[INITIAL_CAPACITY:], [None] * 10)
+
+    assert len(index) == len(ids)
+    assert index.query(embeddings[-1], 1)[0][0] == ids[-1]
+    assert index.query(embeddings[-1], 1, attributes={None})[0][0] == ids[-1]
@@ -0,0 +1,159 @@
+"""
+마이크로 배치 인코더 테스트 모듈
+이 모듈은 동시 인코딩 요청을 병합하여 처리하는 기능을 테스트합니다.
+주요 테스트 대상:
+- 동시 요청 병합 및 호출자별 결과 분배
+- 워커 스레드의 동기 호출 위임
+- 배치 처리기가 없을 때의 직접 인코딩
+- 중지 시 대기 중인 요청 실패 처리 및 동기 호출 대기 시간 제한
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from models.batch_encoder import EncoderStoppedError, MicroBatchEncoder
+
+
+class CountingEncoder:
+    """
+    입력 문장 길이를 값으로 하는 결정적 테스트용 인코더
+    """
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def encode(self, texts, show_progress_bar=False):
+        single = isinstance(texts, str)
+        items = [texts] if single else texts
+        self.batch_sizes.append(len(items))
+        vectors = np.array([[len(t), 1.0] for t in items], dtype=np.float32)
+        return vectors[0] if single else vectors
+
+
+@pytest.mark.asyncio
+@patch("models.batch_encoder.get_model")
+async def test_concurrent_requests_are_coalesced(mock_get_model):
+    """
+    동시에 들어온 요청이 한 번의 encode로 처리되고 각자 자신의 구간을 받는지 검증
+    """
+    model = CountingEncoder()
+    mock_get_model.return_value = model
+    encoder = MicroBatchEncoder(max_batch_size=16, max_wait_ms=50)
+    encoder.start()
+    try:
+        results = await asyncio.gather(
+            encoder.encode_async("a"),
+            encoder.encode_async(["bb", "ccc"]),
+            asyncio.to_thread(encoder.encode, ["dddd", "eeeee", "ffffff"]),
+        )
+    finally:
+        await encoder.stop()
+
+    assert model.batch_sizes == [6]
+    assert results[0].tolist() == [1.0, 1.0]
+    assert results[1][:, 0].tolist() == [2.0, 3.0]
+    assert results[2][:, 0].tolist() == [4.0, 5.0, 6.0]
+
+    stats = encoder.stats()
+    assert stats["batchesTotal"] == 1
+    assert stats["requestsTotal"] == 3
+    assert stats["avgFillRatio"] == pytest.approx(6 / 16, abs=1e-3)
+
+
+@pytest.mark.asyncio
+@patch("models.batch_encoder.get_model")
+async def test_batch_size_limit(mock_get_model):
+    """
+    최대 배치 크기에 도달하면 대기 시간을 기다리지 않고 배치를 나누는지 검증
+    """
+    model = CountingEncoder()
+    mock_get_model.return_value = model
+    encoder = MicroBatchEncoder(max_batch_size=2, max_wait_ms=1000)
+    encoder.start()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(encoder.encode_async(["x", "y"]) for _ in range(3))),
+            timeout=1,
+        )
+    finally:
+        await encoder.stop()
+
+    assert model.batch_sizes == [2, 2, 2]
+
+
+@patch("models.batch_encoder.get_model")
+def test_direct_encode_without_batcher(mock_get_model):
+    """
+    이벤트 루프에 연결되지 않은 경우 모델을 직접 호출하는지 검증
+    """
+    model = CountingEncoder()
+    mock_get_model.return_value = model
+    encoder = MicroBatchEncoder(max_batch_size=16, max_wait_ms=5)
+
+    result = encoder.encode("abc")
+
+    assert result.tolist() == [3.0, 1.0]
+    assert encoder.stats()["directCallsTotal"] == 1
+
+
+class BlockingEncoder:
+    """
+    release 이벤트가 설정될 때까지 encode를 멈추는 테스트용 인코더
+    """
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def encode(self, texts, show_progress_bar=False):
+        self.started.set()
+        self.release.wait(5)
+        return np.zeros((len(texts), 2), dtype=np.float32)
+
+
+@pytest.mark.asyncio
+@patch("models.batch_encoder.get_model")
+async def test_stop_fails_pending_requests(mock_get_model):
+    """
+    중지 시 인코딩 중인 배치와 큐에 남은 요청이 모두 실패 처리되어
+    워커 스레드의 동기 호출자가 멈추지 않는지 검증
+    """
+    model = BlockingEncoder()
+    mock_get_model.return_value = model
+    encoder = MicroBatchEncoder(max_batch_size=1, max_wait_ms=1)
+    encoder.start()
+
+    in_batch = asyncio.create_task(encoder.encode_async(["a"]))
+    await asyncio.to_thread(model.started.wait, 5)
+    queued = asyncio.create_task(asyncio.to_thread(encoder.encode, ["b"]))
+    while encoder.stats()["queueDepth"] == 0:
+        await asyncio.sleep(0.01)
+
+    await encoder.stop()
+    model.release.set()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(in_batch, queued, return_exceptions=True), timeout=5
+    )
+    assert all(isinstance(result, EncoderStoppedError) for result in results)
+
+
+@pytest.mark.asyncio
+@patch("models.batch_encoder.get_model")
+async def test_sync_encode_times_out(mock_get_model):
+    """
+    배치 결과가 제한 시간 안에 오지 않으면 동기 호출이 TimeoutError로 끝나는지 검증
+    """
+    model = BlockingEncoder()
+    mock_get_model.return_value = model
+    encoder = MicroBatchEncoder(max_batch_size=1, max_wait_ms=1, timeout=0.1)
+    encoder.start()
+    try:
+        with pytest.raises(TimeoutError):
+            await asyncio.to_thread(encoder.encode, ["a"])
+    finally:
+        model.release.set()
+        await encoder.stop()
@@ -0,0 +1,69 @@
+"""
+매칭 점수 엔진 벤치마크 테스트 모듈
+주요 테스트 대상:
+- 시드 고정 가상 도메인 데이터 재현성
+- 자식 프로세스 측정 결과 형식
+- 기준 결과 대비 성능 저하 판정 (기기 성능 보정 포함)
+"""
+
+from tests.performance.benchmark_engines import (
+    compare_to_baseline,
+    generate_domain,
+    run_cell,
+)
+
+
+def test_generate_domain_is_deterministic():
+    first = generate_domain(20, dim=8, seed=7)
+    second = generate_domain(20, dim=8, seed=7)
+
+    assert first["metadatas"] == second["metadatas"]
+    assert (first["embeddings"] == second["embeddings"]).all()
+    assert first["metadatas"][0]["emailDomain"] == "benchmark.example.com"
+
+
+def test_run_cell_reports_metrics():
+    data = generate_domain(30, dim=8, seed=1)
+    result = run_cell("legacy", data, queries=2)
+
+    assert result["scored"] == 2 * 29
+    assert result["msPerQuery"] > 0
+    assert result["peakRssMb"] > 0
+
+
+def test_compare_to_baseline_normalizes_machine_speed():
+    baseline = {
+        "calibrationSeconds": 0.1,
+        "results": [
+            {"engine": "legacy", "size": 1000, "msPerQuery": 100, "peakRssDeltaMb": 10},
+            {
+                "engine": "optimized",
+                "size": 1000,
+                "msPerQuery": 50,
+                "peakRssDeltaMb": 10,
+            },
+        ],
+    }
+    # 두 배 느린 기기: legacy는 같은 성능, optimized는 보정 후 1.6배
+    report = {
+        "calibrationSeconds": 0.2,
+        "results": [
+            {"engine": "legacy", "size": 1000, "msPerQuery": 200, "peakRssDeltaMb": 12},
+            {
+                "engine": "optimized",
+                "size": 1000,
+                "msPerQuery": 160,
+                "peakRssDeltaMb": 80,
+            },
+            {"engine": "ann_rank", "size": 1000, "msPerQuery": 5, "peakRssDeltaMb": 1},
+        ],
+    }
+
+    regressions = compare_to_baseline(report, baseline, tolerance=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("optimized N=1000")
+    legacy, optimized, ann = report["results"]
+    assert legacy["timeRatio"] == 1.0 and not legacy["regression"]
+    assert optimized["timeRatio"] == 1.6 and optimized["rssGrowthMb"] == 70
+    assert "regression" not in ann
@@ -0,0 +1,69 @@
+"""
+길이 버킷 배치 인코더 테스트 모듈
+이 모듈은 길이순 버킷 구성과 원래 순서 복원 기능을 테스트합니다.
+주요 테스트 대상:
+- 패딩 비율 / 버킷 크기 / 토큰 수 한도
+- 버킷별 인코딩 후 입력 순서 복원
+"""
+
+import numpy as np
+from models.bucketed_encoder import encode_length_bucketed, plan_buckets
+
+
+class LengthEncoder:
+    """
+    문장 길이를 값으로 하는 결정적 테스트용 인코더 (토크나이저 없음)
+    """
+
+    def __init__(self):
+        self.batches = []
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        self.batches.append(list(texts))
+        return np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+
+
+def test_plan_buckets_respects_padding_ratio():
+    """
+    길이 차이가 큰 문장은 다른 버킷으로 분리되고 모든 인덱스가 한 번씩 포함되는지 검증
+    """
+    lengths = [100, 10, 11, 95, 12, 98]
+    buckets = plan_buckets(lengths, padding_ratio=0.2, max_tokens=10000, max_size=10)
+
+    assert sorted(i for bucket in buckets for i in bucket) == list(range(len(lengths)))
+    assert [sorted(b) for b in buckets] == [[1, 2, 4], [0, 3, 5]]
+    for bucket in buckets:
+        longest = max(lengths[i] for i in bucket)
+        padding = sum(longest - lengths[i] for i in bucket)
+        assert padding <= 0.2 * longest * len(bucket)
+
+
+def test_plan_buckets_respects_size_and_token_limits():
+    """
+    버킷 크기와 버킷당 토큰 수 한도를 넘지 않는지 검증
+    """
+    assert [len(b) for b in plan_buckets([10] * 5, max_size=2)] == [2, 2, 1]
+    assert [len(b) for b in plan_buckets([10] * 5, max_tokens=30)] == [3, 2]
+
+
+def test_encode_length_bucketed_restores_input_order():
+    """
+    버킷 단위로 나누어 인코딩해도 결과가 입력 순서와 일치하는지 검증
+    """
+    texts = ["a" * 50, "bb", "c" * 48, "ddd", "e"]
+    model = LengthEncoder()
+
+    embeddings = encode_length_bucketed(model, texts, padding_ratio=0.2)
+
+    assert embeddings[:, 0].tolist() == [len(t) for t in texts]
+    assert len(model.batches) == 3
+    assert all(
+        max(map(len, batch)) - min(map(len, batch)) < 5 for batch in model.batches
+    )
+
+
+def test_encode_length_bucketed_empty_input():
+    assert encode_length_bucketed(LengthEncoder(), []).shape == (0, 2)
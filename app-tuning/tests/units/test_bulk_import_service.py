@@ -0,0 +1,156 @@
+"""
+사용자 일괄 등록 서비스 테스트 모듈
+이 모듈은 JSONL 레코드 검증 기능을 테스트합니다.
+주요 테스트 대상:
+- 유효한 레코드 파싱
+- 잘못된 JSON / 스키마 오류 / 파일 내 중복 ID의 줄 번호별 오류 보고
+- 검증 실패 시 전체 거절
+- 본문 크기 / 레코드 수 초과 시 파싱 전 413 거절
+- 신규 사용자 비중에 따른 유사도 계산 방식 선택
+"""
+
+import json
+
+import pytest
+import services.bulk_import_service as bulk_import_service
+from api.controllers.user_controller import read_bulk_body
+from fastapi import HTTPException, Request
+from services.bulk_import_service import (
+    SIMILARITY_ALL_PAIRS,
+    SIMILARITY_NEW_USERS,
+    choose_similarity_strategy,
+    import_users_bulk,
+    parse_bulk_records,
+)
+
+
+def make_record(user_id: int, **overrides) -> dict:
+    record = {
+        "userId": user_id,
+        "emailDomain": "kakaotech.com",
+        "gender": "MALE",
+        "ageGroup": "AGE_20S",
+        "MBTI": "ENFP",
+        "religion": "NON_RELIGIOUS",
+        "smoking": "NO_SMOKING",
+        "drinking": "SOMETIMES",
+        "personality": ["KIND"],
+        "preferredPeople": ["NICE_VOICE"],
+        "currentInterests": ["BAKING"],
+        "favoriteFoods": ["FRUIT"],
+        "likedSports": ["YOGA"],
+        "pets": ["FISH"],
+        "selfDevelopment": ["READING"],
+        "hobbies": ["GAMING"],
+    }
+    record.update(overrides)
+    return record
+
+
+def test_parse_valid_records_skips_blank_lines():
+    lines = [json.dumps(make_record(1)), "", json.dumps(make_record(2)).encode()]
+
+    users, errors = parse_bulk_records(lines)
+
+    assert errors == []
+    assert [user.userId for user in users] == [1, 2]
+
+
+def test_parse_reports_errors_by_line():
+    """
+    잘못된 JSON, 스키마 오류, 필수 목록 누락, 파일 내 중복 ID를 줄 번호와 함께 보고하는지 검증
+    """
+    lines = [
+        json.dumps(make_record(1)),
+        "{not json",
+        json.dumps(make_record(2, MBTI="X")),
+        json.dumps(make_record(3, pets=[])),
+        json.dumps(make_record(1)),
+    ]
+
+    users, errors = parse_bulk_records(lines)
+
+    assert [user.userId for user in users] == [1]
+    assert [(e["line"], e["code"]) for e in errors] == [
+        (2, "INVALID_JSON"),
+        (3, "INVALID_RECORD"),
+        (4, "INVALID_RECORD"),
+        (5, "DUPLICATE_ID_IN_FILE"),
+    ]
+
+
+def test_import_rejects_all_records_when_any_is_invalid():
+    lines = [json.dumps(make_record(1)), json.dumps(make_record(2, gender=None))]
+
+    with pytest.raises(HTTPException) as exc_info:
+        import_users_bulk(lines)
+
+    assert exc_info.value.status_code == 422
+    assert exc_info.value.detail["code"] == "BULK_IMPORT_VALIDATION_FAILED"
+    assert exc_info.value.detail["data"]["errorCount"] == 1
+
+
+def test_import_rejects_too_many_records_before_parsing(monkeypatch):
+    """
+    레코드 수가 제한을 넘으면 잘못된 레코드가 있어도 검증 전에 413으로 거절하는지 검증
+    """
+    monkeypatch.setattr(bulk_import_service, "BULK_IMPORT_MAX_RECORDS", 2)
+    lines = ["{not json", "", "{not json", "{not json"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        import_users_bulk(lines)
+
+    assert exc_info.value.status_code == 413
+    assert exc_info.value.detail["data"] == {"maxRecords": 2}
+
+
+def _request(chunks, headers=()):
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    received = []
+
+    async def receive():
+        received.append(messages[len(received)])
+        return received[-1]
+
+    scope = {"type": "http", "method": "POST", "headers": list(headers)}
+    return Request(scope, receive), received
+
+
+@pytest.mark.asyncio
+async def test_read_bulk_body_enforces_byte_limit(monkeypatch):
+    """
+    Content-Length 초과는 본문을 읽기 전에, 스트리밍 중 초과는 제한을 넘는 즉시 413으로 거절하는지 검증
+    """
+    monkeypatch.setattr("api.controllers.user_controller.BULK_IMPORT_MAX_BYTES", 10)
+
+    request, received = _request([b"x" * 20], [(b"content-length", b"20")])
+    with pytest.raises(HTTPException) as exc_info:
+        await read_bulk_body(request)
+    assert exc_info.value.status_code == 413
+    assert received == []
+
+    request, received = _request([b"x" * 6, b"x" * 6, b"x" * 6])
+    with pytest.raises(HTTPException):
+        await read_bulk_body(request)
+    assert len(received) == 2
+
+    request, _ = _request([b"ab\n", b"cd"])
+    assert await read_bulk_body(request) == b"ab\ncd"
+
+
+@pytest.mark.parametrize(
+    "imported, domain_size, expected",
+    [
+        (500, 500, SIMILARITY_ALL_PAIRS),
+        (300, 600, SIMILARITY_ALL_PAIRS),
+        (10, 5000, SIMILARITY_NEW_USERS),
+    ],
+)
+def test_similarity_strategy_by_import_share(imported, domain_size, expected):
+    """
+    신규 사용자가 도메인의 큰 비중일 때만 전체 쌍 재계산을 선택하는지 검증
+    """
+    assert choose_similarity_strategy(imported, domain_size) == expected
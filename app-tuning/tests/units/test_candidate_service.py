@@ -0,0 +1,86 @@
+"""
+매칭 후보 선정 서비스 테스트 모듈
+이 모듈은 규칙 점수 수준별 ANN 후보 선정 기능을 테스트합니다.
+주요 테스트 대상:
+- 후보 집합이 정확한 최종 점수(코사인 + 규칙) 상위 K명을 포함하는지
+- couple 카테고리의 성별 조건
+"""
+
+import numpy as np
+import pytest
+from core.ann_index import DomainAnnIndex
+from core.matching_score_by_category import (
+    AGE_GROUPS,
+    MBTI_COMPATIBILITY,
+    age_group_match_score,
+    mbti_weighted_score,
+)
+from core.score_components import component_weight_vector
+from services.candidate_service import attribute_key, rank_candidates
+from services.score_profile_service import default_weights
+
+
+@pytest.fixture
+def domain():
+    rng = np.random.default_rng(0)
+    size = 3000
+    centers = rng.normal(size=(20, 32))
+    embeddings = (
+        centers[rng.integers(0, 20, size)] + 0.5 * rng.normal(size=(size, 32))
+    ).astype(np.float32)
+    mbtis, ages = list(MBTI_COMPATIBILITY), list(AGE_GROUPS)
+    metadatas = [
+        {
+            "gender": ["MALE", "FEMALE"][i % 2],
+            "MBTI": mbtis[rng.integers(len(mbtis))],
+            "ageGroup": ages[rng.integers(len(ages))],
+        }
+        for i in range(size)
+    ]
+    ids = [str(i) for i in range(size)]
+    index = DomainAnnIndex(32)
+    index.add(ids, embeddings, [attribute_key(meta) for meta in metadatas])
+    return index, ids, embeddings, metadatas
+
+
+def exact_top_k(query, ids, embeddings, metadatas, category, weights, k):
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    vector = component_weight_vector(weights)
+    me = metadatas[query]
+    scores = {}
+    for i, meta in enumerate(metadatas):
+        if i == query or (category == "couple" and meta["gender"] == me["gender"]):
+            continue
+        scores[ids[i]] = (
+            vector[0] * float(normalized[i] @ normalized[query])
+            + vector[1] * mbti_weighted_score(me["MBTI"], meta["MBTI"])
+            + vector[2] * age_group_match_score(me["ageGroup"], meta["ageGroup"])
+        )
+    return set(sorted(scores, key=scores.get, reverse=True)[:k])
+
+
+@pytest.mark.parametrize("category", ["friend", "couple"])
+def test_candidates_cover_exact_top_k(domain, category):
+    index, ids, embeddings, metadatas = domain
+    weights = default_weights()[category]
+
+    for query in range(5):
+        candidates = rank_candidates(
+            index,
+            embeddings[query],
+            ids[query],
+            metadatas[query],
+            category,
+            weights,
+            top_k=50,
+            num_candidates=100,
+        )
+
+        expected = exact_top_k(query, ids, embeddings, metadatas, category, weights, 50)
+        assert len(candidates) == 100 and ids[query] not in candidates
+        assert len(expected & set(candidates)) >= 49
+        if category == "couple":
+            assert all(
+                metadatas[int(c)]["gender"] != metadatas[query]["gender"]
+                for c in candidates
+            )
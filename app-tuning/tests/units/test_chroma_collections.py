@@ -0,0 +1,41 @@
+"""
+Chroma 컬렉션 캐시 테스트 모듈
+주요 테스트 대상:
+- 동시 요청의 최초 컬렉션 생성 (로컬 Chroma 중복 생성 오류 없이 같은 컬렉션 공유)
+"""
+
+import threading
+
+import chromadb
+import core.vector_database.client as chroma_client_module
+import core.vector_database.collections as collections
+from chromadb.config import Settings
+
+
+def test_concurrent_first_access_creates_collection_once(monkeypatch):
+    client = chromadb.EphemeralClient(
+        Settings(anonymized_telemetry=False, allow_reset=True)
+    )
+    client.reset()
+    monkeypatch.setattr(chroma_client_module, "chroma_client", client)
+    monkeypatch.setattr(collections, "_collection_cache", {})
+
+    barrier = threading.Barrier(8)
+    results, errors = [], []
+
+    def access():
+        barrier.wait()
+        try:
+            results.append(collections.get_user_collection())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len({id(collection) for collection in results}) == 1
+    client.reset()
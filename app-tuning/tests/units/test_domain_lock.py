@@ -0,0 +1,83 @@
+"""
+도메인 쓰기 락 테스트 모듈
+이 모듈은 이메일 도메인 단위 쓰기 직렬화 기능을 테스트합니다.
+주요 테스트 대상:
+- 같은 도메인 쓰기의 직렬화
+- 다른 도메인 쓰기의 병렬 처리
+- 경합 횟수 카운터 노출
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.domain_lock import DomainLockRegistry
+from utils.metrics import metrics_registry
+
+
+def _run_concurrently(registry, domains, hold_seconds=0.05):
+    """
+    도메인마다 락을 잡고 읽기-수정-쓰기를 흉내 내며, 동시에 실행된 최대 작업 수를 기록
+    """
+    active = {}
+    max_active = {}
+    guard = threading.Lock()
+
+    def write(domain):
+        with registry.hold(domain):
+            with guard:
+                active[domain] = active.get(domain, 0) + 1
+                max_active[domain] = max(max_active.get(domain, 0), active[domain])
+            time.sleep(hold_seconds)
+            with guard:
+                active[domain] -= 1
+
+    with ThreadPoolExecutor(max_workers=len(domains)) as executor:
+        list(executor.map(write, domains))
+    return max_active
+
+
+def test_same_domain_writes_are_serialized():
+    """
+    같은 도메인의 쓰기는 동시에 하나만 실행되고, 경합 횟수가
+    카운터(domain_locks_contended_total)로 노출되는지 검증
+    """
+    metrics_registry.reset()
+    registry = DomainLockRegistry()
+
+    max_active = _run_concurrently(registry, ["a.com"] * 4)
+
+    assert max_active["a.com"] == 1
+    stats = registry.stats()
+    assert stats["acquiredTotal"] == 4
+    assert stats["contendedTotal"] >= 1
+    assert stats["lockedDomains"] == 0
+    assert metrics_registry.counters("domain_lock_contentions") == {
+        "": stats["contendedTotal"]
+    }
+    rendered = metrics_registry.render_prometheus("app")
+    assert "# TYPE app_domain_locks_contended_total counter" in rendered
+    assert f'app_domain_locks_contended_total {stats["contendedTotal"]}' in rendered
+    metrics_registry.reset()
+
+
+def test_different_domains_run_in_parallel():
+    """
+    서로 다른 도메인의 쓰기는 서로를 기다리지 않는지 검증
+    모든 작업이 락을 잡은 채로 배리어에서 만나야 통과하므로,
+    하나라도 직렬화되면 배리어가 시간 초과로 깨짐
+    """
+    registry = DomainLockRegistry()
+    domains = ["a.com", "b.com", "c.com", "d.com"]
+    barrier = threading.Barrier(len(domains), timeout=5)
+
+    def write(domain):
+        with registry.hold(domain):
+            barrier.wait()
+
+    with ThreadPoolExecutor(max_workers=len(domains)) as executor:
+        list(executor.map(write, domains))
+
+    stats = registry.stats()
+    assert stats["domains"] == 4
+    assert stats["contendedTotal"] == 0
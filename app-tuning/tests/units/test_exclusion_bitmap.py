@@ -0,0 +1,154 @@
+"""
+추천 제외 집합 비트맵 테스트 모듈
+이 모듈은 차단/매칭/노출 제외 집합 비트맵과 튜닝 결과 적용 로직을 테스트합니다.
+주요 테스트 대상:
+- 비트맵 추가/삭제/포함 여부 확인
+- 직렬화 및 역직렬화
+- 제외 집합 적용 후 상위 K 선정
+- 변경 요청의 userId 범위 검증 및 사용자별 변경 직렬화
+"""
+
+import threading
+import time
+
+import pytest
+import services.exclusion_service as exclusion_service
+from core.exclusion_bitmap import MAX_USER_ID, ExclusionBitmap
+from pydantic import ValidationError
+from schemas.exclusion_schema import ExclusionUpdate
+from services.tuning_service import apply_exclusions, format_recommendations
+
+
+class TestExclusionBitmap:
+    """
+    제외 집합 비트맵 기본 연산 테스트 클래스
+    """
+
+    def test_add_discard_contains(self):
+        """
+        userId 추가/삭제 및 포함 여부 확인 테스트
+        문자열/정수 userId가 동일하게 처리되는지 검증
+        """
+        bitmap = ExclusionBitmap([3, "10", 200])
+
+        assert 3 in bitmap
+        assert "10" in bitmap
+        assert 200 in bitmap
+        assert 4 not in bitmap
+        assert "not-a-number" not in bitmap  # 숫자가 아닌 ID는 포함되지 않음
+
+        bitmap.discard(10)
+        assert 10 not in bitmap
+        assert list(bitmap) == [3, 200]  # 오름차순 순회
+        assert len(bitmap) == 2
+
+    def test_serialization_round_trip(self):
+        """
+        직렬화 후 복원 시 동일한 집합이 되는지 검증
+        빈 비트맵은 빈 문자열로 직렬화되어야 함
+        """
+        bitmap = ExclusionBitmap(range(1, 5000, 3))
+        restored = ExclusionBitmap.from_string(bitmap.to_string())
+
+        assert restored == bitmap
+        assert ExclusionBitmap().to_string() == ""
+        assert not ExclusionBitmap.from_string("")
+
+    def test_union(self):
+        """
+        여러 종류의 제외 집합 합집합 테스트
+        """
+        blocked = ExclusionBitmap([1, 2])
+        matched = ExclusionBitmap([2, 7])
+
+        assert list(blocked | matched) == [1, 2, 7]
+
+    def test_rejects_out_of_range_user_id(self):
+        """
+        음수 또는 MAX_USER_ID 초과 userId는 비트맵에 추가되지 않아야 함
+        """
+        bitmap = ExclusionBitmap()
+
+        with pytest.raises(ValueError):
+            bitmap.add(-1)
+        with pytest.raises(ValueError):
+            bitmap.add(MAX_USER_ID + 1)
+        assert MAX_USER_ID + 1 not in bitmap
+        assert not bitmap
+
+
+class TestExclusionUpdate:
+    """
+    제외 집합 변경 요청 검증 및 저장 테스트 클래스
+    """
+
+    @pytest.mark.parametrize("user_id", [0, -5, MAX_USER_ID + 1, 10**10])
+    def test_out_of_range_ids_fail_validation(self, user_id):
+        """
+        범위를 벗어난 userId는 스키마 검증 단계에서 거절(422)되어야 함
+        """
+        with pytest.raises(ValidationError):
+            ExclusionUpdate(add=[user_id])
+        with pytest.raises(ValidationError):
+            ExclusionUpdate(remove=[user_id])
+
+    def test_concurrent_updates_are_not_lost(self, monkeypatch):
+        """
+        같은 사용자에 대한 동시 변경이 모두 저장되는지 검증
+        조회와 저장 사이에 지연을 두어 락이 없으면 한쪽 변경이 유실되는 상황을 재현
+        """
+        store = {}
+
+        def get_exclusions(user_id):
+            snapshot = dict(store.get(user_id, {}))
+            time.sleep(0.05)
+            return snapshot
+
+        def upsert_exclusions(user_id, values):
+            store[user_id] = values
+
+        monkeypatch.setattr(exclusion_service, "get_exclusions", get_exclusions)
+        monkeypatch.setattr(exclusion_service, "upsert_exclusions", upsert_exclusions)
+
+        threads = [
+            threading.Thread(
+                target=exclusion_service.update_exclusions,
+                args=("1", "blocked", [target], []),
+            )
+            for target in (10, 20, 30)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert exclusion_service.get_exclusion_lists("1")["blocked"] == [10, 20, 30]
+
+
+class TestApplyExclusions:
+    """
+    튜닝 결과에 제외 집합을 적용하는 로직 테스트 클래스
+    """
+
+    def test_page_is_filled_after_exclusion(self):
+        """
+        제외 대상이 상위권에 있어도 top_k 만큼 결과가 채워지는지 검증
+        """
+        similarities = {str(i): 1.0 - i * 0.01 for i in range(1, 11)}
+        metadata = {uid: {"userId": uid} for uid in similarities}
+        excluded = ExclusionBitmap([1, 2, 3])
+
+        result = format_recommendations(
+            apply_exclusions(similarities, excluded), metadata, top_k=5
+        )
+
+        assert result == [4, 5, 6, 7, 8]
+
+    def test_missing_metadata_does_not_shrink_page(self):
+        """
+        메타데이터가 없는 유저를 제외해도 top_k 만큼 결과가 채워지는지 검증
+        """
+        similarities = {"1": 0.9, "2": 0.8, "3": 0.7, "4": 0.6}
+        metadata = {"2": {}, "3": {}, "4": {}}
+
+        assert format_recommendations(similarities, metadata, top_k=2) == [2, 3]
@@ -0,0 +1,103 @@
+"""
+CPU 작업 실행기 테스트 모듈
+이 모듈은 크기가 제한된 실행기의 입장 제어(백프레셔) 기능을 테스트합니다.
+주요 테스트 대상:
+- 포화 시 429 거절 및 Retry-After 헤더
+- 백그라운드 작업(reject_when_full=False)의 대기 처리
+- 사용률 통계 (성공 / 실패 / 취소 구분)
+- 대기 코루틴 취소 시 워커 작업이 끝날 때까지 자리 유지
+"""
+
+import asyncio
+import threading
+
+import pytest
+from utils.executor import BoundedExecutor, ExecutorOverloadedError
+from utils.metrics import metrics_registry
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_saturated():
+    """
+    워커 수 + 대기열 크기를 넘는 요청은 즉시 429로 거절되고
+    거절 횟수가 카운터(executor_rejected_total)로 기록되는지 검증
+    """
+    metrics_registry.reset()
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1, retry_after=3)
+    release = threading.Event()
+
+    running = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ExecutorOverloadedError) as exc_info:
+        await executor.run(lambda: None)
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "3"}
+
+    # 백그라운드 작업은 거절하지 않고 대기
+    background = asyncio.create_task(
+        executor.run(lambda: "done", reject_when_full=False)
+    )
+    await asyncio.sleep(0.05)
+    assert executor.stats()["queued"] == 2
+
+    release.set()
+    await asyncio.gather(*running)
+    assert await background == "done"
+
+    stats = executor.stats()
+    assert stats["inflight"] == 0
+    assert stats["completedTotal"] == 3
+    assert stats["rejectedTotal"] == 1
+    assert metrics_registry.counters("executor_rejections") == {"test": 1}
+    metrics_registry.reset()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_worker_finishes():
+    """
+    대기 중인 코루틴이 취소되어도 실행 중인 워커 작업이 끝나기 전에는
+    자리가 반환되지 않아 입장 한도(워커 수 + 대기열 크기)를 넘지 않는지 검증
+    """
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0, retry_after=1)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait()
+
+    task = asyncio.create_task(executor.run(blocking))
+    await asyncio.to_thread(started.wait)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert executor.stats()["inflight"] == 1
+    with pytest.raises(ExecutorOverloadedError):
+        await executor.run(lambda: None)
+
+    release.set()
+    assert await executor.run(lambda: "done", reject_when_full=False) == "done"
+
+    stats = executor.stats()
+    assert stats["inflight"] == 0
+    assert stats["completedTotal"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted_separately():
+    """
+    예외로 끝난 작업은 완료가 아닌 실패로 집계되는지 검증
+    """
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1, retry_after=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await executor.run(fail)
+
+    stats = executor.stats()
+    assert stats["inflight"] == 0
+    assert stats["completedTotal"] == 0
+    assert stats["failedTotal"] == 1
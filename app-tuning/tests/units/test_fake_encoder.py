@@ -0,0 +1,47 @@
+"""
+해시 기반 가짜 인코더 테스트 모듈
+주요 테스트 대상:
+- 결정적 단위 벡터 (단일 문장 / 문장 목록 형식)
+- 단어를 공유하는 문장 간 유사도
+- SBERT_BACKEND=fake 선택 시 모델 파일 없이 로드
+"""
+
+import numpy as np
+from models import sbert_loader
+from models.fake_encoder import HashingEncoder
+
+
+def test_encode_is_deterministic_unit_vectors():
+    encoder = HashingEncoder(dim=32)
+    texts = ["나의 취미는 게임, 음악입니다.", "", "!!"]
+
+    embeddings = encoder.encode(texts, batch_size=2, show_progress_bar=False)
+
+    assert embeddings.shape == (3, 32) and embeddings.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-5)
+    np.testing.assert_array_equal(HashingEncoder(dim=32).encode(texts), embeddings)
+    np.testing.assert_array_equal(encoder.encode(texts[0]), embeddings[0])
+    assert encoder.encode([]).shape == (0, 32)
+
+
+def test_shared_words_increase_similarity():
+    encoder = HashingEncoder(dim=256)
+    base, similar, different = encoder.encode(
+        [
+            "나의 취미는 게임, 음악입니다. 흡연 여부는 비흡연입니다.",
+            "나의 취미는 게임, 독서입니다. 흡연 여부는 비흡연입니다.",
+            "좋아하는 음식은 떡볶이입니다.",
+        ]
+    )
+
+    assert base @ similar > base @ different
+
+
+def test_fake_backend_loads_without_model(monkeypatch):
+    monkeypatch.setenv("SBERT_BACKEND", "fake")
+    monkeypatch.setenv("SENTENCE_TRANSFORMERS_HOME", "/nonexistent")
+
+    model = sbert_loader._load_model()
+
+    assert isinstance(model, HashingEncoder)
+    assert model.get_sentence_embedding_dimension() == 768
@@ -0,0 +1,157 @@
+"""
+SBERT 추론 워커 풀 테스트 모듈
+이 모듈은 프로세스 외부 추론 워커 풀과 CPU 할당량 계산 기능을 테스트합니다.
+주요 테스트 대상:
+- 워커 프로세스 인코딩 결과의 공유 메모리 반환
+- 워커 비정상 종료 / 응답 시간 초과 후 재시작
+- 재시작 실패 시 워커 제외 (남은 워커가 없으면 대기 없이 실패)
+- cgroup CPU 할당량 파싱
+"""
+
+import hashlib
+import time
+
+import numpy as np
+import pytest
+from models.inference_pool import InferencePoolError, InferenceWorkerPool
+from utils.cpu_quota import cgroup_cpu_limit
+
+
+class HashEncoder:
+    """
+    문장 해시 기반의 결정적 테스트용 인코더 (워커 프로세스에서 로드)
+    """
+
+    def get_sentence_embedding_dimension(self):
+        return 32
+
+    def encode(self, texts, show_progress_bar=False):
+        single = isinstance(texts, str)
+        if "sleep" in texts:
+            time.sleep(30)
+        vectors = np.array(
+            [
+                np.frombuffer(hashlib.sha256(t.encode()).digest(), dtype=np.uint8)
+                for t in ([texts] if single else texts)
+            ],
+            dtype=np.float32,
+        )
+        return vectors[0] if single else vectors
+
+
+def load_hash_encoder():
+    return HashEncoder()
+
+
+def load_broken_encoder():
+    raise RuntimeError("모델 로드 실패")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = InferenceWorkerPool(
+        num_workers=2, num_threads=1, loader_path=f"{__name__}:load_hash_encoder"
+    ).start()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def single_pool():
+    pool = InferenceWorkerPool(
+        num_workers=1,
+        num_threads=1,
+        loader_path=f"{__name__}:load_hash_encoder",
+        encode_timeout=1,
+    ).start()
+    yield pool
+    pool.close()
+
+
+class TestInferenceWorkerPool:
+    """
+    추론 워커 풀 테스트 클래스
+    """
+
+    def test_encode_matches_in_process_model(self, pool):
+        """
+        워커 프로세스 결과가 같은 모델의 프로세스 내 결과와 일치하는지 검증
+        (버퍼보다 큰 배치로 공유 메모리 재할당 경로 포함)
+        """
+        texts = [f"문장 {i}" for i in range(20000)]
+        expected = HashEncoder().encode(texts)
+
+        assert pool.get_sentence_embedding_dimension() == 32
+        assert np.array_equal(pool.encode(texts[:3]), expected[:3])
+        assert np.array_equal(pool.encode(texts), expected)
+        assert np.array_equal(pool.encode("문장 0"), expected[0])
+        assert pool.stats()["textsTotal"] == 3 + 20000 + 1
+
+    def test_restarts_dead_worker(self, pool):
+        """
+        워커 프로세스가 종료되면 오류를 반환하고 새 워커로 교체되는지 검증
+        """
+        for worker in pool._workers:
+            worker.process.kill()
+            worker.process.join()
+
+        with pytest.raises(InferencePoolError):
+            pool.encode(["a"])
+
+        assert pool.stats()["restartsTotal"] == 1
+
+    def test_restarts_unresponsive_worker(self, single_pool):
+        """
+        응답 시간을 넘긴 워커는 반납되지 않고 새 워커로 교체되는지 검증
+        """
+        with pytest.raises(InferencePoolError):
+            single_pool.encode(["sleep"])
+
+        stats = single_pool.stats()
+        assert stats["restartsTotal"] == 1
+        assert stats["idleWorkers"] == 1
+        assert np.array_equal(single_pool.encode(["a"]), HashEncoder().encode(["a"]))
+
+    def test_failed_restart_removes_worker(self, single_pool):
+        """
+        재시작한 워커가 준비되지 않으면 풀에서 제외되고,
+        남은 워커가 없으면 이후 요청이 대기하지 않고 실패하는지 검증
+        """
+        worker = single_pool._workers[0]
+        worker.process.kill()
+        worker.process.join()
+        single_pool.loader_path = f"{__name__}:load_broken_encoder"
+
+        with pytest.raises(InferencePoolError):
+            single_pool.encode(["a"])
+        with pytest.raises(InferencePoolError, match="사용 가능한 추론 워커 없음"):
+            single_pool.encode(["a"])
+
+        stats = single_pool.stats()
+        assert stats["restartsTotal"] == 0
+        assert stats["aliveWorkers"] == 0
+        assert stats["idleWorkers"] == 0
+
+
+def test_cgroup_cpu_limit(tmp_path):
+    """
+    cgroup v2/v1 CPU 할당량 파싱 검증
+    """
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("350000 100000\n")
+    assert cgroup_cpu_limit(cpu_max_path=str(cpu_max)) == 3.5
+
+    cpu_max.write_text("max 100000\n")
+    assert cgroup_cpu_limit(cpu_max_path=str(cpu_max)) is None
+
+    quota, period = tmp_path / "quota", tmp_path / "period"
+    quota.write_text("150000")
+    period.write_text("100000")
+    assert (
+        cgroup_cpu_limit(
+            cpu_max_path=str(tmp_path / "missing"),
+            quota_path=str(quota),
+            period_path=str(period),
+        )
+        == 1.5
+    )
@@ -0,0 +1,50 @@
+"""
+로그 큐 핸들러 테스트 모듈
+주요 테스트 대상:
+- 큐 포화 시 삭제 정책 (INFO: 새 레코드 삭제, WARNING 이상: 가장 오래된 레코드 삭제)
+- 버린 레코드 카운터
+- 리스너 스레드를 통한 실제 핸들러 출력
+"""
+
+import logging
+import queue
+
+from utils.log_queue import BoundedQueueHandler, attach_queue_handler, dropped_records
+from utils.metrics import metrics_registry
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord("queue_test", level, __file__, 0, message, None, None)
+
+
+def test_full_queue_drops_info_and_keeps_warnings():
+    metrics_registry.reset()
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue)
+
+    handler.handle(_record(logging.INFO, "first"))
+    handler.handle(_record(logging.INFO, "second"))
+    handler.handle(_record(logging.INFO, "dropped"))
+    handler.handle(_record(logging.ERROR, "error"))
+
+    messages = [log_queue.get_nowait().getMessage() for _ in range(2)]
+    assert messages == ["second", "error"]
+    # 새 INFO 레코드 1개 + 오류 레코드 자리를 위해 버린 가장 오래된 레코드 1개
+    assert dropped_records() == {("queue_test", "INFO"): 2}
+    metrics_registry.reset()
+
+
+def test_listener_writes_to_handlers():
+    target_logger = logging.getLogger("queue_listener_test")
+    target_logger.propagate = False
+    received = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            received.append(self.format(record))
+
+    listener = attach_queue_handler(target_logger, [ListHandler()], maxsize=10)
+    target_logger.warning("hello %s", "queue")
+    listener.stop()
+
+    assert received == ["hello queue"]
@@ -0,0 +1,233 @@
+"""
+카테고리별 매칭 점수 계산 테스트 모듈
+이 모듈은 friend/couple 카테고리 매칭 점수를 한 번에 계산하는 기능을 테스트합니다.
+주요 테스트 대상:
+- 통합 계산 결과와 카테고리별 기준 공식(임베딩 가중치 * 코사인 + 규칙 가중치 * 규칙 점수)의 일치 여부
+- 카테고리별 후보 필터링 (도메인, 성별)
+- 임베딩 모델 호출 횟수
+- 도메인 전체 쌍 계산 결과와 사용자별 계산 결과의 일치 여부
+- 저장된 점수 구성 요소를 새 가중치로 재조합한 결과와 재계산 결과의 일치 여부
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from core.embedding import user_data_to_sentence
+from core.matching_score_by_category import (
+    WEIGHTS_BY_CATEGORY,
+    age_group_match_score,
+    compute_matching_score_sentence_based,
+    compute_matching_scores_by_categories,
+    compute_matching_scores_with_components,
+    iter_domain_matching_scores,
+    mbti_weighted_score,
+)
+from core.score_components import component_weight_vector, unpack_components
+
+
+class HashEncoder:
+    """
+    문장 해시 기반의 결정적 테스트용 인코더
+    """
+
+    def __init__(self):
+        self.encoded_texts = 0
+        self.calls = 0
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        single = isinstance(texts, str)
+        self.calls += 1
+        self.encoded_texts += 1 if single else len(texts)
+        vectors = np.array(
+            [
+                np.frombuffer(hashlib.sha256(t.encode()).digest(), dtype=np.uint8)
+                for t in ([texts] if single else texts)
+            ],
+            dtype=np.float32,
+        )
+        return vectors[0] if single else vectors
+
+
+@pytest.fixture
+def all_users():
+    """
+    두 개의 도메인, 남녀가 섞인 사용자 데이터 픽스처
+    """
+    genders = ["MALE", "FEMALE"]
+    mbtis = ["INTJ", "ENFP", "ISTP", "ESFJ"]
+    ages = ["AGE_20S", "AGE_30S", "AGE_40S"]
+    hobbies = ["게임", "독서", "등산", "요리", "음악"]
+    metadatas = [
+        {
+            "emailDomain": "kakaotech.com" if i % 3 else "other.com",
+            "gender": genders[i % 2],
+            "MBTI": mbtis[i % 4],
+            "ageGroup": ages[i % 3],
+            "hobbies": hobbies[i % 5],
+            "religion": "무교",
+        }
+        for i in range(30)
+    ]
+    return {"ids": [str(i) for i in range(30)], "metadatas": metadatas}
+
+
+class TestComputeMatchingScoresByCategories:
+    """
+    friend/couple 통합 매칭 점수 계산 테스트 클래스
+    """
+
+    @patch("core.matching_score_by_category.get_model")
+    def test_matches_reference_formula(self, mock_get_model, all_users):
+        """
+        통합 계산 결과가 카테고리별 기준 공식과 일치하는지 검증
+        기준 공식: w_e * cos(나, 후보) + w_r * (0.5 * MBTI + 0.5 * 연령대)
+        (friend: w_e=0.7, w_r=0.3 / couple: w_e=0.6, w_r=0.4, 후보는 같은 도메인,
+        couple은 다른 성별만)
+        결과는 소수 6자리로 반올림되므로 반올림 전 기준값과의 차이는 1e-6 미만이어야 함
+        """
+        encoder = HashEncoder()
+        mock_get_model.return_value = encoder
+        user_id, user_meta = "1", all_users["metadatas"][1]
+
+        combined = compute_matching_scores_by_categories(user_id, user_meta, all_users)
+
+        my_vector = encoder.encode(user_data_to_sentence(user_meta))
+        reference_weights = {"friend": (0.7, 0.3), "couple": (0.6, 0.4)}
+        for category, (embedding_weight, rule_weight) in reference_weights.items():
+            expected = {}
+            for other_id, other_meta in zip(all_users["ids"], all_users["metadatas"]):
+                if other_id == user_id:
+                    continue
+                if other_meta["emailDomain"] != user_meta["emailDomain"]:
+                    continue
+                if category == "couple" and other_meta["gender"] == user_meta["gender"]:
+                    continue
+                other_vector = encoder.encode(user_data_to_sentence(other_meta))
+                cosine = float(
+                    my_vector
+                    @ other_vector
+                    / (np.linalg.norm(my_vector) * np.linalg.norm(other_vector))
+                )
+                rule = 0.5 * mbti_weighted_score(
+                    user_meta["MBTI"], other_meta["MBTI"]
+                ) + 0.5 * age_group_match_score(
+                    user_meta["ageGroup"], other_meta["ageGroup"]
+                )
+                expected[other_id] = embedding_weight * cosine + rule_weight * rule
+
+            assert expected
+            single = compute_matching_score_sentence_based(
+                user_id, user_meta, all_users, category
+            )
+            for result in (combined[category], single):
+                assert result.keys() == expected.keys()
+                for other_id, score in expected.items():
+                    assert result[other_id] == pytest.approx(score, abs=1e-6)
+
+    @patch("core.matching_score_by_category.get_model")
+    def test_category_filters_and_single_encoding(self, mock_get_model, all_users):
+        """
+        friend는 같은 도메인 전체, couple은 같은 도메인의 다른 성별만 포함하며
+        임베딩은 카테고리 수와 무관하게 (기준 사용자 + 후보) 문장당 한 번만 계산되고
+        후보 문장은 버킷으로 나누지 않고 한 번의 호출로 인코딩되는지 검증
+        """
+        encoder = HashEncoder()
+        mock_get_model.return_value = encoder
+        user_id, user_meta = "1", all_users["metadatas"][1]
+
+        combined = compute_matching_scores_by_categories(user_id, user_meta, all_users)
+
+        metas = dict(zip(all_users["ids"], all_users["metadatas"]))
+        assert user_id not in combined["friend"]
+        assert all(
+            metas[uid]["emailDomain"] == user_meta["emailDomain"]
+            for uid in combined["friend"]
+        )
+        assert set(combined["couple"]) == {
+            uid
+            for uid in combined["friend"]
+            if metas[uid]["gender"] != user_meta["gender"]
+        }
+        assert encoder.encoded_texts == 1 + len(combined["friend"])
+        assert encoder.calls == 2
+
+
+class TestIterDomainMatchingScores:
+    """
+    도메인 전체 쌍 매칭 점수 계산 테스트 클래스 (일괄 등록용)
+    """
+
+    @patch("core.matching_score_by_category.get_model")
+    def test_matches_per_user_results(self, mock_get_model, all_users):
+        """
+        도메인 전체 쌍 계산 결과가 사용자별 계산 결과와 일치하는지 검증
+        (코사인 계산 방식 차이로 소수점 6자리 반올림 결과가 1e-6 차이 날 수 있음)
+        """
+        mock_get_model.return_value = HashEncoder()
+        domain = [
+            (user_id, meta)
+            for user_id, meta in zip(all_users["ids"], all_users["metadatas"])
+            if meta["emailDomain"] == "kakaotech.com"
+        ]
+        ids = [user_id for user_id, _ in domain]
+        metadatas = [meta for _, meta in domain]
+
+        pairwise = {
+            user_id: scores
+            for user_id, scores, _ in iter_domain_matching_scores(ids, metadatas)
+        }
+
+        assert set(pairwise) == set(ids)
+        for user_id, meta in domain:
+            expected = compute_matching_scores_by_categories(user_id, meta, all_users)
+            for category in ["friend", "couple"]:
+                assert pairwise[user_id][category].keys() == expected[category].keys()
+                for other_id, score in expected[category].items():
+                    assert pairwise[user_id][category][other_id] == pytest.approx(
+                        score, abs=2e-6
+                    )
+
+    def test_empty_domain(self):
+        assert list(iter_domain_matching_scores([], [])) == []
+
+
+class TestScoreComponents:
+    """
+    점수 구성 요소 저장 및 가중치 재조합 테스트 클래스
+    """
+
+    @patch("core.matching_score_by_category.get_model")
+    @pytest.mark.parametrize("same_weights", [True, False])
+    def test_reblend_matches_recompute(self, mock_get_model, all_users, same_weights):
+        """
+        기본 가중치로 저장한 구성 요소를 같은/새 가중치로 재조합한 점수가
+        해당 가중치로 다시 계산한 점수(소수점 6자리)와 정확히 일치하는지 검증
+        """
+        mock_get_model.return_value = HashEncoder()
+        user_id, user_meta = "1", all_users["metadatas"][1]
+        new_weights = (
+            WEIGHTS_BY_CATEGORY
+            if same_weights
+            else {
+                "friend": {"embedding": 0.2, "rule": 0.8, "mbti": 0.9, "age": 0.1},
+                "couple": {"embedding": 0.9, "rule": 0.1, "mbti": 0.3, "age": 0.7},
+            }
+        )
+
+        _, packed = compute_matching_scores_with_components(
+            user_id, user_meta, all_users
+        )
+        expected, _ = compute_matching_scores_with_components(
+            user_id, user_meta, all_users, weights_by_category=new_weights
+        )
+
+        for category, weights in new_weights.items():
+            other_ids, components = unpack_components(packed[category])
+            reblended = components @ component_weight_vector(weights)
+            assert other_ids == list(expected[category])
+            assert {
+                other_id: round(float(score), 6)
+                for other_id, score in zip(other_ids, reblended)
+            } == expected[category]
@@ -0,0 +1,50 @@
+"""
+tracemalloc 메모리 스냅샷 테스트 모듈
+주요 테스트 대상:
+- 두 스냅샷 사이 할당 위치/패키지별 증가량
+- 보관 개수 제한
+- 추적 전 스냅샷 / 없는 스냅샷 비교 오류
+"""
+
+import pytest
+from utils.memory_snapshots import (
+    MemorySnapshotStore,
+    SnapshotNotFoundError,
+    TracemallocNotStartedError,
+)
+
+
+@pytest.fixture
+def store():
+    store = MemorySnapshotStore(limit=2)
+    store.start()
+    yield store
+    store.stop()
+
+
+def test_diff_reports_allocation_site(store):
+    store.take("before")
+    retained = [bytearray(1024) for _ in range(2000)]  # 약 2MB
+    store.take("after")
+
+    diff = store.diff("before", "after", limit=5)
+    top = diff["top"][0]
+    assert "test_memory_snapshots.py:" in top["traceback"][0]
+    assert top["sizeDiffMb"] >= 1.9
+    assert diff["byPackage"][0]["package"] == "app/tests"
+    assert diff["target"]["peakSincePreviousMb"] >= diff["target"]["tracedMb"]
+    assert len(retained) == 2000
+
+
+def test_snapshot_limit_evicts_oldest(store):
+    for name in ("a", "b", "c"):
+        store.take(name)
+    assert [s["name"] for s in store.status()["snapshots"]] == ["b", "c"]
+    with pytest.raises(SnapshotNotFoundError):
+        store.diff("a", "c")
+
+
+def test_snapshot_requires_tracing():
+    store = MemorySnapshotStore(limit=2)
+    with pytest.raises(TracemallocNotStartedError):
+        store.take("idle")
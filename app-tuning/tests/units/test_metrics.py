@@ -0,0 +1,154 @@
+"""
+성능 지표 저장소 테스트 모듈
+이 모듈은 고정 크기 지표 저장소와 성능 요약 기능을 테스트합니다.
+주요 테스트 대상:
+- 히스토그램 백분위수 정확도 (정확한 값 대비 상대 오차)
+- 호출 수와 무관한 저장 크기
+- 데코레이터 기록 → 성능 요약 형식 (샘플링 간격 포함)
+- Prometheus 텍스트 형식 / 경로 템플릿별 요청 지표
+"""
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from utils import logger
+from utils.metrics import (
+    BUCKET_BOUNDS,
+    LatencyHistogram,
+    MetricsRegistry,
+    bucket_index,
+    metrics_registry,
+    register_metrics,
+)
+
+
+def test_bucket_index_matches_bounds():
+    for index, bound in enumerate(BUCKET_BOUNDS):
+        assert bucket_index(bound) == index
+        assert bucket_index(bound * 1.001) == index + 1
+    assert bucket_index(0.0) == 0
+    assert bucket_index(1e9) == len(BUCKET_BOUNDS)
+
+
+def test_histogram_percentiles_close_to_exact():
+    values = np.random.default_rng(0).lognormal(mean=-3, sigma=1.0, size=50000)
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.add(float(value))
+
+    for q in (0.5, 0.95, 0.99):
+        exact = float(np.quantile(values, q))
+        assert histogram.percentile(q) == pytest.approx(exact, rel=0.1)
+    assert histogram.count == len(values)
+    assert histogram.max == pytest.approx(values.max())
+    assert len(histogram.buckets) == len(BUCKET_BOUNDS) + 1
+
+
+def test_registry_size_independent_of_calls():
+    registry = MetricsRegistry()
+    for i in range(10000):
+        registry.observe_latency("api", "op", 0.01 + i * 1e-6)
+        registry.observe("memory", "rss_mb", 100.0 + i)
+
+    summary = registry.latency_summary("api")["op"]
+    assert summary["count"] == 10000
+    assert summary["min"] <= summary["p50"] <= summary["p99"] <= summary["max"]
+    assert registry.stats_summary("memory")["rss_mb"]["latest"] == 10099.0
+
+    registry.reset()
+    assert registry.latency_summary("api") == {}
+
+
+def test_performance_summary_from_decorator():
+    logger.reset_performance_metrics()
+
+    @logger.log_performance(operation_name="summary_op", include_memory=True)
+    def work(user_id):
+        return {"matchedUserCount": 1}
+
+    @logger.log_performance(operation_name="failing_op")
+    def fail(user_id):
+        raise ValueError("boom")
+
+    for _ in range(3):
+        work("1")
+    with pytest.raises(ValueError):
+        fail("1")
+
+    summary = logger.get_performance_summary()
+    assert summary["api_response_times"]["summary_op"]["count"] == 3
+    assert summary["memory_usage"]["samples"] == 3
+    assert summary["memory_usage_by_function"]["summary_op"]["count"] == 3
+    assert summary["errors"] == {"failing_op": {"ValueError": 1}}
+    logger.reset_performance_metrics()
+
+
+def test_render_prometheus_histogram_and_gauges():
+    registry = MetricsRegistry()
+    registry.describe("ops", "op_duration_seconds", "작업 시간", ("operation",))
+    registry.describe("cache", "cache_requests", "캐시 조회", ("cache", "result"))
+    for seconds in (0.001, 0.01, 0.01, 5.0):
+        registry.observe_latency("ops", "encode", seconds)
+    registry.increment("cache", ("collection", "hit"), 3)
+    registry.add_collector(lambda: [("queue_depth", "큐 적재량", {"queue": "jobs"}, 2)])
+
+    text = registry.render_prometheus("svc")
+    lines = text.splitlines()
+    assert "# TYPE svc_op_duration_seconds histogram" in lines
+    assert 'svc_op_duration_seconds_bucket{operation="encode",le="0.001"} 1' in lines
+    assert 'svc_op_duration_seconds_bucket{operation="encode",le="+Inf"} 4' in lines
+    assert 'svc_op_duration_seconds_count{operation="encode"} 4' in lines
+    assert 'svc_cache_requests_total{cache="collection",result="hit"} 3' in lines
+    assert 'svc_queue_depth{queue="jobs"} 2' in lines
+
+    # 버킷 누적 개수는 단조 증가
+    buckets = [int(line.rsplit(" ", 1)[1]) for line in lines if "_bucket{" in line]
+    assert buckets == sorted(buckets)
+
+
+def test_metrics_endpoint_records_route_templates():
+    app = FastAPI()
+    register_metrics(app, namespace="test")
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    metrics_registry.reset()
+    client = TestClient(app)
+    for item_id in range(3):
+        client.get(f"/items/{item_id}")
+    client.get("/missing")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'test_http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 3'
+        in response.text
+    )
+    assert (
+        'test_http_responses_total{method="GET",route="unmatched",status="404"} 1'
+        in response.text
+    )
+    metrics_registry.reset()
+
+
+def test_log_performance_sampling_records_every_call():
+    logger.reset_performance_metrics()
+
+    @logger.log_performance(
+        operation_name="hot_op", include_memory=True, sample_every=10
+    )
+    def hot(user_id):
+        return None
+
+    for _ in range(25):
+        hot("1")
+
+    summary = logger.get_performance_summary()
+    # 소요 시간은 매 호출, 메모리 측정은 10번 중 1번 (0, 10, 20번째 호출)
+    assert summary["api_response_times"]["hot_op"]["count"] == 25
+    assert summary["memory_usage_by_function"]["hot_op"]["count"] == 3
+    logger.reset_performance_metrics()
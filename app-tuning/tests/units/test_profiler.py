@@ -0,0 +1,76 @@
+"""
+샘플링 프로파일러 테스트 모듈
+주요 테스트 대상:
+- 실행 중인 스레드의 함수가 collapsed stack / speedscope 결과에 포함되는지
+- 동시 프로파일링 거절
+- 모니터링 토큰 검사 (미설정 403, 불일치 401)
+"""
+
+import threading
+
+import pytest
+from api.endpoints.monitoring_router import require_monitoring_token
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from utils import profiler
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_loop, args=(stop,), name="busy-worker")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_profile_captures_running_thread(busy_thread):
+    profile = profiler.sample_stacks(seconds=0.3, interval=0.005)
+
+    assert profile.sample_count > 5
+    collapsed = profile.to_collapsed()
+    busy_lines = [
+        line for line in collapsed.splitlines() if line.startswith("busy-worker;")
+    ]
+    assert any("busy_loop (test_profiler.py:" in line for line in busy_lines)
+
+    speedscope = profile.to_speedscope("test")
+    names = {frame["name"] for frame in speedscope["shared"]["frames"]}
+    assert "busy_loop" in names
+    busy = next(p for p in speedscope["profiles"] if p["name"] == "busy-worker")
+    assert len(busy["samples"]) == len(busy["weights"])
+    assert busy["endValue"] == pytest.approx(profile.duration, rel=0.2)
+
+
+def test_concurrent_profile_is_rejected():
+    assert profiler._profile_lock.acquire(blocking=False)
+    try:
+        with pytest.raises(profiler.ProfilerBusyError):
+            profiler.sample_stacks(seconds=0.01, interval=0.005)
+    finally:
+        profiler._profile_lock.release()
+
+
+def test_monitoring_token_required(monkeypatch):
+    app = FastAPI()
+
+    @app.get("/diagnostics", dependencies=[Depends(require_monitoring_token)])
+    def diagnostics():
+        return {"ok": True}
+
+    client = TestClient(app)
+    monkeypatch.delenv("MONITORING_TOKEN", raising=False)
+    assert client.get("/diagnostics").status_code == 403
+
+    monkeypatch.setenv("MONITORING_TOKEN", "secret")
+    assert client.get("/diagnostics").status_code == 401
+    response = client.get("/diagnostics", headers={"X-Monitoring-Token": "wrong"})
+    assert response.status_code == 401
+    response = client.get("/diagnostics", headers={"X-Monitoring-Token": "secret"})
+    assert response.status_code == 200
@@ -0,0 +1,179 @@
+"""
+비동기 사용자 등록 작업 큐 테스트 모듈
+이 모듈은 유사도 계산 작업 큐의 등록/상태 전이/종료 처리를 테스트합니다.
+주요 테스트 대상:
+- 작업 상태 전이 (QUEUED → RUNNING → SUCCEEDED / FAILED) 및 카테고리별 진행률
+- 큐가 가득 찬 경우 거절 (등록 API 429 + Retry-After)
+- 완료 작업 이력 제거
+- 종료 시 워커 중지 및 미완료 작업 실패 처리
+"""
+
+import asyncio
+import threading
+
+import pytest
+import services.registration_job_service as job_service
+from api.controllers import user_controller
+from fastapi import HTTPException
+from services.registration_job_service import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    RegistrationJobQueue,
+    RegistrationQueueFullError,
+)
+
+
+class FakeSimilarityUpdate:
+    """
+    release 이벤트가 설정될 때까지 멈춘 뒤 카테고리별 진행률을 보고하는 유사도 계산 대역
+    fail_user_ids에 포함된 사용자는 예외로 실패
+    """
+
+    def __init__(self, fail_user_ids=()):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.fail_user_ids = set(fail_user_ids)
+
+    def __call__(self, user_id, on_progress=None):
+        self.started.set()
+        self.release.wait(5)
+        if user_id in self.fail_user_ids:
+            raise HTTPException(
+                status_code=500, detail={"code": "SIMILARITY_UPDATE_FAILED"}
+            )
+        for category in job_service.CATEGORIES:
+            on_progress(category)
+
+
+async def _wait_until(predicate, timeout=5.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.fixture
+def similarity_update(monkeypatch):
+    update = FakeSimilarityUpdate(fail_user_ids={"2"})
+    monkeypatch.setattr(job_service, "update_registered_user_similarities_v3", update)
+    yield update
+    update.release.set()
+
+
+@pytest.mark.asyncio
+async def test_job_transitions_and_progress(similarity_update):
+    """
+    작업이 QUEUED → RUNNING → SUCCEEDED / FAILED 순으로 전이되고
+    카테고리별 진행률과 처리 통계가 기록되는지 검증
+    """
+    queue = RegistrationJobQueue(max_queue_size=10, worker_count=1, max_history=10)
+    try:
+        succeeded = queue.submit("1")
+        failed = queue.submit("2")
+        assert succeeded["status"] == JOB_QUEUED
+
+        await asyncio.to_thread(similarity_update.started.wait, 5)
+        assert queue.get_job(succeeded["jobId"])["status"] == JOB_RUNNING
+        assert queue.get_job(failed["jobId"])["status"] == JOB_QUEUED
+
+        similarity_update.release.set()
+        await _wait_until(lambda: failed["finishedAt"] is not None)
+
+        assert succeeded["status"] == JOB_SUCCEEDED
+        assert succeeded["completedCategories"] == job_service.CATEGORIES
+        assert failed["status"] == JOB_FAILED
+        assert failed["error"] == {"code": "SIMILARITY_UPDATE_FAILED"}
+
+        stats = queue.stats()
+        assert stats["processedTotal"] == 2
+        assert stats["failedTotal"] == 1
+        assert stats["jobsByStatus"][JOB_SUCCEEDED] == 1
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_queue_is_full(similarity_update):
+    """
+    실행 중 1건 + 대기열 크기만큼 적재되면 추가 작업은 즉시 거절되는지 검증
+    """
+    queue = RegistrationJobQueue(max_queue_size=1, worker_count=1, max_history=10)
+    try:
+        queue.submit("1")
+        await asyncio.to_thread(similarity_update.started.wait, 5)
+        queue.submit("3")
+
+        assert queue.is_full()
+        with pytest.raises(RegistrationQueueFullError):
+            queue.submit("4")
+        assert len([job for job in queue._jobs.values() if job["userId"] == "4"]) == 0
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_register_api_returns_429_when_queue_is_full(monkeypatch):
+    """
+    큐가 가득 차면 프로필을 저장하기 전에 429 + Retry-After로 거절하는지 검증
+    """
+    monkeypatch.setattr(user_controller.registration_job_queue, "is_full", lambda: True)
+
+    def fail_if_called(*args, **kwargs):
+        raise AssertionError("큐가 가득 찬 경우 프로필을 저장하면 안 됨")
+
+    monkeypatch.setattr(user_controller, "register_user_profile_v3", fail_if_called)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await user_controller.create_user_v3_async(None)
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.detail["code"] == "EMBEDDING_REGISTER_QUEUE_FULL"
+    assert "Retry-After" in exc_info.value.headers
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_are_evicted_first(similarity_update):
+    """
+    작업 이력이 max_history를 넘으면 오래된 완료 작업부터 제거하고
+    대기/실행 중인 작업은 남기는지 검증
+    """
+    queue = RegistrationJobQueue(max_queue_size=10, worker_count=1, max_history=2)
+    try:
+        similarity_update.release.set()
+        first = queue.submit("1")
+        await _wait_until(lambda: first["status"] == JOB_SUCCEEDED)
+
+        similarity_update.release.clear()
+        similarity_update.started.clear()
+        second = queue.submit("3")
+        await asyncio.to_thread(similarity_update.started.wait, 5)
+        third = queue.submit("5")
+
+        assert queue.get_job(first["jobId"]) is None
+        assert queue.get_job(second["jobId"])["status"] == JOB_RUNNING
+        assert queue.get_job(third["jobId"])["status"] == JOB_QUEUED
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_workers_and_fails_pending_jobs(similarity_update):
+    """
+    종료 시 워커가 취소되고 실행/대기 중이던 작업이 실패 처리되는지 검증
+    """
+    queue = RegistrationJobQueue(max_queue_size=10, worker_count=1, max_history=10)
+    running = queue.submit("1")
+    queued = queue.submit("3")
+    await asyncio.to_thread(similarity_update.started.wait, 5)
+    workers = list(queue._workers)
+
+    await queue.stop()
+
+    assert all(worker.done() for worker in workers)
+    assert queue.stats()["queueDepth"] == 0
+    for job in (running, queued):
+        assert job["status"] == JOB_FAILED
+        assert job["error"] == "SERVER_SHUTDOWN"
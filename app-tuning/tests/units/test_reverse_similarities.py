@@ -0,0 +1,84 @@
+"""
+역방향 유사도 병합 테스트 모듈
+이 모듈은 계산한 유사도에 저장된 역방향 점수를 병합하는 기능을 테스트합니다.
+주요 테스트 대상:
+- 조회 이후 같은 도메인에 등록된 사용자의 점수만 본인 문서에서 유지
+- 조회 시점에 존재했던 사용자(ANN 비후보 포함) / 삭제된 사용자 점수 제거
+"""
+
+import json
+
+import pytest
+import services.user_service as user_service
+
+
+class FakeCollection:
+    """
+    ids 조회만 지원하는 Chroma 컬렉션 대역
+    """
+
+    def __init__(self, metadatas):
+        self.metadatas = metadatas
+
+    def get(self, ids, include=None):
+        found = [i for i in ids if i in self.metadatas]
+        return {"ids": found, "metadatas": [self.metadatas[i] for i in found]}
+
+
+@pytest.fixture
+def stores(monkeypatch):
+    """
+    사용자 1의 저장된 문서: 이전 후보 2, 3(현재는 필터로 제외), 조회 이후 등록된 9,
+    삭제된 8, 다른 도메인으로 바뀐 7의 점수를 포함
+    """
+    users = FakeCollection(
+        {
+            uid: {"emailDomain": "a.com" if uid != "7" else "b.com"}
+            for uid in ["1", "2", "3", "4", "7", "9"]
+        }
+    )
+    own = {"2": 0.5, "3": 0.4, "7": 0.3, "8": 0.2, "9": 0.6}
+    similarities = FakeCollection(
+        {
+            "1": {"userId": "1", "similarities": json.dumps(own)},
+            "4": {"userId": "4", "similarities": json.dumps({"1": 0.7})},
+        }
+    )
+    monkeypatch.setattr(user_service, "get_user_collection", lambda: users)
+    monkeypatch.setattr(
+        user_service, "get_similarity_collection", lambda category: similarities
+    )
+
+
+def _snapshot(ids, **extra):
+    return {
+        "ids": ids,
+        "metadatas": [{"emailDomain": "a.com"} for _ in ids],
+        **extra,
+    }
+
+
+def test_full_snapshot_replaces_row_except_later_registrations(stores):
+    """
+    전체 조회 결과로 재계산하면 조회 시점 사용자의 이전 점수는 버리고
+    이후 같은 도메인에 등록된 사용자(9)의 점수와 역방향 점수(4)만 병합
+    """
+    merged = user_service.enrich_with_reverse_similarities_v3(
+        "1", {"2": 0.55}, _snapshot(["1", "2", "3", "4"]), "friend"
+    )
+
+    assert merged == {"2": 0.55, "4": 0.7, "9": 0.6}
+
+
+def test_ann_snapshot_drops_non_candidates(stores):
+    """
+    ANN 후보 조회 결과로 재계산하면 후보가 아니었던 도메인 사용자(3)의 점수도 제거
+    """
+    merged = user_service.enrich_with_reverse_similarities_v3(
+        "1",
+        {"2": 0.55},
+        _snapshot(["1", "2"], domainIds=["1", "2", "3", "4"]),
+        "friend",
+    )
+
+    assert merged == {"2": 0.55, "9": 0.6}
@@ -0,0 +1,22 @@
+"""
+SBERT 백엔드 선택 테스트 모듈
+이 모듈은 SBERT_BACKEND 환경 변수에 따른 추론 백엔드 선택 기능을 테스트합니다.
+"""
+
+import pytest
+from models.sbert_backends import BACKEND_ONNX_INT8, BACKEND_TORCH, get_backend
+
+
+def test_backend_selection(monkeypatch):
+    """
+    기본값은 torch, 대소문자 구분 없이 선택, 지원하지 않는 값은 오류
+    """
+    monkeypatch.delenv("SBERT_BACKEND", raising=False)
+    assert get_backend() == BACKEND_TORCH
+
+    monkeypatch.setenv("SBERT_BACKEND", "ONNX-INT8")
+    assert get_backend() == BACKEND_ONNX_INT8
+
+    monkeypatch.setenv("SBERT_BACKEND", "tensorrt")
+    with pytest.raises(ValueError):
+        get_backend()
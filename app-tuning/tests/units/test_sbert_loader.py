@@ -0,0 +1,87 @@
+"""
+SBERT 모델 지연 로드 테스트 모듈
+이 모듈은 모델을 임포트 시점이 아닌 최초 사용 시점에 로드하는 기능을 테스트합니다.
+주요 테스트 대상:
+- 백그라운드 로드 중 / 완료 후 준비 상태
+- 준비 대기 시간 초과
+- 로드 실패 상태 기록
+"""
+
+import asyncio
+import threading
+
+import pytest
+from models import sbert_loader
+
+
+@pytest.fixture(autouse=True)
+def reset_loader_state(monkeypatch):
+    """
+    테스트마다 모델 로드 상태 초기화
+    """
+    monkeypatch.setattr(sbert_loader, "_model", None)
+    monkeypatch.setattr(sbert_loader, "_ready", threading.Event())
+    monkeypatch.setattr(sbert_loader, "_load_error", None)
+    monkeypatch.setattr(sbert_loader, "_load_seconds", None)
+    monkeypatch.setattr(sbert_loader, "_loading_task", None)
+
+
+@pytest.mark.asyncio
+async def test_background_loading_reports_loading_then_ready(monkeypatch):
+    """
+    백그라운드 로드 중에는 LOADING, 완료 후에는 READY 상태와 같은 모델을 반환하는지 검증
+    """
+    release = threading.Event()
+    model = object()
+
+    def slow_load():
+        release.wait(5)
+        return model
+
+    monkeypatch.setattr(sbert_loader, "_load_encoder", slow_load)
+
+    task = sbert_loader.start_background_loading()
+    await asyncio.sleep(0.05)
+    assert sbert_loader.get_model_status()["status"] == "LOADING"
+    assert not sbert_loader.is_model_ready()
+
+    release.set()
+    await task
+    assert sbert_loader.is_model_ready()
+    assert sbert_loader.get_model() is model
+    assert sbert_loader.get_model_status()["status"] == "READY"
+
+
+@pytest.mark.asyncio
+async def test_wait_until_model_ready_times_out(monkeypatch):
+    """
+    제한 시간 내에 로드가 끝나지 않으면 TimeoutError가 발생하고 로드는 계속되는지 검증
+    """
+    release = threading.Event()
+    monkeypatch.setattr(sbert_loader, "_load_encoder", lambda: release.wait(5))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await sbert_loader.wait_until_model_ready(timeout=0.05)
+
+    release.set()
+    await sbert_loader.wait_until_model_ready(timeout=5)
+    assert sbert_loader.is_model_ready()
+
+
+@pytest.mark.asyncio
+async def test_load_failure_is_reported(monkeypatch):
+    """
+    로드 실패 시 FAILED 상태와 오류 메시지가 기록되는지 검증
+    """
+
+    def failing_load():
+        raise RuntimeError("model missing")
+
+    monkeypatch.setattr(sbert_loader, "_load_encoder", failing_load)
+
+    with pytest.raises(RuntimeError):
+        await sbert_loader.wait_until_model_ready(timeout=5)
+
+    status = sbert_loader.get_model_status()
+    assert status["status"] == "FAILED"
+    assert status["error"] == "model missing"
@@ -0,0 +1,43 @@
+"""
+매칭 점수 구성 요소 직렬화 테스트 모듈
+이 모듈은 구성 요소 행렬의 저장 형식과 가중치 벡터 변환을 테스트합니다.
+주요 테스트 대상:
+- 구성 요소 행렬 직렬화/복원 (float32 정밀도)
+- 구성 요소가 없는 문서 처리
+- 카테고리 가중치 → 구성 요소 가중치 벡터 변환
+"""
+
+import numpy as np
+import pytest
+from core.score_components import (
+    component_weight_vector,
+    pack_components,
+    unpack_components,
+)
+
+
+def test_pack_unpack_round_trip():
+    components = np.array([[0.8123, 0.25, 1.0], [0.1, 0.75, 0.5]])
+
+    packed = pack_components(["3", "7"], components)
+    other_ids, restored = unpack_components({"userId": "1", **packed})
+
+    assert other_ids == ["3", "7"]
+    assert restored.dtype == np.float32
+    np.testing.assert_allclose(restored, components, rtol=1e-7)
+
+
+def test_unpack_without_components():
+    assert unpack_components({"userId": "1", "similarities": "{}"}) is None
+
+
+def test_component_weight_vector():
+    vector = component_weight_vector(
+        {"embedding": 0.6, "rule": 0.4, "mbti": 0.75, "age": 0.25}
+    )
+    assert vector == pytest.approx([0.6, 0.3, 0.1])
+
+    # 규칙 내부 가중치를 생략하면 기본값(0.5 / 0.5) 사용
+    assert component_weight_vector({"embedding": 0.7, "rule": 0.3}) == pytest.approx(
+        [0.7, 0.15, 0.15]
+    )
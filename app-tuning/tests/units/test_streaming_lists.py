@@ -0,0 +1,137 @@
+"""
+사용자/유사도 목록 페이지 조회 및 NDJSON 스트리밍 테스트 모듈
+주요 테스트 대상:
+- iter_users / iter_similarities 페이지 분할 (페이지 크기의 정확한 배수, 빈 컬렉션)
+- 스트리밍 응답 마지막 요약 줄의 문서 수
+- 잘못된 카테고리는 스트리밍 시작 전에 400 반환
+"""
+
+import json
+
+import chromadb
+import core.vector_database.client as chroma_client_module
+import core.vector_database.collections as collections
+import pytest
+from api.controllers import user_controller
+from chromadb.config import Settings
+from core.vector_database.similarity_repository import iter_similarities
+from core.vector_database.user_repository import iter_users
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def chroma(monkeypatch):
+    client = chromadb.EphemeralClient(
+        Settings(anonymized_telemetry=False, allow_reset=True)
+    )
+    client.reset()
+    monkeypatch.setattr(chroma_client_module, "chroma_client", client)
+    monkeypatch.setattr(collections, "_collection_cache", {})
+    yield client
+    client.reset()
+
+
+def _add_users(count: int) -> None:
+    collections.get_user_collection().add(
+        ids=[str(i) for i in range(1, count + 1)],
+        embeddings=[[float(i), 1.0] for i in range(1, count + 1)],
+        metadatas=[{"emailDomain": "kakaotech.com"} for _ in range(count)],
+    )
+
+
+def _add_similarities(category: str, count: int) -> None:
+    collections.get_similarity_collection(category).add(
+        ids=[str(i) for i in range(1, count + 1)],
+        embeddings=[[0.0] for _ in range(count)],
+        metadatas=[
+            {"userId": str(i), "similarities": "{}"} for i in range(1, count + 1)
+        ],
+    )
+
+
+def _read_ndjson(lines) -> list:
+    return [json.loads(line) for line in lines]
+
+
+def test_iter_users_exact_page_multiple(chroma):
+    """
+    문서 수가 페이지 크기의 배수이면 꽉 찬 페이지만 반환하고 빈 페이지는 반환하지 않는지 검증
+    """
+    _add_users(4)
+
+    pages = list(iter_users(page_size=2))
+
+    assert [len(page["ids"]) for page in pages] == [2, 2]
+    assert sorted(user_id for page in pages for user_id in page["ids"]) == [
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+
+
+def test_iter_empty_collections(chroma):
+    assert list(iter_users(page_size=2)) == []
+    assert list(iter_similarities("friend", page_size=2)) == []
+
+
+def test_iter_similarities_pages(chroma):
+    _add_similarities("couple", 5)
+
+    pages = list(iter_similarities("couple", page_size=2))
+
+    assert [len(page["ids"]) for page in pages] == [2, 2, 1]
+    assert all(meta["similarities"] == "{}" for meta in pages[0]["metadatas"])
+
+
+def test_stream_user_ids_summary_count(chroma):
+    """
+    사용자 ID 줄 다음 마지막 줄에 전체 문서 수가 요약되는지 검증
+    """
+    _add_users(4)
+
+    records = _read_ndjson(user_controller._stream_user_ids(page_size=2))
+
+    assert sorted(record["id"] for record in records[:-1]) == ["1", "2", "3", "4"]
+    assert records[-1] == {"code": "REGISTERD_ID_CHECKED", "count": 4}
+
+
+def test_stream_similarities_summary_count(chroma):
+    _add_similarities("friend", 3)
+
+    records = _read_ndjson(user_controller._stream_similarities("friend", 2))
+
+    assert len(records) == 4
+    assert records[0]["metadata"]["similarities"] == "{}"
+    assert records[-1] == {
+        "code": "REGISTERD_SIMILARITY_CHECKED",
+        "collection_name": "friend",
+        "count": 3,
+    }
+
+    empty = _read_ndjson(user_controller._stream_similarities("couple", 2))
+    assert empty == [
+        {
+            "code": "REGISTERD_SIMILARITY_CHECKED",
+            "collection_name": "couple",
+            "count": 0,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_invalid_category_rejected_before_streaming(chroma, monkeypatch):
+    """
+    잘못된 카테고리는 스트리밍 응답을 만들기 전에 400으로 거절되는지 검증
+    """
+
+    def fail_if_called(*args, **kwargs):
+        raise AssertionError("잘못된 카테고리로 스트리밍을 시작하면 안 됨")
+
+    monkeypatch.setattr(user_controller, "_stream_similarities", fail_if_called)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await user_controller.db_similarity_list_v3("invalid", page_size=2)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["code"] == "SIMILARITY_INVALID_CATEGORY"
@@ -0,0 +1,110 @@
+"""
+요청 단위 구간 추적 테스트 모듈
+주요 테스트 대상:
+- 부모/자식 구간 구조와 단계별 요약
+- 추적이 없을 때 구간 미기록 / 구간 수 제한
+- 워커 스레드(contextvars 복사)로의 구간 전달
+- 미들웨어 + 느린 추적 조회 형식
+"""
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from utils import tracing
+from utils.tracing import (
+    TracingMiddleware,
+    add_chroma_bytes,
+    span,
+    start_trace,
+    trace_store,
+)
+
+
+def test_nested_spans_and_stage_summary():
+    trace_store.clear()
+    with start_trace("register"):
+        with span("encode"):
+            time.sleep(0.01)
+        with span("store", category="friend"):
+            with span("chroma.upsert"):
+                add_chroma_bytes(100, 20)
+            with span("chroma.upsert"):
+                add_chroma_bytes(50, 10)
+
+    [trace] = trace_store.slowest()
+    assert trace["name"] == "register"
+    assert trace["chromaBytesOut"] == 150
+    assert trace["chromaBytesIn"] == 30
+    assert trace["stages"]["chroma.upsert"]["count"] == 2
+    assert trace["stages"]["encode"]["totalMs"] >= 10
+
+    encode, store = trace["root"]["children"]
+    assert encode["parentSpanId"] == trace["root"]["spanId"]
+    assert store["attributes"]["category"] == "friend"
+    assert store["children"][0]["attributes"]["chroma.bytes_out"] == 100
+    trace_store.clear()
+
+
+def test_span_without_trace_is_noop():
+    with span("orphan") as current:
+        add_chroma_bytes(1, 1)
+    assert current is None
+
+
+def test_span_limit_counts_dropped(monkeypatch):
+    trace_store.clear()
+    monkeypatch.setattr(tracing, "TRACE_MAX_SPANS", 3)
+    with start_trace("hot_loop"):
+        for _ in range(5):
+            with span("compute"):
+                pass
+
+    [trace] = trace_store.slowest()
+    assert trace["stages"]["compute"]["count"] == 3
+    assert trace["droppedSpans"] == 2
+    trace_store.clear()
+
+
+def test_spans_follow_context_into_worker_threads():
+    trace_store.clear()
+
+    def work():
+        with span("in_thread"):
+            pass
+
+    async def run():
+        with start_trace("async_request"):
+            await asyncio.to_thread(work)
+
+    asyncio.run(run())
+    [trace] = trace_store.slowest()
+    assert trace["root"]["children"][0]["name"] == "in_thread"
+    trace_store.clear()
+
+
+def test_middleware_names_traces_by_route_and_skips_monitoring():
+    trace_store.clear()
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with span("lookup"):
+            return {"id": item_id}
+
+    @app.get("/monitoring/ping")
+    def ping():
+        return {}
+
+    client = TestClient(app)
+    response = client.get("/items/7")
+    client.get("/monitoring/ping")
+
+    traces = trace_store.slowest()
+    assert [trace["name"] for trace in traces] == ["GET /items/{item_id}"]
+    assert response.headers["x-trace-id"] == traces[0]["traceId"]
+    assert traces[0]["root"]["attributes"]["http.status_code"] == 200
+    assert traces[0]["stages"]["lookup"]["count"] == 1
+    trace_store.clear()
@@ -0,0 +1,65 @@
+# 컨테이너(cgroup) CPU 할당량 기반 가용 코어 수 계산 유틸리티
+
+import math
+import os
+from typing import Optional
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(
+    cpu_max_path: str = CGROUP_V2_CPU_MAX,
+    quota_path: str = CGROUP_V1_QUOTA,
+    period_path: str = CGROUP_V1_PERIOD,
+) -> Optional[float]:
+    """
+    cgroup에 설정된 CPU 할당량(코어 수 단위)을 반환
+
+    Returns:
+        float: 할당량 / 주기 (예: 350000/100000 → 3.5), 제한이 없으면 None
+    """
+    cpu_max = _read(cpu_max_path)
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    quota, period = _read(quota_path), _read(period_path)
+    if quota and period and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def available_cpus() -> float:
+    """
+    os.cpu_count()와 cgroup CPU 할당량 중 작은 값을 반환
+    (os.cpu_count()는 컨테이너 할당량을 반영하지 않음)
+    """
+    cpu_count = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    return min(cpu_count, limit) if limit else float(cpu_count)
+
+
+def inference_threads(share: float = 0.5, workers: int = 1) -> int:
+    """
+    추론용 torch 스레드 수 (SBERT_NUM_THREADS 환경 변수가 있으면 우선 사용)
+
+    Args:
+        share: 추론에 할당할 가용 코어 비율 (나머지는 요청 처리용)
+        workers: 추론 프로세스 수 (프로세스별로 나누어 할당)
+    """
+    configured = os.getenv("SBERT_NUM_THREADS")
+    if configured:
+        return max(1, int(configured))
+    return max(1, math.ceil(available_cpus() * share / max(1, workers)))
@@ -0,0 +1,87 @@
+# 이메일 도메인 단위 쓰기 직렬화 유틸리티
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from utils.metrics import metrics_registry
+from utils.tracing import span
+
+metrics_registry.describe(
+    "domain_lock_contentions", "domain_locks_contended", "도메인 락 누적 경합 횟수", ()
+)
+
+# 도메인을 알 수 없는 경우(메타데이터 누락 등) 사용하는 공용 키
+UNKNOWN_DOMAIN = "__unknown__"
+
+
+class DomainLockRegistry:
+    """
+    이메일 도메인별 쓰기 락 레지스트리
+    - 유사도는 같은 도메인 사용자끼리만 계산되므로 역방향 유사도 JSON의
+      읽기-수정-쓰기 충돌도 같은 도메인 안에서만 발생
+    - 같은 도메인의 쓰기는 직렬화하고, 다른 도메인은 병렬로 처리
+    - 유사도 저장은 실행기/스크립트의 워커 스레드에서 수행되므로 threading.Lock 사용
+    """
+
+    def __init__(self):
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self._acquired = 0
+        self._contended = 0
+        self._wait_total = 0.0
+
+    def get_lock(self, domain: Optional[str]) -> threading.Lock:
+        key = domain or UNKNOWN_DOMAIN
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    @contextmanager
+    def hold(self, domain: Optional[str]) -> Iterator[None]:
+        """
+        도메인 락을 잡고 블록을 실행
+
+        Args:
+            domain: 이메일 도메인 (없으면 공용 키 사용)
+        """
+        lock = self.get_lock(domain)
+        started_at = time.perf_counter()
+        contended = not lock.acquire(blocking=False)
+        if contended:
+            metrics_registry.increment("domain_lock_contentions", "")
+            with span("domain_lock_wait", domain=domain):
+                lock.acquire()
+        try:
+            with self._guard:
+                self._acquired += 1
+                self._contended += int(contended)
+                self._wait_total += time.perf_counter() - started_at
+            yield
+        finally:
+            lock.release()
+
+    def stats(self) -> Dict:
+        """
+        도메인 락 경합 통계
+        """
+        with self._guard:
+            return {
+                "domains": len(self._locks),
+                "lockedDomains": sum(
+                    1 for lock in self._locks.values() if lock.locked()
+                ),
+                "acquiredTotal": self._acquired,
+                "contendedTotal": self._contended,
+                "avgWaitSeconds": (
+                    round(self._wait_total / self._acquired, 4)
+                    if self._acquired
+                    else 0.0
+                ),
+            }
+
+
+domain_locks = DomainLockRegistry()
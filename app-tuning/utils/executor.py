@@ -0,0 +1,167 @@
+# CPU 집약 작업 실행기 유틸리티(스레드 풀 + 입장 제어)
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from fastapi import HTTPException
+from utils.metrics import metrics_registry
+
+metrics_registry.describe(
+    "executor_rejections", "executor_rejected", "실행기 누적 거절 횟수", ("executor",)
+)
+
+
+class ExecutorOverloadedError(HTTPException):
+    """
+    실행기의 처리 중 + 대기 작업 수가 허용치를 넘은 경우 발생
+    HTTPException을 상속하므로 컨트롤러의 HTTPException 재전파 경로를 그대로 타고
+    429 + Retry-After 응답으로 변환됨
+    """
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(
+            status_code=429,
+            detail={"code": "SERVER_BUSY", "data": None},
+            headers={"Retry-After": str(retry_after)},
+        )
+        self.executor_name = name
+
+
+class BoundedExecutor:
+    """
+    크기가 제한된 스레드 풀 실행기
+    - SBERT 인코딩, NumPy 점수 계산, 동기 Chroma 호출 등 CPU/블로킹 작업을 이벤트 루프 밖에서 실행
+    - 처리 중 + 대기 작업 수가 (워커 수 + 대기열 크기)를 넘으면 즉시 거절 (백프레셔)
+    - 헬스 체크와 튜닝 조회가 등록 작업에 밀려 지연되지 않도록 전용 풀로 분리
+
+    입장 제어 카운터(_inflight)와 완료/실패 카운터는 이벤트 루프 스레드에서만 변경되며,
+    워커 스레드에서 갱신하는 실행 통계는 락으로 보호
+    대기 중인 코루틴이 취소되어도 이미 실행 중인 워커 작업은 끝까지 실행되므로,
+    자리 반환은 코루틴이 아닌 워커 작업의 완료 콜백에서 수행
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, retry_after: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._inflight = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._queue_wait_total = 0.0
+        self._busy_time_total = 0.0
+        self._started_at = time.time()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    async def run(
+        self, func: Callable, *args, reject_when_full: bool = True, **kwargs
+    ) -> Any:
+        """
+        함수를 실행기 스레드에서 실행하고 결과를 반환
+
+        Args:
+            func: 실행할 동기 함수
+            reject_when_full: False이면 포화 상태에서도 거절하지 않고 대기
+                (이미 별도 큐로 제한되는 백그라운드 작업용)
+
+        Raises:
+            ExecutorOverloadedError: 포화 상태에서 reject_when_full=True인 경우
+        """
+        if reject_when_full and self._inflight >= self.capacity:
+            self._rejected += 1
+            metrics_registry.increment("executor_rejections", self.name)
+            raise ExecutorOverloadedError(self.name, self.retry_after)
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+        # 요청 단위 컨텍스트(contextvars)를 워커 스레드로 전달
+        context = contextvars.copy_context()
+        call = functools.partial(self._timed_call, submitted_at, func, args, kwargs)
+        future = self._executor.submit(context.run, call)
+        self._inflight += 1
+        # 자리 반환 콜백을 결과 전달(wrap_future)보다 먼저 등록하여
+        # 대기 코루틴이 재개되기 전에 통계가 갱신되도록 함
+        future.add_done_callback(functools.partial(self._on_done_threadsafe, loop))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _on_done_threadsafe(
+        self, loop: asyncio.AbstractEventLoop, future: Future
+    ) -> None:
+        # 워커 스레드(또는 취소 시 이벤트 루프 스레드)에서 호출되므로 루프 스레드로 전달
+        try:
+            loop.call_soon_threadsafe(self._on_done, future)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료된 경우 (프로세스 종료 중)
+            pass
+
+    def _on_done(self, future: Future) -> None:
+        self._inflight -= 1
+        if future.cancelled():
+            # 워커에서 실행되기 전에 취소된 작업
+            self._cancelled += 1
+        elif future.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    def _timed_call(self, submitted_at: float, func: Callable, args, kwargs) -> Any:
+        started_at = time.perf_counter()
+        with self._stats_lock:
+            self._queue_wait_total += started_at - submitted_at
+            self._running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._running -= 1
+                self._busy_time_total += time.perf_counter() - started_at
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        실행기 사용률 통계
+        """
+        uptime = max(time.time() - self._started_at, 1e-9)
+        return {
+            "name": self.name,
+            "maxWorkers": self.max_workers,
+            "maxQueue": self.max_queue,
+            "inflight": self._inflight,
+            "running": self._running,
+            "queued": max(0, self._inflight - self._running),
+            "utilization": round(self._running / self.max_workers, 3),
+            "busyRatio": round(self._busy_time_total / (uptime * self.max_workers), 3),
+            "completedTotal": self._completed,
+            "failedTotal": self._failed,
+            "cancelledTotal": self._cancelled,
+            "rejectedTotal": self._rejected,
+            "avgQueueWaitSeconds": (
+                round(self._queue_wait_total / (self._completed + self._failed), 4)
+                if self._completed + self._failed
+                else 0.0
+            ),
+        }
+
+
+# CPU 집약 작업 전용 실행기 (등록/삭제/유사도 계산)
+cpu_executor = BoundedExecutor(
+    name="cpu",
+    max_workers=int(os.getenv("CPU_EXECUTOR_WORKERS", "2")),
+    max_queue=int(os.getenv("CPU_EXECUTOR_QUEUE_SIZE", "8")),
+    retry_after=int(os.getenv("CPU_EXECUTOR_RETRY_AFTER", "5")),
+)
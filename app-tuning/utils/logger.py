@@ -2,14 +2,18 @@
 
 import asyncio
 import functools
+import itertools
 import logging
 import os
 import time
 from datetime import datetime
-from inspect import signature
+from inspect import Signature, signature
 from typing import Any, Callable, Dict, Optional
 
 import psutil
+from utils.log_queue import attach_queue_handler
+from utils.metrics import metrics_registry
+from utils.tracing import span
 
 # 로거 설정
 logger = logging.getLogger("tuning_performance")
@@ -18,7 +22,6 @@ formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
 # 콘솔 핸들러
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
 
 # 파일 핸들러 (logs 디렉토리에 성능 로그 저장)
 os.makedirs("logs", exist_ok=True)
@@ -26,259 +29,173 @@ file_handler = logging.FileHandler(
     f"logs/performance_{datetime.now().strftime('%Y%m%d')}.log"
 )
 file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+
+# 요청 경로에서는 큐에만 넣고, 콘솔/파일 쓰기는 리스너 스레드에서 처리
+log_listener = attach_queue_handler(logger, [console_handler, file_handler])
 
 logger.setLevel(logging.INFO)
 logger.propagate = False  # 부모 로거로 메시지 전파 중단
 
-# 성능 지표 컬렉션 (간단한 인메모리 저장소)
-performance_metrics = {
-    "api_response_times": {},
-    "embedding_generation_times": [],
-    "similarity_calculation_times": [],
-    "db_operation_times": {},
-    "error_counts": {},
-    "memory_usage_samples": [],
-    "memory_usage_by_function": {},
-}
+# 성능 지표 저장소 (이름별 고정 크기 히스토그램/누적 통계, 장시간 실행해도 메모리 사용량 일정)
+performance_metrics = metrics_registry
+
+# log_performance 샘플링 간격: N번 호출 중 1번만 인자 분석/메모리 측정/INFO 로그 (소요 시간 지표는 매번 기록)
+PERF_SAMPLE_EVERY = max(1, int(os.getenv("PERF_SAMPLE_EVERY", "1")))
+# 요청 하나에서 사용자 수만큼 반복 호출되는 내부 함수의 샘플링 간격
+PERF_HOT_SAMPLE_EVERY = max(1, int(os.getenv("PERF_HOT_SAMPLE_EVERY", "100")))
+performance_metrics.describe(
+    "api_response_times",
+    "operation_duration_seconds",
+    "log_performance 작업 소요 시간",
+    ("operation",),
+)
+performance_metrics.describe(
+    "db_operation_times",
+    "db_operation_duration_seconds",
+    "log_db_operation 작업 소요 시간",
+    ("operation",),
+)
 
 
-def log_performance(operation_name: Optional[str] = None, include_memory: bool = False):
+def log_performance(
+    operation_name: Optional[str] = None,
+    include_memory: bool = False,
+    sample_every: Optional[int] = None,
+):
     """
     성능 측정 및 로깅 데코레이터
+    소요 시간 지표는 매 호출 기록하고, 사용자 ID/카테고리 추출 + 메모리 측정 + INFO 로그는
+    sample_every번 호출 중 1번만 수행 (오류는 항상 로그)
+    진행 중인 추적이 있으면 작업 이름으로 하위 구간도 기록
 
     Args:
         operation_name: 로깅할 작업 이름 (기본값: 함수명)
         include_memory: 메모리 사용량도 함께 로깅할지 여부
+        sample_every: 샘플링 간격 (기본값: PERF_SAMPLE_EVERY, 1이면 매 호출 로그)
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            # 작업 이름 결정
-            op_name = operation_name or func.__name__
-
-            # 유저 ID 추출 시도
-            bound_args = signature(func).bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            user_id = (
-                kwargs.get("user_id")
-                or kwargs.get("userId")
-                or (args[0] if args and isinstance(args[0], (str, int)) else None)
-            )
+        op_name = operation_name or func.__name__
+        # 시그니처는 데코레이터 적용 시 한 번만 계산 (인자 바인딩은 로그를 남길 때만)
+        func_signature = signature(func)
+        every = max(1, sample_every or PERF_SAMPLE_EVERY)
+        calls = itertools.count()
+
+        def begin() -> tuple:
+            sampled = next(calls) % every == 0 and logger.isEnabledFor(logging.INFO)
+            initial_memory = _get_memory_usage() if sampled and include_memory else None
+            return sampled, initial_memory, time.perf_counter()
+
+        def succeed(args, kwargs, result, sampled, initial_memory, started_at):
+            elapsed = time.perf_counter() - started_at
+            # 메트릭 저장
+            _store_metric(op_name, elapsed, result)
+            if not sampled:
+                return
+
+            # 메모리 사용량 변화 계산
+            memory_info = ""
+            if initial_memory is not None:
+                final_memory = _get_memory_usage()
+                memory_info = f", memory_diff={final_memory - initial_memory:.2f}MB"
+                performance_metrics.observe("memory_usage", "rss_mb", final_memory)
+                performance_metrics.observe(
+                    "memory_usage_by_function", op_name, final_memory
+                )
 
-            # 객체나 딕셔너리 내부 속성에서 추출
-            if not user_id:
-                for arg in bound_args.arguments.values():
-                    if isinstance(arg, dict):
-                        user_id = arg.get("user_id") or arg.get("userId")
-                    elif hasattr(arg, "user_id"):
-                        user_id = getattr(arg, "user_id")
-                    elif hasattr(arg, "userId"):
-                        user_id = getattr(arg, "userId")
-                    if user_id:
-                        break
-
-            user_id = str(user_id) if user_id is not None else "unknown"
-            # 카테고리 추출 시도 (파라미터로 지정된 경우 우선 사용)
-            extracted_category = None
-            if not extracted_category:
-                # 1. kwargs에서 직접 추출
-                extracted_category = kwargs.get("category")
-
-                # 2. bound_args에서 category 파라미터 추출
-                if not extracted_category and "category" in bound_args.arguments:
-                    extracted_category = bound_args.arguments["category"]
-
-                # 3. 객체나 딕셔너리 내부 속성에서 추출
-                if not extracted_category:
-                    for arg in bound_args.arguments.values():
-                        if isinstance(arg, dict):
-                            extracted_category = arg.get("category")
-                        elif hasattr(arg, "category"):
-                            extracted_category = getattr(arg, "category")
-                        if extracted_category:
-                            break
-            category_info = (
-                f", category={extracted_category}" if extracted_category else ""
+            # 성능 정보 로깅
+            context = _call_context(func_signature, args, kwargs)
+            result_info = _extract_result_info(result)
+            logger.info(
+                f"PERF: {op_name} completed in {elapsed:.3f}s [{context}{result_info}{memory_info}]"
             )
 
-            # 초기 메모리 사용량
-            if include_memory:
-                initial_memory = _get_memory_usage()
-
-            # 시작 시간 기록
-            start_time = time.time()
-
-            try:
-                # 함수 실행
-                result = await func(*args, **kwargs)
-
-                # 경과 시간 계산
-                elapsed = round(time.time() - start_time, 3)
-
-                # 결과 정보 추출
-                result_info = _extract_result_info(result)
-
-                # 메모리 사용량 변화 계산
-                memory_info = ""
-                if include_memory:
-                    final_memory = _get_memory_usage()
-                    memory_diff = final_memory - initial_memory
-                    memory_info = f", memory_diff={memory_diff:.2f}MB"
-
-                    if op_name not in performance_metrics["memory_usage_by_function"]:
-                        performance_metrics["memory_usage_by_function"][op_name] = []
-                    performance_metrics["memory_usage_by_function"][op_name].append(
-                        final_memory
-                    )
-
-                # 성능 정보 로깅
-                logger.info(
-                    f"PERF: {op_name} completed in {elapsed}s [userId={user_id}{category_info}{result_info}{memory_info}]"
-                )
+        def fail(args, kwargs, error: Exception, started_at: float) -> None:
+            elapsed = time.perf_counter() - started_at
+            error_type = type(error).__name__
+            context = _call_context(func_signature, args, kwargs)
+            logger.error(
+                f"PERF-ERROR: {op_name} failed after {elapsed:.3f}s [{context}, error_type={error_type}]"
+            )
+            # 오류 카운트 증가
+            performance_metrics.count_error(op_name, error_type)
 
-                # 메트릭 저장
-                _store_metric(op_name, elapsed, result)
+        # 동기/비동기 함수에 맞는 래퍼 반환
+        if asyncio.iscoroutinefunction(func):
 
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                sampled, initial_memory, started_at = begin()
+                try:
+                    with span(op_name):
+                        result = await func(*args, **kwargs)
+                except Exception as e:
+                    fail(args, kwargs, e, started_at)
+                    raise
+                succeed(args, kwargs, result, sampled, initial_memory, started_at)
                 return result
-            except Exception as e:
-                # 오류 발생 시간 계산
-                elapsed = round(time.time() - start_time, 3)
-
-                # 오류 정보 로깅
-                error_type = type(e).__name__
-                logger.error(
-                    f"PERF-ERROR: {op_name} failed after {elapsed}s [userId={user_id}{category_info}, error_type={error_type}]"
-                )
-
-                # 오류 카운트 증가
-                if op_name not in performance_metrics["error_counts"]:
-                    performance_metrics["error_counts"][op_name] = {}
-
-                if error_type not in performance_metrics["error_counts"][op_name]:
-                    performance_metrics["error_counts"][op_name][error_type] = 0
-
-                performance_metrics["error_counts"][op_name][error_type] += 1
 
-                raise
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            # 작업 이름 결정
-            op_name = operation_name or func.__name__
-
-            bound_args = signature(func).bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            # 유저 ID 추출 시도
-            user_id = (
-                kwargs.get("user_id")
-                or kwargs.get("userId")
-                or (args[0] if args and isinstance(args[0], (str, int)) else None)
-            )
-
-            # 객체 속성 탐색
-            if not user_id:
-                for arg in bound_args.arguments.values():
-                    if isinstance(arg, dict) and ("user_id" in arg or "userId" in arg):
-                        user_id = arg.get("user_id") or arg.get("userId")
-                        break
-                    if hasattr(arg, "user_id"):
-                        user_id = getattr(arg, "user_id")
-                        break
-                    if hasattr(arg, "userId"):
-                        user_id = getattr(arg, "userId")
-                        break
-
-            user_id = str(user_id) if user_id is not None else "unknown"
-            # 카테고리 추출 시도 (파라미터로 지정된 경우 우선 사용)
-            extracted_category = None
-            if not extracted_category:
-                # 1. kwargs에서 직접 추출
-                extracted_category = kwargs.get("category")
-
-                # 2. bound_args에서 category 파라미터 추출
-                if not extracted_category and "category" in bound_args.arguments:
-                    extracted_category = bound_args.arguments["category"]
-
-                # 3. 객체나 딕셔너리 내부 속성에서 추출
-                if not extracted_category:
-                    for arg in bound_args.arguments.values():
-                        if isinstance(arg, dict):
-                            extracted_category = arg.get("category")
-                        elif hasattr(arg, "category"):
-                            extracted_category = getattr(arg, "category")
-                        if extracted_category:
-                            break
-            category_info = (
-                f", category={extracted_category}" if extracted_category else ""
-            )
-            # 초기 메모리 사용량
-            if include_memory:
-                initial_memory = _get_memory_usage()
-
-            # 시작 시간 기록
-            start_time = time.time()
-
+            sampled, initial_memory, started_at = begin()
             try:
-                # 함수 실행
-                result = func(*args, **kwargs)
-
-                # 경과 시간 계산
-                elapsed = round(time.time() - start_time, 3)
-
-                # 결과 정보 추출
-                result_info = _extract_result_info(result)
-
-                # 메모리 사용량 변화 계산
-                memory_info = ""
-                if include_memory:
-                    final_memory = _get_memory_usage()
-                    memory_diff = final_memory - initial_memory
-                    memory_info = f", memory_diff={memory_diff:.2f}MB"
-                    performance_metrics["memory_usage_samples"].append(final_memory)
-
-                    if op_name not in performance_metrics["memory_usage_by_function"]:
-                        performance_metrics["memory_usage_by_function"][op_name] = []
-                    performance_metrics["memory_usage_by_function"][op_name].append(
-                        final_memory
-                    )
-                # 성능 정보 로깅
-                logger.info(
-                    f"PERF: {op_name} completed in {elapsed}s [userId={user_id}{category_info}{result_info}{memory_info}]"
-                )
-
-                # 메트릭 저장
-                _store_metric(op_name, elapsed, result)
-
-                return result
+                with span(op_name):
+                    result = func(*args, **kwargs)
             except Exception as e:
-                # 오류 발생 시간 계산
-                elapsed = round(time.time() - start_time, 3)
-
-                # 오류 정보 로깅
-                error_type = type(e).__name__
-                logger.error(
-                    f"PERF-ERROR: {op_name} failed after {elapsed}s [userId={user_id}{category_info}, error_type={error_type}]"
-                )
-
-                # 오류 카운트 증가
-                if error_type not in performance_metrics["error_counts"]:
-                    performance_metrics["error_counts"][error_type] = 0
-                performance_metrics["error_counts"][error_type] += 1
-
+                fail(args, kwargs, e, started_at)
                 raise
+            succeed(args, kwargs, result, sampled, initial_memory, started_at)
+            return result
 
-        # 동기/비동기 함수에 맞는 래퍼 반환
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
 
+def _call_context(func_signature: Signature, args: tuple, kwargs: dict) -> str:
+    """
+    로그에 남길 사용자 ID / 카테고리 추출 (인자, 딕셔너리 키, 객체 속성 순서로 탐색)
+    """
+    try:
+        bound_args = func_signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        arguments = bound_args.arguments
+    except TypeError:
+        arguments = dict(kwargs)
+
+    # 유저 ID 추출 시도
+    user_id = (
+        kwargs.get("user_id")
+        or kwargs.get("userId")
+        or (args[0] if args and isinstance(args[0], (str, int)) else None)
+    )
+    # 객체나 딕셔너리 내부 속성에서 추출
+    if not user_id:
+        for arg in arguments.values():
+            if isinstance(arg, dict):
+                user_id = arg.get("user_id") or arg.get("userId")
+            else:
+                user_id = getattr(arg, "user_id", None) or getattr(arg, "userId", None)
+            if user_id:
+                break
+    user_id = str(user_id) if user_id is not None else "unknown"
+
+    # 카테고리 추출 시도 (category 파라미터 우선, 없으면 객체나 딕셔너리 내부 속성)
+    category = arguments.get("category")
+    if not category:
+        for arg in arguments.values():
+            if isinstance(arg, dict):
+                category = arg.get("category")
+            else:
+                category = getattr(arg, "category", None)
+            if category:
+                break
+    category_info = f", category={category}" if category else ""
+    return f"userId={user_id}{category_info}"
+
+
 def log_db_operation(operation_type: str, collection_name: str) -> Callable:
     """
     데이터베이스 작업 성능 측정 데코레이터
@@ -312,9 +229,9 @@ def log_db_operation(operation_type: str, collection_name: str) -> Callable:
                 logger.info(f"DB-PERF: {op_key} completed in {elapsed}s{data_info}")
 
                 # 메트릭 저장
-                if op_key not in performance_metrics["db_operation_times"]:
-                    performance_metrics["db_operation_times"][op_key] = []
-                performance_metrics["db_operation_times"][op_key].append(elapsed)
+                performance_metrics.observe_latency(
+                    "db_operation_times", op_key, elapsed
+                )
 
                 return result
             except Exception as e:
@@ -328,9 +245,7 @@ def log_db_operation(operation_type: str, collection_name: str) -> Callable:
                 )
 
                 # 오류 카운트 증가
-                if error_type not in performance_metrics["error_counts"]:
-                    performance_metrics["error_counts"][error_type] = 0
-                performance_metrics["error_counts"][error_type] += 1
+                performance_metrics.count_error(op_key, error_type)
 
                 raise
 
@@ -353,9 +268,9 @@ def log_embedding_generation(
     logger.info(
         f"EMBEDDING: Generated {field_count} fields in {elapsed:.3f}s, vector_size={vector_size}"
     )
-    performance_metrics["embedding_generation_times"].append(
-        {"field_count": field_count, "vector_size": vector_size, "time": elapsed}
-    )
+    performance_metrics.observe("embedding_generation", "time", elapsed)
+    performance_metrics.observe("embedding_generation", "field_count", field_count)
+    performance_metrics.observe("embedding_generation", "vector_size", vector_size)
 
 
 def log_similarity_calculation(
@@ -376,15 +291,9 @@ def log_similarity_calculation(
         f"[userId={user_id}, avg_time_per_user={avg_time_per_user:.5f}s]"
     )
 
-    performance_metrics["similarity_calculation_times"].append(
-        {
-            "user_id": user_id,
-            "total_users": total_users,
-            "match_count": match_count,
-            "time": elapsed,
-            "avg_time_per_user": avg_time_per_user,
-        }
-    )
+    match_ratio = match_count / total_users if total_users > 0 else 0
+    performance_metrics.observe("similarity_calculation", "time", elapsed)
+    performance_metrics.observe("similarity_calculation", "match_ratio", match_ratio)
 
 
 def log_memory_usage(operation: str = "general") -> None:
@@ -396,129 +305,70 @@ def log_memory_usage(operation: str = "general") -> None:
     """
     memory_mb = _get_memory_usage()
     logger.info(f"MEMORY: {operation} - Current usage: {memory_mb:.2f}MB")
-    performance_metrics["memory_usage_samples"].append(memory_mb)
+    performance_metrics.observe("memory_usage", "rss_mb", memory_mb)
 
 
 def get_performance_summary() -> Dict[str, Any]:
     """
-    누적된 성능 지표 요약 정보 반환
+    누적된 성능 지표 요약 정보 반환 (지표 이름별 버킷/누적값으로 계산, 누적 호출 수와 무관)
     """
-    import statistics
-
     summary = {}
 
     # API 응답 시간 요약
-    if performance_metrics["api_response_times"]:
-        summary["api_response_times"] = {}
-        for op_name, times in performance_metrics["api_response_times"].items():
-            if times:
-                summary["api_response_times"][op_name] = {
-                    "count": len(times),
-                    "avg": statistics.mean(times),
-                    "min": min(times),
-                    "max": max(times),
-                    "p95": (
-                        sorted(times)[int(len(times) * 0.95)]
-                        if len(times) > 20
-                        else max(times)
-                    ),
-                }
+    api_response_times = performance_metrics.latency_summary("api_response_times")
+    if api_response_times:
+        summary["api_response_times"] = api_response_times
 
     # 임베딩 생성 시간 요약
-    if performance_metrics["embedding_generation_times"]:
-        times = [
-            item["time"] for item in performance_metrics["embedding_generation_times"]
-        ]
+    embedding = performance_metrics.stats_summary("embedding_generation")
+    if embedding:
         summary["embedding_generation"] = {
-            "count": len(times),
-            "avg_time": statistics.mean(times) if times else 0,
-            "avg_fields": (
-                statistics.mean(
-                    [
-                        item["field_count"]
-                        for item in performance_metrics["embedding_generation_times"]
-                    ]
-                )
-                if times
-                else 0
-            ),
-            "avg_vector_size": (
-                statistics.mean(
-                    [
-                        item["vector_size"]
-                        for item in performance_metrics["embedding_generation_times"]
-                    ]
-                )
-                if times
-                else 0
-            ),
+            "count": embedding["time"]["count"],
+            "avg_time": embedding["time"]["avg"],
+            "avg_fields": embedding["field_count"]["avg"],
+            "avg_vector_size": embedding["vector_size"]["avg"],
         }
 
     # 유사도 계산 시간 요약
-    if performance_metrics["similarity_calculation_times"]:
-        times = [
-            item["time"] for item in performance_metrics["similarity_calculation_times"]
-        ]
+    similarity = performance_metrics.stats_summary("similarity_calculation")
+    if similarity:
         summary["similarity_calculation"] = {
-            "count": len(times),
-            "avg_time": statistics.mean(times) if times else 0,
-            "avg_match_ratio": (
-                statistics.mean(
-                    [
-                        (
-                            item["match_count"] / item["total_users"]
-                            if item["total_users"] > 0
-                            else 0
-                        )
-                        for item in performance_metrics["similarity_calculation_times"]
-                    ]
-                )
-                if times
-                else 0
-            ),
+            "count": similarity["time"]["count"],
+            "avg_time": similarity["time"]["avg"],
+            "avg_match_ratio": similarity["match_ratio"]["avg"],
         }
 
     # DB 작업 시간 요약
-    if performance_metrics["db_operation_times"]:
-        summary["db_operations"] = {}
-        for op_key, times in performance_metrics["db_operation_times"].items():
-            if times:
-                summary["db_operations"][op_key] = {
-                    "count": len(times),
-                    "avg": statistics.mean(times),
-                    "min": min(times),
-                    "max": max(times),
-                }
-
-    # 오류 카운트 요약
-    if performance_metrics["error_counts"]:
-        summary["errors"] = performance_metrics["error_counts"]
+    db_operations = performance_metrics.latency_summary("db_operation_times")
+    if db_operations:
+        summary["db_operations"] = db_operations
+
+    # 오류 카운트 요약 (작업 이름별 오류 유형 횟수)
+    errors = performance_metrics.errors()
+    if errors:
+        summary["errors"] = errors
 
     # 메모리 사용량 요약
-    if performance_metrics["memory_usage_samples"]:
+    memory = performance_metrics.stats_summary("memory_usage").get("rss_mb")
+    if memory:
         summary["memory_usage"] = {
-            "samples": len(performance_metrics["memory_usage_samples"]),
-            "avg": statistics.mean(performance_metrics["memory_usage_samples"]),
-            "max": max(performance_metrics["memory_usage_samples"]),
-            "current": (
-                performance_metrics["memory_usage_samples"][-1]
-                if performance_metrics["memory_usage_samples"]
-                else 0
-            ),
+            "samples": memory["count"],
+            "avg": memory["avg"],
+            "max": memory["max"],
+            "current": memory["latest"],
         }
     # 함수별 메모리 사용량 요약
-    if "memory_usage_by_function" in performance_metrics:
-        summary["memory_usage_by_function"] = {}
-        for func_name, samples in performance_metrics[
+    summary["memory_usage_by_function"] = {
+        func_name: {
+            "count": stats["count"],
+            "avg": stats["avg"],
+            "max": stats["max"],
+            "latest": stats["latest"],
+        }
+        for func_name, stats in performance_metrics.stats_summary(
             "memory_usage_by_function"
-        ].items():
-            if samples:
-                summary["memory_usage_by_function"][func_name] = {
-                    "count": len(samples),
-                    "avg": statistics.mean(samples),
-                    "max": max(samples),
-                    "latest": samples[-1],
-                }
+        ).items()
+    }
     return summary
 
 
@@ -526,21 +376,22 @@ def reset_performance_metrics() -> None:
     """
     성능 지표 초기화
     """
-    for key in performance_metrics:
-        if isinstance(performance_metrics[key], dict):
-            performance_metrics[key] = {}
-        else:
-            performance_metrics[key] = []
+    performance_metrics.reset()
+
+
+_process: Optional[psutil.Process] = None
 
 
 def _get_memory_usage() -> float:
     """
     현재 프로세스의 메모리 사용량을 MB 단위로 반환
+    (psutil.Process 객체는 재사용하되, fork된 워커에서는 새로 생성)
     """
+    global _process
     try:
-        process = psutil.Process(os.getpid())
-        memory_info = process.memory_info()
-        return memory_info.rss / (1024 * 1024)  # MB로 변환
+        if _process is None or _process.pid != os.getpid():
+            _process = psutil.Process(os.getpid())
+        return _process.memory_info().rss / (1024 * 1024)  # MB로 변환
     except Exception:
         return 0.0
 
@@ -566,8 +417,6 @@ def _store_metric(op_name: str, elapsed: float, result: Any = None) -> None:
     성능 지표 저장
     """
     # API 응답 시간 저장
-    if op_name not in performance_metrics["api_response_times"]:
-        performance_metrics["api_response_times"][op_name] = []
-    performance_metrics["api_response_times"][op_name].append(elapsed)
+    performance_metrics.observe_latency("api_response_times", op_name, elapsed)
 
     # 추가 메트릭 (예: 임베딩 또는 유사도 계산 관련)은 전용 함수를 통해 저장
@@ -0,0 +1,197 @@
+# tracemalloc 기반 메모리 스냅샷 유틸리티
+# 등록/재계산 중 메모리 최대치를 어떤 할당 위치(DataFrame 복사, JSON 파싱, 임베딩 리스트 등)가
+# 차지하는지 확인하기 위해 이름 붙인 스냅샷을 보관하고 두 스냅샷의 할당 위치별 차이를 계산
+#
+# - tracemalloc은 추적 중 모든 할당에 비용이 들기 때문에 기본 비활성화, 필요할 때만 start/stop
+# - 스냅샷은 크기가 크므로 최근 MEMORY_SNAPSHOT_LIMIT개만 보관
+
+import os
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Dict
+
+# 보관할 최대 스냅샷 수 (초과 시 가장 오래된 스냅샷 삭제)
+MEMORY_SNAPSHOT_LIMIT = int(os.getenv("MEMORY_SNAPSHOT_LIMIT", "5"))
+# 할당 위치별로 저장할 기본 호출 스택 깊이 (깊을수록 추적 비용/메모리 증가)
+TRACEMALLOC_DEFAULT_FRAMES = 1
+# 차이 계산에서 제외할 할당 위치 (tracemalloc 자체, 모듈 import)
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+MB = 1024 * 1024
+# 애플리케이션 코드 루트 (패키지별 합계에서 app/<디렉터리>로 묶음)
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TracemallocNotStartedError(Exception):
+    """tracemalloc이 시작되지 않은 상태에서 스냅샷을 요청한 경우 발생"""
+
+
+class SnapshotNotFoundError(Exception):
+    """존재하지 않는 스냅샷 이름을 요청한 경우 발생"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.name = name
+
+
+class MemorySnapshotStore:
+    """
+    이름별 tracemalloc 스냅샷 저장소
+    스냅샷마다 직전 스냅샷(또는 추적 시작) 이후의 최대 추적 메모리도 함께 기록
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._snapshots: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, frames: int = TRACEMALLOC_DEFAULT_FRAMES) -> dict:
+        """
+        tracemalloc 추적 시작 (이미 추적 중이면 그대로 유지)
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        return self.status()
+
+    def stop(self) -> dict:
+        """
+        tracemalloc 추적 중지 및 보관 중인 스냅샷 삭제
+        """
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+        return self.status()
+
+    def status(self) -> dict:
+        tracing = tracemalloc.is_tracing()
+        current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        with self._lock:
+            snapshots = [
+                _summary(name, entry) for name, entry in self._snapshots.items()
+            ]
+        return {
+            "tracing": tracing,
+            "frames": tracemalloc.get_traceback_limit() if tracing else 0,
+            "tracedMb": round(current / MB, 3),
+            "peakMb": round(peak / MB, 3),
+            "overheadMb": round(tracemalloc.get_tracemalloc_memory() / MB, 3),
+            "snapshots": snapshots,
+        }
+
+    def take(self, name: str) -> dict:
+        """
+        현재 할당 상태를 name으로 저장 (같은 이름은 덮어씀)
+
+        Raises:
+            TracemallocNotStartedError: 추적 중이 아닌 경우
+        """
+        if not tracemalloc.is_tracing():
+            raise TracemallocNotStartedError()
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+        # 다음 스냅샷의 최대치는 이 시점 이후 구간만 반영
+        tracemalloc.reset_peak()
+        entry = {
+            "snapshot": snapshot,
+            "takenAt": time.time(),
+            "tracedBytes": current,
+            "peakBytes": peak,
+        }
+        with self._lock:
+            self._snapshots.pop(name, None)
+            self._snapshots[name] = entry
+            while len(self._snapshots) > self.limit:
+                self._snapshots.popitem(last=False)
+        return _summary(name, entry)
+
+    def diff(
+        self,
+        base: str,
+        target: str,
+        group_by: str = "lineno",
+        limit: int = 20,
+    ) -> dict:
+        """
+        base → target 스냅샷의 할당 위치별 크기 차이 상위 limit개와 패키지별 합계
+
+        Args:
+            base: 기준 스냅샷 이름
+            target: 비교 스냅샷 이름
+            group_by: "lineno"(파일:줄), "filename", "traceback"(시작 시 frames > 1 필요)
+            limit: 반환할 할당 위치 수 (증가량 절대값 기준)
+
+        Raises:
+            SnapshotNotFoundError: 스냅샷이 없는 경우
+        """
+        with self._lock:
+            entries = {}
+            for name in (base, target):
+                if name not in self._snapshots:
+                    raise SnapshotNotFoundError(name)
+                entries[name] = self._snapshots[name]
+
+        stats = entries[target]["snapshot"].compare_to(
+            entries[base]["snapshot"], group_by
+        )
+        by_package: Dict[str, int] = {}
+        for stat in stats:
+            package = _package_of(stat.traceback[0].filename)
+            by_package[package] = by_package.get(package, 0) + stat.size_diff
+
+        return {
+            "base": _summary(base, entries[base]),
+            "target": _summary(target, entries[target]),
+            "totalDiffMb": round(sum(stat.size_diff for stat in stats) / MB, 3),
+            "byPackage": [
+                {"package": package, "sizeDiffMb": round(size / MB, 3)}
+                for package, size in sorted(
+                    by_package.items(), key=lambda item: abs(item[1]), reverse=True
+                )
+            ],
+            "top": [_stat_to_dict(stat) for stat in stats[:limit]],
+        }
+
+
+def _summary(name: str, entry: dict) -> dict:
+    return {
+        "name": name,
+        "takenAt": round(entry["takenAt"], 3),
+        "tracedMb": round(entry["tracedBytes"] / MB, 3),
+        "peakSincePreviousMb": round(entry["peakBytes"] / MB, 3),
+    }
+
+
+def _stat_to_dict(stat) -> dict:
+    return {
+        "traceback": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+        "sizeMb": round(stat.size / MB, 3),
+        "sizeDiffMb": round(stat.size_diff / MB, 3),
+        "count": stat.count,
+        "countDiff": stat.count_diff,
+    }
+
+
+def _package_of(filename: str) -> str:
+    """
+    할당 위치 파일의 패키지 이름 (site-packages 하위는 최상위 패키지, 표준 라이브러리는 모듈,
+    그 외 애플리케이션 코드는 app/<최상위 디렉터리>)
+    """
+    path = filename.replace("\\", "/")
+    for marker in ("/site-packages/", "/dist-packages/"):
+        if marker in path:
+            return path.split(marker, 1)[1].split("/", 1)[0].removesuffix(".py")
+    if "/lib/python" in path:
+        module = path.split("/lib/python", 1)[1].split("/", 1)[-1]
+        return "stdlib:" + module.split("/", 1)[0].removesuffix(".py")
+    if path.startswith(APP_ROOT + "/"):
+        return "app/" + path[len(APP_ROOT) + 1 :].split("/", 1)[0].removesuffix(".py")
+    return path
+
+
+memory_snapshots = MemorySnapshotStore(MEMORY_SNAPSHOT_LIMIT)
@@ -0,0 +1,395 @@
+# 고정 크기 성능 지표 저장소 유틸리티 (호출 수와 무관하게 메모리 사용량 일정)
+# 외부 서비스 없이 프로세스 내 저장소를 Prometheus 텍스트 형식(/metrics)으로 노출
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+# 지연 시간 히스토그램 버킷: 0.5ms부터 2^(1/4)배(약 19%)씩 증가, 마지막 경계 약 1,000초
+HISTOGRAM_MIN_SECONDS = 0.0005
+HISTOGRAM_BUCKETS_PER_DOUBLING = 4
+HISTOGRAM_NUM_BUCKETS = 84
+BUCKET_BOUNDS = [
+    HISTOGRAM_MIN_SECONDS * 2 ** (i / HISTOGRAM_BUCKETS_PER_DOUBLING)
+    for i in range(HISTOGRAM_NUM_BUCKETS)
+]
+# Prometheus 노출 버킷 (두 배 간격으로 추린 경계, 누적 개수는 정확)
+EXPORTED_BUCKET_INDEXES = list(
+    range(0, HISTOGRAM_NUM_BUCKETS, HISTOGRAM_BUCKETS_PER_DOUBLING)
+)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RunningStats:
+    """
+    값 목록 없이 개수/합계/최소/최대/최근 값만 누적하는 통계
+    """
+
+    __slots__ = ("count", "total", "min", "max", "latest")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.latest = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.latest = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class LatencyHistogram(RunningStats):
+    """
+    로그 스케일 고정 버킷 지연 시간 히스토그램 (HDR 방식)
+    백분위수는 누적 개수로 버킷을 찾은 뒤 버킷 안에서 기하 보간 (상대 오차 약 10% 이내)
+    """
+
+    __slots__ = ("buckets",)
+
+    def __init__(self):
+        super().__init__()
+        # 마지막 칸은 최대 경계 초과분
+        self.buckets = [0] * (HISTOGRAM_NUM_BUCKETS + 1)
+
+    def add(self, value: float) -> None:
+        RunningStats.add(self, value)
+        self.buckets[bisect_left(BUCKET_BOUNDS, value)] += 1
+
+    def percentile(self, q: float) -> float:
+        """
+        q 백분위수 (0 < q <= 1), 측정값 범위(min~max)로 제한
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            if not bucket_count:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = BUCKET_BOUNDS[index - 1] if index else self.min
+                upper = (
+                    BUCKET_BOUNDS[index] if index < HISTOGRAM_NUM_BUCKETS else self.max
+                )
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                fraction = (rank - cumulative) / bucket_count
+                if lower <= 0:
+                    return lower + (upper - lower) * fraction
+                return lower * (upper / lower) ** fraction
+            cumulative += bucket_count
+        return self.max
+
+
+def bucket_index(value: float) -> int:
+    """
+    값이 속하는 버킷 번호 (value <= BUCKET_BOUNDS[i]인 가장 작은 i)
+    """
+    return bisect_left(BUCKET_BOUNDS, value)
+
+
+# 수집기: 조회 시점의 게이지 값 [(지표 이름, 설명, {라벨: 값}, 값)]
+GaugeSample = Tuple[str, str, Dict[str, str], float]
+
+
+class MetricsRegistry:
+    """
+    이름별 지표 저장소
+    - 지연 시간: 그룹/이름별 고정 버킷 히스토그램
+    - 그 외 값: 그룹/이름별 RunningStats
+    - 카운터: 그룹/이름별 누적 횟수
+    - 오류: (작업 이름, 오류 유형)별 카운터
+    이름은 라벨 값 하나(문자열) 또는 여러 개(튜플)이며, 코드에 고정된 작업/경로 이름이므로 개수가 제한됨
+    이름당 크기는 호출 수와 무관
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 그룹 → (Prometheus 지표 이름, 설명, 라벨 이름) (설명이 있는 그룹만 노출)
+        self._descriptions: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        self._collectors: List[Callable[[], Iterable[GaugeSample]]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms: Dict[str, Dict[Hashable, LatencyHistogram]] = {}
+            self._stats: Dict[str, Dict[Hashable, RunningStats]] = {}
+            self._counters: Dict[str, Dict[Hashable, int]] = {}
+            self._errors: Dict[str, Dict[str, int]] = {}
+
+    def describe(
+        self, group: str, metric_name: str, help_text: str, label_names: tuple
+    ) -> None:
+        """
+        그룹을 Prometheus 지표로 노출하도록 등록
+        """
+        self._descriptions[group] = (metric_name, help_text, tuple(label_names))
+
+    def add_collector(self, collector: Callable[[], Iterable[GaugeSample]]) -> None:
+        """
+        조회 시점에 게이지 값을 만드는 수집기 등록 (큐 적재량 등 다른 모듈의 상태)
+        """
+        self._collectors.append(collector)
+
+    def observe_latency(self, group: str, name: Hashable, seconds: float) -> None:
+        with self._lock:
+            series = self._histograms.get(group)
+            if series is None:
+                series = self._histograms[group] = {}
+            histogram = series.get(name)
+            if histogram is None:
+                histogram = series[name] = LatencyHistogram()
+            histogram.add(seconds)
+
+    def observe(self, group: str, name: Hashable, value: float) -> None:
+        with self._lock:
+            series = self._stats.get(group)
+            if series is None:
+                series = self._stats[group] = {}
+            stats = series.get(name)
+            if stats is None:
+                stats = series[name] = RunningStats()
+            stats.add(value)
+
+    def increment(self, group: str, name: Hashable, amount: int = 1) -> None:
+        with self._lock:
+            series = self._counters.setdefault(group, {})
+            series[name] = series.get(name, 0) + amount
+
+    def count_error(self, name: str, error_type: str) -> None:
+        with self._lock:
+            errors = self._errors.setdefault(name, {})
+            errors[error_type] = errors.get(error_type, 0) + 1
+
+    def latency_summary(self, group: str) -> Dict[str, dict]:
+        """
+        이름별 지연 시간 요약 (버킷 수에 비례하는 계산, 누적 호출 수와 무관)
+        """
+        with self._lock:
+            return {
+                _series_key(name): {
+                    "count": histogram.count,
+                    "avg": histogram.mean,
+                    "min": histogram.min,
+                    "max": histogram.max,
+                    "p50": histogram.percentile(0.5),
+                    "p95": histogram.percentile(0.95),
+                    "p99": histogram.percentile(0.99),
+                }
+                for name, histogram in self._histograms.get(group, {}).items()
+                if histogram.count
+            }
+
+    def stats_summary(self, group: str) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                _series_key(name): {
+                    "count": stats.count,
+                    "avg": stats.mean,
+                    "min": stats.min,
+                    "max": stats.max,
+                    "latest": stats.latest,
+                }
+                for name, stats in self._stats.get(group, {}).items()
+                if stats.count
+            }
+
+    def counters(self, group: str) -> Dict[Hashable, int]:
+        with self._lock:
+            return dict(self._counters.get(group, {}))
+
+    def errors(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._errors.items()}
+
+    def render_prometheus(self, namespace: str) -> str:
+        """
+        Prometheus 텍스트 노출 형식 (지표 이름 앞에 namespace_ 접두사)
+        - 지연 시간 그룹: histogram (_bucket/_sum/_count)
+        - 값 그룹: summary (_sum/_count)
+        - 카운터 그룹: counter (_total)
+        - 오류: errors_total{operation, error_type}
+        - 수집기: gauge
+        """
+        lines: List[str] = []
+        with self._lock:
+            for group, (metric, help_text, label_names) in self._descriptions.items():
+                name = f"{namespace}_{metric}"
+                if group in self._histograms:
+                    _header(lines, name, help_text, "histogram")
+                    for key, histogram in self._histograms[group].items():
+                        labels = _labels(label_names, key)
+                        cumulative = 0
+                        previous = 0
+                        for index in EXPORTED_BUCKET_INDEXES:
+                            cumulative += sum(histogram.buckets[previous : index + 1])
+                            previous = index + 1
+                            le = _labels(
+                                label_names + ("le",),
+                                _label_values(key) + (f"{BUCKET_BOUNDS[index]:.6g}",),
+                            )
+                            lines.append(f"{name}_bucket{le} {cumulative}")
+                        le = _labels(
+                            label_names + ("le",), _label_values(key) + ("+Inf",)
+                        )
+                        lines.append(f"{name}_bucket{le} {histogram.count}")
+                        lines.append(f"{name}_sum{labels} {histogram.total:.6f}")
+                        lines.append(f"{name}_count{labels} {histogram.count}")
+                if group in self._stats:
+                    _header(lines, name, help_text, "summary")
+                    for key, stats in self._stats[group].items():
+                        labels = _labels(label_names, key)
+                        lines.append(f"{name}_sum{labels} {stats.total:.6f}")
+                        lines.append(f"{name}_count{labels} {stats.count}")
+                if group in self._counters:
+                    _header(lines, f"{name}_total", help_text, "counter")
+                    for key, value in self._counters[group].items():
+                        lines.append(f"{name}_total{_labels(label_names, key)} {value}")
+
+            if self._errors:
+                name = f"{namespace}_errors_total"
+                _header(lines, name, "작업별 오류 횟수", "counter")
+                for operation, counts in self._errors.items():
+                    for error_type, value in counts.items():
+                        labels = _labels(
+                            ("operation", "error_type"), (operation, error_type)
+                        )
+                        lines.append(f"{name}{labels} {value}")
+            collectors = list(self._collectors)
+
+        # 수집기는 다른 모듈의 락을 잡으므로 저장소 락 밖에서 호출
+        described = set()
+        for collector in collectors:
+            for metric, help_text, labels, value in collector():
+                name = f"{namespace}_{metric}"
+                if name not in described:
+                    described.add(name)
+                    _header(lines, name, help_text, "gauge")
+                label_text = _labels(tuple(labels), tuple(labels.values()))
+                lines.append(f"{name}{label_text} {float(value):.6g}")
+        return "\n".join(lines) + "\n"
+
+
+def _series_key(name: Hashable) -> str:
+    return " ".join(map(str, name)) if isinstance(name, tuple) else str(name)
+
+
+def _label_values(name: Hashable) -> tuple:
+    return tuple(map(str, name)) if isinstance(name, tuple) else (str(name),)
+
+
+def _labels(label_names: tuple, name: Hashable) -> str:
+    if not label_names:
+        return ""
+    pairs = ",".join(
+        f'{label}="{_escape(value)}"'
+        for label, value in zip(label_names, _label_values(name))
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _header(lines: List[str], name: str, help_text: str, metric_type: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {metric_type}")
+
+
+# 프로세스 공용 저장소
+metrics_registry = MetricsRegistry()
+metrics_registry.describe(
+    "http_requests",
+    "http_request_duration_seconds",
+    "경로별 HTTP 요청 처리 시간",
+    ("method", "route"),
+)
+metrics_registry.describe(
+    "http_responses",
+    "http_responses",
+    "경로/상태 코드별 HTTP 응답 수",
+    ("method", "route", "status"),
+)
+
+
+@contextmanager
+def timed(group: str, name: Hashable) -> Iterator[None]:
+    """
+    블록 실행 시간을 그룹/이름의 지연 시간 히스토그램에 기록 (예외가 나도 기록)
+    """
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics_registry.observe_latency(group, name, time.perf_counter() - started_at)
+
+
+class RequestMetricsMiddleware:
+    """
+    경로 템플릿(예: /api/v3/users/{user_id})별 요청 처리 시간/응답 수 기록 ASGI 미들웨어
+    경로 매칭에 실패한 요청은 "unmatched"로 묶어 라벨 수를 제한
+    """
+
+    def __init__(self, app, excluded_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope.get("method", "")
+            metrics_registry.observe_latency(
+                "http_requests", (method, route_path), time.perf_counter() - started_at
+            )
+            metrics_registry.increment(
+                "http_responses", (method, route_path, str(status["code"]))
+            )
+
+
+def register_metrics(app: FastAPI, namespace: str) -> None:
+    """
+    FastAPI 애플리케이션에 요청 지표 미들웨어와 /metrics 엔드포인트 등록
+
+    Args:
+        app: FastAPI 애플리케이션 인스턴스
+        namespace: 지표 이름 접두사 (서비스 이름)
+    """
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(
+            metrics_registry.render_prometheus(namespace),
+            media_type=PROMETHEUS_CONTENT_TYPE,
+        )
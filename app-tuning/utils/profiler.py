@@ -0,0 +1,165 @@
+# 프로세스 내 샘플링 프로파일러 유틸리티
+# 컨테이너에 접속(py-spy, SYS_PTRACE)하지 않고 실행 중인 서버의 핫스팟을 확인하기 위해
+# 별도 스레드에서 일정 간격으로 모든 스레드의 호출 스택(sys._current_frames)을 수집
+#
+# - 수집 중에도 다른 스레드는 계속 실행되며, 비용은 샘플당 (스레드 수 x 스택 깊이) 프레임 조회
+# - 결과는 collapsed stack(flamegraph.pl, speedscope 모두 지원) 또는 speedscope JSON 형식
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# 프로파일링 최대 시간(초)과 기본 샘플링 간격(밀리초)
+PROFILE_MAX_SECONDS = int(os.getenv("PROFILE_MAX_SECONDS", "60"))
+PROFILE_INTERVAL_MS = int(os.getenv("PROFILE_INTERVAL_MS", "10"))
+# 샘플당 기록할 최대 스택 깊이 (깊은 재귀에서 샘플 비용 제한)
+PROFILE_MAX_DEPTH = 128
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# 프레임 식별자: (함수 이름, 파일 경로, 함수 시작 줄)
+Frame = Tuple[str, str, int]
+
+
+class ProfilerBusyError(Exception):
+    """다른 프로파일링이 진행 중인 경우 발생"""
+
+
+class StackProfile:
+    """
+    스레드 이름별 (루트 → 리프) 호출 스택 샘플 수
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Dict[str, Counter] = {}
+        self.sample_count = 0
+        self.duration = 0.0
+        self.sampling_time = 0.0
+
+    @property
+    def sample_period(self) -> float:
+        """
+        실제 샘플 간격 (수집 시간만큼 지정 간격보다 길어질 수 있음)
+        """
+        return self.duration / self.sample_count if self.sample_count else self.interval
+
+    @property
+    def overhead_ratio(self) -> float:
+        """
+        프로파일링 시간 대비 샘플 수집에 사용한 시간 비율 (GIL 점유 비율의 상한)
+        """
+        return self.sampling_time / self.duration if self.duration else 0.0
+
+    def to_collapsed(self) -> str:
+        """
+        collapsed stack 형식 ("스레드;루트;...;리프 샘플수" 한 줄에 스택 하나)
+        """
+        lines = []
+        for thread_name, stacks in self.samples.items():
+            for stack, count in stacks.most_common():
+                names = [thread_name] + [_frame_label(frame) for frame in stack]
+                lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self, name: str) -> dict:
+        """
+        speedscope 파일 형식 (스레드별 sampled 프로파일, 가중치 단위는 초)
+        """
+        frame_indexes: Dict[Frame, int] = {}
+        frames: List[dict] = []
+        profiles = []
+        for thread_name, stacks in self.samples.items():
+            samples, weights = [], []
+            for stack, count in stacks.most_common():
+                indexes = []
+                for frame in stack:
+                    if frame not in frame_indexes:
+                        frame_indexes[frame] = len(frames)
+                        function, filename, line = frame
+                        frames.append(
+                            {"name": function, "file": filename, "line": line}
+                        )
+                    indexes.append(frame_indexes[frame])
+                samples.append(indexes)
+                weights.append(round(count * self.sample_period, 6))
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": round(sum(weights), 6),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            )
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "tuning-api profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+def _frame_label(frame: Frame) -> str:
+    function, filename, line = frame
+    return f"{function} ({os.path.basename(filename)}:{line})"
+
+
+def _stack(frame) -> Tuple[Frame, ...]:
+    stack = []
+    while frame is not None and len(stack) < PROFILE_MAX_DEPTH:
+        code = frame.f_code
+        stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+_profile_lock = threading.Lock()
+
+
+def sample_stacks(seconds: float, interval: float) -> StackProfile:
+    """
+    현재 스레드를 제외한 모든 스레드의 호출 스택을 interval초 간격으로 seconds초 동안 수집
+    (블로킹 함수이므로 이벤트 루프에서는 asyncio.to_thread로 호출)
+
+    Raises:
+        ProfilerBusyError: 다른 프로파일링이 진행 중인 경우 (동시에 하나만 허용)
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError()
+    try:
+        profile = StackProfile(interval)
+        own_thread = threading.get_ident()
+        started_at = time.perf_counter()
+        deadline = started_at + seconds
+        next_sample_at = started_at
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_sample_at:
+                time.sleep(next_sample_at - now)
+                continue
+            next_sample_at = now + interval
+
+            sample_started_at = time.perf_counter()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                thread_name = names.get(thread_id, f"thread-{thread_id}")
+                profile.samples.setdefault(thread_name, Counter())[_stack(frame)] += 1
+            profile.sample_count += 1
+            profile.sampling_time += time.perf_counter() - sample_started_at
+        profile.duration = time.perf_counter() - started_at
+        return profile
+    finally:
+        _profile_lock.release()
@@ -0,0 +1,271 @@
+# 요청 단위 구간(span) 추적 유틸리티
+# OpenTelemetry의 trace/span 모델(traceId, spanId, 부모-자식 구간, 속성)을 따르되 외부 수집기 없이
+# 프로세스 내 고정 크기 버퍼에 최근 추적을 보관하고 /monitoring/traces/slowest로 조회
+#
+# - 현재 구간은 contextvars로 전달 (cpu_executor/asyncio.to_thread 워커 스레드에도 그대로 전달됨)
+# - 진행 중인 추적이 없으면 span()은 아무것도 기록하지 않음 (스크립트/배치 경로 비용 없음)
+
+import itertools
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+# 보관할 최근 추적 수
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "500"))
+# 추적 하나에 기록할 최대 구간 수 (초과분은 개수만 집계)
+TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "512"))
+# 추적하지 않을 경로 접두사 (지표 수집/모니터링 조회)
+TRACE_EXCLUDED_PREFIXES = ("/metrics", "/monitoring")
+
+
+class Trace:
+    """
+    루트 구간 하나와 그 하위 구간들의 묶음 (구간 수 제한, Chroma 송수신 바이트 합계)
+    """
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.root: Optional["Span"] = None
+        self.dropped_spans = 0
+        self.chroma_bytes_in = 0
+        self.chroma_bytes_out = 0
+        self._span_numbers = itertools.count()
+
+    def reserve_span(self) -> bool:
+        if next(self._span_numbers) < TRACE_MAX_SPANS:
+            return True
+        self.dropped_spans += 1
+        return False
+
+
+class Span:
+    """
+    실행 구간 (이름, 시작 시각, 소요 시간, 속성, 하위 구간)
+    """
+
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "attributes",
+        "children",
+        "start_time",
+        "started_at",
+        "duration",
+        "error",
+    )
+
+    def __init__(
+        self, trace: Trace, name: str, parent: Optional["Span"], attributes: dict
+    ):
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.attributes = attributes
+        self.children: List[Span] = []
+        self.start_time = time.time()
+        self.started_at = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        if parent is not None:
+            parent.children.append(self)
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self.started_at
+
+    def to_dict(self) -> dict:
+        duration = self.duration
+        if duration is None:
+            duration = time.perf_counter() - self.started_at
+        children_ms = sum(child.duration or 0.0 for child in self.children) * 1000
+        return {
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTime": round(self.start_time, 6),
+            "durationMs": round(duration * 1000, 3),
+            # 하위 구간에 포함되지 않은 시간 (하위 구간이 병렬이면 음수가 될 수 있어 0으로 보정)
+            "selfMs": round(max(duration * 1000 - children_ms, 0.0), 3),
+            "status": "ERROR" if self.error else "OK",
+            "error": self.error,
+            "attributes": dict(self.attributes),
+            "children": [child.to_dict() for child in list(self.children)],
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class TraceStore:
+    """
+    완료된 최근 추적을 고정 크기 버퍼에 보관
+    """
+
+    def __init__(self, max_traces: int):
+        self._traces: deque = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+
+    def add(self, trace: Trace) -> None:
+        with self._lock:
+            self._traces.append(trace)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+    def slowest(self, limit: int = 10, name: Optional[str] = None) -> List[dict]:
+        """
+        최근 추적 중 소요 시간이 긴 순서로 limit개 (name이 있으면 루트 구간 이름으로 필터)
+        """
+        with self._lock:
+            traces = [
+                trace
+                for trace in self._traces
+                if name is None or trace.root.name == name
+            ]
+        traces.sort(key=lambda trace: trace.root.duration, reverse=True)
+        return [_trace_to_dict(trace) for trace in traces[:limit]]
+
+
+trace_store = TraceStore(TRACE_BUFFER_SIZE)
+
+
+def _trace_to_dict(trace: Trace) -> dict:
+    """
+    추적 요약 (구간 이름별 횟수/합계 시간 + 전체 구간 트리)
+    """
+    stages: Dict[str, dict] = {}
+    pending = list(trace.root.children)
+    while pending:
+        current = pending.pop()
+        stage = stages.setdefault(current.name, {"count": 0, "totalMs": 0.0})
+        stage["count"] += 1
+        stage["totalMs"] += (current.duration or 0.0) * 1000
+        pending.extend(current.children)
+    for stage in stages.values():
+        stage["totalMs"] = round(stage["totalMs"], 3)
+
+    return {
+        "traceId": trace.trace_id,
+        "name": trace.root.name,
+        "startTime": round(trace.root.start_time, 6),
+        "durationMs": round(trace.root.duration * 1000, 3),
+        "chromaBytesIn": trace.chroma_bytes_in,
+        "chromaBytesOut": trace.chroma_bytes_out,
+        "droppedSpans": trace.dropped_spans,
+        "stages": dict(
+            sorted(stages.items(), key=lambda item: item[1]["totalMs"], reverse=True)
+        ),
+        "root": trace.root.to_dict(),
+    }
+
+
+@contextmanager
+def start_trace(name: str, **attributes) -> Iterator[Span]:
+    """
+    새 추적의 루트 구간 시작 (진행 중인 구간이 있어도 새 추적으로 분리)
+    블록이 끝나면 추적을 trace_store에 보관
+    """
+    trace = Trace()
+    root = trace.root = Span(trace, name, None, attributes)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.error = type(e).__name__
+        raise
+    finally:
+        root.finish()
+        _current_span.reset(token)
+        trace_store.add(trace)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """
+    현재 구간의 하위 구간 기록 (진행 중인 추적이 없거나 구간 수 제한을 넘으면 None)
+    """
+    parent = _current_span.get()
+    if parent is None or not parent.trace.reserve_span():
+        yield None
+        return
+
+    current = Span(parent.trace, name, parent, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.finish()
+        _current_span.reset(token)
+
+
+def set_attributes(**attributes) -> None:
+    """
+    현재 구간에 속성 추가 (진행 중인 추적이 없으면 무시)
+    """
+    current = _current_span.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+
+def add_chroma_bytes(bytes_out: int, bytes_in: int) -> None:
+    """
+    현재 구간과 추적 합계에 Chroma 송신(요청)/수신(응답) 바이트 추가
+    """
+    current = _current_span.get()
+    if current is None:
+        return
+    current.attributes["chroma.bytes_out"] = (
+        current.attributes.get("chroma.bytes_out", 0) + bytes_out
+    )
+    current.attributes["chroma.bytes_in"] = (
+        current.attributes.get("chroma.bytes_in", 0) + bytes_in
+    )
+    current.trace.chroma_bytes_out += bytes_out
+    current.trace.chroma_bytes_in += bytes_in
+
+
+class TracingMiddleware:
+    """
+    HTTP 요청마다 루트 구간을 만드는 ASGI 미들웨어
+    루트 구간 이름은 경로 템플릿 기준 (예: "POST /api/v3/users"), 응답 헤더 X-Trace-Id로 추적 ID 전달
+    """
+
+    def __init__(self, app, excluded_prefixes: tuple = TRACE_EXCLUDED_PREFIXES):
+        self.app = app
+        self.excluded_prefixes = excluded_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path", "").startswith(
+            self.excluded_prefixes
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+        with start_trace(f"{method} unmatched") as root:
+
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    root.attributes["http.status_code"] = message["status"]
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-trace-id", root.trace.trace_id.encode())
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    root.name = f"{method} {route}"